@@ -1,10 +1,14 @@
 # _*_ coding: utf-8 _*_
 """Cache control API endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from src.core.dependencies import get_database, get_redis_client
 from src.config import settings
 from src.database.base import Database
-from src.cache.redis_client import RedisClient
+from src.cache.redis_client import CACHE_NAMESPACES, CHAT_CACHE_VERSION_SUFFIX, RedisClient
+from itertools import islice
+from typing import List, Optional, Tuple
+import json
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,6 +22,8 @@ def get_cache_config():
 
 @router.get("/cache/status")
 def get_cache_status(
+    include_namespaces: bool = Query(False, description="네임스페이스별 키 수/메모리 추정 포함 (SCAN 순회)"),
+    sample_size: int = Query(100, ge=1, le=1000, description="네임스페이스별 MEMORY USAGE 샘플 키 수"),
     redis_client: RedisClient = Depends(get_redis_client),
     cache_config = Depends(get_cache_config)
 ):
@@ -30,34 +36,133 @@ def get_cache_status(
             "data": {"enabled": False, "message": "Redis not available"}
         }
     
-    # Redis 정보 조회
+    # Redis 정보 조회 (전체 키 수는 O(1) DBSIZE 사용)
     info = redis_client.redis_client.info()
-    keys = redis_client.redis_client.keys("*")
+    data = {
+        "enabled": True,
+        "redis_version": info.get("redis_version"),
+        "used_memory": info.get("used_memory_human"),
+        "total_keys": redis_client.redis_client.dbsize(),
+        "cache_config": {
+            "enabled": cache_config.cache_enabled,
+            "ttl_chat_messages": cache_config.cache_ttl_chat_messages,
+            "ttl_user_chats": cache_config.cache_ttl_user_chats,
+            "redis_host": cache_config.redis_host,
+            "redis_port": cache_config.redis_port,
+            "redis_db": cache_config.redis_db
+        }
+    }
+    if include_namespaces:
+        data["namespaces"] = redis_client.namespace_stats(sample_size=sample_size)
     
     return {
         "status": "success",
-        "data": {
-            "enabled": True,
-            "redis_version": info.get("redis_version"),
-            "used_memory": info.get("used_memory_human"),
-            "total_keys": len(keys),
-            "cache_config": {
-                "enabled": cache_config.cache_enabled,
-                "ttl_chat_messages": cache_config.cache_ttl_chat_messages,
-                "ttl_user_chats": cache_config.cache_ttl_user_chats,
-                "redis_host": cache_config.redis_host,
-                "redis_port": cache_config.redis_port,
-                "redis_db": cache_config.redis_db
+        "data": data
+    }
+
+
+@router.get("/cache/stats")
+def get_cache_stats(
+    sample_size: int = Query(100, ge=1, le=1000, description="네임스페이스별 MEMORY USAGE 샘플 키 수"),
+    redis_client: RedisClient = Depends(get_redis_client)
+):
+    """네임스페이스별 키 수 및 메모리 사용량 추정 (SCAN 기반)"""
+    if not redis_client or not redis_client.ping():
+        return {
+            "status": "error",
+            "message": "Redis가 사용할 수 없습니다."
+        }
+
+    try:
+        return {
+            "status": "success",
+            "data": {
+                "total_keys": redis_client.redis_client.dbsize(),
+                "namespaces": redis_client.namespace_stats(sample_size=sample_size)
             }
         }
-    }
+    except Exception as e:
+        # Global Exception Handler가 처리하도록 예외를 다시 발생
+        from src.types.response.exceptions import HandledException
+        from src.types.response.response_code import ResponseCode
+        raise HandledException(ResponseCode.CACHE_QUERY_ERROR, e=e)
+
+
+# 채팅방/사용자 ID로 식별되는 키 네임스페이스 (키 형식: {namespace}{id})
+CHAT_SCOPED_NAMESPACES = ["chat:", "generation:", "cancel:", "session:"]
+USER_SCOPED_NAMESPACES = ["user_chats:"]
+
+
+def _invalid_clear_filter(msg: str):
+    from src.types.response.exceptions import HandledException
+    from src.types.response.response_code import ResponseCode
+    return HandledException(ResponseCode.INVALID_DATA_FORMAT, msg=msg)
+
+
+def _build_clear_targets(
+    namespace: Optional[str],
+    chat_id: Optional[str],
+    user_id: Optional[str],
+    prefix: Optional[str]
+) -> Tuple[List[str], List[str]]:
+    """
+    삭제 조건을 (정확한 키 목록, SCAN MATCH 패턴 목록)으로 변환 (조건이 없으면 전체)
+
+    조건은 모두 AND로 결합됨
+    - chat_id/user_id는 정확히 일치하는 ID의 키({ns}{id}, chat:{id}:version)만 대상이며
+      키 이름을 알고 있으므로 SCAN 없이 바로 UNLINK
+    - 접두사 삭제(SCAN)는 namespace/prefix 파라미터로만 가능
+    """
+    escape = RedisClient.escape_pattern
+    if namespace:
+        namespace = namespace if namespace.endswith(":") else f"{namespace}:"
+        if namespace not in CACHE_NAMESPACES:
+            raise _invalid_clear_filter(
+                f"지원하지 않는 네임스페이스입니다: {namespace} (허용: {', '.join(CACHE_NAMESPACES)})"
+            )
+
+    if chat_id and user_id:
+        raise _invalid_clear_filter("chat_id와 user_id는 함께 지정할 수 없습니다. (같은 키에 두 ID가 함께 있지 않음)")
+
+    if chat_id or user_id:
+        if prefix:
+            raise _invalid_clear_filter("prefix는 chat_id/user_id와 함께 지정할 수 없습니다.")
+        scoped_id, scoped_namespaces = (chat_id, CHAT_SCOPED_NAMESPACES) if chat_id else (user_id, USER_SCOPED_NAMESPACES)
+        if namespace:
+            if namespace not in scoped_namespaces:
+                raise _invalid_clear_filter(
+                    f"{namespace} 네임스페이스에는 {'chat_id' if chat_id else 'user_id'} 조건을 적용할 수 없습니다."
+                )
+            scoped_namespaces = [namespace]
+        keys = [f"{ns}{scoped_id}" for ns in scoped_namespaces]
+        if "chat:" in scoped_namespaces and chat_id:
+            keys.append(f"chat:{chat_id}{CHAT_CACHE_VERSION_SUFFIX}")
+        return keys, []
+
+    if namespace and prefix:
+        # 두 접두사를 모두 만족하는 더 긴 접두사 하나로 결합
+        if prefix.startswith(namespace):
+            return [], [f"{escape(prefix)}*"]
+        if namespace.startswith(prefix):
+            return [], [f"{escape(namespace)}*"]
+        raise _invalid_clear_filter(f"prefix({prefix})가 네임스페이스({namespace})에 속하지 않습니다.")
+    if namespace:
+        return [], [f"{escape(namespace)}*"]
+    if prefix:
+        return [], [f"{escape(prefix)}*"]
+    return [], ["*"]
 
 
 @router.post("/cache/clear")
 def clear_cache(
+    namespace: Optional[str] = Query(None, description="삭제할 네임스페이스 (chat, user_chats, session, generation, cancel, master)"),
+    chat_id: Optional[str] = Query(None, description="삭제할 채팅방 ID (정확히 일치)"),
+    user_id: Optional[str] = Query(None, description="삭제할 사용자 ID (정확히 일치)"),
+    prefix: Optional[str] = Query(None, description="삭제할 키 접두사"),
+    stream: bool = Query(False, description="배치별 진행 상황을 NDJSON으로 스트리밍"),
     redis_client: RedisClient = Depends(get_redis_client)
 ):
-    """모든 캐시 삭제"""
+    """캐시 삭제 (ID 지정 시 해당 키 UNLINK, 접두사는 SCAN + UNLINK 배치, 조건 미지정 시 모든 캐시 삭제)"""
     # Service Layer에서 전파된 HandledException을 그대로 전파
     # Global Exception Handler가 자동으로 처리
     if not redis_client or not redis_client.ping():
@@ -66,13 +171,35 @@ def clear_cache(
             "message": "Redis가 사용할 수 없습니다."
         }
     
-    # 모든 캐시 키 삭제
-    keys = redis_client.redis_client.keys("*")
-    if keys:
-        redis_client.redis_client.delete(*keys)
+    keys, patterns = _build_clear_targets(namespace, chat_id, user_id, prefix)
+
+    def iter_progress():
+        deleted_total = 0
+        if keys:
+            deleted_total += redis_client.unlink_exact(keys)
+            yield {"keys": keys, "deleted": deleted_total, "done": False}
+        for pattern in patterns:
+            deleted = 0
+            for scanned, deleted in redis_client.unlink_keys(pattern):
+                yield {"pattern": pattern, "scanned": scanned, "deleted": deleted, "done": False}
+            deleted_total += deleted
+        yield {"keys": keys, "patterns": patterns, "deleted": deleted_total, "done": True}
+
+    if stream:
+        return StreamingResponse(
+            (json.dumps(progress, ensure_ascii=False) + "\n" for progress in iter_progress()),
+            media_type="application/x-ndjson"
+        )
+
+    result = None
+    for result in iter_progress():
+        pass
+    deleted_total = result["deleted"]
+    if deleted_total:
         return {
             "status": "success",
-            "message": f"{len(keys)}개의 캐시가 삭제되었습니다."
+            "message": f"{deleted_total}개의 캐시가 삭제되었습니다.",
+            "data": {"keys": keys, "patterns": patterns, "deleted": deleted_total}
         }
     else:
         return {
@@ -139,9 +266,10 @@ def get_cache_config(
 @router.get("/cache/keys")
 def get_cache_keys(
     pattern: str = "*",
+    limit: int = Query(1000, ge=1, le=10000, description="최대 조회 키 수"),
     redis_client: RedisClient = Depends(get_redis_client)
 ):
-    """캐시 키 목록 조회"""
+    """캐시 키 목록 조회 (SCAN 기반, 최대 limit개)"""
     if not redis_client or not redis_client.ping():
         return {
             "status": "error",
@@ -149,18 +277,24 @@ def get_cache_keys(
         }
 
     try:
-        # 패턴에 맞는 키들 조회
-        keys = redis_client.redis_client.keys(pattern)
+        # 패턴에 맞는 키들을 SCAN으로 limit개까지 조회
+        keys = list(islice(redis_client.scan_keys(pattern), limit))
 
-        # 키별 정보 수집
-        key_info = []
+        # 키별 TTL/타입 정보를 한 번의 파이프라인으로 수집
+        pipe = redis_client.redis_client.pipeline(transaction=False)
         for key in keys:
+            pipe.ttl(key)
+            pipe.type(key)
+        results = pipe.execute() if keys else []
+
+        key_info = []
+        for index, key in enumerate(keys):
             # 키를 문자열로 변환 (bytes인 경우만 decode)
             key_str = key.decode('utf-8') if isinstance(key, bytes) else str(key)
-            ttl = redis_client.redis_client.ttl(key)
+            ttl = results[index * 2]
 
             # 타입 정보를 문자열로 변환
-            key_type_raw = redis_client.redis_client.type(key)
+            key_type_raw = results[index * 2 + 1]
             key_type = key_type_raw.decode('utf-8') if isinstance(key_type_raw, bytes) else str(key_type_raw)
 
             key_info.append({
@@ -174,6 +308,7 @@ def get_cache_keys(
             "data": {
                 "pattern": pattern,
                 "total_keys": len(keys),
+                "truncated": len(keys) >= limit,
                 "keys": key_info
             }
         }
@@ -261,7 +396,7 @@ def get_chat_cache(
     try:
         # 채팅방 관련 키들 조회
         chat_keys = [
-            f"chat_messages:{chat_id}",
+            f"chat:{chat_id}",
             f"generation:{chat_id}",
             f"cancel:{chat_id}"
         ]
@@ -277,6 +412,10 @@ def get_chat_cache(
                     data = redis_client.redis_client.get(key)
                     if isinstance(data, bytes):
                         data = data.decode('utf-8')
+                elif key_type == "list":
+                    # 채팅 히스토리 캐시 (Redis list, 메시지당 JSON 1개)
+                    data = redis_client.redis_client.lrange(key, 0, -1)
+                    data = [item.decode('utf-8') if isinstance(item, bytes) else item for item in data]
                 else:
                     data = "복잡한 데이터 타입"
                 
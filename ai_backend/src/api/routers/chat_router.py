@@ -4,7 +4,9 @@ import asyncio
 import json
 import logging
 
-from fastapi import APIRouter, Depends, Path
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Path, Query
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
@@ -31,7 +33,7 @@ class GenerateTitleRequest(BaseModel):
     message: str
 
 @router.post("/chat/{chat_id}/message", response_model=AIResponse)
-def send_message(
+async def send_message(
     chat_id: str,
     request: UserMessageRequest,
     llm_chat_service: LLMChatService = Depends(get_llm_chat_service)
@@ -41,7 +43,7 @@ def send_message(
     
     # Service Layer에서 전파된 HandledException을 그대로 전파
     # Global Exception Handler가 자동으로 처리
-    ai_response = llm_chat_service.send_message_simple(
+    ai_response = await llm_chat_service.send_message_simple(
         chat_id, 
         request.message, 
         request.user_id,
@@ -198,9 +200,12 @@ async def send_message_stream(
     
     **파라미터:**
     - `chat_id` (path): 조회할 채팅방의 고유 ID
+    - `limit` (query, optional): 조회할 최신 메시지 수 (기본값: 50, 최대: 200)
+    - `before` (query, optional): 커서 메시지 ID. 지정 시 해당 메시지 이전의 메시지를 조회
+      (이전 응답의 `next_before` 값을 그대로 전달)
     
     **조회 우선순위:**
-    1. Redis 캐시에서 먼저 조회 (캐시 히트 시 즉시 반환)
+    1. Redis 캐시에서 먼저 조회 (캐시 히트 시 즉시 반환, `before` 지정 시 DB 직접 조회)
     2. Redis에 없거나 실패한 경우 데이터베이스에서 조회
     3. 조회된 데이터를 Redis에 캐시 저장 (TTL: 30분)
     
@@ -257,6 +262,7 @@ async def send_message_stream(
     **정렬:**
     - 메시지는 생성 일시(`timestamp`) 기준 오름차순으로 정렬됩니다.
     - 가장 오래된 메시지가 첫 번째, 가장 최근 메시지가 마지막에 위치합니다.
+    - 한 페이지는 최신 `limit`개 메시지이며, `next_before`가 null이면 더 이전 메시지가 없습니다.
 
     **캐싱:**
     - Redis 캐시 사용 시 성능 향상
@@ -269,17 +275,21 @@ async def send_message_stream(
 
     **사용 예시:**
     - `GET /api/v1/chat/chat001/history`
+    - `GET /api/v1/chat/chat001/history?limit=20&before=msg001`
     """,
 )
 def get_conversation_history(
     chat_id: str = Path(..., description="채팅방 고유 ID", example="chat001"),
+    limit: int = Query(50, ge=1, le=200, description="조회할 최신 메시지 수"),
+    before: Optional[str] = Query(None, description="커서 메시지 ID (이 메시지 이전 메시지 조회)"),
     llm_chat_service: LLMChatService = Depends(get_llm_chat_service)
 ):
     """대화 기록을 조회합니다."""
     # Service Layer에서 전파된 HandledException을 그대로 전파
     # Global Exception Handler가 자동으로 처리
-    history = llm_chat_service.get_conversation_history(chat_id)
-    return ConversationHistoryResponse(history=history)
+    history = llm_chat_service.get_conversation_history(chat_id, limit=limit, before=before)
+    next_before = history[0]["message_id"] if len(history) >= limit else None
+    return ConversationHistoryResponse(history=history, next_before=next_before)
 
 @router.post("/chat/{chat_id}/clear", response_model=ConversationClearedResponse)
 def clear_conversation(
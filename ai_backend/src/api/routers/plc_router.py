@@ -225,46 +225,23 @@ def get_plc_list(
             sort_order=sort_order,
         )
 
-        # Master 테이블과 조인하여 계층 구조 정보 조회
-        items = []
-        for plc in plcs:
-            # 스냅샷 ID로 계층 구조 정보 조회
-            snapshot_ids = {
-                "plant_id": plc.plant_id_snapshot,
-                "process_id": plc.process_id_snapshot,
-                "line_id": plc.line_id_snapshot,
-                "equipment_group_id": plc.equipment_group_id_snapshot,
-            }
-            # 스냅샷 ID로 계층 구조 정보 조회
-            hierarchy = None
-            if any(snapshot_ids.values()):
-                hierarchy = plc_crud._get_hierarchy_with_names(snapshot_ids)
-
-            items.append(
-                PLCListItem(
-                    id=plc.id,
-                    plc_id=plc.plc_id,
-                    plc_name=plc.plc_name,
-                    plant=hierarchy.get("plant", {}).get("name")
-                    if hierarchy
-                    else None,
-                    process=hierarchy.get("process", {}).get("name")
-                    if hierarchy
-                    else None,
-                    line=hierarchy.get("line", {}).get("name")
-                    if hierarchy
-                    else None,
-                    equipment_group=hierarchy.get("equipment_group", {}).get(
-                        "name"
-                    )
-                    if hierarchy
-                    else None,
-                    unit=plc.unit,
-                    program_id=plc.program_id,
-                    mapping_user=plc.mapping_user,
-                    mapping_dt=plc.mapping_dt,
-                )
+        # 계층 이름은 get_plcs에서 Master 테이블 조인으로 함께 조회됨
+        items = [
+            PLCListItem(
+                id=plc.id,
+                plc_id=plc.plc_id,
+                plc_name=plc.plc_name,
+                plant=plc.plant_name,
+                process=plc.process_name,
+                line=plc.line_name,
+                equipment_group=plc.equipment_group_name,
+                unit=plc.unit,
+                program_id=plc.program_id,
+                mapping_user=plc.mapping_user,
+                mapping_dt=plc.mapping_dt,
             )
+            for plc in plcs
+        ]
 
         total_pages = (total_count + page_size - 1) // page_size
 
@@ -192,19 +192,18 @@ async def register_program(
 
     # 유효성 검사 결과 구성
     validation_result = None
-    if result.get("is_valid") and result.get("warnings"):
+    cross_reference = result.get("cross_reference") or {}
+    if not result.get("is_valid") or result.get("warnings"):
         validation_result = ProgramValidationResult(
-            is_valid=True,
-            errors=result.get("errors", []),
-            warnings=result.get("warnings", []),
-            checked_files=result.get("checked_files", []),
-        )
-    elif not result.get("is_valid"):
-        validation_result = ProgramValidationResult(
-            is_valid=False,
+            is_valid=bool(result.get("is_valid")),
             errors=result.get("errors", []),
             warnings=result.get("warnings", []),
             checked_files=result.get("checked_files", []),
+            file_count_in_zip=cross_reference.get("file_count_in_zip"),
+            file_count_in_xlsx=cross_reference.get("file_count_in_xlsx"),
+            missing_files=cross_reference.get("missing"),
+            extra_files=cross_reference.get("extra"),
+            ambiguous_files=cross_reference.get("ambiguous"),
         )
 
     return RegisterProgramResponse(
@@ -741,22 +740,19 @@ async def delete_programs(
                 detail="삭제할 프로그램 ID가 필요합니다.",
             )
 
-        results = []
+        # 권한 확인 후 한 번에 일괄 삭제 (S3/Milvus/관련 테이블 배치 처리)
+        deletion = await program_service.delete_programs(
+            program_ids=program_ids, user_id=user_id
+        )
+        results = deletion["results"]
         errors = []
-
-        for program_id in program_ids:
-            try:
-                result = await program_service.delete_program(
-                    program_id=program_id, user_id=user_id
-                )
-                results.append(result)
-            except Exception as e:
-                logger.error(
-                    "프로그램 삭제 실패: program_id=%s, error=%s",
-                    program_id,
-                    str(e),
-                )
-                errors.append({"program_id": program_id, "error": str(e)})
+        for error in deletion["errors"]:
+            logger.error(
+                "프로그램 삭제 실패: program_id=%s, error=%s",
+                error["program_id"],
+                error["error"],
+            )
+            errors.append({"program_id": error["program_id"], "error": error["error"]})
 
         return {
             "message": f"{len(results)}개의 프로그램이 삭제되었습니다.",
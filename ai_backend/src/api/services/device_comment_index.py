@@ -0,0 +1,182 @@
+# _*_ coding: utf-8 _*_
+"""Compact memory-mapped device comment index for ladder preprocessing.
+
+전처리 프로세스 풀(spawn)에서도 import되므로 모듈 수준에서는 표준 라이브러리만 import합니다.
+
+파일 구조 (little-endian):
+    header        : magic(4s) + version(H) + entry_count(I)
+    key_offsets   : uint32 × (entry_count + 1)   key_blob 내 시작 위치
+    value_offsets : uint32 × (entry_count + 1)   value_blob 내 시작 위치
+    key_blob      : "파일명\\x00디바이스명" UTF-8, 바이트 순 정렬
+    value_blob    : 설명 UTF-8 (key와 같은 순서)
+"""
+import mmap
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, Optional, Tuple
+
+# 파일명 ↔ 디바이스명 구분자 (정렬 시 같은 파일의 디바이스가 연속으로 배치됨)
+KEY_SEPARATOR = b"\x00"
+
+
+def _little_endian_offsets(values) -> array:
+    offsets = array("I", values)
+    if sys.byteorder != "little":
+        offsets.byteswap()
+    return offsets
+
+
+class DeviceCommentIndex:
+    """디바이스 코멘트 조회 인덱스 (프로그램당 1회 생성, mmap으로 열어 조회)
+
+    - 정렬된 key 배열 + 문자열 blob 구조라 파일 전체를 파싱하지 않고 바로 조회
+    - mmap을 사용하므로 여러 워커 프로세스가 같은 페이지 캐시를 공유 (프로세스별 DataFrame 불필요)
+    - 조회는 이진 탐색 (O(log n))
+    """
+
+    MAGIC = b"DCIX"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHI")
+    FILENAME = "device_comment.idx"
+
+    def __init__(self, path: str):
+        self.path = str(path)
+        self._file = open(self.path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count = self.HEADER.unpack_from(self._mm, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError(f"디바이스 코멘트 인덱스 형식이 아닙니다: {self.path}")
+
+        self._count = count
+        offsets_size = (count + 1) * 4
+        key_start = self.HEADER.size
+        value_start = key_start + offsets_size
+
+        # offset 배열은 복사하지 않고 mmap 위의 uint32 view로 사용 (big-endian 환경만 복사 후 변환)
+        self._view = memoryview(self._mm)
+        self._key_offsets = self._view[key_start:value_start].cast("I")
+        self._value_offsets = self._view[value_start:value_start + offsets_size].cast("I")
+        if sys.byteorder != "little":
+            key_view, value_view = self._key_offsets, self._value_offsets
+            self._key_offsets = _little_endian_offsets(key_view)
+            self._value_offsets = _little_endian_offsets(value_view)
+            key_view.release()
+            value_view.release()
+        self._key_base = value_start + offsets_size
+        self._value_base = self._key_base + self._key_offsets[count]
+
+    @classmethod
+    def build(cls, entries: Iterable[Tuple[str, str, str]], path: str) -> int:
+        """
+        (파일명, 디바이스명, 설명) 목록으로 인덱스 파일 생성
+
+        같은 (파일명, 디바이스명)이 여러 번 나오면 마지막 설명을 사용합니다.
+
+        Returns:
+            int: 저장된 항목 수
+        """
+        merged: Dict[bytes, bytes] = {}
+        for file_name, device, comment in entries:
+            if not device:
+                continue
+            key = file_name.encode("utf-8") + KEY_SEPARATOR + device.encode("utf-8")
+            merged[key] = (comment or "").encode("utf-8")
+
+        keys = sorted(merged)
+        key_offsets = [0]
+        value_offsets = [0]
+        for key in keys:
+            key_offsets.append(key_offsets[-1] + len(key))
+            value_offsets.append(value_offsets[-1] + len(merged[key]))
+
+        with open(path, "wb") as output:
+            output.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, len(keys)))
+            output.write(_little_endian_offsets(key_offsets).tobytes())
+            output.write(_little_endian_offsets(value_offsets).tobytes())
+            for key in keys:
+                output.write(key)
+            for key in keys:
+                output.write(merged[key])
+
+        return len(keys)
+
+    @classmethod
+    def build_from_dataframe(cls, df, path: str) -> int:
+        """디바이스 코멘트 CSV DataFrame(파일명, 디바이스명, 설명)으로 인덱스 파일 생성"""
+        from src.api.services.program_preprocessor import lookup_key
+        from src.api.services.program_validator import ProgramValidator
+
+        columns = ProgramValidator.REQUIRED_CSV_COLUMNS
+        if df is None or not all(column in df.columns for column in columns):
+            return cls.build([], path)
+
+        frame = df[columns].fillna("").astype(str)
+        return cls.build(
+            (
+                (lookup_key(file_name), device.strip(), comment.strip())
+                for file_name, device, comment in frame.itertuples(index=False, name=None)
+            ),
+            path,
+        )
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _key(self, index: int) -> bytes:
+        start = self._key_base + self._key_offsets[index]
+        return self._mm[start:self._key_base + self._key_offsets[index + 1]]
+
+    def _value(self, index: int) -> str:
+        start = self._value_base + self._value_offsets[index]
+        end = self._value_base + self._value_offsets[index + 1]
+        return self._mm[start:end].decode("utf-8")
+
+    def _lower_bound(self, target: bytes, low: int = 0, high: Optional[int] = None) -> int:
+        high = self._count if high is None else high
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def get(self, file_name: str, device: str) -> Optional[str]:
+        """(파일명, 디바이스명) 설명 조회"""
+        target = file_name.encode("utf-8") + KEY_SEPARATOR + device.encode("utf-8")
+        index = self._lower_bound(target)
+        if index < self._count and self._key(index) == target:
+            return self._value(index)
+        return None
+
+    def file_comments(self, file_name: str) -> Dict[str, str]:
+        """파일 1개의 {디바이스명: 설명} (정렬상 연속 구간만 읽음)"""
+        prefix = file_name.encode("utf-8") + KEY_SEPARATOR
+        index = self._lower_bound(prefix)
+        comments = {}
+        while index < self._count:
+            key = self._key(index)
+            if not key.startswith(prefix):
+                break
+            comments[key[len(prefix):].decode("utf-8")] = self._value(index)
+            index += 1
+        return comments
+
+    def close(self):
+        """mmap 및 파일 핸들 해제"""
+        for attribute in ("_key_offsets", "_value_offsets", "_view"):
+            view = getattr(self, attribute, None)
+            if isinstance(view, memoryview):
+                view.release()
+        self._mm.close()
+        self._file.close()
+
+    def __getstate__(self):
+        # 프로세스 간에는 경로만 전달하고 각 프로세스에서 다시 mmap
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"])
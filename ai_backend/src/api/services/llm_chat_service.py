@@ -6,12 +6,19 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from zoneinfo import ZoneInfo
 
-import tiktoken
 from openai import AsyncOpenAI
 from sqlalchemy.orm import Session
-from src.api.services.llm_provider_factory import BaseLLMProvider, LLMProviderFactory
+from src.api.services.llm_provider_factory import (
+    BaseLLMProvider,
+    LLMProviderFactory,
+    LLMRequestContext,
+    get_tokenizer,
+)
+from src.cache.cancellation import get_cancellation_registry
+from src.cache.redis_client import CHAT_CACHE_MAX_MESSAGES
 from src.database.base import Database
 from src.database.crud.chat_crud import ChatCRUD
+from src.database.crud.chat_write_buffer import get_chat_write_buffer
 from src.database.crud.user_crud import UserCRUD
 from src.database.models.chat_models import ChatMessage
 from src.types.response.exceptions import HandledException
@@ -29,10 +36,9 @@ class LLMChatService:
         if db is None:
             raise HandledException(ResponseCode.DATABASE_CONNECTION_ERROR, msg="Database session is required")
         
-        # LLM 제공자 팩토리를 사용하여 제공자 생성
+        # 프로세스 공유 LLM 제공자 사용 (HTTP 연결 풀 재사용)
         try:
-            self.llm_provider = LLMProviderFactory.create_provider()
-            logger.info(f"LLM provider initialized: {type(self.llm_provider).__name__}")
+            self.llm_provider = LLMProviderFactory.get_provider()
         except Exception as e:
             logger.error(f"Failed to initialize LLM provider: {e}")
             raise HandledException(ResponseCode.LLM_CONFIG_ERROR, e=e)
@@ -42,31 +48,23 @@ class LLMChatService:
         self.chat_crud = ChatCRUD(db)  # Repository 인스턴스 생성
         self.user_crud = UserCRUD(db)  # User Repository 인스턴스 생성
         
-        # LLM 제공자 재생성 (chat_crud, user_crud 전달)
-        try:
-            self.llm_provider = LLMProviderFactory.create_provider(chat_crud=self.chat_crud, user_crud=self.user_crud)
-            logger.info(f"LLM provider re-initialized with chat_crud, user_crud: {type(self.llm_provider).__name__}")
-        except Exception as e:
-            logger.error(f"Failed to re-initialize LLM provider: {e}")
-            # 기존 provider 사용 (ExternalAPIProvider가 아닌 경우)
+        # 요청 단위 LLM 컨텍스트 (DB 접근, 노드 데이터 수집)
+        self.llm_context = LLMRequestContext(chat_crud=self.chat_crud, user_crud=self.user_crud)
+        
+        # 취소 상태 관리 (프로세스 단위 이벤트 레지스트리)
+        self.cancellation_registry = get_cancellation_registry()
         
-        # 취소 상태 관리
-        self.is_cancelled = {}
+        # 스트리밍 부분 응답 write-behind 버퍼 (프로세스 단위)
+        self.write_buffer = get_chat_write_buffer()
         
         # 레디스 사용 여부 결정 (로컬: DB만, 운영: 레디스+DB)
         self.use_redis = self._should_use_redis()
         logger.info(f"Cache mode: {'Redis + DB' if self.use_redis else 'DB only'}")
         
-        # 토큰 관리 설정
-        try:
-            self.tokenizer = tiktoken.encoding_for_model(self.llm_provider.model)
-            self.max_tokens = 4000  # 안전한 토큰 제한
-            self.max_history_tokens = 3000  # 히스토리에 사용할 최대 토큰
-        except Exception as e:
-            logger.warning(f"Failed to initialize tokenizer: {e}")
-            self.tokenizer = None
-            self.max_tokens = 4000
-            self.max_history_tokens = 3000
+        # 토큰 관리 설정 (모델별 tokenizer는 프로세스 단위로 캐시)
+        self.tokenizer = get_tokenizer(self.llm_provider.model)
+        self.max_tokens = 4000  # 안전한 토큰 제한
+        self.max_history_tokens = 3000  # 히스토리에 사용할 최대 토큰
     
     def _should_use_redis(self) -> bool:
         """레디스 사용 여부 결정 (로컬: false, 운영: true)"""
@@ -103,57 +101,104 @@ class LLMChatService:
             logger.warning(f"Token counting failed: {e}")
             return len(text) // 4
     
+    def _message_tokens(self, message: Dict) -> int:
+        """메시지 토큰 수 (저장된 값 우선, 없으면 계산 - 이전 메시지 호환)"""
+        token_count = message.get("token_count")
+        if token_count is not None:
+            return token_count
+        return self._count_tokens(message["content"])
+    
     def _truncate_messages_by_tokens(self, messages: List[Dict]) -> List[Dict]:
-        """토큰 수를 기준으로 메시지 개수를 제한"""
-        if not self.tokenizer:
-            # 토큰 계산이 불가능한 경우 메시지 개수로 제한
-            return messages[-20:]
-        
+        """저장된 토큰 수를 기준으로 메시지 개수를 제한 (최신 메시지부터 1회 역순 순회)"""
         total_tokens = 0
-        truncated_messages = []
+        selected_messages = []
         
         # 시스템 프롬프트는 항상 포함
         system_prompt = messages[0] if messages and messages[0].get("role") == "system" else None
         if system_prompt:
-            total_tokens += self._count_tokens(system_prompt["content"])
-            truncated_messages.append(system_prompt)
+            total_tokens += self._message_tokens(system_prompt)
         
         # 나머지 메시지를 역순으로 확인 (최신 메시지부터)
         remaining_messages = messages[1:] if system_prompt else messages
         for message in reversed(remaining_messages):
-            message_tokens = self._count_tokens(message["content"])
+            message_tokens = self._message_tokens(message)
             if total_tokens + message_tokens > self.max_history_tokens:
                 break
             total_tokens += message_tokens
-            truncated_messages.insert(1 if system_prompt else 0, message)
+            selected_messages.append({"role": message["role"], "content": message["content"]})
         
-        logger.debug(f"Truncated messages: {len(truncated_messages)} messages, ~{total_tokens} tokens")
-        return truncated_messages
-    
-    def _get_messages_for_openai(self, chat_id: str) -> List[Dict]:
-        """메시지를 가져와서 OpenAI 형식으로 변환 (레디스 우선)"""
-        messages = []
+        # 역순으로 수집했으므로 한 번만 뒤집어 시간순으로 복원
+        selected_messages.reverse()
+        if system_prompt:
+            selected_messages.insert(0, {"role": system_prompt["role"], "content": system_prompt["content"]})
         
-        # 레디스 우선으로 대화 기록 조회
+        logger.debug(f"Truncated messages: {len(selected_messages)} messages, ~{total_tokens} tokens")
+        return selected_messages
+    
+    def _append_history_cache(self, chat_id: str, message: Optional[ChatMessage] = None, message_id: Optional[str] = None):
+        """대화 기록 캐시(Redis list)에 메시지 추가 - 캐시가 없으면 다음 조회 시 DB에서 재구성"""
+        if not self.use_redis:
+            return
+        try:
+            if message is None and message_id:
+                message = self.chat_crud.get_message(message_id)
+            if message is None:
+                return
+            self.redis_client.append_chat_message(chat_id, self.chat_crud.to_history_dict(message), 1800)  # 30분 TTL
+        except Exception as e:
+            logger.warning(f"Redis cache append failed: {e}")
+    
+    async def _append_history_cache_async(self, chat_id: str, message: Optional[ChatMessage] = None, message_id: Optional[str] = None):
+        """대화 기록 캐시에 메시지 추가 (async 경로용, 비동기 Redis 클라이언트 사용)"""
+        if not self.use_redis:
+            return
+        try:
+            if message is None and message_id:
+                message = self.chat_crud.get_message(message_id)
+            if message is None:
+                return
+            await self._append_history_item_async(chat_id, self.chat_crud.to_history_dict(message))
+        except Exception as e:
+            logger.warning(f"Redis cache append failed: {e}")
+    
+    async def _append_history_item_async(self, chat_id: str, history_item: Dict):
+        """이미 변환된 히스토리 항목을 캐시에 추가 (DB 조회 없음)"""
+        if not self.use_redis:
+            return
+        try:
+            await self.redis_client.aio.append_chat_message(chat_id, history_item, 1800)  # 30분 TTL
+        except Exception as e:
+            logger.warning(f"Redis cache append failed: {e}")
+    
+    async def _get_messages_for_openai(self, chat_id: str) -> List[Dict]:
+        """메시지를 가져와서 OpenAI 형식으로 변환 (레디스 우선, 비동기 Redis 클라이언트 사용)"""
+        cached_history = None
         if self.use_redis:
             try:
-                cached_history = self.redis_client.get_chat_messages(chat_id)
-                if cached_history:
-                    # 캐시된 데이터를 OpenAI 형식으로 변환
-                    for msg in cached_history[-20:]:  # 최근 20개로 증가
-                        # 취소된 메시지는 제외
-                        if msg.get("cancelled", False):
-                            continue
-                        messages.append({
-                            "role": msg.get("role", "user"),
-                            "content": msg.get("content", "")
-                        })
-                    logger.debug(f"Using cached history for chat {chat_id}: {len(messages)} messages")
-                    
-                    # 토큰 기반으로 메시지 제한 적용
-                    return self._truncate_messages_by_tokens(messages)
+                cached_history = await self.redis_client.aio.get_chat_messages(chat_id, 20)
             except Exception as e:
                 logger.warning(f"Redis cache read failed: {e}")
+        return self._build_openai_messages(chat_id, cached_history)
+    
+    def _build_openai_messages(self, chat_id: str, cached_history: Optional[List[Dict]]) -> List[Dict]:
+        """캐시된 대화 기록(없으면 DB)을 OpenAI 형식으로 변환"""
+        messages = []
+        
+        if cached_history:
+            # 캐시된 데이터를 OpenAI 형식으로 변환
+            for msg in cached_history:  # 최근 20개 (LRANGE로 tail만 조회)
+                # 취소된 메시지는 제외
+                if msg.get("cancelled", False):
+                    continue
+                messages.append({
+                    "role": msg.get("role", "user"),
+                    "content": msg.get("content", ""),
+                    "token_count": msg.get("token_count")
+                })
+            logger.debug(f"Using cached history for chat {chat_id}: {len(messages)} messages")
+            
+            # 토큰 기반으로 메시지 제한 적용
+            return self._truncate_messages_by_tokens(messages)
         
         # 레디스에 없거나 실패한 경우 DB에서 조회
         db_messages = self.chat_crud.get_messages(chat_id)
@@ -175,7 +220,8 @@ class LLMChatService:
             
             messages.append({
                 "role": role,
-                "content": msg.message
+                "content": msg.message,
+                "token_count": msg.token_count
             })
         
         logger.debug(f"Using DB history for chat {chat_id}: {len(messages)} messages")
@@ -193,8 +239,17 @@ class LLMChatService:
         except Exception as e:
             raise HandledException(ResponseCode.UNDEFINED_ERROR, e=e)
     
-    def send_message_simple(self, chat_id: str, message: str, user_id: str = "user", plc_id: str = None) -> dict:
-        """사용자 메시지를 처리하고 LLM 응답을 생성 (REST API용)"""
+    def _save_message_simple(self, save, *args, **kwargs) -> Dict:
+        """메시지 저장 후 캐시용 히스토리 항목 반환 (스레드에서 실행되는 동기 DB 작업)"""
+        return self.chat_crud.to_history_dict(save(*args, **kwargs))
+    
+    async def send_message_simple(self, chat_id: str, message: str, user_id: str = "user", plc_id: str = None) -> dict:
+        """사용자 메시지를 처리하고 LLM 응답을 생성 (REST API용)
+        
+        공유 LLM provider의 HTTP 연결 풀은 앱 이벤트 루프에 묶이므로
+        별도 루프(asyncio.run)가 아닌 앱 루프에서 await 하고,
+        동기 DB 작업은 asyncio.to_thread로 실행하여 루프를 막지 않습니다.
+        """
         try:
             # 비즈니스 로직 검증
             if not message or not message.strip():
@@ -204,26 +259,29 @@ class LLMChatService:
                 raise HandledException(ResponseCode.CHAT_SESSION_NOT_FOUND, msg="채팅 ID가 유효하지 않습니다.")
             
             # 채팅 존재 확인 및 초기화
-            self._ensure_chat_exists(chat_id)
+            await asyncio.to_thread(self._ensure_chat_exists, chat_id)
             
             # 사용자 메시지를 DB에 저장
             user_message_id = gen()
-            self.chat_crud.save_user_message(user_message_id, chat_id, user_id, message, plc_id=plc_id)
+            user_history = await asyncio.to_thread(
+                self._save_message_simple, self.chat_crud.save_user_message,
+                user_message_id, chat_id, user_id, message, plc_id=plc_id, token_count=self._count_tokens(message)
+            )
+            await self._append_history_item_async(chat_id, user_history)
             
-            # LLM 응답 생성 (캐시 무효화 없이)
-            ai_response = asyncio.run(self._generate_ai_response(chat_id))
+            # LLM 응답 생성
+            ai_response = await self._generate_ai_response(chat_id)
             
             # AI 응답을 DB에 저장
             ai_message_id = gen()
-            self.chat_crud.save_ai_message(ai_message_id, chat_id, user_id, ai_response, "completed", plc_id=plc_id)
+            ai_history = await asyncio.to_thread(
+                self._save_message_simple, self.chat_crud.save_ai_message,
+                ai_message_id, chat_id, user_id, ai_response, "completed", plc_id=plc_id,
+                token_count=self._count_tokens(ai_response)
+            )
             
-            # 메시지 저장 완료 후 캐시 무효화 (한 번만)
-            if self.use_redis:
-                try:
-                    self.redis_client.delete_chat_messages(chat_id)
-                    logger.debug(f"Invalidated cache for chat {chat_id} after message completion")
-                except Exception as e:
-                    logger.warning(f"Redis cache invalidation failed: {e}")
+            # 메시지 저장 완료 후 캐시에 추가 (RPUSH/LTRIM, 전체 재구성 없음)
+            await self._append_history_item_async(chat_id, ai_history)
             
             # AI 응답 반환
             return {
@@ -242,7 +300,7 @@ class LLMChatService:
                     chat_crud = ChatCRUD(self.db)
                     # AIMessage 객체를 안전하게 문자열로 변환
                     error_msg = self._safe_error_message(e)
-                    chat_crud.update_message_to_error(ai_message_id, error_msg)
+                    await asyncio.to_thread(chat_crud.update_message_to_error, ai_message_id, error_msg)
                 except HandledException:
                     raise  # Repository에서 발생한 HandledException 전파
                 except Exception as db_error:
@@ -267,7 +325,7 @@ class LLMChatService:
             return "Unknown error occurred"
     
     async def _generate_ai_response(self, chat_id: str) -> str:
-        """OpenAI API를 사용하여 AI 응답 생성"""
+        """OpenAI API를 사용하여 AI 응답 생성 (앱 이벤트 루프, 비동기 Redis 클라이언트 사용)"""
         try:
             # 대화 기록을 가져와서 OpenAI 형식으로 변환
             messages = []
@@ -275,23 +333,23 @@ class LLMChatService:
             # 레디스 우선으로 대화 기록 조회
             if self.use_redis:
                 try:
-                    cached_history = self.redis_client.get_chat_messages(chat_id)
+                    cached_history = await self.redis_client.aio.get_chat_messages(chat_id, 10)
                     if cached_history:
                         # 캐시된 데이터 사용
-                        for msg in cached_history[-10:]:  # 최근 10개만
+                        for msg in cached_history:  # 최근 10개만
                             messages.append({
                                 "role": msg.get("role", "user"),
                                 "content": msg.get("content", "")
                             })
                     else:
                         # 캐시에 없으면 DB에서 조회
-                        messages = self._get_messages_for_openai(chat_id)
+                        messages = await asyncio.to_thread(self._build_openai_messages, chat_id, None)
                 except Exception as e:
                     logger.warning(f"Redis cache read failed: {e}")
-                    messages = self._get_messages_for_openai(chat_id)
+                    messages = await asyncio.to_thread(self._build_openai_messages, chat_id, None)
             else:
                 # DB만 사용
-                messages = self._get_messages_for_openai(chat_id)
+                messages = await asyncio.to_thread(self._build_openai_messages, chat_id, None)
             
             # 시스템 프롬프트 추가
             system_prompt = {
@@ -304,18 +362,10 @@ class LLMChatService:
             for i, msg in enumerate(messages):
                 logger.debug(f"  Message {i}: {msg['role']} - {msg['content'][:100]}...")
             
-            # LLM 제공자를 통한 API 호출 (ExternalAPIProvider인 경우 chat_id, user_id 전달)
-            # user_id는 _generate_ai_response에서 지원하지 않으므로 기본값 사용
-            if hasattr(self.llm_provider, 'create_completion'):
-                # create_completion 메서드의 시그니처를 확인하여 chat_id 지원 여부 판단
-                import inspect
-                sig = inspect.signature(self.llm_provider.create_completion)
-                if 'chat_id' in sig.parameters:
-                    response = await self.llm_provider.create_completion(messages, chat_id=chat_id)
-                else:
-                    response = await self.llm_provider.create_completion(messages)
-            else:
-                response = await self.llm_provider.create_completion(messages)
+            # LLM 제공자를 통한 API 호출 (요청 컨텍스트 전달)
+            response = await self.llm_provider.create_completion(
+                messages, chat_id=chat_id, context=self.llm_context
+            )
             
             return response.choices[0].message.content
             
@@ -325,35 +375,43 @@ class LLMChatService:
             raise HandledException(ResponseCode.CHAT_AI_RESPONSE_ERROR, e=e)
     
     
-    def get_conversation_history(self, chat_id: str) -> List[Dict]:
-        """대화 기록 조회 (레디스 우선, 없으면 DB에서)"""
+    def get_conversation_history(self, chat_id: str, limit: int = 50, before: Optional[str] = None) -> List[Dict]:
+        """대화 기록 조회 (최신 limit개, 레디스 우선, 없으면 DB에서 / before 커서는 DB 직접 조회)"""
         try:
             # 비즈니스 로직 검증
             if not chat_id or not chat_id.strip():
                 raise HandledException(ResponseCode.CHAT_SESSION_NOT_FOUND, msg="채팅 ID가 유효하지 않습니다.")
             
-            if self.use_redis:
-                # 레디스에서 먼저 조회
+            # 이전 페이지 조회는 캐시 대상이 아님
+            if before:
+                return self.chat_crud.get_messages_from_db(chat_id, limit=limit, before=before)
+            
+            # 캐시는 최신 CHAT_CACHE_MAX_MESSAGES개만 보관
+            cache_version = None
+            if self.use_redis and limit <= CHAT_CACHE_MAX_MESSAGES:
+                # 레디스에서 먼저 조회 (LRANGE로 tail만 조회)
                 try:
-                    cached_history = self.redis_client.get_chat_messages(chat_id)
+                    cached_history = self.redis_client.get_chat_messages(chat_id, limit)
                     if cached_history:
                         logger.debug(f"Cache hit for chat {chat_id}")
                         return cached_history
+                    # DB 조회 전 버전 (조회 중 append/무효화가 있으면 재구성하지 않음)
+                    cache_version = self.redis_client.get_chat_cache_version(chat_id)
                 except Exception as e:
                     logger.warning(f"Redis cache read failed: {e}")
             
-            # 레디스에 없거나 실패한 경우 DB에서 조회
-            history = self.chat_crud.get_messages_from_db(chat_id)
+            # 레디스에 없거나 실패한 경우 DB에서 조회 (생성 중 메시지는 캐시에서 제외)
+            history, cacheable = self.chat_crud.get_history_for_cache(chat_id, limit=max(limit, CHAT_CACHE_MAX_MESSAGES))
             
-            # 레디스 사용 시 캐시에 저장
-            if self.use_redis and history:
+            # 캐시가 없을 때만 원자적으로 재구성 (이후에는 메시지 단위 append로 유지)
+            if cache_version is not None and cacheable:
                 try:
-                    self.redis_client.set_chat_messages(chat_id, history, 1800)  # 30분 TTL
-                    logger.debug(f"Cached history for chat {chat_id}")
+                    if self.redis_client.set_chat_messages(chat_id, cacheable, 1800, version=cache_version):  # 30분 TTL
+                        logger.debug(f"Cached history for chat {chat_id}")
                 except Exception as e:
                     logger.warning(f"Redis cache write failed: {e}")
             
-            return history
+            return history[-limit:]
         except HandledException:
             raise  # HandledException은 그대로 전파
         except Exception as e:
@@ -368,17 +426,8 @@ class LLMChatService:
             # 레디스 캐시도 삭제
             if self.use_redis:
                 try:
-                    # 채팅방 메시지 캐시 삭제
-                    self.redis_client.delete_chat_messages(chat_id)
-                    
-                    # 생성 상태 캐시 삭제
-                    generation_key = f"generation:{chat_id}"
-                    self.redis_client.redis_client.delete(generation_key)
-                    
-                    # 취소 상태 캐시 삭제
-                    cancel_key = f"cancel:{chat_id}"
-                    self.redis_client.redis_client.delete(cancel_key)
-                    
+                    # 메시지/생성 상태/취소 상태 캐시를 한 번에 삭제
+                    self.redis_client.delete_chat_state(chat_id)
                     logger.debug(f"Cleared all cache for chat {chat_id}")
                 except Exception as e:
                     logger.warning(f"Redis cache clear failed: {e}")
@@ -408,10 +457,12 @@ class LLMChatService:
         
         # 사용자 메시지를 DB에 저장
         user_message_id = gen()
-        self.chat_crud.save_user_message_simple(user_message_id, chat_id, user_id, message, plc_id=plc_id)
+        user_message = self.chat_crud.save_user_message_simple(
+            user_message_id, chat_id, user_id, message, plc_id=plc_id, token_count=self._count_tokens(message)
+        )
         
-        # 스트리밍에서는 캐시 무효화를 하지 않음 (성능 향상)
-        # 대화 완료 후에만 캐시를 업데이트
+        # 캐시에 사용자 메시지 추가 (캐시가 있는 경우에만)
+        self._append_history_cache(chat_id, user_message)
         logger.debug(f"Saved user message for chat {chat_id}")
         
         return user_message_id
@@ -422,6 +473,9 @@ class LLMChatService:
         ai_response_content = ""
         is_cancelled = False
         
+        # 취소 이벤트 등록 (스트림 루프에서는 I/O 없이 이벤트만 확인)
+        cancel_event = self.cancellation_registry.register(chat_id)
+        
         try:
             # 세션 존재 확인 및 초기화
             self._ensure_chat_exists(chat_id)
@@ -429,8 +483,7 @@ class LLMChatService:
             # 생성 시작 표시 (레디스에 저장)
             if self.use_redis:
                 try:
-                    generation_key = f"generation:{chat_id}"
-                    self.redis_client.redis_client.setex(generation_key, 300, "1")  # 5분 TTL
+                    await self.redis_client.aio.start_generation(chat_id, 300)  # 5분 TTL
                 except Exception as e:
                     logger.warning(f"Redis generation start failed: {e}")
             
@@ -443,7 +496,7 @@ class LLMChatService:
             }
             
             # 취소 확인
-            if self.is_cancelled.get(chat_id, False):
+            if cancel_event.is_set():
                 is_cancelled = True
                 yield {
                     'type': 'cancelled',
@@ -453,7 +506,7 @@ class LLMChatService:
                 return
             
             # 대화 기록을 가져와서 OpenAI 형식으로 변환 (레디스 우선)
-            messages = self._get_messages_for_openai(chat_id)
+            messages = await self._get_messages_for_openai(chat_id)
             
             # 시스템 프롬프트 추가
             system_prompt = {
@@ -475,7 +528,7 @@ class LLMChatService:
             }
             
             # 취소 확인
-            if self.is_cancelled.get(chat_id, False):
+            if cancel_event.is_set():
                 is_cancelled = True
                 yield {
                     'type': 'cancelled',
@@ -484,19 +537,10 @@ class LLMChatService:
                 }
                 return
             
-            # LLM 제공자를 통한 스트리밍 API 호출 (ExternalAPIProvider인 경우 chat_id, user_id 전달)
-            if hasattr(self.llm_provider, 'create_completion'):
-                # create_completion 메서드의 시그니처를 확인하여 chat_id, user_id 지원 여부 판단
-                import inspect
-                sig = inspect.signature(self.llm_provider.create_completion)
-                if 'chat_id' in sig.parameters and 'user_id' in sig.parameters:
-                    stream = await self.llm_provider.create_completion(messages, stream=True, chat_id=chat_id, user_id=user_id)
-                elif 'chat_id' in sig.parameters:
-                    stream = await self.llm_provider.create_completion(messages, stream=True, chat_id=chat_id)
-                else:
-                    stream = await self.llm_provider.create_completion(messages, stream=True)
-            else:
-                stream = await self.llm_provider.create_completion(messages, stream=True)
+            # LLM 제공자를 통한 스트리밍 API 호출 (요청 컨텍스트 전달)
+            stream = await self.llm_provider.create_completion(
+                messages, stream=True, chat_id=chat_id, user_id=user_id, context=self.llm_context
+            )
             
             ai_response_content = ""
             ai_message_id = gen()
@@ -505,43 +549,25 @@ class LLMChatService:
             self.chat_crud.save_ai_message_generating(ai_message_id, chat_id, user_id, plc_id=plc_id)
             
             async for chunk in stream:
-                # 취소 확인 (레디스 우선)
-                if self.use_redis:
-                    try:
-                        cancel_key = f"cancel:{chat_id}"
-                        if self.redis_client.redis_client.exists(cancel_key):
-                            is_cancelled = True
-                            logger.info(f"Cancellation detected in stream for session: {chat_id}")
-                            yield {
-                                'type': 'cancelled',
-                                'message': '사용자에 의해 취소되었습니다.',
-                                'timestamp': self.get_current_timestamp()
-                            }
-                            break
-                    except Exception as e:
-                        logger.warning(f"Redis cancel check failed: {e}")
-                
-                # 레디스에 없거나 실패한 경우 DB에서 확인
-                if not is_cancelled:
-                    try:
-                        messages = self.chat_crud.get_messages(chat_id)
-                        if messages and messages[-1].is_cancelled:
-                            is_cancelled = True
-                            logger.info(f"Cancellation detected in stream for session: {chat_id}")
-                            yield {
-                                'type': 'cancelled',
-                                'message': '사용자에 의해 취소되었습니다.',
-                                'timestamp': self.get_current_timestamp()
-                            }
-                            break
-                    except Exception as e:
-                        logger.warning(f"DB cancel check failed: {e}")
+                # 취소 확인 (cancel_generation 또는 Redis pub/sub으로 설정되는 이벤트)
+                if cancel_event.is_set():
+                    is_cancelled = True
+                    logger.info(f"Cancellation detected in stream for session: {chat_id}")
+                    yield {
+                        'type': 'cancelled',
+                        'message': '사용자에 의해 취소되었습니다.',
+                        'timestamp': self.get_current_timestamp()
+                    }
+                    break
                 
                 # Provider별 스트림 청크 처리
                 content = self.llm_provider.process_stream_chunk(chunk)
                 if content is not None:
                     ai_response_content += content
                     
+                    # 부분 응답을 write-behind 버퍼에 등록 (주기적으로 일괄 flush)
+                    self.write_buffer.update(ai_message_id, ai_response_content, len(content.encode("utf-8")))
+                    
                     # 부분 응답 스트림
                     yield {
                         'type': 'ai_response_chunk',
@@ -551,29 +577,30 @@ class LLMChatService:
                         'timestamp': self.get_current_timestamp()
                     }
             
+            # 최종 상태 업데이트 전에 대기 중인 부분 응답 제거
+            if ai_message_id:
+                self.write_buffer.discard(ai_message_id)
+            
             # 취소되지 않은 경우에만 완전한 응답 처리
             if not is_cancelled and ai_response_content:
-                # External API provider인 경우 노드 데이터 저장
-                if hasattr(self.llm_provider, 'get_collected_node_data'):
-                    node_data = self.llm_provider.get_collected_node_data()
-                    if node_data:
-                        # 노드 데이터와 함께 메시지 완료 업데이트
-                        self.chat_crud.update_ai_message_completed(ai_message_id, ai_response_content, node_data)
-                        # 노드 데이터 초기화
-                        self.llm_provider.clear_node_data()
-                    else:
-                        self.chat_crud.update_ai_message_completed(ai_message_id, ai_response_content)
+                # External API provider인 경우 요청 컨텍스트에 수집된 노드 데이터 저장
+                # 토큰 수는 저장 시점에 1회만 계산
+                token_count = self._count_tokens(ai_response_content)
+                node_data = self.llm_context.get_collected_node_data()
+                if node_data:
+                    # 노드 데이터와 함께 메시지 완료 업데이트
+                    self.chat_crud.update_ai_message_completed(
+                        ai_message_id, ai_response_content, node_data, token_count=token_count
+                    )
+                    # 노드 데이터 초기화
+                    self.llm_context.clear_node_data()
                 else:
-                    # 일반 provider인 경우
-                    self.chat_crud.update_ai_message_completed(ai_message_id, ai_response_content)
+                    self.chat_crud.update_ai_message_completed(
+                        ai_message_id, ai_response_content, token_count=token_count
+                    )
                 
-                # 스트리밍 완료 후 캐시 무효화
-                if self.use_redis:
-                    try:
-                        self.redis_client.delete_chat_messages(chat_id)
-                        logger.debug(f"Invalidated cache for chat {chat_id} after streaming completion")
-                    except Exception as e:
-                        logger.warning(f"Redis cache invalidation failed: {e}")
+                # 스트리밍 완료 후 캐시에 AI 메시지 추가
+                await self._append_history_cache_async(chat_id, message_id=ai_message_id)
                 
                 # 완료 표시
                 yield {
@@ -612,6 +639,9 @@ class LLMChatService:
                             is_cancelled=True,
                             plc_id=plc_id
                         )
+                    
+                    # 캐시에 취소된 메시지 추가
+                    await self._append_history_cache_async(chat_id, message_id=ai_message_id)
                             
                 except Exception as e:
                     # DB 저장 실패 시에도 메시지 ID 생성
@@ -632,6 +662,7 @@ class LLMChatService:
         except HandledException as e:
             # HandledException은 스트림으로 전달 (연결 유지)
             if ai_message_id:
+                self.write_buffer.discard(ai_message_id)
                 try:
                     self.chat_crud.update_message_status(ai_message_id, "error")
                     # 에러 메시지로 업데이트
@@ -639,6 +670,7 @@ class LLMChatService:
                     if message:
                         message.message = f"❌ 오류가 발생했습니다: {e.message}"
                         self.db.commit()
+                        await self._append_history_cache_async(chat_id, message)
                 except Exception as db_error:
                     logger.error(f"Failed to update message status to error: {db_error}")
             
@@ -655,6 +687,7 @@ class LLMChatService:
         except Exception as e:
             # 에러 발생 시 메시지 상태를 error로 업데이트
             if ai_message_id:
+                self.write_buffer.discard(ai_message_id)
                 try:
                     self.chat_crud.update_message_status(ai_message_id, "error")
                     # 에러 메시지로 업데이트
@@ -662,6 +695,7 @@ class LLMChatService:
                     if message:
                         message.message = f"❌ 오류가 발생했습니다: {str(e)}"
                         self.db.commit()
+                        await self._append_history_cache_async(chat_id, message)
                 except Exception as db_error:
                     logger.error(f"Failed to update message status to error: {db_error}")
             
@@ -677,11 +711,17 @@ class LLMChatService:
             )
             yield error_response.dict()
         finally:
+            # 취소 이벤트 해제
+            self.cancellation_registry.unregister(chat_id, cancel_event)
+            
+            # 클라이언트 연결 종료 등으로 중단된 경우에도 버퍼 정리
+            if ai_message_id:
+                self.write_buffer.discard(ai_message_id)
+            
             # 생성 완료 - 레디스에서 생성 상태 제거
             if self.use_redis:
                 try:
-                    generation_key = f"generation:{chat_id}"
-                    self.redis_client.redis_client.delete(generation_key)
+                    await self.redis_client.aio.finish_generation(chat_id)
                 except Exception as e:
                     logger.warning(f"Redis generation cleanup failed: {e}")
     
@@ -695,18 +735,13 @@ class LLMChatService:
             # 세션 존재 확인 및 초기화
             self._ensure_chat_exists(chat_id)
             
-            # 레디스에서 생성 상태 확인
+            # 진행 중인 스트림에 취소 신호 전달 (로컬 이벤트 + Redis pub/sub)
+            await self.cancellation_registry.cancel(chat_id)
+            
+            # 레디스에서 생성 상태 확인 및 취소 표시 (파이프라인 1회 왕복)
             if self.use_redis:
                 try:
-                    generation_key = f"generation:{chat_id}"
-                    if self.redis_client.redis_client.exists(generation_key):
-                        # 레디스에서 생성 상태 제거
-                        self.redis_client.redis_client.delete(generation_key)
-                        
-                        # 취소 상태를 레디스에 저장
-                        cancel_key = f"cancel:{chat_id}"
-                        self.redis_client.redis_client.setex(cancel_key, 60, "1")  # 1분 TTL
-                        
+                    if await self.redis_client.aio.mark_cancelled(chat_id, 60):  # 1분 TTL
                         logger.info(f"Generation cancelled for session: {chat_id}")
                         return True
                 except Exception as e:
@@ -722,6 +757,13 @@ class LLMChatService:
                 messages[-1].is_cancelled = True
                 messages[-1].message = "⚠️ 응답이 취소되었습니다."
                 self.db.commit()
+                
+                # 캐시에 없던 메시지가 변경되었으므로 캐시를 다시 구성하도록 삭제
+                if self.use_redis:
+                    try:
+                        await self.redis_client.aio.delete_chat_messages(chat_id)
+                    except Exception as e:
+                        logger.warning(f"Redis cache invalidation failed: {e}")
                 logger.info(f"Generation cancelled for session: {chat_id}")
                 return True
             else:
@@ -751,7 +793,7 @@ class LLMChatService:
                 )
             
             # 취소 메시지 저장
-            self.chat_crud.create_message(
+            cancelled_message = self.chat_crud.create_message(
                 message_id=ai_message_id,
                 chat_id=chat_id,
                 user_id=user_id,
@@ -761,6 +803,7 @@ class LLMChatService:
                 is_cancelled=True,
                 plc_id=None
             )
+            self._append_history_cache(chat_id, cancelled_message)
             
             # DB에 이미 저장되었으므로 메모리 저장 불필요
             
@@ -775,8 +818,7 @@ class LLMChatService:
         if self.use_redis:
             try:
                 # 레디스에서 생성 상태 확인 (간단한 키-값 체크)
-                generation_key = f"generation:{chat_id}"
-                return self.redis_client.redis_client.exists(generation_key)
+                return self.redis_client.is_generating(chat_id)
             except Exception as e:
                 logger.warning(f"Redis generation check failed: {e}")
         
@@ -820,17 +862,8 @@ class LLMChatService:
             # DB 삭제 성공 시 Redis 캐시도 삭제
             if success and self.use_redis:
                 try:
-                    # 채팅방 관련 모든 캐시 삭제
-                    self.redis_client.delete_chat_messages(chat_id)
-                    
-                    # 생성 상태 캐시 삭제
-                    generation_key = f"generation:{chat_id}"
-                    self.redis_client.redis_client.delete(generation_key)
-                    
-                    # 취소 상태 캐시 삭제
-                    cancel_key = f"cancel:{chat_id}"
-                    self.redis_client.redis_client.delete(cancel_key)
-                    
+                    # 채팅방 관련 모든 캐시(메시지/생성/취소 상태)를 한 번에 삭제
+                    self.redis_client.delete_chat_state(chat_id)
                     logger.debug(f"Cleared all cache for deleted chat {chat_id}")
                 except Exception as e:
                     logger.warning(f"Redis cache cleanup failed for chat {chat_id}: {e}")
@@ -3,9 +3,13 @@
 import json
 import logging
 import os
+import threading
+from functools import lru_cache
 from typing import Any, AsyncGenerator, Dict, Optional
 
 import aiohttp
+import httpx
+import tiktoken
 from langserve import RemoteRunnable
 from openai import AsyncOpenAI
 from src.types.response.exceptions import HandledException
@@ -14,6 +18,48 @@ from src.types.response.response_code import ResponseCode
 logger = logging.getLogger(__name__)
 
 
+def _create_http_client() -> httpx.AsyncClient:
+    """Create long-lived HTTP client with tuned keep-alive pool for LLM APIs"""
+    limits = httpx.Limits(
+        max_connections=int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", "100")),
+        max_keepalive_connections=int(os.getenv("LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")),
+        keepalive_expiry=float(os.getenv("LLM_HTTP_KEEPALIVE_EXPIRY", "60")),
+    )
+    timeout = httpx.Timeout(float(os.getenv("LLM_HTTP_TIMEOUT", "120")), connect=10.0)
+    return httpx.AsyncClient(limits=limits, timeout=timeout)
+
+
+@lru_cache(maxsize=None)
+def get_tokenizer(model: str):
+    """Return cached tiktoken encoder for model (None if unsupported)"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception as e:
+        logger.warning(f"Failed to initialize tokenizer for model {model}: {e}")
+        return None
+
+
+class LLMRequestContext:
+    """Request-scoped state for LLM providers
+    
+    Providers are process-wide singletons, so anything tied to a single
+    request (DB sessions, collected node data) lives here instead.
+    """
+    
+    def __init__(self, chat_crud=None, user_crud=None):
+        self.chat_crud = chat_crud  # DB 접근을 위한 ChatCRUD 인스턴스
+        self.user_crud = user_crud  # DB 접근을 위한 UserCRUD 인스턴스
+        self.node_data = {}  # 노드 데이터를 요청 단위로 수집
+    
+    def get_collected_node_data(self):
+        """수집된 노드 데이터 반환"""
+        return self.node_data.copy()
+    
+    def clear_node_data(self):
+        """노드 데이터 초기화"""
+        self.node_data.clear()
+
+
 class BaseLLMProvider:
     """Base class for LLM providers"""
     
@@ -22,7 +68,7 @@ class BaseLLMProvider:
         self.max_tokens = max_tokens
         self.temperature = temperature
     
-    async def create_completion(self, messages, stream=False):
+    async def create_completion(self, messages, stream=False, chat_id=None, user_id=None, context: Optional[LLMRequestContext] = None):
         """Create completion from LLM provider"""
         raise NotImplementedError("Subclasses must implement create_completion")
     
@@ -44,10 +90,10 @@ class OpenAIProvider(BaseLLMProvider):
         if not api_key:
             raise HandledException(ResponseCode.LLM_CONFIG_ERROR, msg="OpenAI API key is required")
         
-        self.client = AsyncOpenAI(api_key=api_key, base_url=base_url)
+        self.client = AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=_create_http_client())
         logger.info("OpenAI provider initialized with model: " + str(model))
     
-    async def create_completion(self, messages: list, stream: bool = False):
+    async def create_completion(self, messages: list, stream: bool = False, chat_id: str = None, user_id: str = None, context: Optional[LLMRequestContext] = None):
         """Create completion using OpenAI API"""
         try:
             response = await self.client.chat.completions.create(
@@ -109,11 +155,12 @@ class AzureOpenAIProvider(BaseLLMProvider):
         self.client = AsyncOpenAI(
             api_key=api_key,
             base_url=endpoint.rstrip('/') + "/openai/deployments/" + deployment_name,
-            default_query={"api-version": api_version}
+            default_query={"api-version": api_version},
+            http_client=_create_http_client()
         )
         logger.info("Azure OpenAI provider initialized with deployment: " + str(deployment_name))
     
-    async def create_completion(self, messages: list, stream: bool = False):
+    async def create_completion(self, messages: list, stream: bool = False, chat_id: str = None, user_id: str = None, context: Optional[LLMRequestContext] = None):
         """Create completion using Azure OpenAI API"""
         try:
             response = await self.client.chat.completions.create(
@@ -163,7 +210,7 @@ class ExternalAPIProvider(BaseLLMProvider):
     """External API Agent provider implementation using LangServe RemoteRunnable"""
     
     def __init__(self, api_url: str, authorization_header: str, 
-                 max_tokens: int = 1000, temperature: float = 0.7, chat_crud=None, user_crud=None):
+                 max_tokens: int = 1000, temperature: float = 0.7):
         super().__init__("external_api", max_tokens, temperature)
         
         if not api_url:
@@ -173,9 +220,6 @@ class ExternalAPIProvider(BaseLLMProvider):
         
         self.api_url = api_url.rstrip('/')
         self.authorization_header = authorization_header
-        self.node_data = {}  # 노드 데이터를 메모리에 수집
-        self.chat_crud = chat_crud  # DB 접근을 위한 ChatCRUD 인스턴스
-        self.user_crud = user_crud  # DB 접근을 위한 UserCRUD 인스턴스
         
         # LangServe RemoteRunnable 초기화
         headers = {
@@ -189,8 +233,11 @@ class ExternalAPIProvider(BaseLLMProvider):
         
         logger.info("External API provider initialized with URL: " + str(self.api_url))
     
-    async def create_completion(self, messages: list, stream: bool = False, chat_id: str = None, user_id: str = None):
+    async def create_completion(self, messages: list, stream: bool = False, chat_id: str = None, user_id: str = None, context: Optional[LLMRequestContext] = None):
         """Create completion using External API via LangServe RemoteRunnable"""
+        if context is None:
+            context = LLMRequestContext()
+        
         try:
             # OpenAI 형식의 messages를 LangServe 형식으로 변환
             langserve_messages = []
@@ -220,9 +267,9 @@ class ExternalAPIProvider(BaseLLMProvider):
                 "auth_level": "admin"  # 기본 auth_level
             }
             
-            if chat_id and self.chat_crud:
+            if chat_id and context.chat_crud:
                 try:
-                    reviewer_count = self.chat_crud.get_reviewer_count(chat_id)
+                    reviewer_count = context.chat_crud.get_reviewer_count(chat_id)
                     additional_kwargs["reviewer_count"] = reviewer_count
                     logger.debug(f"Added reviewer_count to additional_kwargs: {reviewer_count}")
                 except Exception as e:
@@ -230,9 +277,9 @@ class ExternalAPIProvider(BaseLLMProvider):
                     additional_kwargs["reviewer_count"] = 0  # 기본값
             
             # user_id로 user 정보 조회하여 site_list 추가
-            if user_id and self.user_crud:
+            if user_id and context.user_crud:
                 try:
-                    user = self.user_crud.get_user(user_id)
+                    user = context.user_crud.get_user(user_id)
                     if user and user.site_list:
                         additional_kwargs["site_list"] = user.site_list
                         logger.debug(f"Added site_list to additional_kwargs for user {user_id}: {user.site_list}")
@@ -246,7 +293,7 @@ class ExternalAPIProvider(BaseLLMProvider):
             
             if stream:
                 # 스트리밍의 경우 async generator를 직접 반환
-                return self._create_streaming_completion(request_body)
+                return self._create_streaming_completion(request_body, context)
             else:
                 return await self._create_non_streaming_completion(request_body)
                 
@@ -254,7 +301,7 @@ class ExternalAPIProvider(BaseLLMProvider):
             logger.error("External API error: " + str(e))
             raise HandledException(ResponseCode.CHAT_AI_RESPONSE_ERROR, e=e)
     
-    async def _create_streaming_completion(self, request_body: dict):
+    async def _create_streaming_completion(self, request_body: dict, context: LLMRequestContext):
         """Create streaming completion using LangServe RemoteRunnable"""
         try:
             # LangServe RemoteRunnable의 stream 메서드 사용
@@ -262,7 +309,7 @@ class ExternalAPIProvider(BaseLLMProvider):
                 logger.debug(f"Received chunk: {chunk}")
                 
                 # LangServe 스타일의 청크 처리
-                content = self._extract_content_from_chunk(chunk)
+                content = self._extract_content_from_chunk(chunk, context)
                 if content is not None:
                     yield self._create_chunk_object({'content': content})
                     
@@ -271,7 +318,7 @@ class ExternalAPIProvider(BaseLLMProvider):
             raise HandledException(ResponseCode.CHAT_AI_RESPONSE_ERROR, e=e)
     
     
-    def _extract_content_from_chunk(self, chunk_data: dict):
+    def _extract_content_from_chunk(self, chunk_data: dict, context: LLMRequestContext):
         """청크 데이터에서 스트리밍할 컨텐츠 추출"""
         # LangServe 스타일의 청크 처리
         if chunk_data.get("final_result"):
@@ -283,7 +330,7 @@ class ExternalAPIProvider(BaseLLMProvider):
         elif chunk_data.get("updates"):
             # 노드 업데이트는 스트리밍하지 않지만 데이터 저장
             logger.debug(f"Node updates: {chunk_data}")
-            self._store_node_data(chunk_data)
+            self._store_node_data(chunk_data, context)
             return None
         elif chunk_data.get("progress"):
             # 진행상황은 스트리밍하지 않음
@@ -298,8 +345,8 @@ class ExternalAPIProvider(BaseLLMProvider):
         return None
     
     
-    def _store_node_data(self, chunk_data: dict):
-        """노드 결과 데이터를 메모리에 수집 (LangServe 스타일)"""
+    def _store_node_data(self, chunk_data: dict, context: LLMRequestContext):
+        """노드 결과 데이터를 요청 컨텍스트에 수집 (LangServe 스타일)"""
         # 노드 기본 정보 추출
         node_name = chunk_data.get('node_name', 'unknown')
         node_type = chunk_data.get('node_type', 'unknown')
@@ -317,18 +364,10 @@ class ExternalAPIProvider(BaseLLMProvider):
             if key not in ['node_name', 'node_type', 'updates']:
                 node_data[key] = value
         
-        # 노드 데이터를 메모리에 저장
-        self.node_data[node_name] = node_data
+        # 노드 데이터를 요청 컨텍스트에 저장
+        context.node_data[node_name] = node_data
         logger.debug(f"Node '{node_name}' ({node_type}) data collected: {node_data}")
     
-    def get_collected_node_data(self):
-        """수집된 노드 데이터 반환"""
-        return self.node_data.copy()
-    
-    def clear_node_data(self):
-        """노드 데이터 초기화"""
-        self.node_data.clear()
-    
     
     async def _create_non_streaming_completion(self, request_body: dict):
         """Create non-streaming completion using LangServe RemoteRunnable"""
@@ -367,14 +406,8 @@ class ExternalAPIProvider(BaseLLMProvider):
     async def create_title_completion(self, message: str):
         """Create title completion using OpenAIProvider (External API는 타이틀만 OpenAI 사용)"""
         try:
-            # OpenAIProvider를 직접 생성해서 타이틀 생성 (설정에서 값 가져오기)
-            from src.config.simple_settings import settings
-            
-            openai_provider = OpenAIProvider(
-                api_key=settings.openai_api_key,
-                base_url=settings.openai_base_url,
-                model=settings.openai_model,
-            )
+            # 공유 OpenAIProvider로 타이틀 생성 (연결 풀 재사용)
+            openai_provider = LLMProviderFactory.get_provider("openai")
             
             # OpenAIProvider의 create_title_completion 사용
             return await openai_provider.create_title_completion(message)
@@ -395,8 +428,29 @@ class ExternalAPIProvider(BaseLLMProvider):
 class LLMProviderFactory:
     """Factory class for creating LLM providers"""
     
+    # 프로세스 단위 provider 레지스트리 (provider_type -> provider)
+    _providers: Dict[str, BaseLLMProvider] = {}
+    _lock = threading.Lock()
+    
+    @staticmethod
+    def get_provider(provider_type: str = None) -> BaseLLMProvider:
+        """Return shared LLM provider (created once per process)"""
+        if not provider_type:
+            provider_type = os.getenv("LLM_PROVIDER", "openai").lower()
+        
+        provider = LLMProviderFactory._providers.get(provider_type)
+        if provider is not None:
+            return provider
+        
+        with LLMProviderFactory._lock:
+            provider = LLMProviderFactory._providers.get(provider_type)
+            if provider is None:
+                provider = LLMProviderFactory.create_provider(provider_type)
+                LLMProviderFactory._providers[provider_type] = provider
+            return provider
+    
     @staticmethod
-    def create_provider(provider_type: str = None, chat_crud=None, user_crud=None) -> BaseLLMProvider:
+    def create_provider(provider_type: str = None) -> BaseLLMProvider:
         """Create LLM provider based on configuration"""
         
         # 환경 변수에서 제공자 타입 가져오기
@@ -410,7 +464,7 @@ class LLMProviderFactory:
         elif provider_type == "azure_openai":
             return LLMProviderFactory._create_azure_openai_provider()
         elif provider_type == "external_api":
-            return LLMProviderFactory._create_external_api_provider(chat_crud, user_crud)
+            return LLMProviderFactory._create_external_api_provider()
         else:
             raise HandledException(
                 ResponseCode.LLM_CONFIG_ERROR, 
@@ -454,7 +508,7 @@ class LLMProviderFactory:
         )
     
     @staticmethod
-    def _create_external_api_provider(chat_crud=None, user_crud=None) -> ExternalAPIProvider:
+    def _create_external_api_provider() -> ExternalAPIProvider:
         """Create External API provider"""
         api_url = os.getenv("EXTERNAL_API_URL")
         authorization_header = os.getenv("EXTERNAL_API_AUTHORIZATION")
@@ -465,7 +519,5 @@ class LLMProviderFactory:
             api_url=api_url,
             authorization_header=authorization_header,
             max_tokens=max_tokens,
-            temperature=temperature,
-            chat_crud=chat_crud,
-            user_crud=user_crud
+            temperature=temperature
         )
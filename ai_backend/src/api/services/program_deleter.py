@@ -0,0 +1,349 @@
+# _*_ coding: utf-8 _*_
+"""Set-based program deletion for S3 objects, Milvus vectors and related tables."""
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+from shared_core.models import Document
+
+logger = logging.getLogger(__name__)
+
+# S3 delete_objects 1회 요청당 최대 객체 수 (S3 제한)
+S3_DELETE_BATCH_SIZE = 1000
+
+
+class ProgramDeleter:
+    """프로그램 일괄 삭제 처리 클래스
+
+    - 여러 프로그램을 한 번에 처리하며 DB 변경은 program_id IN (...) 단위 UPDATE/DELETE로 수행
+    - Milvus 벡터는 컬렉션별로 milvus_batch_size개 문서씩 delete 1회 호출
+    - S3 객체는 프로그램 prefix별로 목록을 조회하고 delete_objects(1000개) 배치를 동시 실행
+    - S3/Milvus 정리는 동시에 진행하며, 실패해도 DB 소프트 삭제는 계속 진행 (결과에 오류 기록)
+    """
+
+    def __init__(self, db: Session, uploader=None):
+        """
+        Args:
+            db: 데이터베이스 세션
+            uploader: ProgramUploader 인스턴스 (S3 클라이언트/버킷 사용)
+        """
+        self.db = db
+        self.uploader = uploader
+
+        # 삭제 설정
+        # - s3_delete_concurrency: 동시에 실행할 delete_objects 요청 수
+        # - milvus_batch_size: Milvus delete 1회에 포함할 문서 수
+        self.s3_delete_concurrency = int(os.getenv("PROGRAM_DELETE_S3_CONCURRENCY", "4"))
+        self.milvus_batch_size = int(os.getenv("PROGRAM_DELETE_MILVUS_BATCH_SIZE", "200"))
+
+    async def delete_programs(
+        self,
+        program_ids: List[str],
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    ) -> Dict[str, Dict]:
+        """
+        프로그램 일괄 삭제 (권한 확인은 호출자에서 수행)
+
+        Args:
+            program_ids: 삭제할 프로그램 ID 목록
+            progress_callback: 배치 1개 완료 시 (완료 수, 전체 수, 단계명)으로 호출
+                단계명: "s3", "milvus"
+
+        Returns:
+            Dict[str, Dict]: program_id → 삭제 결과
+        """
+        program_ids = list(dict.fromkeys(program_ids))
+        if not program_ids:
+            return {}
+
+        logger.info(f"프로그램 일괄 삭제 시작: programs={len(program_ids)}개")
+
+        # 삭제 대상 Document (필요한 컬럼만 조회)
+        documents = self.db.execute(
+            select(
+                Document.document_id,
+                Document.program_id,
+                Document.milvus_collection_name,
+            ).where(
+                Document.program_id.in_(program_ids),
+                Document.is_deleted.is_(False),
+            )
+        ).all()
+
+        results = {
+            program_id: {
+                "program_id": program_id,
+                "deleted": True,
+                "s3_deletion": {"s3_deleted": True, "objects_deleted": 0},
+                "documents_deletion": {
+                    "deleted": True,
+                    "documents_deleted": 0,
+                    "vectors_deleted": 0,
+                    "total_documents": 0,
+                    "errors": [],
+                },
+                "message": "프로그램이 삭제되었습니다.",
+            }
+            for program_id in program_ids
+        }
+        for document in documents:
+            results[document.program_id]["documents_deletion"]["total_documents"] += 1
+
+        # 1. S3 / Milvus 정리 (동시 실행)
+        await asyncio.gather(
+            self._purge_s3(program_ids, results, progress_callback),
+            self._purge_milvus(documents, results, progress_callback),
+        )
+
+        # 2. DB 일괄 반영 (단일 트랜잭션)
+        counts = self._soft_delete_rows(program_ids)
+        for document in documents:
+            results[document.program_id]["documents_deletion"]["documents_deleted"] += 1
+
+        logger.info(
+            f"프로그램 일괄 삭제 완료: programs={counts['programs']}, "
+            f"documents={counts['documents']}, PLC={counts['plcs']}, "
+            f"ProcessingFailure={counts['failures']}, "
+            f"ProgramLLMDataChunk={counts['chunks']}, "
+            f"KnowledgeReference={counts['knowledge_references']}"
+        )
+        return results
+
+    async def _purge_s3(
+        self,
+        program_ids: List[str],
+        results: Dict[str, Dict],
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    ):
+        """programs/{program_id}/ prefix 전체 삭제 (delete_objects 배치 동시 실행)"""
+        s3_client = self.uploader.s3_client if self.uploader else None
+        s3_bucket = self.uploader.s3_bucket if self.uploader else None
+        if not (s3_client and s3_bucket):
+            logger.warning("S3 클라이언트가 초기화되지 않아 파일 삭제를 건너뜁니다.")
+            return
+
+        def list_keys(program_id: str) -> List[Dict[str, str]]:
+            paginator = s3_client.get_paginator("list_objects_v2")
+            keys = []
+            for page in paginator.paginate(Bucket=s3_bucket, Prefix=f"programs/{program_id}/"):
+                keys.extend({"Key": obj["Key"]} for obj in page.get("Contents", []))
+            return keys
+
+        listings = await asyncio.gather(
+            *(asyncio.to_thread(list_keys, program_id) for program_id in program_ids),
+            return_exceptions=True,
+        )
+
+        batches = []
+        for program_id, keys in zip(program_ids, listings):
+            if isinstance(keys, Exception):
+                logger.error(f"S3 파일 목록 조회 실패: program_id={program_id}, error={str(keys)}")
+                results[program_id]["s3_deletion"] = {"s3_deleted": False, "error": str(keys)}
+                continue
+            for start in range(0, len(keys), S3_DELETE_BATCH_SIZE):
+                batches.append((program_id, keys[start:start + S3_DELETE_BATCH_SIZE]))
+
+        total = len(batches)
+        completed = 0
+        semaphore = asyncio.Semaphore(max(1, self.s3_delete_concurrency))
+
+        def delete_batch(chunk: List[Dict[str, str]]) -> int:
+            response = s3_client.delete_objects(
+                Bucket=s3_bucket, Delete={"Objects": chunk, "Quiet": True}
+            )
+            errors = response.get("Errors", []) if response else []
+            if errors:
+                raise RuntimeError(
+                    f"{len(errors)}개 객체 삭제 실패 (예: {errors[0].get('Key')}: {errors[0].get('Message')})"
+                )
+            return len(chunk)
+
+        async def run(program_id: str, chunk: List[Dict[str, str]]):
+            nonlocal completed
+            async with semaphore:
+                try:
+                    deleted = await asyncio.to_thread(delete_batch, chunk)
+                    s3_result = results[program_id]["s3_deletion"]
+                    if s3_result.get("s3_deleted"):
+                        s3_result["objects_deleted"] += deleted
+                except Exception as e:
+                    logger.error(f"S3 파일 삭제 실패: program_id={program_id}, error={str(e)}")
+                    results[program_id]["s3_deletion"] = {"s3_deleted": False, "error": str(e)}
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total, "s3")
+
+        await asyncio.gather(*(run(program_id, chunk) for program_id, chunk in batches))
+        logger.info(f"S3 파일 삭제 완료: programs={len(program_ids)}개, 배치={total}개")
+
+    async def _purge_milvus(
+        self,
+        documents: List,
+        results: Dict[str, Dict],
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    ):
+        """컬렉션별 문서 배치 단위 Milvus 벡터 삭제 (배치당 delete 1회, 컬렉션당 flush 1회)"""
+        by_collection: Dict[str, List] = {}
+        for document in documents:
+            if document.milvus_collection_name:
+                by_collection.setdefault(document.milvus_collection_name, []).append(document)
+        if not by_collection:
+            return
+
+        batch_size = max(1, self.milvus_batch_size)
+        total = sum(
+            (len(docs) + batch_size - 1) // batch_size for docs in by_collection.values()
+        )
+
+        def record_error(batch: List, message: str):
+            for document in batch:
+                results[document.program_id]["documents_deletion"]["errors"].append(
+                    {
+                        "document_id": document.document_id,
+                        "error": f"Milvus 삭제 실패: {message}",
+                    }
+                )
+
+        def purge():
+            from pymilvus import Collection, connections, utility
+
+            milvus_uri = os.getenv("MILVUS_URI", "./milvus_lite.db")
+            connections.connect("default", uri=milvus_uri)
+
+            completed = 0
+            for collection_name, docs in by_collection.items():
+                batches = [docs[i:i + batch_size] for i in range(0, len(docs), batch_size)]
+                if not utility.has_collection(collection_name):
+                    logger.warning(f"Milvus 컬렉션이 없습니다: {collection_name}")
+                    completed += len(batches)
+                    continue
+
+                collection = Collection(collection_name)
+                collection.load()
+                for batch in batches:
+                    # 벡터의 document_path에 document_id가 포함되어 저장됨 (배치 전체를 OR 조건 1개로 삭제)
+                    expr = " or ".join(
+                        f'document_path like "%{document.document_id}%"' for document in batch
+                    )
+                    try:
+                        collection.delete(expr=expr)
+                        for document in batch:
+                            results[document.program_id]["documents_deletion"]["vectors_deleted"] += 1
+                    except Exception as e:
+                        logger.warning(
+                            f"Milvus 벡터 삭제 실패: collection={collection_name}, "
+                            f"documents={len(batch)}개, error={str(e)}"
+                        )
+                        record_error(batch, str(e))
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(completed, total, "milvus")
+                collection.flush()
+                logger.info(
+                    f"Milvus 벡터 삭제 완료: collection={collection_name}, documents={len(docs)}개"
+                )
+
+        try:
+            await asyncio.to_thread(purge)
+        except Exception as e:
+            # Milvus 삭제 실패해도 전체 프로세스는 계속 진행
+            logger.error(f"Milvus 벡터 삭제 중 오류: {str(e)}")
+            for docs in by_collection.values():
+                record_error(docs, str(e))
+
+    def _soft_delete_rows(self, program_ids: List[str]) -> Dict[str, int]:
+        """관련 테이블 일괄 반영 (program_id IN (...) 단위 UPDATE/DELETE, 단일 commit)
+
+        - Document: is_deleted = True
+        - PLC: program_id 매핑 해제 및 is_active = False
+        - ProcessingFailure: status = 'deleted'
+        - ProgramLLMDataChunk: 실제 삭제 (is_deleted 없음)
+        - KnowledgeReference: 프로그램 Document가 참조하는 항목 is_deleted = True
+        - Program: is_used = False (소프트 삭제)
+        """
+        from src.database.models.knowledge_reference_models import KnowledgeReference
+        from src.database.models.plc_models import PLC
+        from src.database.models.program_models import (
+            ProcessingFailure,
+            Program,
+            ProgramLLMDataChunk,
+        )
+
+        now = datetime.now()
+        try:
+            knowledge_reference_ids = (
+                select(Document.knowledge_reference_id)
+                .where(
+                    Document.program_id.in_(program_ids),
+                    Document.knowledge_reference_id.isnot(None),
+                )
+                .scalar_subquery()
+            )
+            knowledge_references = self.db.execute(
+                update(KnowledgeReference)
+                .where(
+                    KnowledgeReference.reference_id.in_(knowledge_reference_ids),
+                    KnowledgeReference.is_deleted.is_(False),
+                )
+                .values(is_deleted=True)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+
+            documents = self.db.execute(
+                update(Document)
+                .where(
+                    Document.program_id.in_(program_ids),
+                    Document.is_deleted.is_(False),
+                )
+                .values(is_deleted=True, updated_at=now)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+
+            plcs = self.db.execute(
+                update(PLC)
+                .where(PLC.program_id.in_(program_ids), PLC.is_active.is_(True))
+                .values(program_id=None, is_active=False, update_dt=now, update_user="system")
+                .execution_options(synchronize_session=False)
+            ).rowcount
+
+            failures = self.db.execute(
+                update(ProcessingFailure)
+                .where(
+                    ProcessingFailure.source_type == ProcessingFailure.SOURCE_TYPE_PROGRAM,
+                    ProcessingFailure.source_id.in_(program_ids),
+                    ProcessingFailure.status != "deleted",
+                )
+                .values(status="deleted", updated_at=now)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+
+            chunks = self.db.execute(
+                delete(ProgramLLMDataChunk)
+                .where(ProgramLLMDataChunk.program_id.in_(program_ids))
+                .execution_options(synchronize_session=False)
+            ).rowcount
+
+            programs = self.db.execute(
+                update(Program)
+                .where(Program.program_id.in_(program_ids), Program.is_used.is_(True))
+                .values(is_used=False)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+
+            self.db.commit()
+            return {
+                "programs": programs,
+                "documents": documents,
+                "plcs": plcs,
+                "failures": failures,
+                "chunks": chunks,
+                "knowledge_references": knowledge_references,
+            }
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"관련 테이블 일괄 반영 실패: {str(e)}")
+            raise
@@ -0,0 +1,297 @@
+# _*_ coding: utf-8 _*_
+"""Concurrent, backoff-aware retry engine for program processing failures."""
+import asyncio
+import logging
+import os
+import shutil
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+class ProgramFailureRetrier:
+    """프로그램 처리 실패(ProcessingFailure) 재시도 엔진
+
+    - 실패 정보는 (created_at, failure_id) keyset으로 page_size건씩 조회 (전체를 메모리에 올리지 않음)
+    - 페이지마다 재시도 가능한 행을 한 번의 UPDATE로 점유(retrying, retry_count + 1)한 뒤
+      concurrency개까지 동시에 재시도
+    - retry_count 기반 지수 백오프: 마지막 시도 후 backoff_base * 2^(retry_count - 1)초
+      (최대 backoff_max초)가 지나지 않은 행은 이번 실행에서 건너뜀 (deferred)
+    - 생성된 Document, 템플릿데이터 연결, 실패 정보 상태는 페이지 단위로 일괄 반영 후 commit
+    """
+
+    def __init__(self, db: Session, uploader=None):
+        """
+        Args:
+            db: 데이터베이스 세션
+            uploader: ProgramUploader 인스턴스 (전처리 재수행 시 사용)
+        """
+        self.db = db
+        self.uploader = uploader
+
+        # 재시도 설정
+        # - concurrency: 동시 재시도 수 (S3/외부 API 부하 제한)
+        # - page_size: keyset 페이지 크기 (= 배치 commit 단위)
+        # - backoff_base / backoff_max: retry_count 기반 지수 백오프 (초)
+        self.concurrency = int(os.getenv("PROGRAM_RETRY_CONCURRENCY", "8"))
+        self.page_size = int(os.getenv("PROGRAM_RETRY_PAGE_SIZE", "200"))
+        self.backoff_base = float(os.getenv("PROGRAM_RETRY_BACKOFF_BASE_SEC", "30"))
+        self.backoff_max = float(os.getenv("PROGRAM_RETRY_BACKOFF_MAX_SEC", "3600"))
+
+    def backoff_seconds(self, retry_count: int) -> float:
+        """retry_count회 시도한 실패의 다음 재시도까지 대기 시간"""
+        if retry_count <= 0:
+            return 0.0
+        return min(self.backoff_base * (2 ** (retry_count - 1)), self.backoff_max)
+
+    def is_due(self, failure, now: datetime) -> bool:
+        """백오프 대기 시간이 지났는지 여부"""
+        if failure.last_retry_at is None:
+            return True
+        wait = timedelta(seconds=self.backoff_seconds(failure.retry_count or 0))
+        return failure.last_retry_at + wait <= now
+
+    async def retry_program_failures(
+        self,
+        program,
+        user_id: str,
+        failure_type: Optional[str] = None,
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        프로그램의 재시도 대기 실패 정보 재처리
+
+        Args:
+            program: Program
+            user_id: 재시도 요청 사용자 ID (생성 Document의 소유자)
+            failure_type: 재시도할 실패 타입 (None이면 전체)
+
+        Returns:
+            Dict: {"preprocessing": {...}, "document": {...}}
+                각 항목: retried, success, failed, deferred
+        """
+        from src.database.crud.document_crud import DocumentCRUD
+        from src.database.crud.program_failure_crud import ProcessingFailureCRUD
+        from src.database.crud.template_crud import TemplateDataCRUD
+        from src.database.models.program_models import ProcessingFailure
+
+        failure_crud = ProcessingFailureCRUD(self.db)
+        document_crud = DocumentCRUD(self.db)
+        template_data_crud = TemplateDataCRUD(self.db)
+
+        result_keys = {
+            ProcessingFailure.FAILURE_TYPE_PREPROCESSING: "preprocessing",
+            ProcessingFailure.FAILURE_TYPE_DOCUMENT_STORAGE: "document",
+        }
+        retry_results = {
+            key: {"retried": 0, "success": 0, "failed": 0, "deferred": 0}
+            for key in result_keys.values()
+        }
+
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
+        preprocess_state = {"lookups": None, "temp_dir": None, "template_data": None}
+        preprocess_lock = asyncio.Lock()
+
+        async def preprocess_resources():
+            # 전처리 재시도가 있을 때만 조회 테이블/템플릿데이터 매핑을 1회 준비
+            async with preprocess_lock:
+                if preprocess_state["lookups"] is None:
+                    lookups, temp_dir = await self.uploader.load_program_lookups(
+                        program.program_id
+                    )
+                    preprocess_state.update(
+                        lookups=lookups,
+                        temp_dir=temp_dir,
+                        template_data=self._template_data_map(program.program_id),
+                    )
+            return preprocess_state["lookups"], preprocess_state["template_data"]
+
+        async def retry_one(failure) -> Dict:
+            async with semaphore:
+                try:
+                    if failure.failure_type == ProcessingFailure.FAILURE_TYPE_PREPROCESSING:
+                        lookups, template_data = await preprocess_resources()
+                        rebuilt = await self.uploader.rebuild_preprocessed_file(
+                            program_id=program.program_id,
+                            source_file_path=failure.file_path,
+                            file_index=failure.file_index,
+                            lookups=lookups,
+                        )
+                        return self._preprocessing_outcome(
+                            program, user_id, failure, rebuilt, template_data
+                        )
+                    if failure.failure_type == ProcessingFailure.FAILURE_TYPE_DOCUMENT_STORAGE:
+                        return self._document_storage_outcome(program, user_id, failure)
+                    raise ValueError(f"재시도를 지원하지 않는 실패 타입입니다: {failure.failure_type}")
+                except Exception as e:
+                    logger.error(f"재시도 실패: failure_id={failure.failure_id}, error: {str(e)}")
+                    return {"error": str(e)}
+
+        after = None
+        processed = 0
+        try:
+            while True:
+                page = failure_crud.get_retry_candidates_page(
+                    source_type=ProcessingFailure.SOURCE_TYPE_PROGRAM,
+                    source_id=program.program_id,
+                    failure_type=failure_type,
+                    after=after,
+                    limit=self.page_size,
+                )
+                if not page:
+                    break
+                after = (page[-1].created_at, page[-1].failure_id)
+
+                now = datetime.now()
+                due = []
+                for failure in page:
+                    key = result_keys.get(failure.failure_type)
+                    if self.is_due(failure, now):
+                        due.append(failure)
+                    elif key:
+                        retry_results[key]["deferred"] += 1
+
+                claimed = set(failure_crud.claim_for_retry([f.failure_id for f in due]))
+                self.db.commit()
+                targets = [f for f in due if f.failure_id in claimed]
+                if not targets:
+                    continue
+
+                outcomes = await asyncio.gather(*(retry_one(f) for f in targets))
+
+                documents = []
+                links = {}
+                failure_rows = []
+                resolved_at = datetime.now()
+                for failure, outcome in zip(targets, outcomes):
+                    key = result_keys.get(failure.failure_type)
+                    if key:
+                        retry_results[key]["retried"] += 1
+                    if "error" in outcome:
+                        if key:
+                            retry_results[key]["failed"] += 1
+                        failure_rows.append({
+                            "failure_id": failure.failure_id,
+                            "status": ProcessingFailure.STATUS_PENDING,
+                            "error_message": outcome["error"],
+                            "resolved_at": None,
+                            "resolved_by": None,
+                            "updated_at": resolved_at,
+                        })
+                        continue
+
+                    retry_results[key]["success"] += 1
+                    documents.append(outcome["document"])
+                    if outcome.get("template_data_id"):
+                        links[outcome["template_data_id"]] = outcome["document"]["document_id"]
+                    failure_rows.append({
+                        "failure_id": failure.failure_id,
+                        "status": ProcessingFailure.STATUS_RESOLVED,
+                        "error_message": failure.error_message,
+                        "resolved_at": resolved_at,
+                        "resolved_by": "manual",
+                        "updated_at": resolved_at,
+                    })
+
+                try:
+                    document_crud.bulk_create_documents(documents)
+                    template_data_crud.bulk_link_documents(links)
+                    failure_crud.bulk_update_failures(failure_rows)
+                    self.db.commit()
+                except Exception:
+                    self.db.rollback()
+                    # 결과 반영 실패 시 점유한 행을 pending으로 되돌림 (다음 재시도 대상)
+                    failure_crud.bulk_update_failures([
+                        {
+                            "failure_id": row["failure_id"],
+                            "status": ProcessingFailure.STATUS_PENDING,
+                        }
+                        for row in failure_rows
+                    ])
+                    self.db.commit()
+                    raise
+
+                processed += len(targets)
+                logger.info(
+                    f"재시도 진행상황: program_id={program.program_id}, "
+                    f"처리={processed}건 (배치 commit)"
+                )
+        finally:
+            if preprocess_state["lookups"] is not None:
+                preprocess_state["lookups"].close()
+            if preprocess_state["temp_dir"]:
+                shutil.rmtree(preprocess_state["temp_dir"], ignore_errors=True)
+
+        return retry_results
+
+    def _template_data_map(self, program_id: str) -> Dict[str, str]:
+        """logic_id → template_data_id (프로그램 템플릿 전체, 1회 조회)"""
+        from src.database.models.template_models import Template, TemplateData
+
+        rows = self.db.execute(
+            select(TemplateData.logic_id, TemplateData.template_data_id)
+            .join(Template, Template.template_id == TemplateData.template_id)
+            .where(Template.program_id == program_id)
+        ).all()
+        return {row.logic_id: row.template_data_id for row in rows}
+
+    def _preprocessing_outcome(
+        self, program, user_id: str, failure, rebuilt: Dict, template_data: Dict[str, str]
+    ) -> Dict:
+        """전처리 재수행 결과 → Document 행, 템플릿데이터 연결"""
+        from src.utils.uuid_gen import gen
+
+        document = self.uploader.preprocessed_document_row(
+            document_id=gen(),
+            program_id=program.program_id,
+            program_title=program.program_name,
+            user_id=user_id,
+            json_filename=rebuilt["json_filename"],
+            json_s3_key=rebuilt["json_s3_key"],
+            json_s3_path=rebuilt["json_s3_path"],
+            json_size=rebuilt["json_size"],
+            logic_id=rebuilt["logic_id"],
+            source_file_path=failure.file_path,
+            extra_metadata={
+                "retry_count": (failure.retry_count or 0) + 1,
+                "is_retry": True,
+                "failure_id": failure.failure_id,
+            },
+        )
+        return {
+            "document": document,
+            "template_data_id": template_data.get(rebuilt["logic_id"]),
+        }
+
+    def _document_storage_outcome(self, program, user_id: str, failure) -> Dict:
+        """Document 저장 실패 → 이미 업로드된 JSON으로 Document 행 재생성"""
+        from src.utils.uuid_gen import gen
+
+        return {
+            "document": {
+                "document_id": gen(),
+                "document_name": f"{program.program_name}_{failure.filename}",
+                "original_filename": failure.filename,
+                "file_key": failure.s3_key,
+                "file_size": 0,
+                "file_type": "application/json",
+                "file_extension": "json",
+                "user_id": user_id,
+                "upload_path": failure.s3_path,
+                "status": "processing",
+                "document_type": "common",
+                "program_id": program.program_id,
+                "metadata_json": {
+                    "program_id": program.program_id,
+                    "program_title": program.program_name,
+                    "processing_stage": "preprocessed",
+                    "retry_count": (failure.retry_count or 0) + 1,
+                    "is_retry": True,
+                    "failure_id": failure.failure_id,
+                },
+                "create_dt": datetime.now(),
+            },
+        }
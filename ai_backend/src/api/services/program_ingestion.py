@@ -0,0 +1,400 @@
+# _*_ coding: utf-8 _*_
+"""Upload ingestion context shared by program validation, registration and upload."""
+import codecs
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import zipfile
+from functools import cached_property
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, List, Optional
+
+from fastapi import UploadFile
+
+logger = logging.getLogger(__name__)
+
+# 디스크 스풀링 시 한 번에 복사할 크기 (1MB)
+SPOOL_CHUNK_SIZE = 1024 * 1024
+
+# CSV 인코딩 감지에 사용할 앞부분 크기 (64KB)
+ENCODING_SNIFF_SIZE = 64 * 1024
+
+# BOM → 인코딩 (긴 BOM 우선)
+ENCODING_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# BOM이 없을 때 순서대로 시도할 인코딩 (모두 실패하면 latin-1)
+ENCODING_CANDIDATES = ("utf-8", "cp949")
+
+
+def get_program_job_staging_root() -> str:
+    """등록 작업 스테이징 루트 (API와 워커가 공유하는 볼륨)"""
+    from src.config import settings
+
+    return settings.program_job_staging_dir or os.path.join(
+        settings.upload_base_path, "program_jobs"
+    )
+
+
+def detect_text_encoding(prefix: bytes) -> str:
+    """
+    파일 앞부분(최대 ENCODING_SNIFF_SIZE)으로 텍스트 인코딩 감지
+
+    BOM이 있으면 BOM 기준으로, 없으면 utf-8 → cp949 순으로 앞부분이 오류 없이 디코딩되는지 확인합니다.
+    앞부분 끝에서 잘린 멀티바이트 문자는 오류로 보지 않습니다 (incremental decoder, final=False).
+    """
+    for bom, encoding in ENCODING_BOMS:
+        if prefix.startswith(bom):
+            return encoding
+
+    for encoding in ENCODING_CANDIDATES:
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(prefix, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return "latin-1"
+
+
+def read_csv_columns(source, encoding: Optional[str] = None, usecols: Optional[List[str]] = None):
+    """
+    CSV 1회 파싱 (source: 경로 또는 바이트)
+
+    - encoding이 없으면 앞부분만 읽어 detect_text_encoding으로 감지
+    - usecols가 있으면 해당 컬럼만 문자열(dtype=str)로 파싱 (없는 컬럼은 무시)
+    - 앞부분이 ASCII뿐이라 감지가 빗나간 경우에만 cp949 → latin-1로 다시 파싱
+
+    Returns:
+        Tuple[DataFrame, str]: (파싱 결과, 사용한 인코딩)
+    """
+    import io
+
+    import pandas as pd
+
+    is_bytes = isinstance(source, (bytes, bytearray))
+
+    def open_source():
+        return io.BytesIO(source) if is_bytes else source
+
+    if encoding is None:
+        if is_bytes:
+            prefix = bytes(source[:ENCODING_SNIFF_SIZE])
+        else:
+            with open(source, "rb") as file:
+                prefix = file.read(ENCODING_SNIFF_SIZE)
+        encoding = detect_text_encoding(prefix)
+
+    options = {}
+    if usecols is not None:
+        wanted = set(usecols)
+        options = {"usecols": lambda column: column in wanted, "dtype": str}
+
+    try:
+        return pd.read_csv(open_source(), encoding=encoding, **options), encoding
+    except UnicodeDecodeError:
+        for fallback in ("cp949", "latin-1"):
+            if fallback == encoding:
+                continue
+            try:
+                logger.warning(f"CSV 인코딩 감지 불일치: {encoding} → {fallback}로 재시도")
+                return pd.read_csv(open_source(), encoding=fallback, **options), fallback
+            except UnicodeDecodeError:
+                continue
+        raise
+
+
+class ZipEntryIndex:
+    """ZIP namelist 기반 파일명 조회 인덱스
+
+    전체 경로와 파일명(basename)을 한 번만 정규화하여 dict로 보관하므로
+    로직파일명 1건 조회가 O(1)입니다. (디렉토리 엔트리는 제외)
+    """
+
+    def __init__(self, names: Iterable[str], case_insensitive: bool = False):
+        self.case_insensitive = case_insensitive
+        # 정규화된 전체 경로 → 원본 엔트리명
+        self.paths: Dict[str, str] = {}
+        # 정규화된 파일명 → 원본 엔트리명 목록 (동일 파일명이 여러 폴더에 있을 수 있음)
+        self.basenames: Dict[str, List[str]] = {}
+
+        for name in names:
+            if name.endswith("/") or name.endswith("\\"):
+                continue
+            key = self.normalize(name)
+            self.paths[key] = name
+            self.basenames.setdefault(key.rsplit("/", 1)[-1], []).append(name)
+
+    def normalize(self, path: str) -> str:
+        """경로 구분자 통일 (+ 대소문자 무시 옵션 시 casefold)"""
+        normalized = path.replace("\\", "/")
+        return normalized.casefold() if self.case_insensitive else normalized
+
+    def lookup(self, file_name: str) -> List[str]:
+        """전체 경로 일치 우선, 없으면 파일명 일치 엔트리 목록 반환"""
+        key = self.normalize(file_name)
+        if key in self.paths:
+            return [self.paths[key]]
+        return self.basenames.get(key, [])
+
+    def cross_reference(self, file_names: Iterable[str]) -> Dict:
+        """
+        파일명 목록과 ZIP 엔트리를 한 번에 대조
+
+        Returns:
+            Dict: {
+                "matched_count": 일치한 파일명 수,
+                "missing": ZIP에 없는 파일명 목록,
+                "extra": 어떤 파일명과도 매칭되지 않은 ZIP 엔트리 목록,
+                "ambiguous": [{"file_name": ..., "candidates": [...]}]  # 파일명만으로 여러 엔트리와 매칭
+            }
+        """
+        matched_entries = set()
+        matched_count = 0
+        missing = []
+        ambiguous = []
+
+        for file_name in file_names:
+            matches = self.lookup(str(file_name))
+            if not matches:
+                missing.append(file_name)
+                continue
+            matched_count += 1
+            if len(matches) > 1:
+                ambiguous.append({"file_name": file_name, "candidates": matches})
+            matched_entries.update(matches)
+
+        extra = [name for name in self.paths.values() if name not in matched_entries]
+
+        return {
+            "matched_count": matched_count,
+            "missing": missing,
+            "extra": extra,
+            "ambiguous": ambiguous,
+        }
+
+
+class SpooledUpload:
+    """업로드 파일 1개를 디스크에 스풀링하고 파생 정보를 한 번만 계산
+
+    - 스풀링 시 한 번의 순차 읽기로 크기와 SHA-256을 함께 계산
+    - ZIP namelist, DataFrame 등 파싱 결과는 최초 접근 시 1회만 계산 (cached_property)
+    - 요청이 끝나 UploadFile이 닫힌 뒤에도 비동기 후처리에서 사용할 수 있음
+    """
+
+    def __init__(self, upload: UploadFile, path: Path, default_filename: str):
+        self.filename = upload.filename or default_filename
+        self.content_type = upload.content_type
+        self.path = path
+        self._zip_indexes: Dict[bool, ZipEntryIndex] = {}
+
+        digest = hashlib.sha256()
+        size = 0
+        upload.file.seek(0)
+        with open(path, "wb") as spool:
+            while True:
+                chunk = upload.file.read(SPOOL_CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                size += len(chunk)
+                spool.write(chunk)
+        upload.file.seek(0)
+
+        self.size = size
+        self.sha256 = digest.hexdigest()
+
+    @classmethod
+    def restore(cls, manifest: Dict) -> "SpooledUpload":
+        """to_manifest() 결과로 이미 디스크에 있는 스풀링 파일을 다시 연결 (복사 없음)"""
+        spooled = cls.__new__(cls)
+        spooled.filename = manifest["filename"]
+        spooled.content_type = manifest.get("content_type")
+        spooled.path = Path(manifest["path"])
+        spooled.size = manifest["size"]
+        spooled.sha256 = manifest["sha256"]
+        spooled._zip_indexes = {}
+        if manifest.get("encoding"):
+            # 등록 요청에서 감지한 CSV 인코딩 재사용 (워커에서 다시 감지하지 않음)
+            spooled.__dict__["csv_encoding"] = manifest["encoding"]
+        return spooled
+
+    def to_manifest(self) -> Dict:
+        """작업 큐 저장용 메타정보 (JSON 직렬화 가능)"""
+        return {
+            "filename": self.filename,
+            "content_type": self.content_type,
+            "path": str(self.path),
+            "size": self.size,
+            "sha256": self.sha256,
+            "encoding": self.__dict__.get("csv_encoding"),
+        }
+
+    def open(self) -> BinaryIO:
+        """스풀링된 파일을 바이너리 읽기 모드로 열기"""
+        return open(self.path, "rb")
+
+    @cached_property
+    def is_zip(self) -> bool:
+        """ZIP 형식 여부"""
+        return zipfile.is_zipfile(self.path)
+
+    @cached_property
+    def zip_namelist(self) -> List[str]:
+        """ZIP 내부 파일 목록 (중앙 디렉토리만 읽음)"""
+        with zipfile.ZipFile(self.path, "r") as zip_ref:
+            return zip_ref.namelist()
+
+    def zip_index(self, case_insensitive: bool = False) -> ZipEntryIndex:
+        """ZIP 파일명 조회 인덱스 (옵션별 1회만 생성)"""
+        if case_insensitive not in self._zip_indexes:
+            self._zip_indexes[case_insensitive] = ZipEntryIndex(
+                self.zip_namelist, case_insensitive=case_insensitive
+            )
+        return self._zip_indexes[case_insensitive]
+
+    def open_zip(self) -> zipfile.ZipFile:
+        """스풀링된 ZIP 파일 열기 (메모리에 전체를 올리지 않음)"""
+        return zipfile.ZipFile(self.path, "r")
+
+    @cached_property
+    def excel_dataframe(self):
+        """XLSX 파싱 결과 (1회만 파싱)"""
+        import pandas as pd
+
+        return pd.read_excel(self.path)
+
+    @cached_property
+    def csv_encoding(self) -> str:
+        """CSV 인코딩 (앞부분만 읽어 1회 감지, csv_dataframe 파싱 시 확정)"""
+        with self.open() as file:
+            return detect_text_encoding(file.read(ENCODING_SNIFF_SIZE))
+
+    @cached_property
+    def csv_columns(self) -> List[str]:
+        """CSV 헤더 컬럼 목록 (첫 줄만 읽음)"""
+        import csv
+
+        with open(self.path, "r", encoding=self.csv_encoding, errors="replace", newline="") as file:
+            return next(csv.reader(file), [])
+
+    @cached_property
+    def csv_dataframe(self):
+        """디바이스 코멘트 CSV 파싱 결과 (필수 컬럼만 문자열로 1회 파싱)"""
+        from src.api.services.program_validator import ProgramValidator
+
+        df, encoding = read_csv_columns(
+            self.path,
+            encoding=self.csv_encoding,
+            usecols=ProgramValidator.REQUIRED_CSV_COLUMNS,
+        )
+        self.__dict__["csv_encoding"] = encoding
+        return df
+
+
+class ProgramIngestionContext:
+    """프로그램 등록 업로드 1건에 대한 수집 컨텍스트
+
+    업로드 요청당 한 번 생성되어 ProgramValidator, ProgramService, ProgramUploader가 공유합니다.
+    세 파일을 임시 디렉토리에 스풀링하므로, 사용이 끝나면 close()로 정리해야 합니다.
+    등록 작업 큐에 넘길 때는 persist()로 공유 디렉토리에 옮기고, 워커는 restore()로 다시 엽니다.
+    """
+
+    FILE_KEYS = ("ladder_zip", "classification_xlsx", "device_comment_csv")
+
+    def __init__(
+        self,
+        ladder_zip: UploadFile,
+        classification_xlsx: UploadFile,
+        device_comment_csv: UploadFile,
+        spool_dir: Optional[str] = None,
+    ):
+        if spool_dir:
+            Path(spool_dir).mkdir(parents=True, exist_ok=True)
+        self._temp_dir = tempfile.TemporaryDirectory(prefix="program_upload_", dir=spool_dir)
+        self._work_dir = Path(self._temp_dir.name)
+        base = self._work_dir
+        try:
+            self.ladder_zip = SpooledUpload(ladder_zip, base / "ladder_logic.zip", "ladder_logic.zip")
+            self.classification_xlsx = SpooledUpload(
+                classification_xlsx, base / "classification.xlsx", "classification.xlsx"
+            )
+            self.device_comment_csv = SpooledUpload(
+                device_comment_csv, base / "device_comment.csv", "device_comment.csv"
+            )
+        except Exception:
+            self.close()
+            raise
+
+        logger.info(
+            f"업로드 스풀링 완료: ladder_zip={self.ladder_zip.size}B, "
+            f"classification_xlsx={self.classification_xlsx.size}B, "
+            f"device_comment_csv={self.device_comment_csv.size}B"
+        )
+
+    @classmethod
+    def restore(cls, manifest: Dict) -> "ProgramIngestionContext":
+        """persist() 결과로 컨텍스트 복원 (다른 프로세스/재시작 후 워커에서 사용)
+
+        복원된 컨텍스트의 close()는 파일을 지우지 않습니다. (작업 종료 시 discard()로 정리)
+        """
+        context = cls.__new__(cls)
+        context._temp_dir = None
+        context._work_dir = Path(manifest["work_dir"])
+        for key in cls.FILE_KEYS:
+            setattr(context, key, SpooledUpload.restore(manifest["files"][key]))
+        return context
+
+    def persist(self, target_dir: str) -> Dict:
+        """스풀링 파일을 영구 디렉토리로 이동하고 복원용 manifest 반환
+
+        같은 파일시스템이면 rename만 수행하므로 파일을 다시 복사하지 않습니다.
+        """
+        target = Path(target_dir)
+        target.mkdir(parents=True, exist_ok=True)
+        for key in self.FILE_KEYS:
+            spooled = getattr(self, key)
+            destination = target / spooled.path.name
+            shutil.move(str(spooled.path), str(destination))
+            spooled.path = destination
+
+        # 비어 있는 임시 디렉토리 정리 후 영구 디렉토리를 작업 디렉토리로 사용
+        self.close()
+        self._temp_dir = None
+        self._work_dir = target
+
+        return {
+            "work_dir": str(target),
+            "files": {key: getattr(self, key).to_manifest() for key in self.FILE_KEYS},
+        }
+
+    @property
+    def work_dir(self) -> Path:
+        """컨텍스트 전용 작업 디렉토리"""
+        return self._work_dir
+
+    def close(self):
+        """스풀링 파일 및 임시 디렉토리 정리 (persist/restore된 컨텍스트는 유지)"""
+        if self._temp_dir is None:
+            return
+        try:
+            self._temp_dir.cleanup()
+        except Exception as e:
+            logger.warning(f"업로드 임시 디렉토리 정리 실패: {str(e)}")
+
+    def discard(self):
+        """작업 디렉토리까지 삭제 (등록 작업 완료/최종 실패 시)"""
+        self.close()
+        shutil.rmtree(self._work_dir, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
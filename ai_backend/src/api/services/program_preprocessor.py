@@ -0,0 +1,101 @@
+# _*_ coding: utf-8 _*_
+"""CPU-bound ladder preprocessing shared with the preprocessing process pool.
+
+프로세스 풀(spawn)에서 import되므로 모듈 수준에서는 표준 라이브러리만 import합니다.
+"""
+from typing import Dict, Optional
+
+def lookup_key(file_name) -> str:
+    """파일명 조회 키 (경로 구분자 통일 후 basename)"""
+    return str(file_name).replace("\\", "/").rsplit("/", 1)[-1].strip()
+
+
+class PreprocessLookups:
+    """전처리 조회 테이블 (프로그램당 1회 생성, 워커 프로세스에는 파일별 조각(for_file)만 전달)
+
+    - classification: 로직파일명 → 분류체계 XLSX 행
+    - device_index_path: 디바이스 코멘트 인덱스 파일 경로 (DeviceCommentIndex)
+      워커에는 경로만 전달하고 각 프로세스가 최초 사용 시 mmap으로 엽니다.
+    """
+
+    def __init__(
+        self,
+        classification: Optional[Dict[str, Dict[str, str]]] = None,
+        device_index_path: Optional[str] = None,
+    ):
+        self.classification = classification or {}
+        self.device_index_path = device_index_path
+        self._device_index = None
+
+    @property
+    def device_index(self):
+        """디바이스 코멘트 인덱스 (프로세스별 1회 mmap, 경로가 없으면 None)"""
+        if self._device_index is None and self.device_index_path:
+            from src.api.services.device_comment_index import DeviceCommentIndex
+
+            self._device_index = DeviceCommentIndex(self.device_index_path)
+        return self._device_index
+
+    def for_file(self, logic_id: str) -> "PreprocessLookups":
+        """파일 1개 처리에 필요한 조각 (해당 분류체계 행 + 인덱스 경로, 작업마다 작게 전달)"""
+        key = lookup_key(logic_id)
+        row = self.classification.get(key)
+        return PreprocessLookups({key: row} if row else {}, self.device_index_path)
+
+    def close(self):
+        """열린 인덱스 해제"""
+        if self._device_index is not None:
+            self._device_index.close()
+            self._device_index = None
+
+    def __getstate__(self):
+        # 열린 mmap은 전달하지 않음 (워커 프로세스에서 다시 엶)
+        return {
+            "classification": self.classification,
+            "device_index_path": self.device_index_path,
+        }
+
+    def __setstate__(self, state):
+        self.__init__(state["classification"], state["device_index_path"])
+
+    @classmethod
+    def from_dataframe(
+        cls, classification_df=None, device_index_path: Optional[str] = None
+    ) -> "PreprocessLookups":
+        """분류체계 DataFrame을 조회 dict로 변환 (1회 순회)"""
+        from src.api.services.program_validator import ProgramValidator
+
+        logic_file_column = ProgramValidator.REQUIRED_XLSX_COLUMNS[0]
+
+        classification = {}
+        if classification_df is not None and logic_file_column in classification_df.columns:
+            frame = classification_df.fillna("").astype(str)
+            for record in frame.to_dict("records"):
+                key = lookup_key(record[logic_file_column])
+                if key:
+                    classification[key] = {
+                        str(column): value.strip() for column, value in record.items()
+                    }
+
+        return cls(classification, device_index_path)
+
+
+def build_ladder_json(
+    program_id: str,
+    logic_id: str,
+    source_file_path: str,
+    content: bytes,
+    lookups: Optional[PreprocessLookups] = None,
+) -> str:
+    """래더 파일 1개를 전처리 JSON으로 변환 (CPU 단계, 프로세스 풀에서 실행)
+
+    lookups로 분류체계/디바이스 코멘트 조회 테이블(파일별 조각)이 전달되며,
+    출력 JSON 형식은 기존과 같이 유지합니다 (전처리 로직 미구현 → 빈 내용).
+    """
+    # TODO: 전처리 로직 구현 필요
+    # 1. content(원본 래더 파일) 파싱
+    # 2. lookups.classification / lookups.device_index 활용
+    # 3. 파일을 분석하여 JSON 형식으로 변환
+    #   - json_content = json.dumps(processed_data, ensure_ascii=False)
+    json_content = ""  # 전처리 로직 구현 후 채워넣기
+    return json_content
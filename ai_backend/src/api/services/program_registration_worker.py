@@ -0,0 +1,219 @@
+# _*_ coding: utf-8 _*_
+"""Worker that drains the durable program registration job queue."""
+import asyncio
+import logging
+import os
+import socket
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ProgramRegistrationWorker:
+    """프로그램 등록 작업 큐 워커 (프로세스당 1개)
+
+    - concurrency 개수만큼 루프를 돌며 PROGRAM_REGISTRATION_JOBS에서 작업을 점유 (SKIP LOCKED)
+    - 작업마다 전용 DB 세션을 사용하고, 처리 중에는 lease_seconds/3 주기로 heartbeat 갱신
+    - heartbeat에서 점유 상실이 확인되면 실행 중인 작업을 취소하고, 상태 변경(checkpoint/완료/실패)은
+      모두 locked_by가 자신일 때만 반영 (회수한 워커의 진행을 덮어쓰거나 staging 파일을 지우지 않음)
+    - 실패 시 retry_delay_seconds 후 재시도, 최대 시도 횟수 초과 시 Program을 failed로 변경
+    - 프로세스가 죽으면 heartbeat가 끊기고 lease 만료 후 다른 워커가 마지막 checkpoint부터 재개
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 1,
+        poll_interval: float = 2.0,
+        lease_seconds: int = 300,
+        retry_delay_seconds: int = 30,
+    ):
+        self.concurrency = max(concurrency, 1)
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.retry_delay_seconds = retry_delay_seconds
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+        self._tasks: List[asyncio.Task] = []
+        self._stop: Optional[asyncio.Event] = None
+
+    def start(self):
+        """작업 루프 시작 (실행 중인 이벤트 루프에서 호출)"""
+        if self._tasks:
+            return
+        self._stop = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._run_loop(f"{self.worker_id}#{slot}"))
+            for slot in range(self.concurrency)
+        ]
+        logger.info(
+            f"프로그램 등록 워커 시작: worker_id={self.worker_id}, concurrency={self.concurrency}"
+        )
+
+    async def stop(self):
+        """작업 루프 종료 (처리 중인 작업은 lease 만료 후 다른 워커가 이어서 처리)"""
+        if not self._tasks:
+            return
+        self._stop.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info(f"프로그램 등록 워커 종료: worker_id={self.worker_id}")
+
+    async def wait(self):
+        """모든 작업 루프가 끝날 때까지 대기 (독립 워커 프로세스용)"""
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _run_loop(self, slot_id: str):
+        while not self._stop.is_set():
+            try:
+                processed = await self.run_once(slot_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"프로그램 등록 워커 루프 오류: slot={slot_id}, error={str(e)}")
+                processed = False
+
+            # 처리할 작업이 없을 때만 poll_interval 대기 (밀린 작업은 연속 처리)
+            if not processed:
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def run_once(self, slot_id: str) -> bool:
+        """작업 1건 점유 및 처리
+
+        Returns:
+            bool: 처리한 작업이 있으면 True
+        """
+        from src.api.services.program_ingestion import ProgramIngestionContext
+        from src.api.services.program_service import ProgramService
+        from src.core.dependencies import get_database
+        from src.database.crud.program_job_crud import ProgramRegistrationJobCRUD
+        from src.database.models.program_models import ProgramRegistrationJob
+
+        database = get_database()
+        with database.session() as db:
+            job_crud = ProgramRegistrationJobCRUD(db)
+            job = job_crud.claim_next(slot_id, self.lease_seconds)
+            if job is None:
+                return False
+
+            job_id = job.job_id
+            program_id = job.program_id
+            files_manifest = job.payload["files"]
+
+            # 워커 중단이 반복되어 회수 시점에 최종 실패 처리된 작업
+            if job.status == ProgramRegistrationJob.STATUS_FAILED:
+                logger.error(
+                    f"프로그램 등록 작업 최종 실패: job_id={job_id}, "
+                    f"program_id={program_id}, error={job.error_message}"
+                )
+                ProgramService(db=db).mark_registration_failed(program_id, job.error_message)
+                ProgramIngestionContext.restore(files_manifest).discard()
+                return True
+
+            logger.info(
+                f"프로그램 등록 작업 시작: job_id={job_id}, program_id={program_id}, "
+                f"attempt={job.attempts}/{job.max_attempts}, last_stage={job.stage}"
+            )
+
+            service = ProgramService(db=db)
+            lease_lost = asyncio.Event()
+            run = asyncio.create_task(service.run_registration_job(job, job_crud, slot_id))
+            heartbeat = asyncio.create_task(self._heartbeat(job_id, slot_id, run, lease_lost))
+            try:
+                try:
+                    await run
+                except asyncio.CancelledError:
+                    if not lease_lost.is_set():
+                        raise
+                    db.rollback()
+                    logger.warning(
+                        f"프로그램 등록 작업 중단 (lease 상실, 다른 워커가 이어서 처리): "
+                        f"job_id={job_id}, program_id={program_id}"
+                    )
+                    return True
+
+                if job_crud.mark_completed(job_id, slot_id):
+                    ProgramIngestionContext.restore(files_manifest).discard()
+                    logger.info(f"프로그램 등록 작업 완료: job_id={job_id}, program_id={program_id}")
+                else:
+                    logger.warning(
+                        f"프로그램 등록 작업 완료 기록 생략 (lease 상실): "
+                        f"job_id={job_id}, program_id={program_id}"
+                    )
+            except Exception as e:
+                error_message = str(e)
+                retry = job_crud.mark_failed(job_id, slot_id, error_message, self.retry_delay_seconds)
+                if retry is None:
+                    logger.warning(
+                        f"프로그램 등록 작업 실패 기록 생략 (lease 상실): job_id={job_id}, "
+                        f"program_id={program_id}, error={error_message}"
+                    )
+                elif retry:
+                    logger.warning(
+                        f"프로그램 등록 작업 실패 (재시도 예약): job_id={job_id}, "
+                        f"program_id={program_id}, error={error_message}"
+                    )
+                else:
+                    logger.error(
+                        f"프로그램 등록 작업 최종 실패: job_id={job_id}, "
+                        f"program_id={program_id}, error={error_message}"
+                    )
+                    service.mark_registration_failed(program_id, error_message)
+                    ProgramIngestionContext.restore(files_manifest).discard()
+            finally:
+                heartbeat.cancel()
+                run.cancel()
+        return True
+
+    async def _heartbeat(
+        self, job_id: str, slot_id: str, run: asyncio.Task, lease_lost: asyncio.Event
+    ):
+        """처리 중인 작업의 lease 갱신 (별도 세션, 스레드에서 실행)
+
+        다른 워커에게 회수된 것이 확인되면 lease_lost를 설정하고 실행 중인 작업(run)을 취소
+        """
+        from src.core.dependencies import get_database
+        from src.database.crud.program_job_crud import ProgramRegistrationJobCRUD
+
+        database = get_database()
+        interval = max(self.lease_seconds // 3, 1)
+
+        def beat() -> bool:
+            with database.session() as db:
+                return ProgramRegistrationJobCRUD(db).heartbeat(job_id, slot_id)
+
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await asyncio.to_thread(beat):
+                    logger.warning(
+                        f"프로그램 등록 작업 lease 상실, 실행 취소: job_id={job_id}, slot={slot_id}"
+                    )
+                    lease_lost.set()
+                    run.cancel()
+                    return
+            except Exception as e:
+                logger.warning(f"프로그램 등록 작업 heartbeat 실패: job_id={job_id}, error={str(e)}")
+
+
+# 전역 등록 워커 인스턴스
+program_registration_worker = None
+
+
+def get_program_registration_worker() -> ProgramRegistrationWorker:
+    """등록 워커 의존성 주입 (프로세스 싱글톤)"""
+    global program_registration_worker
+    if program_registration_worker is None:
+        from src.config import settings
+
+        program_registration_worker = ProgramRegistrationWorker(
+            concurrency=settings.program_job_worker_concurrency,
+            poll_interval=settings.program_job_poll_interval_sec,
+            lease_seconds=settings.program_job_lease_sec,
+            retry_delay_seconds=settings.program_job_retry_delay_sec,
+        )
+    return program_registration_worker
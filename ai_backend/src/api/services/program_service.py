@@ -2,12 +2,18 @@
 """Program Service for handling program registration and management."""
 import asyncio
 import logging
+import os
 from datetime import datetime
 from typing import Dict, List, Optional
 
 from fastapi import UploadFile
 from sqlalchemy.orm import Session
 from shared_core.models import Document
+from src.api.services.program_ingestion import (
+    ProgramIngestionContext,
+    SpooledUpload,
+    get_program_job_staging_root,
+)
 from src.api.services.program_uploader import ProgramUploader
 from src.api.services.program_validator import ProgramValidator
 from src.types.response.exceptions import HandledException
@@ -72,19 +78,28 @@ class ProgramService:
         Returns:
             Dict: 프로그램 등록 결과
         """
+        context = None
         try:
             program_id = gen()
 
-            # 1. 유효성 검사
-            validation_result = self._validate_program_files(
-                program_id=program_id,
+            # 0. 업로드 파일을 한 번만 디스크에 스풀링 (검증/저장/업로드에서 공유)
+            #    작업 큐 스테이징 볼륨에 스풀링하여 적재 시 복사 없이 rename만 수행
+            context = ProgramIngestionContext(
                 ladder_zip=ladder_zip,
                 classification_xlsx=classification_xlsx,
                 device_comment_csv=device_comment_csv,
+                spool_dir=get_program_job_staging_root(),
+            )
+
+            # 1. 유효성 검사
+            validation_result = self._validate_program_files(
+                program_id=program_id,
+                context=context,
             )
 
             # 2. 유효성 검사 직후 응답 반환
             if not validation_result["is_valid"]:
+                context.discard()
                 return validation_result
 
             # 3. 성공 시 즉시 응답 반환 (나머지는 비동기로 처리)
@@ -93,42 +108,81 @@ class ProgramService:
                 program_title=program_title,
                 warnings=validation_result["warnings"],
                 checked_files=validation_result["checked_files"],
+                cross_reference=validation_result["cross_reference"],
             )
 
-            # 4. 나머지 작업은 비동기로 처리 (DB 저장, 템플릿 생성 등)
-            asyncio.create_task(
-                self._complete_program_registration_async(
-                    program_id=program_id,
-                    program_title=program_title,
-                    program_description=program_description,
-                    user_id=user_id,
-                    ladder_zip=ladder_zip,
-                    classification_xlsx=classification_xlsx,
-                    device_comment_csv=device_comment_csv,
-                )
+            # 4. 나머지 작업은 등록 작업 큐에 적재 (워커 프로세스가 단계별로 처리)
+            #    스테이징 파일 정리는 워커가 담당
+            self._enqueue_registration_job(
+                program_id=program_id,
+                program_title=program_title,
+                program_description=program_description,
+                user_id=user_id,
+                context=context,
             )
 
             return response
 
         except HandledException:
+            if context is not None:
+                context.discard()
             raise
         except Exception as e:
+            if context is not None:
+                context.discard()
             logger.error(f"프로그램 등록 중 오류: {str(e)}")
             raise HandledException(ResponseCode.PROGRAM_REGISTRATION_ERROR, e=e)
 
+    def _enqueue_registration_job(
+        self,
+        program_id: str,
+        program_title: str,
+        program_description: Optional[str],
+        user_id: str,
+        context: ProgramIngestionContext,
+    ) -> str:
+        """등록 작업 적재
+
+        - 스풀링 파일을 작업별 스테이징 디렉토리로 옮겨 API 재시작 후에도 워커가 사용할 수 있게 함
+        - 생성할 행의 ID를 미리 발급하여 payload에 저장 (단계 재실행 시 같은 ID로 존재 여부 확인)
+        """
+        from src.config import settings
+        from src.database.crud.program_job_crud import ProgramRegistrationJobCRUD
+
+        job_id = gen()
+        manifest = context.persist(os.path.join(get_program_job_staging_root(), job_id))
+
+        payload = {
+            "program_title": program_title,
+            "program_description": program_description,
+            "user_id": user_id,
+            "files": manifest,
+            "ids": {
+                "template_document_id": gen(),
+                "template_id": gen(),
+                "ladder_document_id": gen(),
+                "comment_document_id": gen(),
+            },
+        }
+
+        ProgramRegistrationJobCRUD(self.db).enqueue(
+            job_id=job_id,
+            program_id=program_id,
+            payload=payload,
+            max_attempts=settings.program_job_max_attempts,
+        )
+        logger.info(f"프로그램 등록 작업 적재: program_id={program_id}, job_id={job_id}")
+        return job_id
+
     def _validate_program_files(
         self,
         program_id: str,
-        ladder_zip: UploadFile,
-        classification_xlsx: UploadFile,
-        device_comment_csv: UploadFile,
+        context: ProgramIngestionContext,
     ) -> Dict:
         """프로그램 파일 유효성 검사"""
         logger.info(f"프로그램 유효성 검사 시작: program_id={program_id}")
-        is_valid, errors, warnings, checked_files = self.validator.validate_files(
-            ladder_zip=ladder_zip,
-            classification_xlsx=classification_xlsx,
-            device_comment_csv=device_comment_csv,
+        is_valid, errors, warnings, checked_files, cross_reference = (
+            self.validator.validate_files(context)
         )
 
         if not is_valid:
@@ -143,6 +197,7 @@ class ProgramService:
                 "error_sections": error_sections,  # 섹션별 그룹화된 에러
                 "warnings": warnings,
                 "checked_files": checked_files,
+                "cross_reference": cross_reference,
                 "message": "유효성 검사를 통과하지 못했습니다.",
             }
 
@@ -151,6 +206,7 @@ class ProgramService:
             "errors": errors,
             "warnings": warnings,
             "checked_files": checked_files,
+            "cross_reference": cross_reference,
         }
 
     def _group_errors_by_section(self, errors: List[str]) -> Dict[str, List[str]]:
@@ -207,6 +263,10 @@ class ProgramService:
         logger.info(f"프로그램 메타데이터 저장 시작: program_id={program_id}")
         from src.database.models.program_models import Program
 
+        if self.program_crud.get_program(program_id):
+            logger.info(f"프로그램 메타데이터 이미 존재 (재실행): program_id={program_id}")
+            return
+
         self.program_crud.create_program(
             program_id=program_id,
             program_name=program_title,
@@ -223,59 +283,83 @@ class ProgramService:
         program_id: str,
         program_title: str,
         user_id: str,
-        classification_xlsx: UploadFile,
+        classification_xlsx: SpooledUpload,
+        template_document_id: Optional[str] = None,
+        template_id: Optional[str] = None,
     ) -> Dict:
-        """템플릿 및 템플릿데이터 생성"""
+        """템플릿 및 템플릿데이터 생성
+
+        ID를 지정하면 이미 생성된 행은 건너뜁니다. (등록 작업 단계 재실행)
+        """
         logger.info(f"템플릿 및 템플릿데이터 생성 시작: program_id={program_id}")
         from src.database.crud.template_crud import TemplateCRUD, TemplateDataCRUD
         from src.database.crud.document_crud import DocumentCRUD
-        import pandas as pd
-        import io
 
         template_crud = TemplateCRUD(self.db)
         template_data_crud = TemplateDataCRUD(self.db)
         document_crud = DocumentCRUD(self.db)
 
-        # classification_xlsx 파일 읽기
-        classification_xlsx.file.seek(0)
-        xlsx_content = classification_xlsx.file.read()
-        classification_xlsx.file.seek(0)
-        df = pd.read_excel(io.BytesIO(xlsx_content))
+        template_document_id = template_document_id or gen()
+        template_id = template_id or gen()
+
+        # 템플릿데이터는 단일 트랜잭션으로 적재되므로 행이 있으면 전체가 저장된 상태
+        existing_rows = template_data_crud.get_template_data_by_template(template_id)
+        if existing_rows:
+            template_data_list = [
+                {
+                    "template_data_id": row.template_data_id,
+                    "logic_id": row.logic_id,
+                    "logic_name": row.logic_name,
+                }
+                for row in existing_rows
+            ]
+            logger.info(
+                f"템플릿데이터 이미 존재 (재실행): program_id={program_id}, "
+                f"template_id={template_id}, template_data_count={len(template_data_list)}"
+            )
+            return {
+                "template_document_id": template_document_id,
+                "template_data_list": template_data_list,
+                "total_expected": len(template_data_list),
+            }
+
+        # classification_xlsx DataFrame (유효성 검사에서 파싱한 결과 재사용)
+        df = classification_xlsx.excel_dataframe
 
         # 템플릿 Document 생성
-        template_document_id = gen()
-        document_crud.create_document(
-            document_id=template_document_id,
-            document_name=f"{program_title}_template",
-            original_filename="classification.xlsx",
-            file_key=None,
-            file_size=len(xlsx_content),
-            file_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            file_extension="xlsx",
-            user_id=user_id,
-            upload_path=None,
-            status="processing",
-            document_type="common",
-            program_id=program_id,
-            program_file_type="template",
-            metadata_json={
-                "program_id": program_id,
-                "program_title": program_title,
-            },
-        )
+        if not document_crud.get_document(template_document_id):
+            document_crud.create_document(
+                document_id=template_document_id,
+                document_name=f"{program_title}_template",
+                original_filename="classification.xlsx",
+                file_key=None,
+                file_size=classification_xlsx.size,
+                file_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                file_extension="xlsx",
+                user_id=user_id,
+                upload_path=None,
+                status="processing",
+                document_type="common",
+                program_id=program_id,
+                program_file_type="template",
+                metadata_json={
+                    "program_id": program_id,
+                    "program_title": program_title,
+                },
+            )
 
         # 템플릿 생성
-        template_id = gen()
-        template_crud.create_template(
-            template_id=template_id,
-            document_id=template_document_id,
-            created_by=user_id,
-            program_id=program_id,
-            metadata_json={
-                "program_id": program_id,
-                "program_title": program_title,
-            },
-        )
+        if not template_crud.get_template(template_id):
+            template_crud.create_template(
+                template_id=template_id,
+                document_id=template_document_id,
+                created_by=user_id,
+                program_id=program_id,
+                metadata_json={
+                    "program_id": program_id,
+                    "program_title": program_title,
+                },
+            )
 
         # 템플릿데이터 생성
         template_data_list = self._create_template_data_rows(
@@ -305,115 +389,145 @@ class ProgramService:
         program_id: str,
         template_data_crud,
     ) -> List[Dict]:
-        """템플릿데이터 행 생성"""
-        template_data_list = []
-        for idx, row in df.iterrows():
-            template_data_id = gen()
-
-            # 엑셀 컬럼에서 직접 값 추출
-            logic_id = str(
-                row.get("LOGIC_ID", row.get("로직파일명", f"logic_{idx}"))
-            ).strip()
-            logic_name = str(
-                row.get("LOGIC_NAME", row.get("로직파일명", logic_id))
-            ).strip()
-            folder_id = str(row.get("FOLDER_ID", "")).strip() or None
-            folder_name = str(row.get("FOLDER_NAME", "")).strip() or None
-            sub_folder_name = str(row.get("SUB_FOLDER_NAME", "")).strip() or None
-
-            # 기존 형식 호환성
-            classification = str(row.get("분류", "")).strip()
-            template_name = str(row.get("템플릿명", "")).strip()
-
-            template_data_crud.create_template_data(
-                template_data_id=template_data_id,
-                template_id=template_id,
-                logic_id=logic_id,
-                logic_name=logic_name,
-                row_index=idx,
-                folder_id=folder_id,
-                folder_name=folder_name,
-                sub_folder_name=sub_folder_name,
-                document_id=None,
-                metadata_json={
+        """템플릿데이터 행 생성 (컬럼 단위 추출 + 단일 트랜잭션 bulk insert)"""
+        import pandas as pd
+
+        if df.empty:
+            return []
+
+        def text_column(*names):
+            """첫 번째로 존재하는 컬럼을 공백 제거한 문자열로 추출 (없거나 NaN이면 빈 문자열)"""
+            for name in names:
+                if name in df.columns:
+                    return df[name].fillna("").astype(str).str.strip()
+            return pd.Series("", index=df.index, dtype=object)
+
+        # 엑셀 컬럼에서 직접 값 추출 (행 단위 iterrows 대신 컬럼 단위로 한 번에 처리)
+        row_indexes = df.index.tolist()
+        logic_ids = text_column("LOGIC_ID", "로직파일명")
+        logic_ids = logic_ids.where(
+            logic_ids != "", pd.Series([f"logic_{idx}" for idx in row_indexes], index=df.index)
+        )
+        logic_names = text_column("LOGIC_NAME", "로직파일명")
+        logic_names = logic_names.where(logic_names != "", logic_ids)
+
+        # 기존 형식 호환성
+        classifications = text_column("분류")
+        template_names = text_column("템플릿명")
+
+        rows = [
+            {
+                "template_id": template_id,
+                "logic_id": logic_id,
+                "logic_name": logic_name,
+                "row_index": row_index,
+                "folder_id": folder_id or None,
+                "folder_name": folder_name or None,
+                "sub_folder_name": sub_folder_name or None,
+                "document_id": None,
+                "metadata_json": {
                     "program_id": program_id,
-                    "classification": classification if classification else None,
-                    "template_name": template_name if template_name else None,
+                    "classification": classification or None,
+                    "template_name": template_name or None,
                 },
+            }
+            for (
+                row_index,
+                logic_id,
+                logic_name,
+                folder_id,
+                folder_name,
+                sub_folder_name,
+                classification,
+                template_name,
+            ) in zip(
+                row_indexes,
+                logic_ids.tolist(),
+                logic_names.tolist(),
+                text_column("FOLDER_ID").tolist(),
+                text_column("FOLDER_NAME").tolist(),
+                text_column("SUB_FOLDER_NAME").tolist(),
+                classifications.tolist(),
+                template_names.tolist(),
             )
-            template_data_list.append({
-                "template_data_id": template_data_id,
-                "logic_id": logic_id,
-                "logic_name": logic_name,
-            })
+        ]
 
-        return template_data_list
+        template_data_ids = template_data_crud.bulk_create(rows)
+
+        return [
+            {
+                "template_data_id": template_data_id,
+                "logic_id": row["logic_id"],
+                "logic_name": row["logic_name"],
+            }
+            for template_data_id, row in zip(template_data_ids, rows)
+        ]
 
     def _create_program_documents(
         self,
         program_id: str,
         program_title: str,
         user_id: str,
-        ladder_zip: UploadFile,
-        device_comment_csv: UploadFile,
+        ladder_zip: SpooledUpload,
+        device_comment_csv: SpooledUpload,
         template_document_id: str,
+        ladder_document_id: Optional[str] = None,
+        comment_document_id: Optional[str] = None,
     ) -> Dict[str, str]:
-        """프로그램 관련 Document 생성"""
+        """프로그램 관련 Document 생성 (ID 지정 시 이미 생성된 Document는 건너뜀)"""
         from src.database.crud.document_crud import DocumentCRUD
 
         document_crud = DocumentCRUD(self.db)
 
         # ladder_zip Document 생성
-        ladder_document_id = gen()
-        ladder_zip.file.seek(0)
-        ladder_zip_size = len(ladder_zip.file.read())
-        ladder_zip.file.seek(0)
-
-        document_crud.create_document(
-            document_id=ladder_document_id,
-            document_name=f"{program_title}_ladder_logic",
-            original_filename=ladder_zip.filename or "ladder_logic.zip",
-            file_key=None,
-            file_size=ladder_zip_size,
-            file_type="application/zip",
-            file_extension="zip",
-            user_id=user_id,
-            upload_path=None,
-            status="processing",
-            document_type="common",
-            program_id=program_id,
-            program_file_type="ladder_logic",
-            metadata_json={
-                "program_id": program_id,
-                "program_title": program_title,
-            },
-        )
+        ladder_document_id = ladder_document_id or gen()
+
+        if not document_crud.get_document(ladder_document_id):
+            document_crud.create_document(
+                document_id=ladder_document_id,
+                document_name=f"{program_title}_ladder_logic",
+                original_filename=ladder_zip.filename,
+                file_key=None,
+                file_size=ladder_zip.size,
+                file_type="application/zip",
+                file_extension="zip",
+                user_id=user_id,
+                upload_path=None,
+                status="processing",
+                document_type="common",
+                program_id=program_id,
+                program_file_type="ladder_logic",
+                metadata_json={
+                    "program_id": program_id,
+                    "program_title": program_title,
+                },
+            )
 
         # device_comment_csv Document 생성
-        comment_document_id = gen()
-        device_comment_csv.file.seek(0)
-        comment_csv_size = len(device_comment_csv.file.read())
-        device_comment_csv.file.seek(0)
-
-        document_crud.create_document(
-            document_id=comment_document_id,
-            document_name=f"{program_title}_device_comment",
-            original_filename=device_comment_csv.filename or "device_comment.csv",
-            file_key=None,
-            file_size=comment_csv_size,
-            file_type="text/csv",
-            file_extension="csv",
-            user_id=user_id,
-            upload_path=None,
-            status="processing",
-            document_type="common",
-            program_id=program_id,
-            program_file_type="comment",
-            metadata_json={
-                "program_id": program_id,
-                "program_title": program_title,
-            },
-        )
+        comment_document_id = comment_document_id or gen()
+
+        if not document_crud.get_document(comment_document_id):
+            document_crud.create_document(
+                document_id=comment_document_id,
+                document_name=f"{program_title}_device_comment",
+                original_filename=device_comment_csv.filename,
+                file_key=None,
+                file_size=device_comment_csv.size,
+                file_type="text/csv",
+                file_extension="csv",
+                user_id=user_id,
+                upload_path=None,
+                status="processing",
+                document_type="common",
+                program_id=program_id,
+                program_file_type="comment",
+                metadata_json={
+                    "program_id": program_id,
+                    "program_title": program_title,
+                    # 등록 시 감지한 CSV 인코딩 (후속 처리에서 다시 감지하지 않도록 기록)
+                    "encoding": device_comment_csv.csv_encoding,
+                },
+            )
 
         self.db.commit()
         logger.info(
@@ -449,84 +563,199 @@ class ProgramService:
         )
         self.db.commit()
 
-    async def _complete_program_registration_async(
-        self,
-        program_id: str,
-        program_title: str,
-        program_description: Optional[str],
-        user_id: str,
-        ladder_zip: UploadFile,
-        classification_xlsx: UploadFile,
-        device_comment_csv: UploadFile,
-    ):
-        """프로그램 등록 완료 처리 (비동기)
-        
-        - 프로그램 메타데이터 저장
-        - 템플릿 및 템플릿데이터 생성
-        - Document 생성
-        - S3 업로드 및 전처리 시작
+    async def run_registration_job(self, job, job_crud, worker_id: str) -> None:
+        """등록 작업 단계별 실행 (워커에서 호출)
+
+        메타데이터 → 템플릿 → S3 → 전처리 → 인덱싱 순으로 처리하며 단계가 끝날 때마다
+        checkpoint를 저장합니다. 재시도/회수된 작업은 마지막 완료 단계 다음부터 재개합니다.
+        checkpoint 저장 시 점유(worker_id)를 잃은 것이 확인되면 즉시 중단합니다.
+        동기 DB/pandas 단계는 스레드에서 실행하여 이벤트 루프(heartbeat 포함)를 막지 않습니다.
+        예외는 호출자(워커)가 재시도 또는 최종 실패로 처리합니다.
+
+        Args:
+            job: ProgramRegistrationJob
+            job_crud: ProgramRegistrationJobCRUD
+            worker_id: 작업을 점유한 워커 ID
         """
-        try:
-            # 1. 프로그램 메타데이터 저장
-            self._create_program_metadata(
-                program_id=program_id,
-                program_title=program_title,
-                program_description=program_description,
-                user_id=user_id,
+        from src.database.models.program_models import ProgramRegistrationJob
+
+        async def save_checkpoint(stage: str, data: Optional[Dict] = None):
+            saved = await self._run_sync_stage(job_crud.save_checkpoint, job.job_id, worker_id, stage, data)
+            if not saved:
+                raise HandledException(
+                    ResponseCode.DATABASE_TRANSACTION_ERROR,
+                    msg=f"등록 작업 점유를 잃었습니다 (job_id={job.job_id}, stage={stage})",
+                )
+
+        stages = ProgramRegistrationJob.STAGES
+        completed = set(stages[: stages.index(job.stage) + 1]) if job.stage else set()
+        program_id = job.program_id
+        payload = job.payload
+        ids = payload["ids"]
+        checkpoint = dict(job.checkpoint or {})
+        context = ProgramIngestionContext.restore(payload["files"])
+
+        if completed:
+            logger.info(
+                f"프로그램 등록 작업 재개: program_id={program_id}, "
+                f"job_id={job.job_id}, last_stage={job.stage}, attempt={job.attempts}"
             )
 
-            # 2. 템플릿 및 템플릿데이터 생성
-            template_result = self._create_templates_and_data(
+        # 1. 프로그램 메타데이터 저장
+        if ProgramRegistrationJob.STAGE_METADATA not in completed:
+            await self._run_sync_stage(
+                self._create_program_metadata,
                 program_id=program_id,
-                program_title=program_title,
-                user_id=user_id,
-                classification_xlsx=classification_xlsx,
+                program_title=payload["program_title"],
+                program_description=payload.get("program_description"),
+                user_id=payload["user_id"],
             )
-            template_document_id = template_result["template_document_id"]
-            template_data_list = template_result["template_data_list"]
-            total_expected = template_result["total_expected"]
+            await save_checkpoint(ProgramRegistrationJob.STAGE_METADATA)
 
-            # 3. Document 생성 (ladder_logic, comment, template)
-            document_ids = self._create_program_documents(
+        # 2. 템플릿/템플릿데이터/Document 생성 및 Program.metadata_json 업데이트
+        if ProgramRegistrationJob.STAGE_TEMPLATES not in completed:
+            template_result = await self._run_sync_stage(
+                self._create_templates_and_data,
                 program_id=program_id,
-                program_title=program_title,
-                user_id=user_id,
-                ladder_zip=ladder_zip,
-                device_comment_csv=device_comment_csv,
-                template_document_id=template_document_id,
+                program_title=payload["program_title"],
+                user_id=payload["user_id"],
+                classification_xlsx=context.classification_xlsx,
+                template_document_id=ids["template_document_id"],
+                template_id=ids["template_id"],
             )
-
-            # 4. Program.metadata_json 업데이트
-            self._update_program_metadata(
-                program_id=program_id, total_expected=total_expected
+            await self._run_sync_stage(
+                self._create_program_documents,
+                program_id=program_id,
+                program_title=payload["program_title"],
+                user_id=payload["user_id"],
+                ladder_zip=context.ladder_zip,
+                device_comment_csv=context.device_comment_csv,
+                template_document_id=ids["template_document_id"],
+                ladder_document_id=ids["ladder_document_id"],
+                comment_document_id=ids["comment_document_id"],
+            )
+            await self._run_sync_stage(
+                self._update_program_metadata,
+                program_id=program_id,
+                total_expected=template_result["total_expected"],
             )
+            await save_checkpoint(ProgramRegistrationJob.STAGE_TEMPLATES)
 
-            # 5. S3 업로드 및 전처리 시작
-            await self._process_program_async(
+        # 3. S3 업로드 및 ZIP 압축 해제
+        if ProgramRegistrationJob.STAGE_S3 not in completed:
+            s3_paths = await self._upload_program_files(
                 program_id=program_id,
-                program_title=program_title,
-                user_id=user_id,
-                ladder_zip=ladder_zip,
-                classification_xlsx=classification_xlsx,
-                device_comment_csv=device_comment_csv,
-                ladder_document_id=document_ids["ladder_document_id"],
-                comment_document_id=document_ids["comment_document_id"],
-                template_document_id=document_ids["template_document_id"],
+                user_id=payload["user_id"],
+                context=context,
+                ladder_document_id=ids["ladder_document_id"],
+                comment_document_id=ids["comment_document_id"],
+                template_document_id=ids["template_document_id"],
+            )
+            await save_checkpoint(ProgramRegistrationJob.STAGE_S3, {"s3_paths": s3_paths})
+        else:
+            s3_paths = checkpoint["s3_paths"]
+
+        # 4. 전처리 (중간에 중단된 경우 이전 시도의 부분 결과를 지우고 다시 수행)
+        if ProgramRegistrationJob.STAGE_PREPROCESS not in completed:
+            if job.attempts > 1:
+                await self._run_sync_stage(self._reset_preprocess_outputs, program_id)
+            template_data_list = await self._run_sync_stage(
+                self._load_template_data_list, ids["template_id"]
+            )
+            await self._preprocess_program_files(
+                program_id=program_id,
+                program_title=payload["program_title"],
+                user_id=payload["user_id"],
+                s3_paths=s3_paths,
                 template_data_list=template_data_list,
+                context=context,
             )
+            await save_checkpoint(ProgramRegistrationJob.STAGE_PREPROCESS)
 
-        except Exception as e:
-            logger.error(
-                f"프로그램 등록 완료 처리 중 오류: program_id={program_id}, error={str(e)}"
-            )
-            from src.database.models.program_models import Program
+        # 5. Vector DB 인덱싱 요청
+        if ProgramRegistrationJob.STAGE_INDEXING not in completed:
+            await self._request_program_indexing(program_id=program_id, s3_paths=s3_paths)
+            await save_checkpoint(ProgramRegistrationJob.STAGE_INDEXING)
 
-            self.program_crud.update_program_status(
-                program_id=program_id,
-                status=Program.STATUS_FAILED,
-                error_message=str(e),
+    @staticmethod
+    async def _run_sync_stage(func, *args, **kwargs):
+        """동기 단계를 스레드에서 실행
+
+        작업이 취소되어도 스레드의 DB 작업이 끝난 뒤에 취소를 전파하여
+        호출자의 rollback과 같은 세션을 동시에 사용하지 않도록 합니다.
+        """
+        future = asyncio.ensure_future(asyncio.to_thread(func, *args, **kwargs))
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            try:
+                await future
+            except Exception:
+                pass
+            raise
+
+    def mark_registration_failed(self, program_id: str, error_message: str):
+        """등록 작업 최종 실패 시 프로그램 상태 반영 (메타데이터 단계 전 실패면 무시)"""
+        from src.database.models.program_models import Program
+
+        self.db.rollback()
+        if not self.program_crud.get_program(program_id):
+            return
+        self.program_crud.update_program_status(
+            program_id=program_id,
+            status=Program.STATUS_FAILED,
+            error_message=error_message,
+        )
+        self.db.commit()
+
+    def _load_template_data_list(self, template_id: str) -> List[Dict]:
+        """전처리용 템플릿데이터 목록 (logic_id 매핑용 최소 컬럼)"""
+        from src.database.crud.template_crud import TemplateDataCRUD
+
+        return [
+            {
+                "template_data_id": row.template_data_id,
+                "logic_id": row.logic_id,
+                "logic_name": row.logic_name,
+            }
+            for row in TemplateDataCRUD(self.db).get_template_data_by_template(template_id)
+        ]
+
+    def _reset_preprocess_outputs(self, program_id: str):
+        """중단된 전처리 시도의 부분 결과 정리 (전처리 Document, 템플릿데이터 연결, 전처리 실패 기록)"""
+        from src.database.models.program_models import ProcessingFailure
+        from src.database.models.template_models import Template, TemplateData
+
+        template_ids = self.db.query(Template.template_id).filter(
+            Template.program_id == program_id
+        )
+        self.db.query(TemplateData).filter(
+            TemplateData.template_id.in_(template_ids.scalar_subquery())
+        ).update({TemplateData.document_id: None}, synchronize_session=False)
+
+        # 전처리 Document는 program_file_type이 없는 JSON Document
+        deleted_documents = (
+            self.db.query(Document)
+            .filter(
+                Document.program_id == program_id,
+                Document.program_file_type.is_(None),
             )
-            self.db.commit()
+            .delete(synchronize_session=False)
+        )
+        deleted_failures = (
+            self.db.query(ProcessingFailure)
+            .filter(
+                ProcessingFailure.source_type == ProcessingFailure.SOURCE_TYPE_PROGRAM,
+                ProcessingFailure.source_id == program_id,
+                ProcessingFailure.failure_type == ProcessingFailure.FAILURE_TYPE_PREPROCESSING,
+            )
+            .delete(synchronize_session=False)
+        )
+        self.db.commit()
+        logger.info(
+            f"이전 전처리 결과 정리: program_id={program_id}, "
+            f"documents={deleted_documents}, failures={deleted_failures}"
+        )
 
     def _build_success_response(
         self,
@@ -534,6 +763,7 @@ class ProgramService:
         program_title: str,
         warnings: List[str],
         checked_files: List[str],
+        cross_reference: Optional[Dict] = None,
     ) -> Dict:
         """성공 응답 생성"""
         return {
@@ -544,241 +774,234 @@ class ProgramService:
             "errors": [],
             "warnings": warnings,
             "checked_files": checked_files,
+            "cross_reference": cross_reference or {},
             "message": "파일 등록 요청하였습니다.",
         }
 
-    async def _process_program_async(
+    async def _upload_program_files(
         self,
         program_id: str,
-        program_title: str,
         user_id: str,
-        ladder_zip: UploadFile,
-        classification_xlsx: UploadFile,
-        device_comment_csv: UploadFile,
+        context: ProgramIngestionContext,
         ladder_document_id: str,
         comment_document_id: str,
         template_document_id: str,
-        template_data_list: list,
-    ):
-        """
-        비동기로 프로그램 처리 (S3 업로드, DB 저장, Vector DB 인덱싱)
-        """
-        try:
-            logger.info(f"비동기 프로그램 처리 시작: program_id={program_id}")
+    ) -> Dict:
+        """S3 업로드/ZIP 압축 해제 후 Document에 S3 경로 반영 (등록 작업 S3 단계)"""
+        # 1. S3에 파일 업로드 및 ZIP 압축 해제 (비동기)
+        logger.info(f"S3 업로드 시작: program_id={program_id}")
+        s3_paths = await self.uploader.upload_and_unzip(
+            context=context,
+            program_id=program_id,
+            user_id=user_id,
+        )
+        logger.info(f"S3 업로드 완료: program_id={program_id}")
 
-            # 1. S3에 파일 업로드 및 ZIP 압축 해제 (비동기)
-            logger.info(f"S3 업로드 시작: program_id={program_id}")
-            s3_paths = await self.uploader.upload_and_unzip(
-                ladder_zip=ladder_zip,
-                classification_xlsx=classification_xlsx,
-                device_comment_csv=device_comment_csv,
-                program_id=program_id,
-                user_id=user_id,
-            )
-            logger.info(f"S3 업로드 완료: program_id={program_id}")
-
-            # 2. Document에 S3 경로 업데이트 (비동기)
-            logger.info(f"Document S3 경로 업데이트 시작: program_id={program_id}")
-            from src.database.crud.document_crud import DocumentCRUD
-            document_crud = DocumentCRUD(self.db)
-
-            # ladder_document 업데이트
-            if ladder_document_id and s3_paths.get("ladder_zip_path"):
-                document_crud.update_document(
-                    document_id=ladder_document_id,
-                    file_key=f"programs/{program_id}/ladder_logic.zip",
-                    upload_path=s3_paths.get("ladder_zip_path"),
-                )
+        # 2. Document에 S3 경로 업데이트 (비동기)
+        logger.info(f"Document S3 경로 업데이트 시작: program_id={program_id}")
+        from src.database.crud.document_crud import DocumentCRUD
+        document_crud = DocumentCRUD(self.db)
 
-            # comment_document 업데이트
-            if comment_document_id and s3_paths.get("device_comment_csv_path"):
-                document_crud.update_document(
-                    document_id=comment_document_id,
-                    file_key=f"programs/{program_id}/device_comment.csv",
-                    upload_path=s3_paths.get("device_comment_csv_path"),
-                )
+        # ladder_document 업데이트
+        if ladder_document_id and s3_paths.get("ladder_zip_path"):
+            document_crud.update_document(
+                document_id=ladder_document_id,
+                file_key=f"programs/{program_id}/ladder_logic.zip",
+                upload_path=s3_paths.get("ladder_zip_path"),
+            )
 
-            # template_document 업데이트
-            if template_document_id and s3_paths.get("classification_xlsx_path"):
-                document_crud.update_document(
-                    document_id=template_document_id,
-                    file_key=f"programs/{program_id}/classification.xlsx",
-                    upload_path=s3_paths.get("classification_xlsx_path"),
-                )
+        # comment_document 업데이트
+        if comment_document_id and s3_paths.get("device_comment_csv_path"):
+            document_crud.update_document(
+                document_id=comment_document_id,
+                file_key=f"programs/{program_id}/device_comment.csv",
+                upload_path=s3_paths.get("device_comment_csv_path"),
+            )
 
-            self.db.commit()
-            logger.info(f"Document S3 경로 업데이트 완료: program_id={program_id}")
+        # template_document 업데이트
+        if template_document_id and s3_paths.get("classification_xlsx_path"):
+            document_crud.update_document(
+                document_id=template_document_id,
+                file_key=f"programs/{program_id}/classification.xlsx",
+                upload_path=s3_paths.get("classification_xlsx_path"),
+            )
 
-            # 3. 전처리: ZIP 압축 해제 파일들로 JSON 생성, S3 업로드 및 Document 저장
-            logger.info(f"전처리 시작: program_id={program_id}")
-            unzipped_files = s3_paths.get("unzipped_files", [])
+        self.db.commit()
+        logger.info(f"Document S3 경로 업데이트 완료: program_id={program_id}")
 
-            # CRUD 인스턴스 생성
-            from src.database.crud.document_crud import DocumentCRUD
-            from src.database.crud.program_failure_crud import ProcessingFailureCRUD
-            from src.database.crud.template_crud import TemplateDataCRUD
+        return s3_paths
 
-            document_crud = DocumentCRUD(self.db)
-            failure_crud = ProcessingFailureCRUD(self.db)
-            template_data_crud = TemplateDataCRUD(self.db)
+    async def _preprocess_program_files(
+        self,
+        program_id: str,
+        program_title: str,
+        user_id: str,
+        s3_paths: Dict,
+        template_data_list: list,
+        context: Optional[ProgramIngestionContext] = None,
+    ):
+        """ZIP 압축 해제 파일 전처리 및 처리 통계 저장 (등록 작업 전처리 단계)"""
+        # 전처리: ZIP 압축 해제 파일들로 JSON 생성, S3 업로드 및 Document 저장
+        logger.info(f"전처리 시작: program_id={program_id}")
+        unzipped_files = s3_paths.get("unzipped_files", [])
 
-            # template_data_list를 logic_id로 매핑 (빠른 조회를 위해)
-            template_data_map = {
-                td["logic_id"]: td for td in template_data_list
-            }
+        # CRUD 인스턴스 생성
+        from src.database.crud.document_crud import DocumentCRUD
+        from src.database.crud.program_failure_crud import ProcessingFailureCRUD
+        from src.database.crud.template_crud import TemplateDataCRUD
 
-            # 전처리 수행 (각 파일마다 즉시 Document 저장)
-            preprocess_result = await self.uploader.preprocess_and_create_json(
-                program_id=program_id,
-                program_title=program_title,
-                user_id=user_id,
-                unzipped_files=unzipped_files,
-                classification_xlsx_path=s3_paths.get("classification_xlsx_path"),
-                device_comment_csv_path=s3_paths.get("device_comment_csv_path"),
-                db_session=self.db,
-                document_crud=document_crud,
-                template_data_crud=template_data_crud,
-                failure_crud=failure_crud,
-                template_data_map=template_data_map,
-                chunk_commit_size=50,
-            )
+        document_crud = DocumentCRUD(self.db)
+        failure_crud = ProcessingFailureCRUD(self.db)
+        template_data_crud = TemplateDataCRUD(self.db)
 
-            preprocess_summary = preprocess_result.get("summary", {})
-            created_documents = preprocess_result.get("created_documents", [])
-            failed_files = preprocess_result.get("failed_files", [])
+        # template_data_list를 logic_id로 매핑 (빠른 조회를 위해)
+        template_data_map = {
+            td["logic_id"]: td for td in template_data_list
+        }
 
-            logger.info(
-                f"전처리 완료: {preprocess_summary.get('success', 0)}개 성공, "
-                f"{preprocess_summary.get('failed', 0)}개 실패"
-            )
+        # 전처리 수행 (I/O·CPU 단계별 동시 처리, Document는 배치 저장)
+        preprocess_result = await self.uploader.preprocess_and_create_json(
+            program_id=program_id,
+            program_title=program_title,
+            user_id=user_id,
+            unzipped_files=unzipped_files,
+            classification_xlsx_path=s3_paths.get("classification_xlsx_path"),
+            device_comment_csv_path=s3_paths.get("device_comment_csv_path"),
+            db_session=self.db,
+            document_crud=document_crud,
+            template_data_crud=template_data_crud,
+            failure_crud=failure_crud,
+            template_data_map=template_data_map,
+            chunk_commit_size=50,
+            context=context,
+            device_comment_index_path=s3_paths.get("device_comment_index_path"),
+        )
 
-            # 부분 실패가 있는 경우 경고 로깅
-            has_partial_failure = len(failed_files) > 0
+        preprocess_summary = preprocess_result.get("summary", {})
+        created_documents = preprocess_result.get("created_documents", [])
+        failed_files = preprocess_result.get("failed_files", [])
 
-            if has_partial_failure:
-                logger.warning(
-                    f"부분 실패 발생: program_id={program_id}, "
-                    f"전처리 실패: {len(failed_files)}개"
-                )
+        logger.info(
+            f"전처리 완료: {preprocess_summary.get('success', 0)}개 성공, "
+            f"{preprocess_summary.get('failed', 0)}개 실패"
+        )
 
-            # 실패 정보 요약을 Program.metadata_json에 저장 (통계용)
-            processing_metadata = {
-                "total_expected": len(unzipped_files),
-                "total_successful_documents": len(created_documents),
-                "has_partial_failure": has_partial_failure,
-                "preprocessing_summary": preprocess_summary,
-                # 실제 실패 정보는 ProcessingFailure 테이블에서 조회
-            }
+        # 부분 실패가 있는 경우 경고 로깅
+        has_partial_failure = len(failed_files) > 0
 
-            # Program.metadata_json 업데이트 (통계만)
-            from src.database.models.program_models import Program
+        if has_partial_failure:
+            logger.warning(
+                f"부분 실패 발생: program_id={program_id}, "
+                f"전처리 실패: {len(failed_files)}개"
+            )
 
-            program = self.program_crud.get_program(program_id)
-            if program:
-                current_metadata = program.metadata_json or {}
-                current_metadata.update(processing_metadata)
-                self.program_crud.update_program(
-                    program_id=program_id, metadata_json=current_metadata
-                )
-                self.db.commit()
-                logger.info(f"처리 메타데이터 저장 완료: program_id={program_id}")
+        # 실패 정보 요약을 Program.metadata_json에 저장 (통계용)
+        processing_metadata = {
+            "total_expected": len(unzipped_files),
+            "total_successful_documents": len(created_documents),
+            "has_partial_failure": has_partial_failure,
+            "preprocessing_summary": preprocess_summary,
+            # 실제 실패 정보는 ProcessingFailure 테이블에서 조회
+        }
 
-            # 5. Vector DB 인덱싱 요청 (비동기)
-            logger.info(f"Vector DB 인덱싱 요청 시작: program_id={program_id}")
+        # Program.metadata_json 업데이트 (통계만)
+        program = self.program_crud.get_program(program_id)
+        if program:
+            current_metadata = program.metadata_json or {}
+            current_metadata.update(processing_metadata)
+            self.program_crud.update_program(
+                program_id=program_id, metadata_json=current_metadata
+            )
+            self.db.commit()
+            logger.info(f"처리 메타데이터 저장 완료: program_id={program_id}")
 
-            # ProcessingJob 테이블에 인덱싱 작업 생성
-            from shared_core import ProcessingJobCRUD
+    async def _request_program_indexing(self, program_id: str, s3_paths: Dict):
+        """Vector DB 인덱싱 요청 및 프로그램 상태 반영 (등록 작업 인덱싱 단계)"""
+        from src.database.models.program_models import Program
 
-            job_crud = ProcessingJobCRUD(self.db)
-            job_id = (
-                f"vector_indexing_{program_id}_"
-                f"{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            )
+        # Vector DB 인덱싱 요청 (비동기)
+        logger.info(f"Vector DB 인덱싱 요청 시작: program_id={program_id}")
 
-            # 인덱싱 작업 생성
-            job_crud.create_job(
-                job_id=job_id,
-                doc_id=program_id,  # program_id를 doc_id로 사용
-                job_type="vector_indexing",
-                total_steps=1,
-            )
-            self.db.commit()
-            logger.info(f"Vector DB 인덱싱 작업 생성: job_id={job_id}")
+        # ProcessingJob 테이블에 인덱싱 작업 생성
+        from shared_core import ProcessingJobCRUD
 
-            try:
-                # Vector DB 인덱싱 요청
-                indexing_success = await self.uploader.request_vector_indexing(
-                    program_id=program_id, s3_paths=s3_paths
-                )
+        job_crud = ProcessingJobCRUD(self.db)
+        job_id = (
+            f"vector_indexing_{program_id}_"
+            f"{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        )
 
-                if indexing_success:
-                    # 인덱싱 작업 성공 처리
-                    job_crud.update_job_status(
-                        job_id=job_id,
-                        status="completed",
-                        completed_steps=1,
-                        current_step="Vector DB 인덱싱 완료",
-                        result_data={"program_id": program_id, "status": "completed"},
-                    )
+        # 인덱싱 작업 생성
+        job_crud.create_job(
+            job_id=job_id,
+            doc_id=program_id,  # program_id를 doc_id로 사용
+            job_type="vector_indexing",
+            total_steps=1,
+        )
+        self.db.commit()
+        logger.info(f"Vector DB 인덱싱 작업 생성: job_id={job_id}")
 
-                    # 프로그램 상태 업데이트
-                    self.program_crud.update_program_status(
-                        program_id=program_id, status=Program.STATUS_COMPLETED
-                    )
-                    self.program_crud.update_program_vector_info(
-                        program_id=program_id, vector_indexed=True
-                    )
-                    self.db.commit()
-                    logger.info(f"프로그램 처리 완료: program_id={program_id}")
-                else:
-                    # 인덱싱 작업 실패 처리
-                    job_crud.update_job_status(
-                        job_id=job_id,
-                        status="failed",
-                        completed_steps=0,
-                        current_step="Vector DB 인덱싱 실패",
-                        error_message="Vector DB 인덱싱 요청 실패",
-                    )
+        try:
+            # Vector DB 인덱싱 요청
+            indexing_success = await self.uploader.request_vector_indexing(
+                program_id=program_id, s3_paths=s3_paths
+            )
 
-                    # 프로그램 상태 업데이트
-                    self.program_crud.update_program_status(
-                        program_id=program_id, status=Program.STATUS_INDEXING_FAILED
-                    )
-                    self.db.commit()
-                    logger.warning(f"Vector DB 인덱싱 실패: program_id={program_id}")
+            if indexing_success:
+                # 인덱싱 작업 성공 처리
+                job_crud.update_job_status(
+                    job_id=job_id,
+                    status="completed",
+                    completed_steps=1,
+                    current_step="Vector DB 인덱싱 완료",
+                    result_data={"program_id": program_id, "status": "completed"},
+                )
 
-            except Exception as indexing_error:
-                # 인덱싱 중 예외 발생 처리
-                error_msg = str(indexing_error)
+                # 프로그램 상태 업데이트
+                self.program_crud.update_program_status(
+                    program_id=program_id, status=Program.STATUS_COMPLETED
+                )
+                self.program_crud.update_program_vector_info(
+                    program_id=program_id, vector_indexed=True
+                )
+                self.db.commit()
+                logger.info(f"프로그램 처리 완료: program_id={program_id}")
+            else:
+                # 인덱싱 작업 실패 처리
                 job_crud.update_job_status(
                     job_id=job_id,
                     status="failed",
                     completed_steps=0,
-                    current_step="Vector DB 인덱싱 오류",
-                    error_message=error_msg,
+                    current_step="Vector DB 인덱싱 실패",
+                    error_message="Vector DB 인덱싱 요청 실패",
                 )
 
+                # 프로그램 상태 업데이트
                 self.program_crud.update_program_status(
                     program_id=program_id, status=Program.STATUS_INDEXING_FAILED
                 )
                 self.db.commit()
-                logger.error(
-                    f"Vector DB 인덱싱 중 오류: program_id={program_id}, error={error_msg}"
-                )
-                raise
+                logger.warning(f"Vector DB 인덱싱 실패: program_id={program_id}")
 
-        except Exception as e:
-            logger.error(
-                f"비동기 프로그램 처리 중 오류: program_id={program_id}, error={str(e)}"
+        except Exception as indexing_error:
+            # 인덱싱 중 예외 발생 처리
+            error_msg = str(indexing_error)
+            job_crud.update_job_status(
+                job_id=job_id,
+                status="failed",
+                completed_steps=0,
+                current_step="Vector DB 인덱싱 오류",
+                error_message=error_msg,
             )
-            from src.database.models.program_models import Program
 
             self.program_crud.update_program_status(
-                program_id=program_id,
-                status=Program.STATUS_FAILED,
-                error_message=str(e),
+                program_id=program_id, status=Program.STATUS_INDEXING_FAILED
             )
             self.db.commit()
+            logger.error(
+                f"Vector DB 인덱싱 중 오류: program_id={program_id}, error={error_msg}"
+            )
+            raise
 
     async def get_program(self, program_id: str, user_id: str) -> Dict:
         """프로그램 정보 조회"""
@@ -845,6 +1068,9 @@ class ProgramService:
         """
         실패한 파일 재시도
 
+        ProgramFailureRetrier가 실패 정보를 keyset 페이지 단위로 조회하여
+        동시성 제한 + retry_count 기반 지수 백오프로 재시도하고, 결과는 페이지 단위로 일괄 반영합니다.
+
         Args:
             program_id: 프로그램 ID
             user_id: 사용자 ID
@@ -860,130 +1086,29 @@ class ProgramService:
                 raise HandledException(ResponseCode.PROGRAM_NOT_FOUND)
 
             # 사용자 권한 확인
-            if program.user_id != user_id:
+            if program.create_user != user_id:
                 raise HandledException(
                     ResponseCode.CHAT_ACCESS_DENIED,
                     msg="프로그램에 접근할 권한이 없습니다.",
                 )
 
-            # 실패 정보 조회 (ProcessingFailure 테이블에서)
-            from src.database.crud.program_failure_crud import ProcessingFailureCRUD
-
+            from src.api.services.program_failure_retrier import ProgramFailureRetrier
             from src.database.models.program_models import ProcessingFailure
 
-            failure_crud = ProcessingFailureCRUD(self.db)
-
-            # 재시도 대상 실패 정보 조회
+            # 재시도 대상 실패 타입
             failure_type_filter = None
             if retry_type == "preprocessing":
                 failure_type_filter = ProcessingFailure.FAILURE_TYPE_PREPROCESSING
             elif retry_type == "document":
                 failure_type_filter = ProcessingFailure.FAILURE_TYPE_DOCUMENT_STORAGE
 
-            pending_failures = failure_crud.get_program_failures(
-                program_id=program_id,
+            retrier = ProgramFailureRetrier(self.db, self.uploader)
+            retry_results = await retrier.retry_program_failures(
+                program=program,
+                user_id=user_id,
                 failure_type=failure_type_filter,
-                status=ProcessingFailure.STATUS_PENDING,
             )
 
-            retry_results = {
-                "preprocessing": {"retried": 0, "success": 0, "failed": 0},
-                "document": {"retried": 0, "success": 0, "failed": 0},
-            }
-
-            # 실패 파일 재시도
-            for failure in pending_failures:
-                try:
-                    # 재시도 횟수 증가
-                    failure_crud.increment_retry_count(failure.failure_id)
-                    failure_crud.update_failure_status(
-                        failure_id=failure.failure_id,
-                        status=ProcessingFailure.STATUS_RETRYING,
-                    )
-
-                    if (
-                        failure.failure_type
-                        == ProcessingFailure.FAILURE_TYPE_PREPROCESSING
-                    ):
-                        retry_results["preprocessing"]["retried"] += 1
-                        # TODO: 전처리 재시도 로직 구현
-                        # 재시도 성공 시
-                        # failure_crud.mark_as_resolved(
-                        #     failure_id=failure.failure_id, resolved_by="manual"
-                        # )
-                        # retry_results["preprocessing"]["success"] += 1
-
-                    elif (
-                        failure.failure_type
-                        == ProcessingFailure.FAILURE_TYPE_DOCUMENT_STORAGE
-                    ):
-                        retry_results["document"]["retried"] += 1
-
-                        # Document 재생성
-                        from src.database.crud.document_crud import DocumentCRUD
-                        from src.utils.uuid_gen import gen
-
-                        document_crud = DocumentCRUD(self.db)
-                        document_id = gen()
-
-                        document_crud.create_document(
-                            document_id=document_id,
-                            document_name=f"{program.program_title}_{failure.filename}",
-                            original_filename=failure.filename,
-                            file_key=failure.s3_key,
-                            file_size=0,
-                            file_type="application/json",
-                            file_extension="json",
-                            user_id=user_id,
-                            upload_path=failure.s3_path,
-                            status="processing",
-                            document_type="common",
-                            metadata_json={
-                                "program_id": program_id,
-                                "program_title": program.program_title,
-                                "processing_stage": "preprocessed",
-                                "retry_count": failure.retry_count,
-                                "is_retry": True,
-                                "failure_id": failure.failure_id,
-                            },
-                        )
-                        self.db.commit()
-
-                        # 재시도 성공
-                        failure_crud.mark_as_resolved(
-                            failure_id=failure.failure_id, resolved_by="manual"
-                        )
-                        retry_results["document"]["success"] += 1
-                        logger.info(
-                            f"Document 재생성 성공: failure_id={failure.failure_id}, "
-                            f"filename={failure.filename}"
-                        )
-
-                except Exception as e:
-                    # 재시도 실패
-                    if (
-                        failure.failure_type
-                        == ProcessingFailure.FAILURE_TYPE_PREPROCESSING
-                    ):
-                        retry_results["preprocessing"]["failed"] += 1
-                    elif (
-                        failure.failure_type
-                        == ProcessingFailure.FAILURE_TYPE_DOCUMENT_STORAGE
-                    ):
-                        retry_results["document"]["failed"] += 1
-
-                    failure_crud.update_failure_status(
-                        failure_id=failure.failure_id,
-                        status=ProcessingFailure.STATUS_PENDING,
-                        error_message=str(e),
-                    )
-                    self.db.rollback()
-                    logger.error(
-                        f"재시도 실패: failure_id={failure.failure_id}, "
-                        f"error: {str(e)}"
-                    )
-                    continue
-
             # 재시도 이력 저장 (통계용)
             if (
                 retry_results["preprocessing"]["retried"] > 0
@@ -991,8 +1116,8 @@ class ProgramService:
             ):
                 program = self.program_crud.get_program(program_id)
                 if program:
-                    current_metadata = program.metadata_json or {}
-                    retry_history = current_metadata.get("retry_history", [])
+                    current_metadata = dict(program.metadata_json or {})
+                    retry_history = list(current_metadata.get("retry_history", []))
                     retry_history.append(
                         {
                             "retry_type": retry_type,
@@ -1102,362 +1227,86 @@ class ProgramService:
         Returns:
             Dict: 삭제 결과
         """
-        try:
-            # 프로그램 정보 조회
-            program = self.program_crud.get_program(program_id)
-            if not program:
-                raise HandledException(ResponseCode.PROGRAM_NOT_FOUND)
-
-            # 사용자 권한 확인 (user_id가 제공된 경우)
-            if user_id and program.create_user != user_id:
-                raise HandledException(
-                    ResponseCode.CHAT_ACCESS_DENIED,
-                    msg="프로그램을 삭제할 권한이 없습니다.",
-                )
-
-            logger.info(f"프로그램 삭제 시작: program_id={program_id}")
-
-            # 병렬로 실행할 작업들
-            tasks = []
-
-            # 1. S3 파일 삭제 (비동기)
-            async def delete_s3_files():
-                try:
-                    await self._delete_s3_files(program_id, program)
-                    return {"s3_deleted": True}
-                except Exception as e:
-                    logger.error(f"S3 파일 삭제 실패: {str(e)}")
-                    return {"s3_deleted": False, "error": str(e)}
-
-            # 2. Documents 및 Knowledge 삭제 (비동기)
-            async def delete_documents_and_knowledge():
-                try:
-                    result = await self._delete_documents_and_knowledge(
-                        program_id
-                    )
-                    return result
-                except Exception as e:
-                    logger.error(f"Documents/Knowledge 삭제 실패: {str(e)}")
-                    return {"deleted": False, "error": str(e)}
-
-            # 병렬 실행
-            tasks.append(delete_s3_files())
-            tasks.append(delete_documents_and_knowledge())
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            s3_result = results[0] if not isinstance(results[0], Exception) else {}
-            docs_result = (
-                results[1] if not isinstance(results[1], Exception) else {}
-            )
-
-            # 3. 관련 테이블 메타정보 업데이트
-            try:
-                self._update_related_tables_metadata(program_id)
-            except Exception as e:
-                logger.error(f"관련 테이블 메타정보 업데이트 실패: {str(e)}")
-
-            # 4. Program 삭제 (소프트 삭제)
-            success = self.program_crud.delete_program(program_id)
-
-            if not success:
-                raise HandledException(
-                    ResponseCode.DATABASE_QUERY_ERROR,
-                    msg="프로그램 삭제에 실패했습니다.",
-                )
+        result = await self.delete_programs([program_id], user_id=user_id)
+        if result["errors"]:
+            error = result["errors"][0]
+            if error.get("response_code"):
+                raise HandledException(error["response_code"], msg=error.get("msg"))
+            raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, msg=error["error"])
+        return result["results"][0]
+
+    async def delete_programs(
+        self,
+        program_ids: List[str],
+        user_id: Optional[str] = None,
+        progress_callback=None,
+    ) -> Dict:
+        """
+        프로그램 일괄 삭제
 
-            logger.info(f"프로그램 삭제 완료: program_id={program_id}")
+        권한이 확인된 프로그램을 한 번에 ProgramDeleter로 넘겨 S3/Milvus 정리와
+        관련 테이블 반영을 프로그램 단위 반복 없이 일괄 처리합니다.
 
-            return {
-                "program_id": program_id,
-                "deleted": True,
-                "s3_deletion": s3_result,
-                "documents_deletion": docs_result,
-                "message": "프로그램이 삭제되었습니다.",
-            }
+        Args:
+            program_ids: 삭제할 프로그램 ID 목록
+            user_id: 사용자 ID (권한 확인용, 선택)
+            progress_callback: 배치 1개 완료 시 (완료 수, 전체 수, 단계명)으로 호출
 
-        except HandledException:
-            raise
-        except Exception as e:
-            logger.error(f"프로그램 삭제 중 오류: {str(e)}")
-            raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
+        Returns:
+            Dict: {"results": [...], "errors": [{"program_id", "error", ...}]}
+        """
+        from src.api.services.program_deleter import ProgramDeleter
+        from src.database.models.program_models import Program
 
-    async def _delete_s3_files(self, program_id: str, program):
-        """S3 파일 삭제"""
         try:
-            # metadata_json에서 S3 경로 정보 추출
-            metadata = program.metadata_json or {}
-            s3_paths = metadata.get("s3_paths", {})
-
-            if not s3_paths and not self.uploader.s3_client:
-                logger.warning(
-                    "S3 클라이언트가 없거나 경로 정보가 없습니다."
-                )
-                return
-
-            # S3 클라이언트가 있는 경우
-            if self.uploader.s3_client and self.uploader.s3_bucket:
-                # programs/{program_id}/ 디렉토리 전체 삭제
-                prefix = f"programs/{program_id}/"
-
-                try:
-                    # S3에서 해당 prefix의 모든 객체 삭제
-                    paginator = self.uploader.s3_client.get_paginator(
-                        "list_objects_v2"
-                    )
-                    pages = paginator.paginate(
-                        Bucket=self.uploader.s3_bucket, Prefix=prefix
-                    )
-
-                    objects_to_delete = []
-                    for page in pages:
-                        if "Contents" in page:
-                            for obj in page["Contents"]:
-                                objects_to_delete.append({"Key": obj["Key"]})
-
-                    if objects_to_delete:
-                        # 1000개씩 나누어 삭제 (S3 제한)
-                        for i in range(0, len(objects_to_delete), 1000):
-                            chunk = objects_to_delete[i:i + 1000]
-                            self.uploader.s3_client.delete_objects(
-                                Bucket=self.uploader.s3_bucket,
-                                Delete={"Objects": chunk},
-                            )
-                        logger.info(
-                            f"S3 파일 삭제 완료: {len(objects_to_delete)}개 파일"
-                        )
-                    else:
-                        logger.info(f"S3에 삭제할 파일이 없습니다: {prefix}")
-
-                except Exception as e:
-                    logger.error(f"S3 파일 삭제 중 오류: {str(e)}")
-                    raise
-            else:
-                logger.warning(
-                    "S3 클라이언트가 초기화되지 않아 파일 삭제를 건너뜁니다."
+            program_ids = list(dict.fromkeys(program_ids))
+            programs = {
+                program.program_id: program
+                for program in self.db.query(Program)
+                .filter(
+                    Program.program_id.in_(program_ids),
+                    Program.is_used.is_(True),
                 )
-
-        except Exception as e:
-            logger.error(f"S3 파일 삭제 실패: {str(e)}")
-            raise
-
-    async def _delete_documents_and_knowledge(self, program_id: str) -> Dict:
-        """Documents 및 Knowledge (Milvus 벡터) 삭제"""
-        try:
-            # program_id로 Documents 조회
-            documents = (
-                self.db.query(Document)
-                .filter(Document.program_id == program_id)
-                .filter(Document.is_deleted.is_(False))
                 .all()
-            )
+            }
 
-            deleted_count = 0
-            vector_deleted_count = 0
+            deletable_ids = []
             errors = []
+            for program_id in program_ids:
+                program = programs.get(program_id)
+                if not program:
+                    errors.append({
+                        "program_id": program_id,
+                        "error": "프로그램을 찾을 수 없습니다.",
+                        "response_code": ResponseCode.PROGRAM_NOT_FOUND,
+                    })
+                elif user_id and program.create_user != user_id:
+                    errors.append({
+                        "program_id": program_id,
+                        "error": "프로그램을 삭제할 권한이 없습니다.",
+                        "response_code": ResponseCode.CHAT_ACCESS_DENIED,
+                        "msg": "프로그램을 삭제할 권한이 없습니다.",
+                    })
+                else:
+                    deletable_ids.append(program_id)
 
-            for document in documents:
-                try:
-                    # Milvus 벡터 삭제
-                    if document.milvus_collection_name:
-                        try:
-                            await self._delete_milvus_vectors(
-                                document.document_id,
-                                document.milvus_collection_name,
-                            )
-                            vector_deleted_count += 1
-                        except Exception as e:
-                            logger.warning(
-                                f"Milvus 벡터 삭제 실패: "
-                                f"document_id={document.document_id}, "
-                                f"error={str(e)}"
-                            )
-                            errors.append(
-                                {
-                                    "document_id": document.document_id,
-                                    "error": f"Milvus 삭제 실패: {str(e)}",
-                                }
-                            )
-
-                    # Document 소프트 삭제
-                    document.is_deleted = True
-                    document.updated_at = datetime.now()
-                    deleted_count += 1
-
-                except Exception as e:
-                    logger.error(
-                        f"Document 삭제 실패: document_id={document.document_id}, "
-                        f"error={str(e)}"
-                    )
-                    errors.append(
-                        {
-                            "document_id": document.document_id,
-                            "error": str(e),
-                        }
-                    )
+            logger.info(
+                f"프로그램 삭제 시작: 요청={len(program_ids)}개, 삭제 대상={len(deletable_ids)}개"
+            )
 
-            # DB 커밋
-            self.db.commit()
+            deleter = ProgramDeleter(self.db, self.uploader)
+            results = await deleter.delete_programs(
+                deletable_ids, progress_callback=progress_callback
+            )
 
+            logger.info(f"프로그램 삭제 완료: {len(results)}개")
             return {
-                "deleted": True,
-                "documents_deleted": deleted_count,
-                "vectors_deleted": vector_deleted_count,
-                "total_documents": len(documents),
+                "results": [results[program_id] for program_id in deletable_ids],
                 "errors": errors,
             }
 
-        except Exception as e:
-            self.db.rollback()
-            logger.error(f"Documents/Knowledge 삭제 실패: {str(e)}")
+        except HandledException:
             raise
-
-    async def _delete_milvus_vectors(
-        self, document_id: str, collection_name: str
-    ):
-        """Milvus에서 벡터 삭제"""
-        try:
-            from pymilvus import Collection, connections, utility
-
-            # Milvus 연결 설정 (환경변수에서 가져오기)
-            import os
-
-            milvus_uri = os.getenv("MILVUS_URI", "./milvus_lite.db")
-            connections.connect("default", uri=milvus_uri)
-
-            # 컬렉션이 존재하는지 확인
-            if not utility.has_collection(collection_name):
-                logger.warning(
-                    f"Milvus 컬렉션이 없습니다: {collection_name}"
-                )
-                return
-
-            # 컬렉션 로드
-            collection = Collection(collection_name)
-            collection.load()
-
-            # document_path로 벡터 삭제
-            # Document의 upload_path나 file_key를 사용하여 삭제
-            # document_path 필드에 document_id나 file_key가 저장되어 있을 것으로 예상
-            expr = f'document_path like "%{document_id}%"'
-
-            try:
-                collection.delete(expr=expr)
-                collection.flush()
-                logger.info(
-                    f"Milvus 벡터 삭제 완료: document_id={document_id}, "
-                    f"collection={collection_name}"
-                )
-            except Exception as e:
-                logger.warning(
-                    f"Milvus 벡터 삭제 실패: document_id={document_id}, "
-                    f"error={str(e)}"
-                )
-                # 삭제 실패해도 계속 진행
-
-        except Exception as e:
-            logger.error(f"Milvus 벡터 삭제 중 오류: {str(e)}")
-            # Milvus 삭제 실패해도 전체 프로세스는 계속 진행
-
-    def _update_related_tables_metadata(self, program_id: str):
-        """관련 테이블 메타정보 업데이트"""
-        try:
-            from src.database.models.plc_models import PLC
-
-            # 1. PLC 테이블: program_id 매핑 해제 및 is_active = False
-            plcs = (
-                self.db.query(PLC)
-                .filter(PLC.program_id == program_id)
-                .filter(PLC.is_active.is_(True))
-                .all()
-            )
-
-            for plc in plcs:
-                plc.program_id = None
-                plc.is_active = False
-                plc.update_dt = datetime.now()
-                plc.update_user = "system"  # 시스템 삭제
-
-            # 2. ProcessingFailure: status를 'deleted'로 업데이트
-            from src.database.models.program_models import ProcessingFailure
-
-            failures = (
-                self.db.query(ProcessingFailure)
-                .filter(
-                    ProcessingFailure.source_type
-                    == ProcessingFailure.SOURCE_TYPE_PROGRAM
-                )
-                .filter(ProcessingFailure.source_id == program_id)
-                .filter(ProcessingFailure.status != "deleted")
-                .all()
-            )
-
-            for failure in failures:
-                failure.status = "deleted"
-                failure.updated_at = datetime.now()
-
-            # 3. ProgramLLMDataChunk: 삭제 (또는 is_deleted 플래그가 있다면 사용)
-            from src.database.models.program_models import ProgramLLMDataChunk
-
-            chunks = (
-                self.db.query(ProgramLLMDataChunk)
-                .filter(ProgramLLMDataChunk.program_id == program_id)
-                .all()
-            )
-
-            # ProgramLLMDataChunk에는 is_deleted가 없으므로 실제 삭제
-            for chunk in chunks:
-                self.db.delete(chunk)
-
-            # 4. KnowledgeReference: Document를 통해 연결된 것들 삭제
-            from src.database.models.knowledge_reference_models import (
-                KnowledgeReference,
-            )
-            from shared_core.models import Document
-
-            # Program과 연결된 Document를 통해 KnowledgeReference 조회
-            documents_with_ref = (
-                self.db.query(Document)
-                .filter(Document.program_id == program_id)
-                .filter(Document.knowledge_reference_id.isnot(None))
-                .all()
-            )
-
-            knowledge_ref_ids = {
-                doc.knowledge_reference_id
-                for doc in documents_with_ref
-                if doc.knowledge_reference_id
-            }
-
-            knowledge_refs = []
-            if knowledge_ref_ids:
-                knowledge_refs = (
-                    self.db.query(KnowledgeReference)
-                    .filter(
-                        KnowledgeReference.reference_id.in_(knowledge_ref_ids)
-                    )
-                    .all()
-                )
-
-                for ref in knowledge_refs:
-                    # is_deleted가 있다면 사용, 없으면 실제 삭제
-                    if hasattr(ref, "is_deleted"):
-                        ref.is_deleted = True
-                    else:
-                        self.db.delete(ref)
-
-            # DB 커밋
-            self.db.commit()
-
-            logger.info(
-                f"관련 테이블 메타정보 업데이트 완료: "
-                f"PLC={len(plcs)}, "
-                f"ProcessingFailure={len(failures)}, "
-                f"ProgramLLMDataChunk={len(chunks)}, "
-                f"KnowledgeReference={len(knowledge_refs)}"
-            )
-
         except Exception as e:
-            self.db.rollback()
-            logger.error(f"관련 테이블 메타정보 업데이트 실패: {str(e)}")
-            raise
+            logger.error(f"프로그램 삭제 중 오류: {str(e)}")
+            raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
@@ -1,18 +1,58 @@
 # _*_ coding: utf-8 _*_
 """Program upload module for S3 upload and file processing."""
-import io
+import asyncio
 import logging
+import multiprocessing
 import os
+import shutil
 import tempfile
-import zipfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
-from typing import Dict
-
-from fastapi import UploadFile
+from typing import Callable, Dict, Optional, Tuple
+
+from src.api.services.device_comment_index import DeviceCommentIndex
+from src.api.services.program_ingestion import (
+    ProgramIngestionContext,
+    SpooledUpload,
+    read_csv_columns,
+)
+from src.api.services.program_preprocessor import (
+    PreprocessLookups,
+    build_ladder_json,
+)
 
 logger = logging.getLogger(__name__)
 
+# 전처리 CPU 프로세스 풀 (프로세스당 1개, 최초 전처리 시 생성하여 재사용)
+# spawn 기동/모듈 import 비용을 업로드마다 다시 내지 않도록 앱/워커 종료 시에만 shutdown
+_preprocess_pool: Optional[ProcessPoolExecutor] = None
+_preprocess_pool_lock = threading.Lock()
+
+
+def get_preprocess_pool(max_workers: int) -> ProcessPoolExecutor:
+    """전처리 프로세스 풀 (지연 생성, 워커 비정상 종료로 깨진 풀은 새로 생성)"""
+    global _preprocess_pool
+    with _preprocess_pool_lock:
+        if _preprocess_pool is not None and getattr(_preprocess_pool, "_broken", False):
+            _preprocess_pool.shutdown(wait=False, cancel_futures=True)
+            _preprocess_pool = None
+        if _preprocess_pool is None:
+            _preprocess_pool = ProcessPoolExecutor(
+                max_workers=max(1, max_workers),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _preprocess_pool
+
+
+def shutdown_preprocess_pool():
+    """전처리 프로세스 풀 종료 (앱/워커 종료 시 호출)"""
+    global _preprocess_pool
+    with _preprocess_pool_lock:
+        if _preprocess_pool is not None:
+            _preprocess_pool.shutdown(wait=False, cancel_futures=True)
+            _preprocess_pool = None
+
 
 class ProgramUploader:
     """프로그램 파일 S3 업로드 및 처리 클래스"""
@@ -27,145 +67,334 @@ class ProgramUploader:
         self.s3_bucket = s3_bucket
         # TODO: S3 클라이언트 초기화 로직 추가
 
+        # ZIP 멤버 스트리밍 업로드 설정
+        # - upload_workers: 동시 업로드 워커 수 (대기 큐는 워커 수의 2배로 제한)
+        # - upload_max_retries: 파일별 최대 시도 횟수 (지수 백오프)
+        # - multipart_threshold: 이 크기 이상인 멤버는 multipart 업로드
+        self.upload_workers = int(os.getenv("PROGRAM_UPLOAD_WORKERS", "8"))
+        self.upload_max_retries = int(os.getenv("PROGRAM_UPLOAD_MAX_RETRIES", "3"))
+        self.upload_retry_backoff = float(os.getenv("PROGRAM_UPLOAD_RETRY_BACKOFF", "0.5"))
+        self.multipart_threshold = (
+            int(os.getenv("PROGRAM_UPLOAD_MULTIPART_THRESHOLD_MB", "16")) * 1024 * 1024
+        )
+        self._transfer_config = None
+
+        # 전처리 파이프라인 설정
+        # - preprocess_io_concurrency: 원본 읽기/JSON S3 업로드 동시 수행 수
+        # - preprocess_cpu_workers: 파싱/JSON 생성 프로세스 풀 크기 (기본: CPU 코어 수)
+        self.preprocess_io_concurrency = int(
+            os.getenv("PROGRAM_PREPROCESS_IO_CONCURRENCY", "16")
+        )
+        self.preprocess_cpu_workers = int(
+            os.getenv("PROGRAM_PREPROCESS_CPU_WORKERS", str(os.cpu_count() or 1))
+        )
+
     async def upload_and_unzip(
         self,
-        ladder_zip: UploadFile,
-        classification_xlsx: UploadFile,
-        device_comment_csv: UploadFile,
+        context: ProgramIngestionContext,
         program_id: str,
         user_id: str,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
     ) -> Dict[str, str]:
         """
         파일들을 S3에 업로드하고 ZIP 파일을 압축 해제
 
+        업로드 컨텍스트에 스풀링된 파일을 그대로 사용하므로 업로드 파일을 다시 메모리로 읽지 않습니다.
+
         Returns:
             Dict[str, str]: 업로드된 파일들의 S3 경로 정보
                 {
                     'ladder_zip_path': 's3://...',
                     'unzipped_base_path': 's3://...',
                     'classification_xlsx_path': 's3://...',
-                    'device_comment_csv_path': 's3://...'
+                    'device_comment_csv_path': 's3://...',
+                    'device_comment_index_path': 's3://...'
                 }
         """
         try:
-            # 임시 디렉토리 생성
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # 1. ZIP 파일 S3 업로드
-                ladder_zip.file.seek(0)
-                ladder_zip_path = await self._upload_to_s3(
-                    file=ladder_zip,
-                    s3_key=f"programs/{program_id}/ladder_logic.zip",
-                    content_type="application/zip",
-                )
+            # 1. ZIP 파일 S3 업로드
+            ladder_zip_path = await self._upload_to_s3(
+                file=context.ladder_zip,
+                s3_key=f"programs/{program_id}/ladder_logic.zip",
+                content_type="application/zip",
+            )
 
-                # 2. ZIP 파일 압축 해제
-                ladder_zip.file.seek(0)
-                unzipped_files = await self._unzip_to_s3(
-                    zip_file=ladder_zip,
-                    s3_prefix=f"programs/{program_id}/unzipped/",
-                    temp_dir=temp_path,
-                )
+            # 2. ZIP 멤버를 스트리밍으로 S3에 업로드 (디스크 압축 해제 없음)
+            unzipped_files = await self._unzip_to_s3(
+                zip_file=context.ladder_zip,
+                s3_prefix=f"programs/{program_id}/unzipped/",
+                progress_callback=progress_callback,
+            )
 
-                # 3. XLSX 파일 S3 업로드
-                classification_xlsx.file.seek(0)
-                classification_xlsx_path = await self._upload_to_s3(
-                    file=classification_xlsx,
-                    s3_key=f"programs/{program_id}/classification.xlsx",
-                    content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                )
+            # 3. XLSX 파일 S3 업로드
+            classification_xlsx_path = await self._upload_to_s3(
+                file=context.classification_xlsx,
+                s3_key=f"programs/{program_id}/classification.xlsx",
+                content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            )
 
-                # 4. CSV 파일 S3 업로드
-                device_comment_csv.file.seek(0)
-                device_comment_csv_path = await self._upload_to_s3(
-                    file=device_comment_csv,
-                    s3_key=f"programs/{program_id}/device_comment.csv",
-                    content_type="text/csv",
-                )
+            # 4. CSV 파일 S3 업로드
+            device_comment_csv_path = await self._upload_to_s3(
+                file=context.device_comment_csv,
+                s3_key=f"programs/{program_id}/device_comment.csv",
+                content_type="text/csv",
+            )
 
-                return {
-                    "ladder_zip_path": ladder_zip_path,
-                    "unzipped_base_path": f"programs/{program_id}/unzipped/",
-                    "unzipped_files": unzipped_files,
-                    "classification_xlsx_path": classification_xlsx_path,
-                    "device_comment_csv_path": device_comment_csv_path,
-                }
+            # 5. 디바이스 코멘트 인덱스 생성 (프로그램당 1회) 및 S3 업로드
+            device_comment_index_path = await self._build_device_comment_index(
+                context=context, program_id=program_id
+            )
+
+            return {
+                "ladder_zip_path": ladder_zip_path,
+                "unzipped_base_path": f"programs/{program_id}/unzipped/",
+                "unzipped_files": unzipped_files,
+                "classification_xlsx_path": classification_xlsx_path,
+                "device_comment_csv_path": device_comment_csv_path,
+                "device_comment_index_path": device_comment_index_path,
+            }
 
         except Exception as e:
             logger.error(f"S3 업로드 및 압축 해제 중 오류: {str(e)}")
             raise
 
     async def _upload_to_s3(
-        self, file: UploadFile, s3_key: str, content_type: str
+        self, file: SpooledUpload, s3_key: str, content_type: str
     ) -> str:
         """
-        파일을 S3에 업로드
+        스풀링된 파일을 S3에 업로드 (디스크에서 스트리밍)
 
         Returns:
             str: S3 경로 (s3://bucket/key 형식)
         """
         try:
-            file.file.seek(0)
-            file_content = file.file.read()
-            file.file.seek(0)
+            if self.s3_client:
+                def upload():
+                    with file.open() as body:
+                        self.s3_client.upload_fileobj(
+                            body,
+                            self.s3_bucket,
+                            s3_key,
+                            ExtraArgs={"ContentType": content_type},
+                            Config=self._get_transfer_config(),
+                        )
 
-            # TODO: S3 업로드 로직 구현
-            # 예시:
-            # self.s3_client.put_object(
-            #     Bucket=self.s3_bucket,
-            #     Key=s3_key,
-            #     Body=file_content,
-            #     ContentType=content_type
-            # )
+                await asyncio.to_thread(upload)
 
-            logger.info(f"S3 업로드 완료: {s3_key}")
+            logger.info(f"S3 업로드 완료: {s3_key} ({file.size}B)")
             return f"s3://{self.s3_bucket}/{s3_key}"
 
         except Exception as e:
             logger.error(f"S3 업로드 실패: {str(e)}")
             raise
 
-    async def _unzip_to_s3(
-        self, zip_file: UploadFile, s3_prefix: str, temp_dir: Path
-    ) -> list:
+    async def _build_device_comment_index(
+        self, context: ProgramIngestionContext, program_id: str
+    ) -> str:
         """
-        ZIP 파일을 압축 해제하여 S3에 업로드
+        검증 단계에서 파싱한 디바이스 코멘트 CSV로 인덱스 파일을 만들어 S3에 업로드
+
+        인덱스 파일은 컨텍스트 작업 디렉토리에도 남겨 두어 같은 작업의 전처리 단계에서
+        다시 내려받지 않고 바로 mmap으로 엽니다.
 
         Returns:
-            list: 업로드된 파일 목록
+            str: S3 경로 (s3://bucket/key 형식)
         """
+        s3_key = f"programs/{program_id}/{DeviceCommentIndex.FILENAME}"
+        index_path = context.work_dir / DeviceCommentIndex.FILENAME
+
         try:
-            zip_file.file.seek(0)
-            zip_content = zip_file.file.read()
-            zip_file.file.seek(0)
+            entry_count = await asyncio.to_thread(
+                DeviceCommentIndex.build_from_dataframe,
+                context.device_comment_csv.csv_dataframe,
+                str(index_path),
+            )
 
-            uploaded_files = []
+            if self.s3_client:
+                await asyncio.to_thread(
+                    self.s3_client.upload_file,
+                    str(index_path),
+                    self.s3_bucket,
+                    s3_key,
+                    ExtraArgs={"ContentType": "application/octet-stream"},
+                    Config=self._get_transfer_config(),
+                )
 
-            # 임시 디렉토리에 압축 해제
-            with zipfile.ZipFile(io.BytesIO(zip_content), "r") as zip_ref:
-                zip_ref.extractall(temp_dir)
+            logger.info(
+                f"디바이스 코멘트 인덱스 업로드 완료: {s3_key} "
+                f"({entry_count}건, {index_path.stat().st_size}B)"
+            )
+            return f"s3://{self.s3_bucket}/{s3_key}"
+
+        except Exception as e:
+            logger.error(f"디바이스 코멘트 인덱스 생성 실패: {str(e)}")
+            raise
 
-                # 압축 해제된 파일들을 S3에 업로드
-                for root, dirs, files in os.walk(temp_dir):
-                    for file_name in files:
-                        local_file_path = Path(root) / file_name
-                        relative_path = local_file_path.relative_to(temp_dir)
-                        s3_key = f"{s3_prefix}{relative_path.as_posix()}"
+    def _get_transfer_config(self):
+        """multipart 업로드 설정 (boto3 TransferConfig, 최초 사용 시 생성)"""
+        if self._transfer_config is None:
+            from boto3.s3.transfer import TransferConfig
 
-                        # TODO: 각 파일을 S3에 업로드
-                        # with open(local_file_path, 'rb') as f:
-                        #     self.s3_client.put_object(
-                        #         Bucket=self.s3_bucket,
-                        #         Key=s3_key,
-                        #         Body=f.read()
-                        #     )
+            self._transfer_config = TransferConfig(
+                multipart_threshold=self.multipart_threshold,
+                multipart_chunksize=self.multipart_threshold,
+                max_concurrency=4,
+            )
+        return self._transfer_config
+
+    @staticmethod
+    def _safe_member_name(member_name: str) -> Optional[str]:
+        """ZIP 멤버 경로를 S3 키용 상대 경로로 정규화 (상위 경로 참조는 제외)"""
+        name = member_name.replace("\\", "/").lstrip("/")
+        parts = [part for part in name.split("/") if part not in ("", ".")]
+        if not parts or ".." in parts:
+            return None
+        return "/".join(parts)
+
+    def _put_member(self, open_member, info, s3_key: str):
+        """ZIP 멤버 1개를 스트리밍으로 S3에 업로드 (워커 스레드에서 실행)"""
+        if not self.s3_client:
+            return
+
+        with open_member(info) as source:
+            if info.file_size < self.multipart_threshold:
+                self.s3_client.put_object(
+                    Bucket=self.s3_bucket, Key=s3_key, Body=source.read()
+                )
+            else:
+                self.s3_client.upload_fileobj(
+                    source, self.s3_bucket, s3_key, Config=self._get_transfer_config()
+                )
 
-                        uploaded_files.append(s3_key)
-                        logger.debug(f"압축 해제 파일 S3 업로드: {s3_key}")
+    async def _put_member_with_retry(
+        self, executor, open_member, info, s3_key: str
+    ):
+        """ZIP 멤버 업로드 (실패 시 지수 백오프로 재시도)"""
+        loop = asyncio.get_running_loop()
+        for attempt in range(1, self.upload_max_retries + 1):
+            try:
+                await loop.run_in_executor(
+                    executor, self._put_member, open_member, info, s3_key
+                )
+                return
+            except Exception as e:
+                if attempt >= self.upload_max_retries:
+                    raise
+                delay = self.upload_retry_backoff * (2 ** (attempt - 1))
+                logger.warning(
+                    f"ZIP 멤버 업로드 재시도 ({attempt}/{self.upload_max_retries}): "
+                    f"{s3_key}, {delay:.1f}초 후, error={str(e)}"
+                )
+                await asyncio.sleep(delay)
+
+    async def _unzip_to_s3(
+        self,
+        zip_file: SpooledUpload,
+        s3_prefix: str,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    ) -> list:
+        """
+        ZIP 멤버를 하나씩 스트리밍으로 읽어 S3에 업로드 (디스크에 압축 해제하지 않음)
+
+        - upload_workers개의 워커가 동시에 업로드, 대기 큐 크기로 back-pressure 적용
+        - 작은 멤버는 put_object, multipart_threshold 이상은 multipart 업로드
+        - 파일별 재시도 후에도 실패한 멤버가 있으면 남은 멤버는 건너뛰고 예외 발생
+
+        Args:
+            zip_file: 스풀링된 ZIP 파일
+            s3_prefix: 업로드할 S3 키 prefix
+            progress_callback: 파일 1개 업로드 완료 시 (완료 수, 전체 수, S3 키)로 호출
+
+        Returns:
+            list: 업로드된 파일 목록 (ZIP 내 순서)
+        """
+        try:
+            # 업로드 대상 멤버 목록 (중앙 디렉토리만 읽음)
+            entries = []
+            with zip_file.open_zip() as zip_ref:
+                for info in zip_ref.infolist():
+                    if info.is_dir():
+                        continue
+                    member_name = self._safe_member_name(info.filename)
+                    if member_name is None:
+                        logger.warning(f"허용되지 않는 ZIP 멤버 경로 제외: {info.filename}")
+                        continue
+                    entries.append((info, f"{s3_prefix}{member_name}"))
+
+            total = len(entries)
+            uploaded: Dict[int, str] = {}
+            failures = []
+
+            # 워커 스레드별 ZIP 핸들 (ZipFile 객체는 스레드 간 공유하지 않음)
+            local = threading.local()
+            handles = []
+            handles_lock = threading.Lock()
+
+            def open_member(info):
+                zip_ref = getattr(local, "zip_ref", None)
+                if zip_ref is None:
+                    zip_ref = zip_file.open_zip()
+                    local.zip_ref = zip_ref
+                    with handles_lock:
+                        handles.append(zip_ref)
+                return zip_ref.open(info)
+
+            executor = ThreadPoolExecutor(
+                max_workers=self.upload_workers, thread_name_prefix="zip-upload"
+            )
+            queue: asyncio.Queue = asyncio.Queue(maxsize=self.upload_workers * 2)
+
+            async def worker():
+                while True:
+                    item = await queue.get()
+                    try:
+                        if item is None:
+                            return
+                        index, info, s3_key = item
+                        try:
+                            await self._put_member_with_retry(
+                                executor, open_member, info, s3_key
+                            )
+                        except Exception as e:
+                            logger.error(f"ZIP 멤버 업로드 실패: {s3_key}, error={str(e)}")
+                            failures.append((info.filename, str(e)))
+                            continue
+
+                        uploaded[index] = s3_key
+                        logger.debug(
+                            f"압축 해제 파일 S3 업로드 ({len(uploaded)}/{total}): {s3_key}"
+                        )
+                        if progress_callback:
+                            progress_callback(len(uploaded), total, s3_key)
+                    finally:
+                        queue.task_done()
+
+            workers = [
+                asyncio.create_task(worker())
+                for _ in range(max(1, min(self.upload_workers, total)))
+            ]
+            try:
+                for index, (info, s3_key) in enumerate(entries):
+                    # 재시도 후에도 실패한 멤버가 있으면 나머지는 건너뜀
+                    if failures:
+                        break
+                    await queue.put((index, info, s3_key))
+            finally:
+                for _ in workers:
+                    await queue.put(None)
+                await asyncio.gather(*workers, return_exceptions=True)
+                executor.shutdown(wait=True)
+                for handle in handles:
+                    handle.close()
+
+            if failures:
+                raise RuntimeError(
+                    f"ZIP 멤버 {len(failures)}개 업로드 실패: "
+                    f"{', '.join(name for name, _ in failures[:10])}"
+                )
 
-            logger.info(f"ZIP 압축 해제 완료: {len(uploaded_files)}개 파일")
-            return uploaded_files
+            logger.info(f"ZIP 압축 해제 완료: {len(uploaded)}개 파일")
+            return [uploaded[index] for index in sorted(uploaded)]
 
         except Exception as e:
             logger.error(f"ZIP 압축 해제 실패: {str(e)}")
@@ -185,15 +414,20 @@ class ProgramUploader:
         failure_crud,
         template_data_map: Dict[str, Dict],
         chunk_commit_size: int = 50,
+        context: Optional[ProgramIngestionContext] = None,
+        device_comment_index_path: Optional[str] = None,
     ) -> Dict[str, Dict]:
         """
         ZIP 압축 해제 파일들을 전처리하여 JSON 파일 생성, S3 업로드 및 Document 저장
 
-        전략: 개별 처리 및 즉시 DB 반영
-        - 각 파일을 개별적으로 처리
-        - 전처리 성공 시 즉시 Document 테이블에 저장 및 template_data 연결
-        - 실패 시 즉시 ProcessingFailure 테이블에 저장
-        - 청크 단위로 commit (성능 최적화)
+        전략: 단계별 동시성 제한 파이프라인 + 배치 DB 반영
+        - I/O 단계(원본 읽기, JSON S3 업로드)는 preprocess_io_concurrency개까지 동시 수행
+        - CPU 단계(파싱/JSON 생성)는 프로세스 공유 ProcessPoolExecutor(preprocess_cpu_workers)에서 수행
+        - 분류체계 XLSX는 한 번만 조회 dict로 만들고 작업마다 해당 파일의 행만 전달
+        - 디바이스 코멘트는 업로드 단계에서 만든 인덱스 파일을 각 워커 프로세스가 mmap으로 조회
+        - Document 생성, template_data 연결, ProcessingFailure 저장은 chunk_commit_size 단위로
+          일괄 INSERT/UPDATE 후 commit
+        - 개별 파일 실패 시에도 나머지 파일은 계속 처리
 
         Args:
             program_id: 프로그램 ID
@@ -207,7 +441,9 @@ class ProgramUploader:
             template_data_crud: TemplateDataCRUD 인스턴스
             failure_crud: ProcessingFailureCRUD 인스턴스
             template_data_map: logic_id -> template_data 매핑 딕셔너리
-            chunk_commit_size: 청크 commit 크기 (기본값: 50)
+            chunk_commit_size: 배치 commit 크기 (기본값: 50)
+            context: 업로드 컨텍스트 (있으면 원본을 로컬 ZIP에서 읽고 파싱된 XLSX/CSV 재사용)
+            device_comment_index_path: 디바이스 코멘트 인덱스 S3 경로 (로컬 인덱스가 없을 때 사용)
 
         Returns:
             Dict: 전처리 결과
@@ -224,146 +460,177 @@ class ProgramUploader:
         try:
             from src.utils.uuid_gen import gen
             from src.database.models.program_models import ProcessingFailure
-            import os
 
+            total = len(unzipped_files)
             logger.info(
                 f"전처리 시작: program_id={program_id}, "
-                f"unzipped_files={len(unzipped_files)}개"
+                f"unzipped_files={total}개"
             )
 
             created_documents = []
             failed_files = []
 
-            for idx, unzipped_file_path in enumerate(unzipped_files, start=1):
-                try:
-                    # TODO: 전처리 로직 구현 필요
-                    # 1. unzipped_file_path에서 파일 다운로드
-                    # 2. classification_xlsx_path와 device_comment_csv_path 활용
-                    # 3. 파일을 분석하여 JSON 형식으로 변환
-                    # 4. json_content 생성
-                    #
-                    # 예시:
-                    #   - S3에서 파일 다운로드
-                    #   - 파일 내용 파싱
-                    #   - classification_xlsx와 device_comment_csv 데이터 결합
-                    #   - JSON 형식으로 변환
-                    #   - json_content = json.dumps(processed_data, ensure_ascii=False)
-
-                    json_filename = f"processed_{program_id}_{idx}.json"
-                    json_s3_key = f"programs/{program_id}/processed/{json_filename}"
-
-                    # TODO: 전처리 결과를 JSON으로 변환하여 json_content 생성
-                    json_content = ""  # 전처리 로직 구현 후 채워넣기
-
-                    # S3에 JSON 파일 업로드
-                    json_s3_path = await self._upload_json_to_s3(
-                        json_content=json_content, s3_key=json_s3_key
-                    )
-
-                    # logic_id 추출 (source_file_path에서)
-                    logic_id = None
-                    if unzipped_file_path:
-                        filename = os.path.basename(unzipped_file_path)
-                        logic_id = filename
+            # 배치 반영 대기 행
+            pending_documents = []
+            pending_links: Dict[str, str] = {}
+            pending_failures = []
+
+            def flush():
+                if not (pending_documents or pending_failures):
+                    return
+                document_crud.bulk_create_documents(pending_documents)
+                template_data_crud.bulk_link_documents(pending_links)
+                failure_crud.bulk_create(pending_failures)
+                db_session.commit()
+                logger.info(
+                    f"전처리 진행상황: {len(created_documents) + len(failed_files)}/{total} "
+                    f"완료 (배치 commit)"
+                )
+                pending_documents.clear()
+                pending_links.clear()
+                pending_failures.clear()
+
+            lookups, lookups_dir = await self._load_preprocess_lookups(
+                context,
+                classification_xlsx_path,
+                device_comment_csv_path,
+                device_comment_index_path,
+            )
+            read_source, close_sources = self._source_reader(context)
 
-                    # template_data 찾기
-                    template_data_id = None
-                    if logic_id and logic_id in template_data_map:
-                        template_data_id = template_data_map[logic_id]["template_data_id"]
+            loop = asyncio.get_running_loop()
+            io_semaphore = asyncio.Semaphore(max(1, self.preprocess_io_concurrency))
+            cpu_workers = max(1, min(self.preprocess_cpu_workers, total or 1))
+            cpu_pool = get_preprocess_pool(self.preprocess_cpu_workers)
 
-                    # Document 생성
-                    document_id = gen()
-                    document_crud.create_document(
-                        document_id=document_id,
-                        document_name=f"{program_title}_{json_filename}",
-                        original_filename=json_filename,
-                        file_key=json_s3_key,
-                        file_size=len(json_content.encode("utf-8")),
-                        file_type="application/json",
-                        file_extension="json",
-                        user_id=user_id,
-                        upload_path=json_s3_path,
-                        status="processing",
-                        document_type="common",
-                        program_id=program_id,
-                        metadata_json={
-                            "program_id": program_id,
-                            "program_title": program_title,
-                            "processing_stage": "preprocessed",
-                            "json_filename": json_filename,
-                            "logic_id": logic_id,
-                            "source_file_path": unzipped_file_path,
-                        },
-                    )
+            async def process(idx: int, unzipped_file_path: str):
+                json_filename, json_s3_key = self._processed_json_key(program_id, idx)
 
-                    # template_data.document_id에 연결
-                    if template_data_id:
-                        template_data_crud.update_template_data(
-                            template_data_id=template_data_id,
-                            document_id=document_id,
-                        )
+                # logic_id 추출 (source_file_path에서)
+                logic_id = (
+                    os.path.basename(unzipped_file_path) if unzipped_file_path else None
+                )
 
-                    created_documents.append({
-                        "document_id": document_id,
-                        "s3_path": json_s3_path,
-                        "filename": json_filename,
-                        "template_data_id": template_data_id,
-                    })
+                try:
+                    async with io_semaphore:
+                        content = await asyncio.to_thread(read_source, unzipped_file_path)
+
+                    json_content = await loop.run_in_executor(
+                        cpu_pool,
+                        build_ladder_json,
+                        program_id,
+                        logic_id,
+                        unzipped_file_path,
+                        content,
+                        lookups.for_file(logic_id),
+                    )
 
-                    # 청크 단위 commit (성능 최적화)
-                    if idx % chunk_commit_size == 0:
-                        db_session.commit()
-                        logger.info(
-                            f"전처리 진행상황: {idx}/{len(unzipped_files)} "
-                            f"완료 (청크 commit)"
+                    async with io_semaphore:
+                        json_s3_path = await self._upload_json_to_s3(
+                            json_content=json_content, s3_key=json_s3_key
                         )
-
                 except Exception as file_error:
-                    # 개별 파일 처리 실패 시에도 계속 진행
+                    # 개별 파일 처리 실패 시에도 계속 진행 (ProcessingFailure는 배치 저장)
                     logger.error(
                         f"파일 처리 실패: {unzipped_file_path}, "
                         f"error: {str(file_error)}"
                     )
-                    db_session.rollback()
-
-                    # ProcessingFailure에 저장
                     failure_id = gen()
-                    failure_crud.create_failure(
-                        failure_id=failure_id,
-                        source_type=ProcessingFailure.SOURCE_TYPE_PROGRAM,
-                        source_id=program_id,
-                        failure_type=ProcessingFailure.FAILURE_TYPE_PREPROCESSING,
-                        error_message=str(file_error),
-                        file_path=unzipped_file_path,
-                        file_index=idx,
-                        error_details={
+                    pending_failures.append({
+                        "failure_id": failure_id,
+                        "source_type": ProcessingFailure.SOURCE_TYPE_PROGRAM,
+                        "source_id": program_id,
+                        "failure_type": ProcessingFailure.FAILURE_TYPE_PREPROCESSING,
+                        "error_message": str(file_error),
+                        "file_path": unzipped_file_path,
+                        "file_index": idx,
+                        "error_details": {
                             "error": str(file_error),
                             "timestamp": datetime.now().isoformat(),
                         },
-                    )
-                    db_session.commit()
-
+                        "status": ProcessingFailure.STATUS_PENDING,
+                    })
                     failed_files.append({
                         "file_path": unzipped_file_path,
                         "index": idx,
                         "error": str(file_error),
                         "failure_id": failure_id,
                     })
-                    continue
+                    return
 
-            # 남은 파일들 commit
-            if len(unzipped_files) % chunk_commit_size != 0:
-                db_session.commit()
+                # template_data 찾기
+                template_data_id = None
+                if logic_id and logic_id in template_data_map:
+                    template_data_id = template_data_map[logic_id]["template_data_id"]
+
+                document_id = gen()
+                pending_documents.append(
+                    self.preprocessed_document_row(
+                        document_id=document_id,
+                        program_id=program_id,
+                        program_title=program_title,
+                        user_id=user_id,
+                        json_filename=json_filename,
+                        json_s3_key=json_s3_key,
+                        json_s3_path=json_s3_path,
+                        json_size=len(json_content.encode("utf-8")),
+                        logic_id=logic_id,
+                        source_file_path=unzipped_file_path,
+                    )
+                )
 
+                # template_data.document_id에 연결
+                if template_data_id:
+                    pending_links[template_data_id] = document_id
+
+                created_documents.append({
+                    "document_id": document_id,
+                    "s3_path": json_s3_path,
+                    "filename": json_filename,
+                    "template_data_id": template_data_id,
+                })
+
+            # I/O 대기 중에도 CPU 워커가 쉬지 않도록 두 단계 동시성 합만큼 파이프라인 워커 실행
+            items = iter(enumerate(unzipped_files, start=1))
+
+            async def pipeline_worker():
+                for idx, unzipped_file_path in items:
+                    await process(idx, unzipped_file_path)
+                    if len(pending_documents) + len(pending_failures) >= chunk_commit_size:
+                        flush()
+
+            workers = [
+                asyncio.create_task(pipeline_worker())
+                for _ in range(
+                    max(1, min(total, self.preprocess_io_concurrency + cpu_workers))
+                )
+            ]
+            try:
+                await asyncio.gather(*workers)
+                # 남은 행 반영
+                flush()
+            except Exception:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                db_session.rollback()
+                raise
+            finally:
+                close_sources()
+                if lookups_dir:
+                    shutil.rmtree(lookups_dir, ignore_errors=True)
+
+            failed_files.sort(key=lambda failed: failed["index"])
             summary = {
-                "total": len(unzipped_files),
+                "total": total,
                 "success": len(created_documents),
                 "failed": len(failed_files),
             }
 
             logger.info(
                 f"전처리 완료: {summary['success']}개 성공, "
-                f"{summary['failed']}개 실패 / 총 {summary['total']}개"
+                f"{summary['failed']}개 실패 / 총 {summary['total']}개 "
+                f"(io_concurrency={self.preprocess_io_concurrency}, cpu_workers={cpu_workers})"
             )
 
             if failed_files:
@@ -382,6 +649,226 @@ class ProgramUploader:
             logger.error(f"전처리 중 오류: {str(e)}")
             raise
 
+    @staticmethod
+    def _processed_json_key(program_id: str, idx: int) -> Tuple[str, str]:
+        """전처리 JSON 파일명과 S3 키 (파일 순번 기준이라 재시도 시 같은 키에 덮어씀)"""
+        json_filename = f"processed_{program_id}_{idx}.json"
+        return json_filename, f"programs/{program_id}/processed/{json_filename}"
+
+    @staticmethod
+    def preprocessed_document_row(
+        document_id: str,
+        program_id: str,
+        program_title: str,
+        user_id: str,
+        json_filename: str,
+        json_s3_key: str,
+        json_s3_path: str,
+        json_size: int,
+        logic_id: Optional[str],
+        source_file_path: str,
+        extra_metadata: Optional[Dict] = None,
+    ) -> Dict:
+        """전처리 JSON Document 일괄 INSERT용 행 (DocumentCRUD.bulk_create_documents)"""
+        metadata_json = {
+            "program_id": program_id,
+            "program_title": program_title,
+            "processing_stage": "preprocessed",
+            "json_filename": json_filename,
+            "logic_id": logic_id,
+            "source_file_path": source_file_path,
+        }
+        if extra_metadata:
+            metadata_json.update(extra_metadata)
+        return {
+            "document_id": document_id,
+            "document_name": f"{program_title}_{json_filename}",
+            "original_filename": json_filename,
+            "file_key": json_s3_key,
+            "file_size": json_size,
+            "file_type": "application/json",
+            "file_extension": "json",
+            "user_id": user_id,
+            "upload_path": json_s3_path,
+            "status": "processing",
+            "document_type": "common",
+            "program_id": program_id,
+            "metadata_json": metadata_json,
+            "create_dt": datetime.now(),
+        }
+
+    async def load_program_lookups(
+        self, program_id: str
+    ) -> Tuple[PreprocessLookups, Optional[str]]:
+        """등록 완료된 프로그램의 전처리 조회 테이블 (S3에 업로드된 XLSX/인덱스 사용, 실패 재처리용)
+
+        Returns:
+            Tuple[PreprocessLookups, Optional[str]]: 조회 테이블, 사용 후 정리할 임시 디렉토리
+        """
+        prefix = f"s3://{self.s3_bucket}/programs/{program_id}"
+        return await self._load_preprocess_lookups(
+            None,
+            f"{prefix}/classification.xlsx",
+            f"{prefix}/device_comment.csv",
+            f"{prefix}/{DeviceCommentIndex.FILENAME}",
+        )
+
+    async def rebuild_preprocessed_file(
+        self,
+        program_id: str,
+        source_file_path: str,
+        file_index: int,
+        lookups: PreprocessLookups,
+    ) -> Dict:
+        """
+        원본 래더 파일 1개 전처리 재수행 (S3 원본 읽기 → JSON 생성 → S3 업로드)
+
+        Returns:
+            Dict: {"json_filename", "json_s3_key", "json_s3_path", "json_size", "logic_id"}
+        """
+        if not self.s3_client:
+            raise RuntimeError(f"원본 파일을 읽을 수 없습니다: {source_file_path}")
+
+        json_filename, json_s3_key = self._processed_json_key(program_id, file_index)
+        logic_id = os.path.basename(source_file_path)
+
+        content = await asyncio.to_thread(self._get_s3_object, source_file_path)
+        json_content = await asyncio.to_thread(
+            build_ladder_json, program_id, logic_id, source_file_path, content, lookups
+        )
+        json_s3_path = await self._upload_json_to_s3(
+            json_content=json_content, s3_key=json_s3_key
+        )
+        return {
+            "json_filename": json_filename,
+            "json_s3_key": json_s3_key,
+            "json_s3_path": json_s3_path,
+            "json_size": len(json_content.encode("utf-8")),
+            "logic_id": logic_id,
+        }
+
+    async def _load_preprocess_lookups(
+        self,
+        context: Optional[ProgramIngestionContext],
+        classification_xlsx_path: Optional[str],
+        device_comment_csv_path: Optional[str],
+        device_comment_index_path: Optional[str] = None,
+    ) -> Tuple[PreprocessLookups, Optional[str]]:
+        """분류체계 조회 테이블 1회 생성 및 디바이스 코멘트 인덱스 파일 준비
+
+        컨텍스트가 있으면 검증 단계에서 파싱한 DataFrame과 작업 디렉토리의 인덱스를 재사용하고,
+        없으면 S3의 인덱스를 임시 디렉토리로 내려받습니다 (인덱스가 없으면 CSV로 생성).
+
+        Returns:
+            Tuple[PreprocessLookups, Optional[str]]: 조회 테이블, 정리할 임시 디렉토리
+        """
+
+        def load() -> Tuple[PreprocessLookups, Optional[str]]:
+            classification_df = None
+            device_comment_df = None
+            if context is not None:
+                classification_df = context.classification_xlsx.excel_dataframe
+                index_path = context.work_dir / DeviceCommentIndex.FILENAME
+                if index_path.exists():
+                    return PreprocessLookups.from_dataframe(classification_df, str(index_path)), None
+                device_comment_df = context.device_comment_csv.csv_dataframe
+            elif self.s3_client:
+                import io
+
+                import pandas as pd
+
+                if classification_xlsx_path:
+                    classification_df = pd.read_excel(
+                        io.BytesIO(self._get_s3_object(classification_xlsx_path))
+                    )
+            else:
+                return PreprocessLookups.from_dataframe(), None
+
+            temp_dir = tempfile.mkdtemp(prefix="device_comment_index_")
+            index_path = os.path.join(temp_dir, DeviceCommentIndex.FILENAME)
+            try:
+                if device_comment_df is None and device_comment_index_path:
+                    bucket, key = self._split_s3_path(device_comment_index_path)
+                    self.s3_client.download_file(bucket, key, index_path)
+                else:
+                    if device_comment_df is None and device_comment_csv_path:
+                        from src.api.services.program_validator import ProgramValidator
+
+                        device_comment_df, _ = read_csv_columns(
+                            self._get_s3_object(device_comment_csv_path),
+                            usecols=ProgramValidator.REQUIRED_CSV_COLUMNS,
+                        )
+                    DeviceCommentIndex.build_from_dataframe(device_comment_df, index_path)
+            except Exception:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                raise
+            return PreprocessLookups.from_dataframe(classification_df, index_path), temp_dir
+
+        lookups, temp_dir = await asyncio.to_thread(load)
+
+        device_comment_count = 0
+        if lookups.device_index is not None:
+            device_comment_count = len(lookups.device_index)
+            lookups.close()
+        logger.info(
+            f"전처리 조회 테이블 생성: classification={len(lookups.classification)}건, "
+            f"device_comments={device_comment_count}건"
+        )
+        return lookups, temp_dir
+
+    def _split_s3_path(self, s3_path: str) -> Tuple[str, str]:
+        """s3://bucket/key 또는 key → (bucket, key)"""
+        if s3_path.startswith("s3://"):
+            bucket, key = s3_path[len("s3://"):].split("/", 1)
+            return bucket, key
+        return self.s3_bucket, s3_path
+
+    def _get_s3_object(self, s3_path: str) -> bytes:
+        """S3 객체 다운로드 (s3://bucket/key 또는 key)"""
+        bucket, key = self._split_s3_path(s3_path)
+        response = self.s3_client.get_object(Bucket=bucket, Key=key)
+        return response["Body"].read()
+
+    def _source_reader(
+        self, context: Optional[ProgramIngestionContext]
+    ) -> Tuple[Callable[[str], bytes], Callable[[], None]]:
+        """원본 래더 파일 읽기 함수와 정리 함수 반환
+
+        컨텍스트가 있으면 스풀링된 ZIP에서 직접 읽고 (스레드별 ZipFile 핸들),
+        없으면 S3 get_object로 내려받습니다.
+        """
+        members = {}
+        if context is not None:
+            with context.ladder_zip.open_zip() as zip_ref:
+                for info in zip_ref.infolist():
+                    member_name = self._safe_member_name(info.filename)
+                    if member_name and not info.is_dir():
+                        members[member_name] = info
+
+        local = threading.local()
+        handles = []
+        handles_lock = threading.Lock()
+
+        def read_source(s3_path: str) -> bytes:
+            info = members.get(s3_path.split("/unzipped/", 1)[-1]) if members else None
+            if info is not None:
+                zip_ref = getattr(local, "zip_ref", None)
+                if zip_ref is None:
+                    zip_ref = context.ladder_zip.open_zip()
+                    local.zip_ref = zip_ref
+                    with handles_lock:
+                        handles.append(zip_ref)
+                return zip_ref.read(info)
+            if self.s3_client:
+                return self._get_s3_object(s3_path)
+            raise RuntimeError(f"원본 파일을 읽을 수 없습니다: {s3_path}")
+
+        def close_sources():
+            for handle in handles:
+                handle.close()
+
+        return read_source, close_sources
+
     async def _upload_json_to_s3(self, json_content: str, s3_key: str) -> str:
         """
         JSON 파일을 S3에 업로드
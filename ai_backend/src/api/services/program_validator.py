@@ -1,12 +1,12 @@
 # _*_ coding: utf-8 _*_
 """Program validation module for file validation."""
-import io
 import logging
-import zipfile
 from typing import Dict, List, Tuple
 
-import pandas as pd
-from fastapi import UploadFile
+from src.api.services.program_ingestion import (
+    ProgramIngestionContext,
+    SpooledUpload,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,27 +25,37 @@ class ProgramValidator:
         "설명",
     ]  # 예시 컬럼명, 실제 컬럼명에 맞게 수정 필요
 
+    # 교차 검증 경고 메시지에 표시할 최대 파일 수
+    REPORT_PREVIEW_COUNT = 10
+
+    @staticmethod
+    def case_insensitive_match() -> bool:
+        """로직파일명 ↔ ZIP 엔트리 대조 시 대소문자 무시 여부 (호출 시점 설정값)"""
+        from src.config import settings
+
+        return settings.program_filename_case_insensitive
+
     @staticmethod
     def validate_files(
-        ladder_zip: UploadFile,
-        classification_xlsx: UploadFile,
-        device_comment_csv: UploadFile,
-    ) -> Tuple[bool, List[str], List[str], List[str]]:
+        context: ProgramIngestionContext,
+    ) -> Tuple[bool, List[str], List[str], List[str], Dict]:
         """
-        파일 유효성 검사
+        파일 유효성 검사 (각 파일은 컨텍스트에서 1회만 파싱되어 재사용됨)
 
         Returns:
-            Tuple[bool, List[str], List[str], List[str]]:
-                (is_valid, errors, warnings, checked_files)
+            Tuple[bool, List[str], List[str], List[str], Dict]:
+                (is_valid, errors, warnings, checked_files, cross_reference)
+                cross_reference: 교차 검증 리포트 (교차 검증을 수행하지 않은 경우 빈 dict)
         """
         errors = []
         warnings = []
         checked_files = []
+        cross_reference = {}
 
         try:
             # 1. ZIP 파일 검증
             zip_errors, zip_warnings, zip_files = ProgramValidator._validate_zip_file(
-                ladder_zip
+                context.ladder_zip
             )
             errors.extend(zip_errors)
             warnings.extend(zip_warnings)
@@ -53,7 +63,7 @@ class ProgramValidator:
 
             # 2. XLSX 파일 검증 및 컬럼 확인
             xlsx_errors, xlsx_warnings, xlsx_files = (
-                ProgramValidator._validate_xlsx_file(classification_xlsx)
+                ProgramValidator._validate_xlsx_file(context.classification_xlsx)
             )
             errors.extend(xlsx_errors)
             warnings.extend(xlsx_warnings)
@@ -61,7 +71,7 @@ class ProgramValidator:
 
             # 3. CSV 파일 검증 및 컬럼 확인
             csv_errors, csv_warnings, csv_files = ProgramValidator._validate_csv_file(
-                device_comment_csv
+                context.device_comment_csv
             )
             errors.extend(csv_errors)
             warnings.extend(csv_warnings)
@@ -69,23 +79,26 @@ class ProgramValidator:
 
             # 4. XLSX의 로직파일명이 ZIP에 있는지 확인
             if not errors:  # 에러가 없을 때만 교차 검증
-                cross_errors = ProgramValidator._validate_file_cross_reference(
-                    ladder_zip, classification_xlsx
+                cross_errors, cross_warnings, cross_reference = (
+                    ProgramValidator._validate_file_cross_reference(
+                        context.ladder_zip, context.classification_xlsx
+                    )
                 )
                 errors.extend(cross_errors)
+                warnings.extend(cross_warnings)
 
             is_valid = len(errors) == 0
 
-            return is_valid, errors, warnings, checked_files
+            return is_valid, errors, warnings, checked_files, cross_reference
 
         except Exception as e:
             logger.error(f"유효성 검사 중 예외 발생: {str(e)}")
             errors.append(f"유효성 검사 중 오류 발생: {str(e)}")
-            return False, errors, warnings, checked_files
+            return False, errors, warnings, checked_files, cross_reference
 
     @staticmethod
     def _validate_zip_file(
-        zip_file: UploadFile,
+        zip_file: SpooledUpload,
     ) -> Tuple[List[str], List[str], List[str]]:
         """ZIP 파일 유효성 검사"""
         errors = []
@@ -93,25 +106,19 @@ class ProgramValidator:
         checked_files = []
 
         try:
-            # 파일 읽기
-            zip_file.file.seek(0)
-            zip_content = zip_file.file.read()
-            zip_file.file.seek(0)
-
             # ZIP 파일 형식 확인
-            if not zipfile.is_zipfile(io.BytesIO(zip_content)):
+            if not zip_file.is_zip:
                 errors.append(f"{zip_file.filename}은(는) 유효한 ZIP 파일이 아닙니다.")
                 return errors, warnings, checked_files
 
-            # ZIP 파일 내용 확인
-            with zipfile.ZipFile(io.BytesIO(zip_content), "r") as zip_ref:
-                file_list = zip_ref.namelist()
-                checked_files = file_list
+            # ZIP 파일 내용 확인 (namelist는 컨텍스트에 캐시됨)
+            file_list = zip_file.zip_namelist
+            checked_files = file_list
 
-                if len(file_list) == 0:
-                    errors.append(f"{zip_file.filename}은(는) 비어있는 ZIP 파일입니다.")
-                else:
-                    logger.info(f"ZIP 파일 검증 완료: {len(file_list)}개 파일 발견")
+            if len(file_list) == 0:
+                errors.append(f"{zip_file.filename}은(는) 비어있는 ZIP 파일입니다.")
+            else:
+                logger.info(f"ZIP 파일 검증 완료: {len(file_list)}개 파일 발견")
 
         except Exception as e:
             errors.append(f"ZIP 파일 검증 중 오류: {str(e)}")
@@ -120,7 +127,7 @@ class ProgramValidator:
 
     @staticmethod
     def _validate_xlsx_file(
-        xlsx_file: UploadFile,
+        xlsx_file: SpooledUpload,
     ) -> Tuple[List[str], List[str], List[str]]:
         """XLSX 파일 유효성 검사 및 컬럼 확인"""
         errors = []
@@ -128,13 +135,8 @@ class ProgramValidator:
         checked_files = []
 
         try:
-            # 파일 읽기
-            xlsx_file.file.seek(0)
-            xlsx_content = xlsx_file.file.read()
-            xlsx_file.file.seek(0)
-
-            # XLSX 파일 읽기
-            df = pd.read_excel(io.BytesIO(xlsx_content))
+            # XLSX 파일 읽기 (컨텍스트에 캐시된 DataFrame)
+            df = xlsx_file.excel_dataframe
 
             # 필수 컬럼 확인
             missing_columns = []
@@ -165,7 +167,7 @@ class ProgramValidator:
 
     @staticmethod
     def _validate_csv_file(
-        csv_file: UploadFile,
+        csv_file: SpooledUpload,
     ) -> Tuple[List[str], List[str], List[str]]:
         """CSV 파일 유효성 검사 및 컬럼 확인"""
         errors = []
@@ -173,32 +175,21 @@ class ProgramValidator:
         checked_files = []
 
         try:
-            # 파일 읽기
-            csv_file.file.seek(0)
-            csv_content = csv_file.file.read()
-            csv_file.file.seek(0)
-
-            # CSV 파일 읽기 (인코딩 자동 감지 시도)
-            try:
-                df = pd.read_csv(io.BytesIO(csv_content), encoding="utf-8")
-            except UnicodeDecodeError:
-                try:
-                    df = pd.read_csv(io.BytesIO(csv_content), encoding="cp949")
-                except:
-                    df = pd.read_csv(io.BytesIO(csv_content), encoding="latin-1")
-
-            # 필수 컬럼 확인
+            # 필수 컬럼 확인 (인코딩은 앞부분만 읽어 감지, 헤더 1줄만 파싱)
+            columns = csv_file.csv_columns
             missing_columns = []
             for col in ProgramValidator.REQUIRED_CSV_COLUMNS:
-                if col not in df.columns:
+                if col not in columns:
                     missing_columns.append(col)
 
             if missing_columns:
                 errors.append(
                     f"CSV 파일에 필수 컬럼이 없습니다: {', '.join(missing_columns)}. "
-                    f"현재 컬럼: {', '.join(df.columns.tolist())}"
+                    f"현재 컬럼: {', '.join(columns)}"
                 )
             else:
+                # 필수 컬럼만 1회 파싱 (컨텍스트에 캐시된 DataFrame)
+                df = csv_file.csv_dataframe
                 # 파일명 리스트 추출
                 if "파일명" in df.columns:
                     device_files = df["파일명"].dropna().tolist()
@@ -214,65 +205,67 @@ class ProgramValidator:
 
     @staticmethod
     def _validate_file_cross_reference(
-        ladder_zip: UploadFile, classification_xlsx: UploadFile
-    ) -> List[str]:
-        """XLSX의 로직파일명이 ZIP 파일에 실제로 있는지 교차 검증"""
+        ladder_zip: SpooledUpload, classification_xlsx: SpooledUpload
+    ) -> Tuple[List[str], List[str], Dict]:
+        """
+        XLSX의 로직파일명이 ZIP 파일에 실제로 있는지 교차 검증
+
+        ZIP namelist로 만든 인덱스(전체 경로/파일명)로 로직파일명당 O(1) 조회하며,
+        같은 순회에서 누락/미사용/모호(동일 파일명 중복) 항목을 함께 집계합니다.
+
+        Returns:
+            Tuple[List[str], List[str], Dict]: (errors, warnings, cross_reference)
+        """
         errors = []
+        warnings = []
+        report = {}
+        preview = ProgramValidator.REPORT_PREVIEW_COUNT
 
         try:
-            # ZIP 파일 내용 읽기
-            ladder_zip.file.seek(0)
-            zip_content = ladder_zip.file.read()
-            ladder_zip.file.seek(0)
-
-            # XLSX 파일 내용 읽기
-            classification_xlsx.file.seek(0)
-            xlsx_content = classification_xlsx.file.read()
-            classification_xlsx.file.seek(0)
-
-            # ZIP 파일 내 파일 목록 추출
-            with zipfile.ZipFile(io.BytesIO(zip_content), "r") as zip_ref:
-                zip_files = set(zip_ref.namelist())
-
-            # XLSX 파일에서 로직파일명 추출
-            df = pd.read_excel(io.BytesIO(xlsx_content))
+            # XLSX 파일에서 로직파일명 추출 (컨텍스트에 캐시된 DataFrame)
+            df = classification_xlsx.excel_dataframe
             if "로직파일명" not in df.columns:
                 errors.append("XLSX 파일에 '로직파일명' 컬럼을 찾을 수 없습니다.")
-                return errors
-
-            logic_files = df["로직파일명"].dropna().tolist()
-
-            # ZIP 파일에 없는 파일명 확인
-            missing_files = []
-            for logic_file in logic_files:
-                # 파일명 정규화 (경로 구분자 통일)
-                normalized_logic_file = logic_file.replace("\\", "/")
-                found = False
-
-                # 정확히 일치하거나, 파일명만 일치하는지 확인
-                for zip_file in zip_files:
-                    normalized_zip_file = zip_file.replace("\\", "/")
-                    if (
-                        normalized_logic_file == normalized_zip_file
-                        or normalized_logic_file == normalized_zip_file.split("/")[-1]
-                    ):
-                        found = True
-                        break
-
-                if not found:
-                    missing_files.append(logic_file)
+                return errors, warnings, report
+
+            logic_files = df["로직파일명"].dropna().astype(str).tolist()
 
+            # ZIP 파일명 인덱스 (컨텍스트에 캐시됨)
+            zip_index = ladder_zip.zip_index(ProgramValidator.case_insensitive_match())
+            report = zip_index.cross_reference(logic_files)
+            report["file_count_in_zip"] = len(zip_index.paths)
+            report["file_count_in_xlsx"] = len(logic_files)
+
+            missing_files = report["missing"]
             if missing_files:
                 errors.append(
                     f"분류체계 데이터에 있는 {len(missing_files)}개 파일이 ZIP 파일에 없습니다: "
-                    f"{', '.join(missing_files[:10])}"  # 처음 10개만 표시
+                    f"{', '.join(missing_files[:preview])}"  # 처음 10개만 표시
+                )
+
+            ambiguous_files = report["ambiguous"]
+            if ambiguous_files:
+                warnings.append(
+                    f"분류체계 데이터의 {len(ambiguous_files)}개 파일명이 ZIP 내 여러 경로와 일치합니다: "
+                    + ", ".join(
+                        f"{item['file_name']}({len(item['candidates'])}개)"
+                        for item in ambiguous_files[:preview]
+                    )
+                )
+
+            extra_files = report["extra"]
+            if extra_files:
+                warnings.append(
+                    f"ZIP 파일의 {len(extra_files)}개 파일이 분류체계 데이터에 없습니다: "
+                    f"{', '.join(extra_files[:preview])}"
                 )
 
             logger.info(
-                f"교차 검증 완료: {len(logic_files)}개 파일 중 {len(logic_files) - len(missing_files)}개 확인됨"
+                f"교차 검증 완료: {len(logic_files)}개 파일 중 {report['matched_count']}개 확인됨 "
+                f"(누락 {len(missing_files)}, 모호 {len(ambiguous_files)}, 미사용 {len(extra_files)})"
             )
 
         except Exception as e:
             errors.append(f"교차 검증 중 오류: {str(e)}")
 
-        return errors
+        return errors, warnings, report
@@ -0,0 +1,130 @@
+# _*_ coding: utf-8 _*_
+"""Event-driven cancellation registry for streaming AI responses."""
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CancellationRegistry:
+    """스트리밍 생성 취소 레지스트리 (프로세스 단위)
+
+    - chat_id별 asyncio.Event를 보관하여 스트림 루프에서 I/O 없이 취소 여부 확인
+    - Redis pub/sub 채널로 다른 레플리카/워커에 취소 신호 전파
+    - Redis가 없으면 현재 프로세스 내에서만 취소 신호 전달 (로컬 fallback)
+    """
+
+    CHANNEL = "chat:cancel"
+
+    def __init__(self):
+        self._events: Dict[str, asyncio.Event] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._redis_client = None
+        self._listener_thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def start(self, redis_client=None, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """취소 신호 수신 시작 (앱 startup 시 1회 호출)"""
+        self._loop = loop or asyncio.get_running_loop()
+
+        if redis_client is None:
+            logger.info("Cancellation registry started in local mode (Redis disabled)")
+            return
+
+        if self._listener_thread is not None and self._listener_thread.is_alive():
+            return
+
+        self._redis_client = redis_client
+        self._stop.clear()
+        self._listener_thread = threading.Thread(
+            target=self._listen, name="cancel-listener", daemon=True
+        )
+        self._listener_thread.start()
+        logger.info(f"Cancellation registry subscribed to Redis channel: {self.CHANNEL}")
+
+    def stop(self):
+        """취소 신호 수신 종료 (앱 shutdown 시 호출)"""
+        self._stop.set()
+        if self._listener_thread is not None:
+            self._listener_thread.join(timeout=2)
+            self._listener_thread = None
+
+    def _listen(self):
+        """Redis pub/sub 구독 루프 (별도 스레드에서 실행)"""
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                pubsub = self._redis_client.redis_client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.CHANNEL)
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        chat_id = message.get("data")
+                        if self._loop is not None and chat_id:
+                            self._loop.call_soon_threadsafe(self._set_local, chat_id)
+            except Exception as e:
+                logger.warning(f"Cancellation listener error, reconnecting: {e}")
+                time.sleep(1)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+    def register(self, chat_id: str) -> asyncio.Event:
+        """스트림 시작 시 chat_id에 대한 취소 이벤트 등록"""
+        event = asyncio.Event()
+        self._events[chat_id] = event
+        return event
+
+    def unregister(self, chat_id: str, event: Optional[asyncio.Event] = None):
+        """스트림 종료 시 취소 이벤트 해제 (다른 스트림이 재등록한 경우는 유지)"""
+        current = self._events.get(chat_id)
+        if current is not None and (event is None or current is event):
+            del self._events[chat_id]
+
+    def is_cancelled(self, chat_id: str) -> bool:
+        """취소 여부 확인 (I/O 없음)"""
+        event = self._events.get(chat_id)
+        return event is not None and event.is_set()
+
+    def _set_local(self, chat_id: str) -> bool:
+        """현재 프로세스의 이벤트에 취소 신호 설정"""
+        event = self._events.get(chat_id)
+        if event is None:
+            return False
+        event.set()
+        return True
+
+    async def cancel(self, chat_id: str) -> bool:
+        """취소 신호 전파 (로컬 즉시 설정 + Redis 비동기 발행)
+
+        Returns:
+            bool: 로컬 스트림에 전달되었거나 Redis 구독자가 신호를 수신한 경우 True
+        """
+        delivered = self._set_local(chat_id)
+
+        if self._redis_client is not None:
+            try:
+                receivers = await self._redis_client.aio.publish(self.CHANNEL, chat_id)
+                delivered = delivered or bool(receivers)
+            except Exception as e:
+                logger.warning(f"Redis cancel publish failed: {e}")
+
+        return delivered
+
+
+# 전역 취소 레지스트리 인스턴스
+cancellation_registry = None
+
+
+def get_cancellation_registry() -> CancellationRegistry:
+    """취소 레지스트리 의존성 주입 (프로세스 싱글톤)"""
+    global cancellation_registry
+    if cancellation_registry is None:
+        cancellation_registry = CancellationRegistry()
+    return cancellation_registry
@@ -0,0 +1,236 @@
+# _*_ coding: utf-8 _*_
+"""Versioned in-process cache for hierarchy master data."""
+import json
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 계층 레벨 (상위 → 하위)
+MASTER_LEVELS = ("plant", "process", "line", "equipment_group")
+
+
+class MasterDataCache:
+    """기준정보 마스터(Plant/Process/Line/EquipmentGroup) 프로세스 캐시
+
+    - 4개 마스터 테이블을 한 번에 적재하여 ID → {id, code, name, display_order, is_active} 조회를 메모리에서 처리
+    - master_crud 쓰기 시 invalidate()로 버전을 올려 다음 조회 시 재적재
+    - Redis가 있으면 버전 카운터(master:version)와 스냅샷(master:snapshot)을 공유하여
+      다른 워커/레플리카도 변경을 감지하고 DB 대신 Redis 스냅샷으로 재적재
+    - Redis가 없으면 ttl_seconds 경과 시 재적재 (다른 워커의 변경은 최대 TTL만큼 늦게 반영)
+    """
+
+    VERSION_KEY = "master:version"
+    SNAPSHOT_KEY = "master:snapshot"
+
+    def __init__(self, ttl_seconds: int = 600, version_check_seconds: int = 5):
+        self.ttl_seconds = ttl_seconds
+        self.version_check_seconds = version_check_seconds
+
+        self._data: Optional[Dict[str, Dict[str, Dict]]] = None
+        self._version = 0
+        self._loaded_at = 0.0
+        self._checked_at = 0.0
+        self._stale = True
+        self._lock = threading.Lock()
+
+    def _redis(self):
+        """공유용 Redis 연결 (캐시 비활성화/연결 실패 시 None)"""
+        try:
+            from src.core.dependencies import get_redis_client
+
+            client = get_redis_client()
+            return client.redis_client if client else None
+        except Exception:
+            return None
+
+    def _remote_version(self, redis) -> int:
+        value = redis.get(self.VERSION_KEY)
+        return int(value) if value else 0
+
+    def _needs_reload(self) -> bool:
+        """재적재 필요 여부 (Redis 버전 확인은 version_check_seconds 주기로만 수행)"""
+        now = time.monotonic()
+        if self._data is None or self._stale or now - self._loaded_at > self.ttl_seconds:
+            return True
+        if now - self._checked_at < self.version_check_seconds:
+            return False
+
+        self._checked_at = now
+        redis = self._redis()
+        if redis is None:
+            return False
+        try:
+            return self._remote_version(redis) != self._version
+        except Exception as e:
+            logger.warning(f"기준정보 캐시 버전 확인 실패: {str(e)}")
+            return False
+
+    def _load_from_db(self, session) -> Dict[str, Dict[str, Dict]]:
+        """4개 마스터 테이블을 테이블당 1회 쿼리로 적재"""
+        from src.database.models.master_models import (
+            EquipmentGroupMaster,
+            LineMaster,
+            PlantMaster,
+            ProcessMaster,
+        )
+
+        columns_by_level = {
+            "plant": (
+                PlantMaster.plant_id,
+                PlantMaster.plant_code,
+                PlantMaster.plant_name,
+                PlantMaster.display_order,
+                PlantMaster.is_active,
+            ),
+            "process": (
+                ProcessMaster.process_id,
+                ProcessMaster.process_code,
+                ProcessMaster.process_name,
+                ProcessMaster.display_order,
+                ProcessMaster.is_active,
+            ),
+            "line": (
+                LineMaster.line_id,
+                LineMaster.line_code,
+                LineMaster.line_name,
+                LineMaster.display_order,
+                LineMaster.is_active,
+            ),
+            "equipment_group": (
+                EquipmentGroupMaster.equipment_group_id,
+                EquipmentGroupMaster.equipment_group_code,
+                EquipmentGroupMaster.equipment_group_name,
+                EquipmentGroupMaster.display_order,
+                EquipmentGroupMaster.is_active,
+            ),
+        }
+
+        data = {}
+        for level, columns in columns_by_level.items():
+            data[level] = {
+                master_id: {
+                    "id": master_id,
+                    "code": code,
+                    "name": name,
+                    "display_order": display_order,
+                    "is_active": bool(is_active),
+                }
+                for master_id, code, name, display_order, is_active in session.query(*columns).all()
+            }
+        return data
+
+    def _load(self, session):
+        """Redis 스냅샷(같은 버전) 또는 DB에서 적재"""
+        redis = self._redis()
+        version = 0
+        data = None
+
+        if redis is not None:
+            try:
+                version = self._remote_version(redis)
+                raw = redis.get(self.SNAPSHOT_KEY)
+                if raw:
+                    snapshot = json.loads(raw)
+                    if snapshot.get("version") == version:
+                        data = snapshot.get("data")
+            except Exception as e:
+                logger.warning(f"기준정보 캐시 Redis 스냅샷 조회 실패: {str(e)}")
+
+        if data is None:
+            data = self._load_from_db(session)
+            if redis is not None:
+                try:
+                    redis.setex(
+                        self.SNAPSHOT_KEY,
+                        self.ttl_seconds,
+                        json.dumps({"version": version, "data": data}),
+                    )
+                except Exception as e:
+                    logger.warning(f"기준정보 캐시 Redis 스냅샷 저장 실패: {str(e)}")
+
+        self._data = data
+        self._version = version
+        self._loaded_at = self._checked_at = time.monotonic()
+        self._stale = False
+        logger.debug(
+            f"기준정보 캐시 적재: version={version}, "
+            + ", ".join(f"{level}={len(data.get(level, {}))}" for level in MASTER_LEVELS)
+        )
+
+    def _get_data(self, session) -> Dict[str, Dict[str, Dict]]:
+        if self._needs_reload():
+            with self._lock:
+                if self._data is None or self._stale or self._needs_reload():
+                    self._load(session)
+        return self._data
+
+    def invalidate(self):
+        """기준정보 변경 시 호출 (공유 버전 증가 + 로컬 캐시 무효화)"""
+        redis = self._redis()
+        if redis is not None:
+            try:
+                redis.incr(self.VERSION_KEY)
+            except Exception as e:
+                logger.warning(f"기준정보 캐시 버전 증가 실패: {str(e)}")
+        self._stale = True
+
+    def get(self, session, level: str, master_id: Optional[str], active_only: bool = False) -> Optional[Dict]:
+        """레벨별 기준정보 단건 조회 (level: plant, process, line, equipment_group)"""
+        if not master_id:
+            return None
+        entry = self._get_data(session).get(level, {}).get(master_id)
+        if entry is None or (active_only and not entry["is_active"]):
+            return None
+        return entry
+
+    def get_hierarchy(
+        self,
+        session,
+        plant_id: Optional[str] = None,
+        process_id: Optional[str] = None,
+        line_id: Optional[str] = None,
+        equipment_group_id: Optional[str] = None,
+        active_only: bool = False,
+    ) -> Optional[Dict]:
+        """
+        스냅샷 ID들로 계층 구조 이름 정보 조회 (캐시 적중 시 DB 쿼리 없음)
+
+        Returns:
+            Dict: 계층 구조 정보
+            {
+                "plant": {"id": "...", "code": "...", "name": "..."},
+                "process": {"id": "...", "code": "...", "name": "..."},
+                "line": {"id": "...", "code": "...", "name": "..."},
+                "equipment_group": {"id": "...", "code": "...", "name": "..."}
+            }
+        """
+        hierarchy = {}
+        for level, master_id in zip(MASTER_LEVELS, (plant_id, process_id, line_id, equipment_group_id)):
+            entry = self.get(session, level, master_id, active_only=active_only)
+            if entry:
+                hierarchy[level] = {
+                    "id": entry["id"],
+                    "code": entry["code"],
+                    "name": entry["name"],
+                }
+        return hierarchy if hierarchy else None
+
+
+# 전역 기준정보 캐시 인스턴스
+master_data_cache = None
+
+
+def get_master_data_cache() -> MasterDataCache:
+    """기준정보 캐시 의존성 주입 (프로세스 싱글톤)"""
+    global master_data_cache
+    if master_data_cache is None:
+        from src.config import settings
+
+        master_data_cache = MasterDataCache(
+            ttl_seconds=settings.cache_ttl_master_data,
+            version_check_seconds=settings.master_cache_version_check_sec,
+        )
+    return master_data_cache
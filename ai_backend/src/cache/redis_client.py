@@ -1,14 +1,232 @@
 # _*_ coding: utf-8 _*_
 """Redis client for caching and session management."""
 import redis
+import redis.asyncio as aioredis
 import json
 import os
-from typing import Optional, Dict, Any, List
+import re
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 from datetime import datetime, timedelta
 
+# 채팅 히스토리 캐시에 유지할 최대 메시지 수 (Redis list, 최신 메시지 기준)
+CHAT_CACHE_MAX_MESSAGES = 50
+
+# 캐시 관리용 키 네임스페이스 및 SCAN/UNLINK 배치 크기
+CACHE_NAMESPACES = ["chat:", "user_chats:", "session:", "generation:", "cancel:", "master:"]
+SCAN_BATCH_SIZE = int(os.getenv("REDIS_SCAN_BATCH_SIZE", "500"))
+
+# 채팅 히스토리 캐시 버전 키 (캐시 쓰기/무효화마다 증가, DB 재구성과 append 경합 감지용)
+CHAT_CACHE_VERSION_SUFFIX = ":version"
+
+# 캐시가 없을 때만, 그리고 DB 조회 전에 읽은 버전이 그대로일 때만 히스토리 재구성
+# KEYS: [목록 키, 버전 키] / ARGV: [조회 전 버전, TTL, 메시지 JSON...]
+REBUILD_CHAT_CACHE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+if (redis.call('GET', KEYS[2]) or '') ~= ARGV[1] then
+    return 0
+end
+if #ARGV < 3 then
+    return 0
+end
+for i = 3, #ARGV do
+    redis.call('RPUSH', KEYS[1], ARGV[i])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+# 메시지 1개 추가 (같은 message_id가 있으면 그 자리를 교체, 캐시가 없으면 버전만 증가)
+# KEYS: [목록 키, 버전 키] / ARGV: [메시지 JSON, message_id, TTL, 최대 메시지 수]
+APPEND_CHAT_CACHE_SCRIPT = """
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+if ARGV[2] ~= '' then
+    local items = redis.call('LRANGE', KEYS[1], 0, -1)
+    for i, item in ipairs(items) do
+        local ok, decoded = pcall(cjson.decode, item)
+        if ok and type(decoded) == 'table' and decoded['message_id'] == ARGV[2] then
+            redis.call('LSET', KEYS[1], i - 1, ARGV[1])
+            redis.call('EXPIRE', KEYS[1], ARGV[3])
+            return 1
+        end
+    end
+end
+redis.call('RPUSH', KEYS[1], ARGV[1])
+redis.call('LTRIM', KEYS[1], -tonumber(ARGV[4]), -1)
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
+
+def _chat_cache_keys(chat_id: str) -> List[str]:
+    key = f"chat:{chat_id}"
+    return [key, f"{key}{CHAT_CACHE_VERSION_SUFFIX}"]
+
+
+def _rebuild_chat_cache_args(messages: List[Dict[str, Any]], version: Optional[str], expire_seconds: int) -> List[Any]:
+    # message_id 기준 중복 제거 (뒤에 나온 항목 우선, 순서 유지)
+    by_id = {}
+    for message in messages:
+        by_id.pop(message.get("message_id"), None)
+        by_id[message.get("message_id")] = message
+    items = [json.dumps(message) for message in list(by_id.values())[-CHAT_CACHE_MAX_MESSAGES:]]
+    return [version or "", expire_seconds, *items]
+
+
+def _append_chat_cache_args(message: Dict[str, Any], expire_seconds: int) -> List[Any]:
+    return [json.dumps(message), message.get("message_id") or "", expire_seconds, CHAT_CACHE_MAX_MESSAGES]
+
+
+class AsyncRedisClient:
+    """비동기 Redis 클라이언트 (redis.asyncio) - async 코드 경로용
+    
+    RedisClient와 동일한 메서드 이름을 제공하며, 채팅 스트리밍 hot path에서
+    여러 명령을 하나의 파이프라인으로 묶어 이벤트 루프를 블로킹하지 않습니다.
+    """
+    
+    def __init__(self, host: str, port: int, db: int, password: Optional[str],
+                 max_connections: int, socket_timeout: int, socket_connect_timeout: int):
+        self.redis_client = aioredis.Redis(
+            host=host,
+            port=port,
+            db=db,
+            password=password,
+            decode_responses=True,
+            socket_connect_timeout=socket_connect_timeout,
+            socket_timeout=socket_timeout,
+            retry_on_timeout=True,
+            max_connections=max_connections
+        )
+        self._rebuild_chat_script = self.redis_client.register_script(REBUILD_CHAT_CACHE_SCRIPT)
+        self._append_chat_script = self.redis_client.register_script(APPEND_CHAT_CACHE_SCRIPT)
+    
+    async def ping(self) -> bool:
+        """Redis 연결 상태 확인"""
+        try:
+            return await self.redis_client.ping()
+        except Exception:
+            return False
+    
+    async def get_chat_cache_version(self, chat_id: str) -> str:
+        """채팅 메시지 캐시 버전 조회 (DB 재구성 전에 읽어 set_chat_cache에 전달)"""
+        try:
+            return await self.redis_client.get(_chat_cache_keys(chat_id)[1]) or ""
+        except Exception:
+            return ""
+    
+    async def set_chat_cache(self, chat_id: str, messages: List[Dict[str, Any]], expire_seconds: int = 1800,
+                             version: Optional[str] = None) -> bool:
+        """채팅 메시지 캐시 재구성 (원자적, 캐시가 없고 version 이후 변경이 없을 때만, 최신 CHAT_CACHE_MAX_MESSAGES개 유지)"""
+        try:
+            result = await self._rebuild_chat_script(
+                keys=_chat_cache_keys(chat_id),
+                args=_rebuild_chat_cache_args(messages, version, expire_seconds)
+            )
+            return bool(result)
+        except Exception:
+            return False
+    
+    async def append_chat_cache(self, chat_id: str, message: Dict[str, Any], expire_seconds: int = 1800) -> bool:
+        """채팅 메시지 캐시에 메시지 1개 추가 (같은 message_id는 교체, 캐시가 있는 경우에만)"""
+        try:
+            result = await self._append_chat_script(
+                keys=_chat_cache_keys(chat_id),
+                args=_append_chat_cache_args(message, expire_seconds)
+            )
+            return bool(result)
+        except Exception:
+            return False
+    
+    async def get_chat_cache(self, chat_id: str, count: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+        """채팅 메시지 캐시 조회 (count 지정 시 최신 count개만 조회)"""
+        try:
+            key = f"chat:{chat_id}"
+            start = -count if count else 0
+            data = await self.redis_client.lrange(key, start, -1)
+            return [json.loads(item) for item in data] if data else None
+        except Exception:
+            return None
+    
+    async def delete_chat_cache(self, chat_id: str, expire_seconds: int = 1800) -> bool:
+        """채팅 메시지 캐시 삭제 (버전 증가 → 진행 중인 재구성이 이전 데이터를 쓰지 않음)"""
+        try:
+            key, version_key = _chat_cache_keys(chat_id)
+            async with self.redis_client.pipeline() as pipe:
+                pipe.delete(key)
+                pipe.incr(version_key)
+                pipe.expire(version_key, expire_seconds)
+                result = await pipe.execute()
+            return bool(result[0])
+        except Exception:
+            return False
+    
+    async def get_chat_messages(self, chat_id: str, count: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+        """채팅 메시지 조회 (get_chat_cache와 동일)"""
+        return await self.get_chat_cache(chat_id, count)
+    
+    async def append_chat_message(self, chat_id: str, message: Dict[str, Any], expire_seconds: int = 1800) -> bool:
+        """채팅 메시지 추가 (append_chat_cache와 동일)"""
+        return await self.append_chat_cache(chat_id, message, expire_seconds)
+    
+    async def set_chat_messages(self, chat_id: str, messages: List[Dict[str, Any]], expire_seconds: int = 1800,
+                                version: Optional[str] = None) -> bool:
+        """채팅 메시지 저장 (set_chat_cache와 동일)"""
+        return await self.set_chat_cache(chat_id, messages, expire_seconds, version)
+    
+    async def delete_chat_messages(self, chat_id: str) -> bool:
+        """채팅 메시지 삭제 (delete_chat_cache와 동일)"""
+        return await self.delete_chat_cache(chat_id)
+    
+    async def start_generation(self, chat_id: str, expire_seconds: int = 300) -> bool:
+        """생성 시작 표시 (generation 키 설정 + 이전 cancel 키 제거, 1회 왕복)"""
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            pipe.setex(f"generation:{chat_id}", expire_seconds, "1")
+            pipe.delete(f"cancel:{chat_id}")
+            await pipe.execute()
+        return True
+    
+    async def finish_generation(self, chat_id: str) -> bool:
+        """생성 완료 표시 (generation 키 제거)"""
+        return bool(await self.redis_client.delete(f"generation:{chat_id}"))
+    
+    async def mark_cancelled(self, chat_id: str, expire_seconds: int = 60) -> bool:
+        """생성 취소 표시 (generation 확인/제거 + cancel 키 설정, 1회 왕복)
+        
+        Returns:
+            bool: 취소 시점에 생성 중이었는지 여부
+        """
+        async with self.redis_client.pipeline() as pipe:
+            pipe.exists(f"generation:{chat_id}")
+            pipe.delete(f"generation:{chat_id}")
+            pipe.setex(f"cancel:{chat_id}", expire_seconds, "1")
+            result = await pipe.execute()
+        return bool(result[0])
+    
+    async def publish(self, channel: str, message: str) -> int:
+        """채널에 메시지 발행 (구독자 수 반환)"""
+        return await self.redis_client.publish(channel, message)
+    
+    async def close(self):
+        """Redis 연결 종료"""
+        try:
+            # redis-py 5.0.1+ 는 aclose, 이전 버전은 close
+            close = getattr(self.redis_client, "aclose", None) or self.redis_client.close
+            await close()
+        except Exception:
+            pass
+
 
 class RedisClient:
-    """Redis 클라이언트 - 캐싱 및 세션 관리"""
+    """Redis 클라이언트 - 캐싱 및 세션 관리
+    
+    동기 메서드는 sync 라우트/서비스용 facade이며,
+    async 코드 경로에서는 동일한 API의 `aio` (AsyncRedisClient)를 사용합니다.
+    """
     
     def __init__(self):
         self.host = os.getenv("REDIS_HOST", "localhost")
@@ -32,6 +250,19 @@ class RedisClient:
             retry_on_timeout=True,
             max_connections=max_connections  # 100 → 500 (1000명 대응)
         )
+        self._rebuild_chat_script = self.redis_client.register_script(REBUILD_CHAT_CACHE_SCRIPT)
+        self._append_chat_script = self.redis_client.register_script(APPEND_CHAT_CACHE_SCRIPT)
+        
+        # async 코드 경로용 클라이언트 (이벤트 루프 블로킹 방지)
+        self.aio = AsyncRedisClient(
+            host=self.host,
+            port=self.port,
+            db=self.db,
+            password=self.password,
+            max_connections=max_connections,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_connect_timeout
+        )
     
     def ping(self) -> bool:
         """Redis 연결 상태 확인"""
@@ -66,29 +297,64 @@ class RedisClient:
         except Exception:
             return False
     
-    def set_chat_cache(self, chat_id: str, messages: List[Dict[str, Any]], expire_seconds: int = 1800) -> bool:
-        """채팅 메시지 캐시 저장"""
+    def get_chat_cache_version(self, chat_id: str) -> str:
+        """채팅 메시지 캐시 버전 조회 (DB 재구성 전에 읽어 set_chat_cache에 전달)"""
         try:
-            key = f"chat:{chat_id}"
-            self.redis_client.setex(key, expire_seconds, json.dumps(messages))
-            return True
+            return self.redis_client.get(_chat_cache_keys(chat_id)[1]) or ""
+        except Exception:
+            return ""
+    
+    def set_chat_cache(self, chat_id: str, messages: List[Dict[str, Any]], expire_seconds: int = 1800,
+                       version: Optional[str] = None) -> bool:
+        """채팅 메시지 캐시 재구성 (Lua 스크립트로 원자적 처리)
+        
+        캐시 키가 없고, DB 조회 전에 읽은 version 이후 append/무효화가 없었을 때만 저장합니다.
+        그 사이 다른 요청이 메시지를 추가했다면 저장하지 않고 다음 조회 시 다시 재구성합니다.
+        """
+        try:
+            result = self._rebuild_chat_script(
+                keys=_chat_cache_keys(chat_id),
+                args=_rebuild_chat_cache_args(messages, version, expire_seconds)
+            )
+            return bool(result)
+        except Exception:
+            return False
+    
+    def append_chat_cache(self, chat_id: str, message: Dict[str, Any], expire_seconds: int = 1800) -> bool:
+        """채팅 메시지 캐시에 메시지 1개 추가 (O(1), 캐시가 있는 경우에만)
+        
+        캐시가 없으면 부분 히스토리가 생기지 않도록 추가하지 않으며(버전만 증가),
+        다음 조회 시 DB에서 재구성됩니다. 같은 message_id가 이미 있으면 그 항목을 교체합니다.
+        """
+        try:
+            result = self._append_chat_script(
+                keys=_chat_cache_keys(chat_id),
+                args=_append_chat_cache_args(message, expire_seconds)
+            )
+            return bool(result)
         except Exception:
             return False
     
-    def get_chat_cache(self, chat_id: str) -> Optional[List[Dict[str, Any]]]:
-        """채팅 메시지 캐시 조회"""
+    def get_chat_cache(self, chat_id: str, count: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+        """채팅 메시지 캐시 조회 (count 지정 시 최신 count개만 조회)"""
         try:
             key = f"chat:{chat_id}"
-            data = self.redis_client.get(key)
-            return json.loads(data) if data else None
+            start = -count if count else 0
+            data = self.redis_client.lrange(key, start, -1)
+            return [json.loads(item) for item in data] if data else None
         except Exception:
             return None
     
-    def delete_chat_cache(self, chat_id: str) -> bool:
-        """채팅 메시지 캐시 삭제"""
+    def delete_chat_cache(self, chat_id: str, expire_seconds: int = 1800) -> bool:
+        """채팅 메시지 캐시 삭제 (버전 증가 → 진행 중인 재구성이 이전 데이터를 쓰지 않음)"""
         try:
-            key = f"chat:{chat_id}"
-            return bool(self.redis_client.delete(key))
+            key, version_key = _chat_cache_keys(chat_id)
+            pipe = self.redis_client.pipeline()
+            pipe.delete(key)
+            pipe.incr(version_key)
+            pipe.expire(version_key, expire_seconds)
+            result = pipe.execute()
+            return bool(result[0])
         except Exception:
             return False
     
@@ -118,18 +384,39 @@ class RedisClient:
         except Exception:
             return False
     
-    def get_chat_messages(self, chat_id: str) -> Optional[List[Dict[str, Any]]]:
+    def get_chat_messages(self, chat_id: str, count: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
         """채팅 메시지 조회 (get_chat_cache와 동일)"""
-        return self.get_chat_cache(chat_id)
+        return self.get_chat_cache(chat_id, count)
+    
+    def append_chat_message(self, chat_id: str, message: Dict[str, Any], expire_seconds: int = 1800) -> bool:
+        """채팅 메시지 추가 (append_chat_cache와 동일)"""
+        return self.append_chat_cache(chat_id, message, expire_seconds)
     
-    def set_chat_messages(self, chat_id: str, messages: List[Dict[str, Any]], expire_seconds: int = 1800) -> bool:
+    def set_chat_messages(self, chat_id: str, messages: List[Dict[str, Any]], expire_seconds: int = 1800,
+                          version: Optional[str] = None) -> bool:
         """채팅 메시지 저장 (set_chat_cache와 동일)"""
-        return self.set_chat_cache(chat_id, messages, expire_seconds)
+        return self.set_chat_cache(chat_id, messages, expire_seconds, version)
     
     def delete_chat_messages(self, chat_id: str) -> bool:
         """채팅 메시지 삭제 (delete_chat_cache와 동일)"""
         return self.delete_chat_cache(chat_id)
     
+    def delete_chat_state(self, chat_id: str) -> int:
+        """채팅 관련 캐시(메시지/생성/취소 상태)를 한 번의 DELETE로 삭제 (메시지 캐시 버전 증가)"""
+        try:
+            key, version_key = _chat_cache_keys(chat_id)
+            pipe = self.redis_client.pipeline()
+            pipe.delete(key, f"generation:{chat_id}", f"cancel:{chat_id}")
+            pipe.incr(version_key)
+            pipe.expire(version_key, 1800)
+            return pipe.execute()[0]
+        except Exception:
+            return 0
+    
+    def is_generating(self, chat_id: str) -> bool:
+        """생성 중 여부 확인"""
+        return bool(self.redis_client.exists(f"generation:{chat_id}"))
+    
     def increment_counter(self, key: str, expire_seconds: int = 3600) -> int:
         """카운터 증가"""
         try:
@@ -148,7 +435,80 @@ class RedisClient:
             return int(value) if value else 0
         except Exception:
             return 0
-    
+
+    @staticmethod
+    def escape_pattern(prefix: str) -> str:
+        """SCAN MATCH 패턴에서 glob 특수문자 이스케이프"""
+        return re.sub(r"([*?\[\]\\])", r"\\\1", prefix)
+
+    def scan_keys(self, pattern: str = "*", count: int = SCAN_BATCH_SIZE) -> Iterator[str]:
+        """SCAN 기반 키 순회 (KEYS와 달리 Redis를 블로킹하지 않음)"""
+        return self.redis_client.scan_iter(match=pattern, count=count)
+
+    def unlink_keys(self, pattern: str = "*", batch_size: int = SCAN_BATCH_SIZE) -> Iterator[Tuple[int, int]]:
+        """SCAN으로 찾은 키를 batch_size 단위 UNLINK로 삭제
+
+        UNLINK는 메모리 해제를 백그라운드 스레드에서 수행하므로 큰 키도 Redis를 블로킹하지 않습니다.
+
+        Yields:
+            Tuple[int, int]: 배치마다 (누적 스캔 키 수, 누적 삭제 키 수)
+        """
+        scanned = 0
+        deleted = 0
+        batch: List[str] = []
+        for key in self.scan_keys(pattern, count=batch_size):
+            batch.append(key)
+            scanned += 1
+            if len(batch) >= batch_size:
+                deleted += self.redis_client.unlink(*batch)
+                batch = []
+                yield scanned, deleted
+        # 마지막 배치가 남았거나 아무 키도 없을 때만 최종 결과 반환 (같은 결과 중복 방지)
+        if batch or scanned == 0:
+            if batch:
+                deleted += self.redis_client.unlink(*batch)
+            yield scanned, deleted
+
+    def unlink_exact(self, keys: List[str], batch_size: int = SCAN_BATCH_SIZE) -> int:
+        """이름을 아는 키를 SCAN 없이 batch_size 단위 UNLINK로 삭제 (삭제된 키 수 반환)"""
+        deleted = 0
+        for start in range(0, len(keys), batch_size):
+            deleted += self.redis_client.unlink(*keys[start:start + batch_size])
+        return deleted
+
+    def namespace_stats(self, sample_size: int = 100, count: int = SCAN_BATCH_SIZE) -> Dict[str, Dict[str, Any]]:
+        """네임스페이스별 키 수와 메모리 사용량 추정 (SCAN 1회 순회)
+
+        메모리는 네임스페이스별 최대 sample_size개 키의 MEMORY USAGE 평균 × 키 수로 추정합니다.
+        """
+        counts = {namespace: 0 for namespace in CACHE_NAMESPACES}
+        counts["other"] = 0
+        samples: Dict[str, List[str]] = {namespace: [] for namespace in counts}
+
+        for key in self.scan_keys("*", count=count):
+            namespace = next((ns for ns in CACHE_NAMESPACES if key.startswith(ns)), "other")
+            counts[namespace] += 1
+            if len(samples[namespace]) < sample_size:
+                samples[namespace].append(key)
+
+        # 샘플 키의 MEMORY USAGE를 한 번의 파이프라인으로 조회
+        pipe = self.redis_client.pipeline(transaction=False)
+        for namespace in counts:
+            for key in samples[namespace]:
+                pipe.memory_usage(key)
+        usages = iter(pipe.execute() if any(samples.values()) else [])
+
+        stats = {}
+        for namespace, key_count in counts.items():
+            sampled = [next(usages) or 0 for _ in samples[namespace]]
+            average = sum(sampled) / len(sampled) if sampled else 0
+            stats[namespace.rstrip(":")] = {
+                "keys": key_count,
+                "sampled_keys": len(sampled),
+                "estimated_memory_bytes": int(average * key_count)
+            }
+        return stats
+
     def close(self):
         """Redis 연결 종료"""
         try:
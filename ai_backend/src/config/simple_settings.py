@@ -139,6 +139,34 @@ class Settings(BaseSettings):
     cache_enabled: bool = Field(default=True, env="CACHE_ENABLED")
     cache_ttl_chat_messages: int = Field(default=1800, env="CACHE_TTL_CHAT_MESSAGES")  # 30분
     cache_ttl_user_chats: int = Field(default=600, env="CACHE_TTL_USER_CHATS")  # 10분
+    cache_ttl_master_data: int = Field(default=600, env="CACHE_TTL_MASTER_DATA")  # 10분 (기준정보 프로세스 캐시 최대 보관 시간)
+    master_cache_version_check_sec: int = Field(default=5, env="MASTER_CACHE_VERSION_CHECK_SEC")  # Redis 버전 확인 주기
+    
+    # Chat Streaming Write-behind Configuration
+    # ==========================================
+    # 스트리밍 중인 AI 응답의 부분 내용을 DB에 주기적으로 반영 (크래시 복구용)
+    # - flush_interval_ms: 부분 내용 flush 주기 (밀리초)
+    # - flush_bytes: 마지막 flush 이후 누적 크기가 이 값을 넘으면 즉시 flush
+    chat_stream_flush_interval_ms: int = Field(default=1000, env="CHAT_STREAM_FLUSH_INTERVAL_MS")
+    chat_stream_flush_bytes: int = Field(default=4096, env="CHAT_STREAM_FLUSH_BYTES")
+    
+    # Program Registration Job Queue Configuration
+    # ==========================================
+    # 프로그램 등록 후처리(메타데이터 → 템플릿 → S3 → 전처리 → 인덱싱)를 DB 작업 큐로 처리
+    # - staging_dir: 업로드 파일 보관 경로 (API와 워커가 공유하는 볼륨, 비어 있으면 UPLOAD_BASE_PATH/program_jobs)
+    # - embedded_worker: API 프로세스 안에서도 워커 실행 (기본 false, 별도 워커 없이 로컬 개발할 때만 true)
+    # - worker_processes / worker_concurrency: 워커 프로세스 수 / 프로세스당 동시 작업 수
+    # - lease_sec: heartbeat가 이 시간 동안 없으면 다른 워커가 작업을 회수 (크래시 복구)
+    program_job_staging_dir: str = Field(default="", env="PROGRAM_JOB_STAGING_DIR")
+    program_job_embedded_worker: bool = Field(default=False, env="PROGRAM_JOB_EMBEDDED_WORKER")
+    program_job_worker_processes: int = Field(default=2, env="PROGRAM_JOB_WORKER_PROCESSES")
+    program_job_worker_concurrency: int = Field(default=1, env="PROGRAM_JOB_WORKER_CONCURRENCY")
+    program_job_poll_interval_sec: float = Field(default=2.0, env="PROGRAM_JOB_POLL_INTERVAL_SEC")
+    program_job_lease_sec: int = Field(default=300, env="PROGRAM_JOB_LEASE_SEC")
+    program_job_max_attempts: int = Field(default=3, env="PROGRAM_JOB_MAX_ATTEMPTS")
+    program_job_retry_delay_sec: int = Field(default=30, env="PROGRAM_JOB_RETRY_DELAY_SEC")
+    # 프로그램 파일 검증: 로직파일명 ↔ ZIP 엔트리 대조 시 대소문자 무시 여부
+    program_filename_case_insensitive: bool = Field(default=False, env="PROGRAM_FILENAME_CASE_INSENSITIVE")
     
     # Redis Configuration (캐시가 활성화된 경우에만 사용)
     redis_host: str = Field(default="localhost", env="REDIS_HOST")
@@ -218,7 +246,8 @@ class Settings(BaseSettings):
         """캐시 타입별 TTL 반환"""
         ttl_map = {
             "chat_messages": self.cache_ttl_chat_messages,
-            "user_chats": self.cache_ttl_user_chats
+            "user_chats": self.cache_ttl_user_chats,
+            "master_data": self.cache_ttl_master_data
         }
         return ttl_map.get(cache_type, 300)  # 기본 5분
     
@@ -28,6 +28,7 @@ __all__ = [
     "Program",
     "PLC",
     "ProcessingFailure",
+    "ProgramRegistrationJob",
     "PlantMaster",
     "ProcessMaster",
     "LineMaster",
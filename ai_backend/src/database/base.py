@@ -26,6 +26,27 @@ __all__ = [
 
 Base = declarative_base()
 
+# 기존 테이블에 대한 스키마 변경 (create_all은 기존 테이블을 변경하지 않음)
+# 모든 문장은 반복 실행해도 안전해야 함 (IF [NOT] EXISTS)
+SCHEMA_MIGRATIONS = [
+    # CHAT_MESSAGES.TOKEN_COUNT: 저장 시점 토큰 수 (히스토리 truncation 시 재인코딩 방지)
+    'ALTER TABLE "CHAT_MESSAGES" ADD COLUMN IF NOT EXISTS "TOKEN_COUNT" INTEGER',
+    # CHAT_MESSAGES 최신 N개 / 커서 기반 히스토리 조회 인덱스
+    # (CREATE_DT, MESSAGE_ID 순 정렬까지 인덱스로 처리, 이전 3컬럼 인덱스는 대체 후 삭제)
+    'CREATE INDEX IF NOT EXISTS idx_chat_messages_chat_deleted_create_id '
+    'ON "CHAT_MESSAGES" ("CHAT_ID", "IS_DELETED", "CREATE_DT", "MESSAGE_ID")',
+    'DROP INDEX IF EXISTS idx_chat_messages_chat_deleted_create',
+    # PROGRAM_REGISTRATION_JOBS 작업 점유 조회 인덱스 (queued + available_at 순)
+    'CREATE INDEX IF NOT EXISTS idx_program_registration_jobs_claim '
+    'ON "PROGRAM_REGISTRATION_JOBS" ("STATUS", "AVAILABLE_AT")',
+    # DOCUMENT_CHUNKS 페이지 지문 (문서 처리 파이프라인 증분 재처리)
+    'ALTER TABLE "DOCUMENT_CHUNKS" ADD COLUMN IF NOT EXISTS source_path VARCHAR(500)',
+    'ALTER TABLE "DOCUMENT_CHUNKS" ADD COLUMN IF NOT EXISTS text_hash VARCHAR(64)',
+    'ALTER TABLE "DOCUMENT_CHUNKS" ADD COLUMN IF NOT EXISTS image_hash VARCHAR(64)',
+    'CREATE INDEX IF NOT EXISTS "ix_DOCUMENT_CHUNKS_source_path" '
+    'ON "DOCUMENT_CHUNKS" (source_path)',
+]
+
 
 class Database:
     def __init__(self, db_config):
@@ -186,11 +207,27 @@ class Database:
                 else:
                     raise
             
+            # 기존 테이블 스키마 변경 적용
+            self.apply_schema_migrations()
+            
             # 최종 로그는 위에서 이미 출력됨 (생성 필요 시 또는 모두 존재 시)
         except Exception as e:
             logger.error("❌ 테이블 생성 실패: " + str(e))
             raise e
 
+    def apply_schema_migrations(self):
+        """
+        SCHEMA_MIGRATIONS의 DDL을 순서대로 적용 (멱등)
+        개별 문장 실패 시 경고만 남기고 계속 진행
+        """
+        for statement in SCHEMA_MIGRATIONS:
+            try:
+                with self._engine.begin() as conn:
+                    conn.execute(text(statement))
+                logger.debug("스키마 변경 적용: %s", statement)
+            except Exception as e:
+                logger.warning("스키마 변경 적용 실패: %s (%s)", statement, str(e))
+
     @contextmanager
     def session(self):
         """
@@ -2,10 +2,10 @@
 """Chat CRUD operations with database."""
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import desc
+from sqlalchemy import desc, or_
 from sqlalchemy.orm import Session
 from src.database.models.chat_models import Chat, ChatMessage
 from src.types.response.exceptions import HandledException
@@ -53,6 +53,7 @@ class ChatCRUD:
         plc_process_id_snapshot: Optional[str] = None,
         plc_line_id_snapshot: Optional[str] = None,
         plc_equipment_group_id_snapshot: Optional[str] = None,
+        token_count: Optional[int] = None,
     ) -> ChatMessage:
         """메시지 생성"""
         try:
@@ -69,6 +70,7 @@ class ChatCRUD:
                 plc_process_id_snapshot=plc_process_id_snapshot,
                 plc_line_id_snapshot=plc_line_id_snapshot,
                 plc_equipment_group_id_snapshot=plc_equipment_group_id_snapshot,
+                token_count=token_count,
                 create_dt=datetime.now(ZoneInfo("Asia/Seoul")),
             )
             self.session.add(chat_message)
@@ -134,7 +136,7 @@ class ChatCRUD:
         equipment_group_id: Optional[str],
     ) -> Optional[Dict]:
         """
-        스냅샷 ID들로부터 master 테이블 조인하여 계층 구조 정보 조회
+        스냅샷 ID들로부터 기준정보 캐시를 통해 계층 구조 정보 조회 (캐시 적중 시 DB 쿼리 없음)
         
         Returns:
             Dict: 계층 구조 정보
@@ -146,87 +148,100 @@ class ChatCRUD:
             }
         """
         try:
-            from src.database.models.master_models import (
-                EquipmentGroupMaster,
-                LineMaster,
-                PlantMaster,
-                ProcessMaster,
-            )
-
-            hierarchy = {}
+            from src.cache.master_data_cache import get_master_data_cache
 
-            if plant_id:
-                plant = (
-                    self.session.query(PlantMaster)
-                    .filter(PlantMaster.plant_id == plant_id)
-                    .first()
-                )
-                if plant:
-                    hierarchy["plant"] = {
-                        "id": plant.plant_id,
-                        "code": plant.plant_code,
-                        "name": plant.plant_name,
-                    }
-
-            if process_id:
-                process = (
-                    self.session.query(ProcessMaster)
-                    .filter(ProcessMaster.process_id == process_id)
-                    .first()
-                )
-                if process:
-                    hierarchy["process"] = {
-                        "id": process.process_id,
-                        "code": process.process_code,
-                        "name": process.process_name,
-                    }
-
-            if line_id:
-                line = (
-                    self.session.query(LineMaster)
-                    .filter(LineMaster.line_id == line_id)
-                    .first()
-                )
-                if line:
-                    hierarchy["line"] = {
-                        "id": line.line_id,
-                        "code": line.line_code,
-                        "name": line.line_name,
-                    }
-
-            if equipment_group_id:
-                equipment = (
-                    self.session.query(EquipmentGroupMaster)
-                    .filter(
-                        EquipmentGroupMaster.equipment_group_id
-                        == equipment_group_id
-                    )
-                    .first()
-                )
-                if equipment:
-                    hierarchy["equipment_group"] = {
-                        "id": equipment.equipment_group_id,
-                        "code": equipment.equipment_group_code,
-                        "name": equipment.equipment_group_name,
-                    }
-
-            return hierarchy if hierarchy else None
+            return get_master_data_cache().get_hierarchy(
+                self.session,
+                plant_id=plant_id,
+                process_id=process_id,
+                line_id=line_id,
+                equipment_group_id=equipment_group_id,
+            )
 
         except Exception as e:
             logger.warning(
                 f"스냅샷 ID로 계층 구조 조회 실패: {str(e)}"
             )
             return None
+
+    def _get_plc_hierarchy_snapshots(self, plc_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """여러 PLC의 현재 계층 구조 스냅샷 ID들을 한 번의 쿼리로 조회 (스냅샷 없는 구 메시지용)"""
+        if not plc_ids:
+            return {}
+
+        try:
+            from src.database.models.plc_models import PLC
+
+            rows = (
+                self.session.query(
+                    PLC.id,
+                    PLC.plant_id_snapshot,
+                    PLC.process_id_snapshot,
+                    PLC.line_id_snapshot,
+                    PLC.equipment_group_id_snapshot,
+                )
+                .filter(PLC.id.in_(plc_ids))
+                .all()
+            )
+
+            snapshots = {}
+            for plc_id, plant_id, process_id, line_id, equipment_group_id in rows:
+                snapshot = {
+                    key: value
+                    for key, value in (
+                        ("plant_id", plant_id),
+                        ("process_id", process_id),
+                        ("line_id", line_id),
+                        ("equipment_group_id", equipment_group_id),
+                    )
+                    if value
+                }
+                snapshots[plc_id] = snapshot if snapshot else None
+            return snapshots
+
+        except Exception as e:
+            logger.warning(f"PLC 계층 구조 스냅샷 일괄 조회 실패: {str(e)}")
+            return {}
     
-    def get_messages(self, chat_id: str, limit: int = 50) -> List[ChatMessage]:
-        """특정 채팅의 메시지 조회"""
+    def get_messages(self, chat_id: str, limit: int = 50, before: Optional[str] = None) -> List[ChatMessage]:
+        """
+        특정 채팅의 최신 메시지 조회 (키셋 페이지네이션)
+        
+        (CHAT_ID, IS_DELETED, CREATE_DT) 인덱스를 역방향으로 스캔하여 최신 limit개를 가져온 뒤
+        시간순(오래된 것부터)으로 반환합니다.
+        
+        Args:
+            chat_id: 채팅 ID
+            limit: 최대 조회 개수
+            before: 커서 메시지 ID (지정 시 해당 메시지보다 이전 메시지만 조회)
+        """
         try:
-            return self.session.query(ChatMessage)\
+            query = self.session.query(ChatMessage)\
                 .filter(ChatMessage.chat_id == chat_id)\
-                .filter(ChatMessage.is_deleted == False)\
-                .order_by(ChatMessage.create_dt)\
+                .filter(ChatMessage.is_deleted == False)
+            
+            if before:
+                cursor = self.session.query(ChatMessage.create_dt, ChatMessage.message_id)\
+                    .filter(ChatMessage.message_id == before)\
+                    .filter(ChatMessage.chat_id == chat_id)\
+                    .first()
+                if cursor is None:
+                    return []
+                # (create_dt, message_id) < (cursor_dt, cursor_id)
+                query = query.filter(
+                    or_(
+                        ChatMessage.create_dt < cursor.create_dt,
+                        (ChatMessage.create_dt == cursor.create_dt)
+                        & (ChatMessage.message_id < cursor.message_id),
+                    )
+                )
+            
+            messages = query\
+                .order_by(desc(ChatMessage.create_dt), desc(ChatMessage.message_id))\
                 .limit(limit)\
                 .all()
+            messages.reverse()
+            return messages
         except Exception as e:
             logger.error("Database error getting messages: " + str(e))
             raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
@@ -281,6 +296,7 @@ class ChatCRUD:
         user_id: str,
         message: str,
         plc_id: str = None,
+        token_count: Optional[int] = None,
     ) -> ChatMessage:
         """사용자 메시지 저장 (PLC 계층 구조 스냅샷 자동 저장)"""
         try:
@@ -301,6 +317,7 @@ class ChatCRUD:
                 plc_process_id_snapshot=snapshot.get("process_id") if snapshot else None,
                 plc_line_id_snapshot=snapshot.get("line_id") if snapshot else None,
                 plc_equipment_group_id_snapshot=snapshot.get("equipment_group_id") if snapshot else None,
+                token_count=token_count,
             )
         except Exception as e:
             logger.error(f"Database error saving user message: {str(e)}")
@@ -314,6 +331,7 @@ class ChatCRUD:
         message: str,
         status: str = "completed",
         plc_id: str = None,
+        token_count: Optional[int] = None,
     ) -> ChatMessage:
         """AI 메시지 저장 (PLC 계층 구조 스냅샷 자동 저장)"""
         try:
@@ -336,72 +354,123 @@ class ChatCRUD:
                 plc_process_id_snapshot=snapshot.get("process_id") if snapshot else None,
                 plc_line_id_snapshot=snapshot.get("line_id") if snapshot else None,
                 plc_equipment_group_id_snapshot=snapshot.get("equipment_group_id") if snapshot else None,
+                token_count=token_count,
             )
         except Exception as e:
             logger.error(f"Database error saving AI message: {str(e)}")
             raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
     
-    def get_messages_from_db(self, chat_id: str) -> List[dict]:
-        """데이터베이스에서 메시지 조회하여 딕셔너리로 변환"""
-        try:
-            messages = self.get_messages(chat_id)
-
-            # ChatMessage 객체를 딕셔너리로 변환
-            history = []
-            for msg in messages:
-                role = "user" if msg.message_type == "user" else "assistant"
-                if msg.is_cancelled:
-                    role = "system"
-
-                # PLC 계층 구조: 스냅샷 ID에서 master 테이블 조인으로 조회
-                plc_hierarchy = None
-                if msg.plc_id:
-                    # 스냅샷 ID가 있으면 master 테이블에서 조회
-                    if (msg.plc_plant_id_snapshot or msg.plc_process_id_snapshot or 
-                        msg.plc_line_id_snapshot or msg.plc_equipment_group_id_snapshot):
-                        plc_hierarchy = self._get_hierarchy_from_snapshot_ids(
-                            msg.plc_plant_id_snapshot,
-                            msg.plc_process_id_snapshot,
-                            msg.plc_line_id_snapshot,
-                            msg.plc_equipment_group_id_snapshot,
-                        )
-                    else:
-                        # 스냅샷이 없으면 현재 PLC 정보 조회 (하위 호환성)
-                        snapshot = self._get_plc_hierarchy_snapshot(msg.plc_id)
-                        if snapshot:
-                            plc_hierarchy = self._get_hierarchy_from_snapshot_ids(
-                                snapshot.get("plant_id"),
-                                snapshot.get("process_id"),
-                                snapshot.get("line_id"),
-                                snapshot.get("equipment_group_id"),
-                            )
-
-                history.append(
-                    {
-                        "role": role,
-                        "content": msg.message,
-                        "timestamp": msg.create_dt.isoformat(),
-                        "cancelled": msg.is_cancelled,
-                        "message_id": msg.message_id,
-                        "plc_id": msg.plc_id,
-                        "plc_hierarchy": plc_hierarchy,
-                    }
+    def get_message(self, message_id: str) -> Optional[ChatMessage]:
+        """메시지 단건 조회"""
+        try:
+            return self.session.query(ChatMessage).filter(ChatMessage.message_id == message_id).first()
+        except Exception as e:
+            logger.error(f"Database error getting message: {str(e)}")
+            raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
+
+    def to_history_dict(self, msg: ChatMessage, plc_snapshots: Optional[Dict[str, Optional[Dict]]] = None) -> dict:
+        """ChatMessage를 히스토리(캐시) 딕셔너리로 변환
+        
+        Args:
+            msg: 채팅 메시지
+            plc_snapshots: 미리 일괄 조회한 PLC 스냅샷 (plc_id → 스냅샷 ID들, 스냅샷 없는 구 메시지용)
+        """
+        role = "user" if msg.message_type == "user" else "assistant"
+        if msg.is_cancelled:
+            role = "system"
+
+        # PLC 계층 구조: 스냅샷 ID에서 master 테이블 조인으로 조회
+        plc_hierarchy = None
+        if msg.plc_id:
+            # 스냅샷 ID가 있으면 master 테이블에서 조회
+            if (msg.plc_plant_id_snapshot or msg.plc_process_id_snapshot or 
+                msg.plc_line_id_snapshot or msg.plc_equipment_group_id_snapshot):
+                plc_hierarchy = self._get_hierarchy_from_snapshot_ids(
+                    msg.plc_plant_id_snapshot,
+                    msg.plc_process_id_snapshot,
+                    msg.plc_line_id_snapshot,
+                    msg.plc_equipment_group_id_snapshot,
                 )
+            else:
+                # 스냅샷이 없으면 현재 PLC 정보 조회 (하위 호환성)
+                if plc_snapshots is not None and msg.plc_id in plc_snapshots:
+                    snapshot = plc_snapshots[msg.plc_id]
+                else:
+                    snapshot = self._get_plc_hierarchy_snapshot(msg.plc_id)
+                if snapshot:
+                    plc_hierarchy = self._get_hierarchy_from_snapshot_ids(
+                        snapshot.get("plant_id"),
+                        snapshot.get("process_id"),
+                        snapshot.get("line_id"),
+                        snapshot.get("equipment_group_id"),
+                    )
 
-            # 시간순으로 정렬 (오래된 것부터)
-            history.sort(key=lambda x: x["timestamp"])
-            return history
+        return {
+            "role": role,
+            "content": msg.message,
+            "timestamp": msg.create_dt.isoformat(),
+            "cancelled": msg.is_cancelled,
+            "message_id": msg.message_id,
+            "plc_id": msg.plc_id,
+            "plc_hierarchy": plc_hierarchy,
+            "token_count": msg.token_count,
+        }
+
+    def get_messages_from_db(self, chat_id: str, limit: int = 50, before: Optional[str] = None) -> List[dict]:
+        """데이터베이스에서 메시지 조회하여 딕셔너리로 변환 (최신 limit개, before 커서 지원)"""
+        try:
+            messages = self.get_messages(chat_id, limit=limit, before=before)
+            return self._to_history_list(messages)
         except Exception as e:
             logger.error(f"Database error getting messages: {str(e)}")
             raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
     
+    def get_history_for_cache(self, chat_id: str, limit: int = 50) -> Tuple[List[dict], List[dict]]:
+        """
+        최신 limit개 히스토리와 캐시 재구성용 히스토리 조회
+        
+        생성 중(generating)인 AI 메시지는 완료 시점에 캐시에 추가되므로 캐시용 목록에서는 제외합니다.
+        
+        Returns:
+            Tuple: (전체 히스토리, 캐시용 히스토리)
+        """
+        try:
+            messages = self.get_messages(chat_id, limit=limit)
+            generating_ids = {msg.message_id for msg in messages if msg.status == "generating"}
+            history = self._to_history_list(messages)
+            cacheable = [item for item in history if item["message_id"] not in generating_ids]
+            return history, cacheable
+        except Exception as e:
+            logger.error(f"Database error getting messages: {str(e)}")
+            raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
+    
+    def _to_history_list(self, messages: List[ChatMessage]) -> List[dict]:
+        """ChatMessage 목록을 시간순 히스토리 딕셔너리 목록으로 변환"""
+        # 스냅샷 없는 구 메시지의 PLC 스냅샷은 한 번에 조회
+        legacy_plc_ids = {
+            msg.plc_id for msg in messages
+            if msg.plc_id and not (
+                msg.plc_plant_id_snapshot or msg.plc_process_id_snapshot or
+                msg.plc_line_id_snapshot or msg.plc_equipment_group_id_snapshot
+            )
+        }
+        plc_snapshots = self._get_plc_hierarchy_snapshots(list(legacy_plc_ids))
+
+        # ChatMessage 객체를 딕셔너리로 변환 (계층 이름은 기준정보 캐시에서 조회)
+        history = [self.to_history_dict(msg, plc_snapshots) for msg in messages]
+
+        # 시간순으로 정렬 (오래된 것부터)
+        history.sort(key=lambda x: x["timestamp"])
+        return history
+    
     def clear_conversation(self, chat_id: str):
         """대화 기록 초기화 (DB에서 메시지 삭제)"""
         try:
-            # 채팅의 모든 메시지를 삭제 상태로 변경
-            messages = self.get_messages(chat_id)
-            for msg in messages:
-                msg.is_deleted = True
+            # 채팅의 모든 메시지를 삭제 상태로 변경 (단일 UPDATE)
+            self.session.query(ChatMessage)\
+                .filter(ChatMessage.chat_id == chat_id)\
+                .filter(ChatMessage.is_deleted == False)\
+                .update({ChatMessage.is_deleted: True}, synchronize_session=False)
             self.session.commit()
         except Exception as e:
             logger.error(f"Database error clearing conversation: {str(e)}")
@@ -507,6 +576,7 @@ class ChatCRUD:
         user_id: str,
         message: str,
         plc_id: str = None,
+        token_count: Optional[int] = None,
     ):
         """사용자 메시지 저장 (PLC 계층 구조 스냅샷 자동 저장)"""
         try:
@@ -515,7 +585,7 @@ class ChatCRUD:
             if plc_id:
                 snapshot = self._get_plc_hierarchy_snapshot(plc_id)
 
-            self.create_message(
+            return self.create_message(
                 message_id=message_id,
                 chat_id=chat_id,
                 user_id=user_id,
@@ -527,6 +597,7 @@ class ChatCRUD:
                 plc_process_id_snapshot=snapshot.get("process_id") if snapshot else None,
                 plc_line_id_snapshot=snapshot.get("line_id") if snapshot else None,
                 plc_equipment_group_id_snapshot=snapshot.get("equipment_group_id") if snapshot else None,
+                token_count=token_count,
             )
         except Exception as e:
             logger.error(f"Database error saving user message: {str(e)}")
@@ -563,7 +634,7 @@ class ChatCRUD:
             logger.error(f"Database error saving AI message generating: {str(e)}")
             raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
     
-    def update_ai_message_completed(self, message_id: str, content: str, external_api_nodes: dict = None):
+    def update_ai_message_completed(self, message_id: str, content: str, external_api_nodes: dict = None, token_count: Optional[int] = None):
         """AI 메시지를 완료 상태로 업데이트"""
         try:
             self.update_message_status(message_id, "completed")
@@ -571,6 +642,7 @@ class ChatCRUD:
             message = self.session.query(ChatMessage).filter(ChatMessage.message_id == message_id).first()
             if message:
                 message.message = content
+                message.token_count = token_count
                 # External API 노드 데이터가 있으면 안전하게 저장
                 if external_api_nodes:
                     safe_nodes = self._safe_json_serialize(external_api_nodes)
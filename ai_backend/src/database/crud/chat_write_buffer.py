@@ -0,0 +1,141 @@
+# _*_ coding: utf-8 _*_
+"""Write-behind buffer for streamed AI message content."""
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+from sqlalchemy import bindparam
+from src.database.models.chat_models import ChatMessage
+
+logger = logging.getLogger(__name__)
+
+
+class ChatMessageWriteBuffer:
+    """스트리밍 중인 AI 메시지 내용의 write-behind 버퍼 (프로세스 단위)
+
+    - message_id별로 최신 내용만 보관 (청크 단위 업데이트를 하나로 병합)
+    - flush 주기(ms) 또는 누적 크기(bytes) 도달 시 flush
+    - 여러 채팅의 flush를 하나의 executemany UPDATE로 묶어서 실행
+    - STATUS='generating' 인 행만 갱신하여 완료/취소된 메시지를 덮어쓰지 않음
+    """
+
+    def __init__(self, database, flush_interval_ms: int = 1000, flush_bytes: int = 4096):
+        self.database = database
+        self.flush_interval = flush_interval_ms / 1000
+        self.flush_bytes = flush_bytes
+
+        self._pending: Dict[str, str] = {}
+        self._pending_bytes: Dict[str, int] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+
+        table = ChatMessage.__table__
+        self._update_stmt = (
+            table.update()
+            .where(table.c.MESSAGE_ID == bindparam("b_message_id"))
+            .where(table.c.STATUS == "generating")
+            .values(MESSAGE=bindparam("b_message"))
+        )
+
+    def start(self):
+        """flush 백그라운드 태스크 시작 (앱 startup 시 1회 호출)"""
+        if self._flusher_task is not None and not self._flusher_task.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._flusher_task = asyncio.create_task(self._run())
+        logger.info(
+            f"Chat message write buffer started: interval={self.flush_interval}s, "
+            f"bytes={self.flush_bytes}"
+        )
+
+    async def stop(self):
+        """flush 태스크 종료 후 남은 내용 flush (앱 shutdown 시 호출)"""
+        if self._flusher_task is not None:
+            self._flusher_task.cancel()
+            try:
+                await self._flusher_task
+            except asyncio.CancelledError:
+                pass
+            self._flusher_task = None
+        await self.flush()
+
+    def update(self, message_id: str, content: str, appended_bytes: int = 0):
+        """메시지의 현재까지 누적된 내용 등록 (I/O 없음)
+
+        Args:
+            message_id: 메시지 ID
+            content: 현재까지의 전체 내용
+            appended_bytes: 이번 청크로 추가된 바이트 수
+        """
+        self._pending[message_id] = content
+        pending_bytes = self._pending_bytes.get(message_id, 0) + appended_bytes
+        self._pending_bytes[message_id] = pending_bytes
+
+        if pending_bytes >= self.flush_bytes and self._wakeup is not None:
+            self._wakeup.set()
+
+    def discard(self, message_id: str):
+        """대기 중인 내용 제거 (완료/취소/에러 업데이트 직전에 호출)"""
+        self._pending.pop(message_id, None)
+        self._pending_bytes.pop(message_id, None)
+
+    async def flush(self) -> int:
+        """대기 중인 모든 메시지 내용을 한 번의 executemany로 DB에 반영
+
+        Returns:
+            int: flush한 메시지 수
+        """
+        if not self._pending:
+            return 0
+
+        pending, self._pending = self._pending, {}
+        self._pending_bytes = {}
+
+        params = [
+            {"b_message_id": message_id, "b_message": content}
+            for message_id, content in pending.items()
+        ]
+        try:
+            await asyncio.to_thread(self._execute, params)
+            logger.debug(f"Flushed partial content for {len(params)} streaming messages")
+        except Exception as e:
+            logger.warning(f"Chat message write buffer flush failed: {e}")
+            # 실패한 내용은 새로 들어온 내용이 없는 경우에만 다시 대기열에 넣음
+            for message_id, content in pending.items():
+                self._pending.setdefault(message_id, content)
+        return len(params)
+
+    def _execute(self, params: List[Dict[str, str]]):
+        """executemany UPDATE 실행 (워커 스레드에서 실행)"""
+        with self.database.session() as session:
+            session.execute(self._update_stmt, params)
+            session.commit()
+
+    async def _run(self):
+        """주기적 flush 루프"""
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+
+# 전역 write-behind 버퍼 인스턴스
+chat_write_buffer = None
+
+
+def get_chat_write_buffer() -> ChatMessageWriteBuffer:
+    """write-behind 버퍼 의존성 주입 (프로세스 싱글톤)"""
+    global chat_write_buffer
+    if chat_write_buffer is None:
+        from src.config import settings
+        from src.core.dependencies import get_database
+
+        chat_write_buffer = ChatMessageWriteBuffer(
+            get_database(),
+            flush_interval_ms=settings.chat_stream_flush_interval_ms,
+            flush_bytes=settings.chat_stream_flush_bytes,
+        )
+    return chat_write_buffer
@@ -2,12 +2,16 @@
 """Document CRUD operations with database."""
 import logging
 
+from typing import Dict, List
+
 from src.types.response.exceptions import HandledException
 from src.types.response.response_code import ResponseCode
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 # 공통 모듈 사용
 from shared_core import DocumentCRUD as BaseDocumentCRUD
+from shared_core.models import Document
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +32,21 @@ class DocumentCRUD(BaseDocumentCRUD):
             logger.error(f"문서 생성 실패: {str(e)}")
             raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
     
+    def bulk_create_documents(self, rows: List[Dict]) -> int:
+        """문서 일괄 생성 (단일 INSERT executemany, commit은 호출자가 수행)
+
+        Args:
+            rows: Document 컬럼 속성명을 키로 갖는 딕셔너리 목록 (모든 행의 키가 같아야 함)
+        """
+        if not rows:
+            return 0
+        try:
+            self.db.execute(insert(Document), rows)
+            return len(rows)
+        except Exception as e:
+            logger.error(f"문서 일괄 생성 실패: {str(e)}")
+            raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
+    
     def get_document(self, document_id: str):
         """문서 조회 (FastAPI 예외 처리)"""
         try:
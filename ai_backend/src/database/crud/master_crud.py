@@ -19,6 +19,16 @@ from src.types.response.response_code import ResponseCode
 logger = logging.getLogger(__name__)
 
 
+def _invalidate_master_cache():
+    """기준정보 변경 후 계층 이름 캐시 무효화 (실패해도 쓰기 작업에는 영향 없음)"""
+    try:
+        from src.cache.master_data_cache import get_master_data_cache
+
+        get_master_data_cache().invalidate()
+    except Exception as e:
+        logger.warning(f"기준정보 캐시 무효화 실패: {str(e)}")
+
+
 class PlantMasterCRUD:
     """PlantMaster 관련 CRUD 작업을 처리하는 클래스"""
 
@@ -51,6 +61,7 @@ class PlantMasterCRUD:
             self.db.add(plant)
             self.db.commit()
             self.db.refresh(plant)
+            _invalidate_master_cache()
             return plant
         except Exception as e:
             self.db.rollback()
@@ -96,6 +107,7 @@ class PlantMasterCRUD:
                 if update_user:
                     plant.update_user = update_user
                 self.db.commit()
+                _invalidate_master_cache()
                 return True
             return False
         except Exception as e:
@@ -138,6 +150,7 @@ class ProcessMasterCRUD:
             self.db.add(process)
             self.db.commit()
             self.db.refresh(process)
+            _invalidate_master_cache()
             return process
         except Exception as e:
             self.db.rollback()
@@ -185,6 +198,7 @@ class ProcessMasterCRUD:
                 if update_user:
                     process.update_user = update_user
                 self.db.commit()
+                _invalidate_master_cache()
                 return True
             return False
         except Exception as e:
@@ -227,6 +241,7 @@ class LineMasterCRUD:
             self.db.add(line)
             self.db.commit()
             self.db.refresh(line)
+            _invalidate_master_cache()
             return line
         except Exception as e:
             self.db.rollback()
@@ -274,6 +289,7 @@ class LineMasterCRUD:
                 if update_user:
                     line.update_user = update_user
                 self.db.commit()
+                _invalidate_master_cache()
                 return True
             return False
         except Exception as e:
@@ -316,6 +332,7 @@ class EquipmentGroupMasterCRUD:
             self.db.add(equipment_group)
             self.db.commit()
             self.db.refresh(equipment_group)
+            _invalidate_master_cache()
             return equipment_group
         except Exception as e:
             self.db.rollback()
@@ -373,6 +390,7 @@ class EquipmentGroupMasterCRUD:
                 if update_user:
                     equipment_group.update_user = update_user
                 self.db.commit()
+                _invalidate_master_cache()
                 return True
             return False
         except Exception as e:
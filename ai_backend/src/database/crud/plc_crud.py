@@ -282,77 +282,6 @@ class PLCCRUD:
             logger.error(f"특정 시점의 PLC 계층 구조 조회 실패: {str(e)}")
             raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
 
-    def _get_hierarchy_with_names(
-        self, snapshot_ids: Optional[Dict]
-    ) -> Optional[Dict]:
-        """
-        스냅샷 ID들로부터 master 테이블 조인하여 계층 구조 정보 조회
-        
-        Returns:
-            Dict: 계층 구조 정보 (id, code, name 포함)
-        """
-        if not snapshot_ids:
-            return None
-
-        try:
-            from src.database.crud.master_crud import (
-                EquipmentGroupMasterCRUD,
-                LineMasterCRUD,
-                PlantMasterCRUD,
-                ProcessMasterCRUD,
-            )
-
-            plant_crud = PlantMasterCRUD(self.db)
-            process_crud = ProcessMasterCRUD(self.db)
-            line_crud = LineMasterCRUD(self.db)
-            equipment_crud = EquipmentGroupMasterCRUD(self.db)
-
-            hierarchy = {}
-
-            if snapshot_ids.get("plant_id"):
-                plant = plant_crud.get_plant(snapshot_ids["plant_id"])
-                if plant:
-                    hierarchy["plant"] = {
-                        "id": plant.plant_id,
-                        "code": plant.plant_code,
-                        "name": plant.plant_name,
-                    }
-
-            if snapshot_ids.get("process_id"):
-                process = process_crud.get_process(snapshot_ids["process_id"])
-                if process:
-                    hierarchy["process"] = {
-                        "id": process.process_id,
-                        "code": process.process_code,
-                        "name": process.process_name,
-                    }
-
-            if snapshot_ids.get("line_id"):
-                line = line_crud.get_line(snapshot_ids["line_id"])
-                if line:
-                    hierarchy["line"] = {
-                        "id": line.line_id,
-                        "code": line.line_code,
-                        "name": line.line_name,
-                    }
-
-            if snapshot_ids.get("equipment_group_id"):
-                equipment = equipment_crud.get_equipment_group(
-                    snapshot_ids["equipment_group_id"]
-                )
-                if equipment:
-                    hierarchy["equipment_group"] = {
-                        "id": equipment.equipment_group_id,
-                        "code": equipment.equipment_group_code,
-                        "name": equipment.equipment_group_name,
-                    }
-
-            return hierarchy if hierarchy else None
-
-        except Exception as e:
-            logger.warning(f"스냅샷 ID로 계층 구조 조회 실패: {str(e)}")
-            return None
-
     def get_plcs(
         self,
         plant_id: Optional[str] = None,
@@ -365,10 +294,13 @@ class PLCCRUD:
         page_size: int = 10,
         sort_by: str = "plc_id",
         sort_order: str = "asc",
-    ) -> tuple[List[PLC], int]:
+    ) -> tuple[List, int]:
         """
         PLC 목록 조회 (검색, 필터링, 페이지네이션, 정렬)
 
+        목록 화면에 필요한 PLC 컬럼과 계층 이름(활성 기준정보만)을 한 번의 조인 쿼리로 조회하고,
+        전체 개수는 조인 없는 PLC 단독 COUNT로 계산합니다. (페이지당 쿼리 2회)
+
         Args:
             plant_id: Plant ID로 필터링
             process_id: Process ID로 필터링
@@ -382,9 +314,13 @@ class PLCCRUD:
             sort_order: 정렬 순서 (asc, desc)
 
         Returns:
-            Tuple[List[PLC], int]: (PLC 목록, 전체 개수)
+            Tuple[List[Row], int]: (PLC 목록 행, 전체 개수)
+            각 행: id, plc_id, plc_name, unit, program_id, mapping_user, mapping_dt,
+                  plant_name, process_name, line_name, equipment_group_name
         """
         try:
+            from sqlalchemy import and_, func
+
             from src.database.models.master_models import (
                 EquipmentGroupMaster,
                 LineMaster,
@@ -392,54 +328,84 @@ class PLCCRUD:
                 ProcessMaster,
             )
 
-            # 기본 쿼리: PLC와 Master 테이블 조인
+            # 필터링 조건 (모두 PLC 컬럼 기준이므로 목록/개수 쿼리에서 공유)
+            conditions = [PLC.is_active.is_(True)]
+            if plant_id:
+                conditions.append(PLC.plant_id_snapshot == plant_id)
+            if process_id:
+                conditions.append(PLC.process_id_snapshot == process_id)
+            if line_id:
+                conditions.append(PLC.line_id_snapshot == line_id)
+            if equipment_group_id:
+                conditions.append(
+                    PLC.equipment_group_id_snapshot == equipment_group_id
+                )
+            if plc_id:
+                conditions.append(PLC.plc_id.ilike(f"%{plc_id}%"))
+            if plc_name:
+                conditions.append(PLC.plc_name.ilike(f"%{plc_name}%"))
+
+            # 전체 개수 조회 (Master 조인 없이 PLC 단독 COUNT)
+            total_count = (
+                self.db.query(func.count(PLC.id)).filter(*conditions).scalar()
+            ) or 0
+
+            # 목록 쿼리: 필요한 컬럼만 projection + Master 테이블 조인으로 이름 포함
+            # (비활성 기준정보는 이름을 표시하지 않음)
             query = (
-                self.db.query(PLC)
+                self.db.query(
+                    PLC.id,
+                    PLC.plc_id,
+                    PLC.plc_name,
+                    PLC.unit,
+                    PLC.program_id,
+                    PLC.mapping_user,
+                    PLC.mapping_dt,
+                    PlantMaster.plant_name.label("plant_name"),
+                    ProcessMaster.process_name.label("process_name"),
+                    LineMaster.line_name.label("line_name"),
+                    EquipmentGroupMaster.equipment_group_name.label(
+                        "equipment_group_name"
+                    ),
+                )
                 .outerjoin(
                     PlantMaster,
-                    PLC.plant_id_snapshot == PlantMaster.plant_id,
+                    and_(
+                        PLC.plant_id_snapshot == PlantMaster.plant_id,
+                        PlantMaster.is_active.is_(True),
+                    ),
                 )
                 .outerjoin(
                     ProcessMaster,
-                    PLC.process_id_snapshot == ProcessMaster.process_id,
+                    and_(
+                        PLC.process_id_snapshot == ProcessMaster.process_id,
+                        ProcessMaster.is_active.is_(True),
+                    ),
                 )
                 .outerjoin(
                     LineMaster,
-                    PLC.line_id_snapshot == LineMaster.line_id,
+                    and_(
+                        PLC.line_id_snapshot == LineMaster.line_id,
+                        LineMaster.is_active.is_(True),
+                    ),
                 )
                 .outerjoin(
                     EquipmentGroupMaster,
-                    PLC.equipment_group_id_snapshot
-                    == EquipmentGroupMaster.equipment_group_id,
+                    and_(
+                        PLC.equipment_group_id_snapshot
+                        == EquipmentGroupMaster.equipment_group_id,
+                        EquipmentGroupMaster.is_active.is_(True),
+                    ),
                 )
-                .filter(PLC.is_active.is_(True))
+                .filter(*conditions)
             )
 
-            # 필터링 조건
-            if plant_id:
-                query = query.filter(PLC.plant_id_snapshot == plant_id)
-            if process_id:
-                query = query.filter(PLC.process_id_snapshot == process_id)
-            if line_id:
-                query = query.filter(PLC.line_id_snapshot == line_id)
-            if equipment_group_id:
-                query = query.filter(
-                    PLC.equipment_group_id_snapshot == equipment_group_id
-                )
-            if plc_id:
-                query = query.filter(PLC.plc_id.ilike(f"%{plc_id}%"))
-            if plc_name:
-                query = query.filter(PLC.plc_name.ilike(f"%{plc_name}%"))
-
-            # 전체 개수 조회
-            total_count = query.count()
-
-            # 정렬
+            # 정렬 (동일 값 간 페이지 경계가 흔들리지 않도록 PK를 보조 정렬로 사용)
             sort_column = getattr(PLC, sort_by, PLC.plc_id)
             if sort_order.lower() == "desc":
-                query = query.order_by(desc(sort_column))
+                query = query.order_by(desc(sort_column), desc(PLC.id))
             else:
-                query = query.order_by(sort_column)
+                query = query.order_by(sort_column, PLC.id)
 
             # 페이지네이션
             offset = (page - 1) * page_size
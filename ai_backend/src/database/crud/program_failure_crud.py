@@ -4,9 +4,9 @@ ProcessingFailure 모델 관련 CRUD 작업
 """
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import desc
+from sqlalchemy import and_, desc, insert, or_, select, update
 from sqlalchemy.orm import Session
 from src.database.models.program_models import ProcessingFailure
 from src.types.response.exceptions import HandledException
@@ -72,6 +72,21 @@ class ProcessingFailureCRUD:
             logger.error(f"실패 정보 생성 실패: {str(e)}")
             raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
 
+    def bulk_create(self, rows: List[Dict]) -> int:
+        """실패 정보 일괄 생성 (단일 INSERT executemany, commit은 호출자가 수행)
+
+        Args:
+            rows: create_failure 인자와 같은 키를 가진 딕셔너리 목록 (모든 행의 키가 같아야 함)
+        """
+        if not rows:
+            return 0
+        try:
+            self.db.execute(insert(ProcessingFailure), rows)
+            return len(rows)
+        except Exception as e:
+            logger.error(f"실패 정보 일괄 생성 실패: {str(e)}")
+            raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
+
     def get_failure(self, failure_id: str) -> Optional[ProcessingFailure]:
         """실패 정보 조회"""
         try:
@@ -141,8 +156,9 @@ class ProcessingFailureCRUD:
         self,
         failure_type: Optional[str] = None,
         max_retry_count: Optional[int] = None,
+        limit: Optional[int] = None,
     ) -> List[ProcessingFailure]:
-        """재시도 대기 중인 실패 정보 조회"""
+        """재시도 대기 중인 실패 정보 조회 (limit 지정 시 오래된 순으로 최대 limit건)"""
         try:
             query = self.db.query(ProcessingFailure).filter(
                 ProcessingFailure.status == ProcessingFailure.STATUS_PENDING
@@ -155,11 +171,123 @@ class ProcessingFailureCRUD:
                 query = query.filter(
                     ProcessingFailure.retry_count < max_retry_count
                 )
-            return query.order_by(ProcessingFailure.created_at).all()
+            query = query.order_by(ProcessingFailure.created_at)
+            if limit is not None:
+                query = query.limit(limit)
+            return query.all()
         except Exception as e:
             logger.error(f"재시도 대기 실패 정보 조회 실패: {str(e)}")
             raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
 
+    def get_retry_candidates_page(
+        self,
+        source_type: str,
+        source_id: str,
+        failure_type: Optional[str] = None,
+        after: Optional[Tuple[datetime, str]] = None,
+        limit: int = 200,
+    ) -> List:
+        """
+        재시도 대상 실패 정보 1페이지 조회 (keyset 페이지네이션)
+
+        (created_at, failure_id) 순으로 정렬하고 after 이후 행만 조회하므로
+        OFFSET 없이 페이지 수와 무관하게 같은 비용으로 다음 페이지를 가져옵니다.
+        최대 재시도 횟수에 도달한 행은 제외합니다.
+
+        Args:
+            after: 이전 페이지 마지막 행의 (created_at, failure_id)
+
+        Returns:
+            List[Row]: 재시도에 필요한 컬럼만 담은 행 (세션 commit 후에도 만료되지 않음)
+        """
+        try:
+            query = select(
+                ProcessingFailure.failure_id,
+                ProcessingFailure.failure_type,
+                ProcessingFailure.created_at,
+                ProcessingFailure.filename,
+                ProcessingFailure.file_path,
+                ProcessingFailure.file_index,
+                ProcessingFailure.s3_path,
+                ProcessingFailure.s3_key,
+                ProcessingFailure.error_message,
+                ProcessingFailure.retry_count,
+                ProcessingFailure.last_retry_at,
+            ).where(
+                ProcessingFailure.source_type == source_type,
+                ProcessingFailure.source_id == source_id,
+                ProcessingFailure.status == ProcessingFailure.STATUS_PENDING,
+                ProcessingFailure.retry_count < ProcessingFailure.max_retry_count,
+            )
+            if failure_type:
+                query = query.where(ProcessingFailure.failure_type == failure_type)
+            if after is not None:
+                created_at, failure_id = after
+                query = query.where(
+                    or_(
+                        ProcessingFailure.created_at > created_at,
+                        and_(
+                            ProcessingFailure.created_at == created_at,
+                            ProcessingFailure.failure_id > failure_id,
+                        ),
+                    )
+                )
+            query = query.order_by(
+                ProcessingFailure.created_at, ProcessingFailure.failure_id
+            ).limit(limit)
+            return self.db.execute(query).all()
+        except Exception as e:
+            logger.error(f"재시도 대상 실패 정보 조회 실패: {str(e)}")
+            raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
+
+    def claim_for_retry(self, failure_ids: List[str]) -> List[str]:
+        """
+        재시도 대상 일괄 점유 (pending → retrying, retry_count + 1, commit은 호출자가 수행)
+
+        다른 요청이 먼저 점유한 행은 status 조건에 걸려 제외됩니다.
+
+        Returns:
+            List[str]: 실제로 점유한 failure_id 목록
+        """
+        if not failure_ids:
+            return []
+        try:
+            now = datetime.now()
+            result = self.db.execute(
+                update(ProcessingFailure)
+                .where(
+                    ProcessingFailure.failure_id.in_(failure_ids),
+                    ProcessingFailure.status == ProcessingFailure.STATUS_PENDING,
+                )
+                .values(
+                    status=ProcessingFailure.STATUS_RETRYING,
+                    retry_count=ProcessingFailure.retry_count + 1,
+                    last_retry_at=now,
+                    updated_at=now,
+                )
+                .returning(ProcessingFailure.failure_id)
+                .execution_options(synchronize_session=False)
+            )
+            return [row.failure_id for row in result]
+        except Exception as e:
+            logger.error(f"재시도 대상 점유 실패: {str(e)}")
+            raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
+
+    def bulk_update_failures(self, rows: List[Dict]) -> int:
+        """실패 정보 일괄 갱신 (기본키 기준 UPDATE executemany, commit은 호출자가 수행)
+
+        Args:
+            rows: failure_id와 갱신할 컬럼을 키로 갖는 딕셔너리 목록 (모든 행의 키가 같아야 함)
+        """
+        if not rows:
+            return 0
+        try:
+            self.db.execute(update(ProcessingFailure), rows)
+            return len(rows)
+        except Exception as e:
+            logger.error(f"실패 정보 일괄 갱신 실패: {str(e)}")
+            raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
+
     def update_failure_status(
         self,
         failure_id: str,
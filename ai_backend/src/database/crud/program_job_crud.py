@@ -0,0 +1,248 @@
+# _*_ coding: utf-8 _*_
+"""Program Registration Job CRUD operations with database.
+ProgramRegistrationJob 모델 관련 작업 큐 연산
+"""
+import logging
+from datetime import timedelta
+from typing import Dict, Optional
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session
+from src.database.models.program_models import ProgramRegistrationJob
+from src.types.response.exceptions import HandledException
+from src.types.response.response_code import ResponseCode
+
+logger = logging.getLogger(__name__)
+
+
+class ProgramRegistrationJobCRUD:
+    """ProgramRegistrationJob 작업 큐 연산을 처리하는 클래스"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def enqueue(
+        self,
+        job_id: str,
+        program_id: str,
+        payload: Dict,
+        max_attempts: int = 3,
+    ) -> ProgramRegistrationJob:
+        """등록 작업 적재"""
+        try:
+            job = ProgramRegistrationJob(
+                job_id=job_id,
+                program_id=program_id,
+                status=ProgramRegistrationJob.STATUS_QUEUED,
+                payload=payload,
+                checkpoint={},
+                max_attempts=max_attempts,
+            )
+            self.db.add(job)
+            self.db.commit()
+            self.db.refresh(job)
+            return job
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"등록 작업 적재 실패: {str(e)}")
+            raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
+
+    def get_job(self, job_id: str) -> Optional[ProgramRegistrationJob]:
+        """작업 조회"""
+        try:
+            return (
+                self.db.query(ProgramRegistrationJob)
+                .filter(ProgramRegistrationJob.job_id == job_id)
+                .first()
+            )
+        except Exception as e:
+            logger.error(f"등록 작업 조회 실패: {str(e)}")
+            raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
+
+    def claim_next(
+        self, worker_id: str, lease_seconds: int
+    ) -> Optional[ProgramRegistrationJob]:
+        """처리할 작업 1건 점유
+
+        - 대기(queued) 중이며 available_at이 지난 작업
+        - 실행(running) 중이지만 lease 시간 동안 heartbeat가 없는 작업 (워커 크래시)
+        FOR UPDATE SKIP LOCKED로 여러 워커가 동시에 조회해도 같은 작업을 가져가지 않습니다.
+
+        lease 만료 작업이 이미 max_attempts만큼 시도되었으면 다시 실행하지 않고 failed로 변경한 뒤
+        반환합니다. 호출자는 status가 failed인 작업을 받으면 최종 실패 후처리만 수행해야 합니다.
+        """
+        try:
+            now = func.now()
+            job = (
+                self.db.query(ProgramRegistrationJob)
+                .filter(
+                    or_(
+                        and_(
+                            ProgramRegistrationJob.status
+                            == ProgramRegistrationJob.STATUS_QUEUED,
+                            ProgramRegistrationJob.available_at <= now,
+                        ),
+                        and_(
+                            ProgramRegistrationJob.status
+                            == ProgramRegistrationJob.STATUS_RUNNING,
+                            ProgramRegistrationJob.locked_at
+                            < now - timedelta(seconds=lease_seconds),
+                        ),
+                    )
+                )
+                .order_by(ProgramRegistrationJob.available_at, ProgramRegistrationJob.created_at)
+                .with_for_update(skip_locked=True)
+                .limit(1)
+                .first()
+            )
+            if job is None:
+                self.db.rollback()
+                return None
+
+            if job.status == ProgramRegistrationJob.STATUS_RUNNING:
+                logger.warning(
+                    f"lease 만료 작업 회수: job_id={job.job_id}, "
+                    f"previous_worker={job.locked_by}, stage={job.stage}"
+                )
+                # 워커를 죽게 만드는 작업(OOM 등)이 무한히 회수되지 않도록 시도 횟수 제한
+                if (job.attempts or 0) >= (job.max_attempts or 0):
+                    job.status = ProgramRegistrationJob.STATUS_FAILED
+                    job.error_message = (
+                        f"최대 시도 횟수({job.max_attempts}) 초과: "
+                        f"처리 중 워커가 중단되었습니다 (stage={job.stage})"
+                    )
+                    job.locked_by = None
+                    job.locked_at = None
+                    self.db.commit()
+                    self.db.refresh(job)
+                    return job
+
+            job.status = ProgramRegistrationJob.STATUS_RUNNING
+            job.locked_by = worker_id
+            job.locked_at = now
+            job.attempts = (job.attempts or 0) + 1
+            self.db.commit()
+            self.db.refresh(job)
+            return job
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"등록 작업 점유 실패: {str(e)}")
+            raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
+
+    def heartbeat(self, job_id: str, worker_id: str) -> bool:
+        """점유 갱신 (다른 워커에게 회수된 경우 False)"""
+        try:
+            updated = (
+                self.db.query(ProgramRegistrationJob)
+                .filter(
+                    ProgramRegistrationJob.job_id == job_id,
+                    ProgramRegistrationJob.locked_by == worker_id,
+                    ProgramRegistrationJob.status == ProgramRegistrationJob.STATUS_RUNNING,
+                )
+                .update({ProgramRegistrationJob.locked_at: func.now()}, synchronize_session=False)
+            )
+            self.db.commit()
+            return updated > 0
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"등록 작업 heartbeat 실패: {str(e)}")
+            raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
+
+    def _get_owned_job(self, job_id: str, worker_id: str) -> Optional[ProgramRegistrationJob]:
+        """worker_id가 점유 중인 실행 작업 (행 잠금, 다른 워커에게 회수되었으면 None)"""
+        return (
+            self.db.query(ProgramRegistrationJob)
+            .filter(
+                ProgramRegistrationJob.job_id == job_id,
+                ProgramRegistrationJob.locked_by == worker_id,
+                ProgramRegistrationJob.status == ProgramRegistrationJob.STATUS_RUNNING,
+            )
+            .with_for_update()
+            .first()
+        )
+
+    def save_checkpoint(
+        self, job_id: str, worker_id: str, stage: str, checkpoint: Optional[Dict] = None
+    ) -> bool:
+        """단계 완료 기록 (산출물은 기존 checkpoint에 병합)
+
+        Returns:
+            bool: 기록했으면 True, 다른 워커에게 회수되어 점유를 잃었으면 False
+        """
+        try:
+            job = self._get_owned_job(job_id, worker_id)
+            if not job:
+                self.db.rollback()
+                return False
+            merged = dict(job.checkpoint or {})
+            if checkpoint:
+                merged.update(checkpoint)
+            job.stage = stage
+            job.checkpoint = merged
+            job.locked_at = func.now()
+            self.db.commit()
+            return True
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"등록 작업 checkpoint 저장 실패: {str(e)}")
+            raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
+
+    def mark_completed(self, job_id: str, worker_id: str) -> bool:
+        """작업 완료 처리
+
+        Returns:
+            bool: 완료 처리했으면 True, 다른 워커에게 회수되어 점유를 잃었으면 False
+        """
+        try:
+            updated = self.db.query(ProgramRegistrationJob).filter(
+                ProgramRegistrationJob.job_id == job_id,
+                ProgramRegistrationJob.locked_by == worker_id,
+                ProgramRegistrationJob.status == ProgramRegistrationJob.STATUS_RUNNING,
+            ).update(
+                {
+                    ProgramRegistrationJob.status: ProgramRegistrationJob.STATUS_COMPLETED,
+                    ProgramRegistrationJob.locked_by: None,
+                    ProgramRegistrationJob.locked_at: None,
+                    ProgramRegistrationJob.error_message: None,
+                    ProgramRegistrationJob.completed_at: func.now(),
+                },
+                synchronize_session=False,
+            )
+            self.db.commit()
+            return updated > 0
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"등록 작업 완료 처리 실패: {str(e)}")
+            raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
+
+    def mark_failed(
+        self, job_id: str, worker_id: str, error_message: str, retry_delay_seconds: int
+    ) -> Optional[bool]:
+        """작업 실패 처리
+
+        Returns:
+            Optional[bool]: 재시도가 예약되었으면 True, 최대 시도 횟수를 넘어 최종 실패면 False,
+                다른 워커에게 회수되어 점유를 잃었으면 None (상태 변경 없음)
+        """
+        try:
+            self.db.rollback()
+            job = self._get_owned_job(job_id, worker_id)
+            if not job:
+                self.db.rollback()
+                return None
+
+            retry = (job.attempts or 0) < (job.max_attempts or 0)
+            job.error_message = error_message
+            job.locked_by = None
+            job.locked_at = None
+            if retry:
+                job.status = ProgramRegistrationJob.STATUS_QUEUED
+                job.available_at = func.now() + timedelta(seconds=retry_delay_seconds)
+            else:
+                job.status = ProgramRegistrationJob.STATUS_FAILED
+            self.db.commit()
+            return retry
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"등록 작업 실패 처리 실패: {str(e)}")
+            raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
@@ -3,11 +3,12 @@
 import logging
 from typing import Dict, List, Optional
 
-from sqlalchemy import desc
+from sqlalchemy import desc, insert, update
 from sqlalchemy.orm import Session
 from src.database.models.template_models import Template, TemplateData
 from src.types.response.exceptions import HandledException
 from src.types.response.response_code import ResponseCode
+from src.utils.uuid_gen import gen
 
 logger = logging.getLogger(__name__)
 
@@ -146,6 +147,64 @@ class TemplateDataCRUD:
             logger.error(f"템플릿 데이터 생성 실패: {str(e)}")
             raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
 
+    def bulk_create(self, rows: List[Dict]) -> List[str]:
+        """
+        템플릿 데이터 일괄 생성 (단일 트랜잭션)
+
+        행마다 add/commit/refresh 하지 않고 하나의 INSERT executemany로 저장합니다.
+        (SQLAlchemy 2.0 insertmanyvalues로 다중 VALUES 배치 전송)
+
+        Args:
+            rows: create_template_data 인자와 같은 키를 가진 딕셔너리 목록
+                  (template_data_id가 없으면 새로 생성)
+
+        Returns:
+            List[str]: rows 순서대로 저장된 template_data_id 목록
+        """
+        if not rows:
+            return []
+
+        try:
+            values = []
+            for row in rows:
+                value = dict(row)
+                value.setdefault("template_data_id", gen())
+                values.append(value)
+
+            self.db.execute(insert(TemplateData), values)
+            self.db.commit()
+            return [value["template_data_id"] for value in values]
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"템플릿 데이터 일괄 생성 실패: {str(e)}")
+            raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
+
+    def bulk_link_documents(self, document_ids: Dict[str, str]) -> int:
+        """
+        템플릿 데이터 ↔ Document 연결 일괄 갱신 (commit은 호출자가 수행)
+
+        Args:
+            document_ids: template_data_id → document_id
+
+        Returns:
+            int: 갱신 요청 행 수
+        """
+        if not document_ids:
+            return 0
+
+        try:
+            self.db.execute(
+                update(TemplateData),
+                [
+                    {"template_data_id": template_data_id, "document_id": document_id}
+                    for template_data_id, document_id in document_ids.items()
+                ],
+            )
+            return len(document_ids)
+        except Exception as e:
+            logger.error(f"템플릿 데이터 Document 일괄 연결 실패: {str(e)}")
+            raise HandledException(ResponseCode.DATABASE_QUERY_ERROR, e=e)
+
     def get_template_data(
         self, template_data_id: str
     ) -> Optional[TemplateData]:
@@ -6,6 +6,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -43,6 +44,7 @@ class ChatMessage(Base):
     create_dt = Column('CREATE_DT', DateTime, nullable=False, server_default=func.now())
     is_deleted = Column('IS_DELETED', Boolean, nullable=False, server_default=false())
     is_cancelled = Column('IS_CANCELLED', Boolean, nullable=False, server_default=false())  # 취소된 메시지 표시
+    token_count = Column('TOKEN_COUNT', Integer, nullable=True)  # 저장 시점에 계산한 토큰 수 (히스토리 truncation용)
     
     # PLC 연결 (PLC 테이블의 ID 참조)
     plc_id = Column('PLC_ID', String(50), ForeignKey('PLC.ID'), nullable=True, index=True)
@@ -57,6 +59,11 @@ class ChatMessage(Base):
     # External API 노드 처리 결과 저장용 (JSON)
     external_api_nodes = Column('EXTERNAL_API_NODES', JSON, nullable=True)
 
+    __table_args__ = (
+        # 채팅별 최신 N개 / 커서 기반 히스토리 조회용 (역방향 인덱스 스캔)
+        Index("idx_chat_messages_chat_deleted_create_id", "CHAT_ID", "IS_DELETED", "CREATE_DT", "MESSAGE_ID"),
+    )
+
 
 class MessageRating(Base):
     """메시지 평가 테이블 - AI 답변에 대한 사용자 평가"""
@@ -214,3 +214,84 @@ class ProgramLLMDataChunk(Base):
             f"program_id='{self.program_id}', "
             f"data_type='{self.data_type}')>"
         )
+
+
+class ProgramRegistrationJob(Base):
+    """프로그램 등록 작업 큐 테이블
+
+    API는 업로드 검증 후 작업만 적재하고, 별도 워커 프로세스가
+    SELECT ... FOR UPDATE SKIP LOCKED로 작업을 가져가 단계별로 처리합니다.
+    단계 완료 시마다 STAGE/CHECKPOINT를 저장하므로 재시작 후 마지막 완료 단계 다음부터 재개합니다.
+    """
+
+    __tablename__ = "PROGRAM_REGISTRATION_JOBS"
+
+    # 기본 정보
+    job_id = Column("JOB_ID", String(50), primary_key=True)
+    program_id = Column("PROGRAM_ID", String(50), nullable=False, index=True)
+
+    # 상태 정보
+    status = Column(
+        "STATUS",
+        String(50),
+        nullable=False,
+        default="queued",
+        server_default="queued",
+        index=True,
+    )
+    stage = Column(
+        "STAGE", String(50), nullable=True, comment="마지막으로 완료된 단계"
+    )
+    error_message = Column("ERROR_MESSAGE", Text, nullable=True)
+
+    # 작업 입력 (스테이징 파일 manifest, 등록 정보, 미리 발급한 ID) / 단계별 산출물
+    payload = Column("PAYLOAD", JSON, nullable=False)
+    checkpoint = Column("CHECKPOINT", JSON, nullable=True)
+
+    # 재시도 정보
+    attempts = Column("ATTEMPTS", Integer, nullable=False, server_default="0")
+    max_attempts = Column("MAX_ATTEMPTS", Integer, nullable=False, server_default="3")
+    available_at = Column(
+        "AVAILABLE_AT", DateTime, nullable=False, server_default=func.now()
+    )
+
+    # 점유 정보 (LOCKED_AT이 lease 시간보다 오래되면 다른 워커가 회수)
+    locked_by = Column("LOCKED_BY", String(100), nullable=True)
+    locked_at = Column("LOCKED_AT", DateTime, nullable=True)
+
+    # 시간 정보
+    created_at = Column(
+        "CREATED_AT", DateTime, nullable=False, server_default=func.now()
+    )
+    updated_at = Column(
+        "UPDATED_AT", DateTime, nullable=True, server_default=func.now(), onupdate=func.now()
+    )
+    completed_at = Column("COMPLETED_AT", DateTime, nullable=True)
+
+    # 상태 상수
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_COMPLETED = "completed"
+    STATUS_FAILED = "failed"
+
+    # 단계 상수 (처리 순서)
+    STAGE_METADATA = "metadata"
+    STAGE_TEMPLATES = "templates"
+    STAGE_S3 = "s3"
+    STAGE_PREPROCESS = "preprocess"
+    STAGE_INDEXING = "indexing"
+    STAGES = (
+        STAGE_METADATA,
+        STAGE_TEMPLATES,
+        STAGE_S3,
+        STAGE_PREPROCESS,
+        STAGE_INDEXING,
+    )
+
+    def __repr__(self):
+        return (
+            f"<ProgramRegistrationJob(job_id='{self.job_id}', "
+            f"program_id='{self.program_id}', "
+            f"status='{self.status}', "
+            f"stage='{self.stage}')>"
+        )
@@ -456,6 +456,31 @@ def create_app():
                 str(e),
             )
 
+        # 스트리밍 취소 레지스트리 시작 (Redis pub/sub 구독, 비활성화 시 로컬 모드)
+        from src.cache.cancellation import get_cancellation_registry
+        from src.core.dependencies import get_redis_client
+        try:
+            get_cancellation_registry().start(get_redis_client())
+        except Exception as e:
+            logger.warning("취소 레지스트리 시작 실패: %s", str(e))
+
+        # 스트리밍 부분 응답 write-behind 버퍼 시작
+        from src.database.crud.chat_write_buffer import get_chat_write_buffer
+        try:
+            get_chat_write_buffer().start()
+        except Exception as e:
+            logger.warning("메시지 write-behind 버퍼 시작 실패: %s", str(e))
+
+        # 프로그램 등록 작업 워커 (로컬 개발용, PROGRAM_JOB_EMBEDDED_WORKER=true 일 때만 API 프로세스 내부에서 실행)
+        if settings.program_job_embedded_worker:
+            from src.api.services.program_registration_worker import (
+                get_program_registration_worker,
+            )
+            try:
+                get_program_registration_worker().start()
+            except Exception as e:
+                logger.warning("프로그램 등록 워커 시작 실패: %s", str(e))
+
         async def update_progress_periodically():
             """
             적응형 주기로 진행률 통계 업데이트
@@ -511,6 +536,30 @@ def create_app():
         asyncio.create_task(update_progress_periodically())
         logger.info("진행률 통계 업데이트 백그라운드 작업 시작됨")
 
+    @app.on_event("shutdown")
+    async def shutdown_background_tasks():
+        """백그라운드 작업 종료"""
+        from src.cache.cancellation import get_cancellation_registry
+        get_cancellation_registry().stop()
+
+        # 남은 부분 응답 flush
+        from src.database.crud.chat_write_buffer import get_chat_write_buffer
+        try:
+            await get_chat_write_buffer().stop()
+        except Exception as e:
+            logger.warning("메시지 write-behind 버퍼 종료 실패: %s", str(e))
+
+        # 처리 중인 등록 작업은 lease 만료 후 다른 워커가 checkpoint부터 재개
+        if settings.program_job_embedded_worker:
+            from src.api.services.program_registration_worker import (
+                get_program_registration_worker,
+            )
+            await get_program_registration_worker().stop()
+
+        # 전처리 프로세스 풀 종료 (사용한 적이 있을 때만 생성되어 있음)
+        from src.api.services.program_uploader import shutdown_preprocess_pool
+        shutdown_preprocess_pool()
+
     return app
 
 app = create_app()
@@ -42,6 +42,7 @@ class ConversationHistoryResponse(BaseModel):
     """대화 기록 응답 모델"""
     type: str = Field(default="conversation_history", description="응답 타입")
     history: List[Dict[str, Any]] = Field(..., description="대화 기록")
+    next_before: Optional[str] = Field(default=None, description="이전 페이지 조회용 커서 (before 파라미터로 전달, 없으면 마지막 페이지)")
 
 
 class ConversationClearedResponse(BaseModel):
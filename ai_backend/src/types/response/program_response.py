@@ -20,6 +20,12 @@ class ProgramValidationResult(BaseModel):
     )
     matched_files: Optional[list] = Field(None, description="매칭된 파일 목록")
     missing_files: Optional[list] = Field(None, description="누락된 파일 목록")
+    extra_files: Optional[list] = Field(
+        None, description="분류체계 데이터에 없는 ZIP 파일 목록"
+    )
+    ambiguous_files: Optional[list] = Field(
+        None, description="ZIP 내 여러 경로와 일치하는 파일명 목록 (file_name, candidates)"
+    )
 
 
 class ProgramInfo(BaseModel):
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+프로그램 등록 작업 워커 프로세스 풀
+
+API 이벤트 루프와 분리된 프로세스에서 등록 작업 큐(PROGRAM_REGISTRATION_JOBS)를 처리합니다.
+
+사용법:
+    python -m src.worker                      # PROGRAM_JOB_WORKER_PROCESSES 개수만큼 실행
+    python -m src.worker --processes 4 --concurrency 2
+"""
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import signal
+import time
+
+from src.config import settings
+
+logger = logging.getLogger("src.worker")
+
+
+def setup_worker_logging():
+    """워커 프로세스 로깅 설정 (APP_LOG_LEVEL 사용)"""
+    logging.basicConfig(
+        level=getattr(logging, settings.app_log_level.upper(), logging.INFO),
+        format="%(asctime)s.%(msecs)03d %(levelname)-5s %(process)5d --- %(name)-40s : %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+
+async def run_worker_process(concurrency: int):
+    """워커 프로세스 1개의 이벤트 루프 (SIGTERM/SIGINT 수신 시 종료)"""
+    from src.api.services.program_registration_worker import ProgramRegistrationWorker
+    from src.core.dependencies import get_database
+
+    get_database()
+    worker = ProgramRegistrationWorker(
+        concurrency=concurrency,
+        poll_interval=settings.program_job_poll_interval_sec,
+        lease_seconds=settings.program_job_lease_sec,
+        retry_delay_seconds=settings.program_job_retry_delay_sec,
+    )
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, lambda: asyncio.create_task(worker.stop()))
+
+    worker.start()
+    try:
+        await worker.wait()
+    finally:
+        from src.api.services.program_uploader import shutdown_preprocess_pool
+
+        shutdown_preprocess_pool()
+
+
+def worker_process_main(concurrency: int):
+    setup_worker_logging()
+    asyncio.run(run_worker_process(concurrency))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프로그램 등록 작업 워커")
+    parser.add_argument("--processes", type=int, default=settings.program_job_worker_processes)
+    parser.add_argument("--concurrency", type=int, default=settings.program_job_worker_concurrency)
+    args = parser.parse_args()
+
+    setup_worker_logging()
+    processes = max(args.processes, 1)
+    logger.info(f"등록 워커 프로세스 풀 시작: processes={processes}, concurrency={args.concurrency}")
+
+    stopping = False
+
+    def request_stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    def spawn() -> multiprocessing.Process:
+        process = multiprocessing.Process(
+            target=worker_process_main, args=(args.concurrency,), daemon=False
+        )
+        process.start()
+        return process
+
+    pool = [spawn() for _ in range(processes)]
+
+    # 비정상 종료된 워커 프로세스는 다시 띄움 (작업은 lease 만료 후 checkpoint부터 재개)
+    while not stopping:
+        for index, process in enumerate(pool):
+            if not process.is_alive():
+                logger.warning(
+                    f"등록 워커 프로세스 종료 감지: pid={process.pid}, exitcode={process.exitcode}, 재시작"
+                )
+                pool[index] = spawn()
+        time.sleep(1)
+
+    logger.info("등록 워커 프로세스 풀 종료 중")
+    for process in pool:
+        if process.is_alive():
+            process.terminate()
+    for process in pool:
+        process.join(timeout=30)
+
+
+if __name__ == "__main__":
+    main()
@@ -25,9 +25,11 @@ from document_processing_pipeline import (
     extract_text_from_document,
     generate_image_descriptions,
     initialize_database,
+    plan_incremental_reindex,
     save_document_chunk,
     update_document_processing_status,
 )
+from page_fingerprint import page_fingerprints_from
 from prefect import flow, get_run_logger, task
 from prefect.context import get_run_context
 from prefect.task_runners import ConcurrentTaskRunner
@@ -128,7 +130,7 @@ def process_single_document_complete(document_path: str, max_pages: int = None,
                 logger.info(f"📋 문서 ID: {doc_metadata['doc_id']}")
                 
                 # 이미 완료된 문서인지 확인
-                if not doc_metadata["is_new"]:
+                if doc_metadata["is_duplicate"]:
                     logger.info(f"⏭️ 이미 완료된 문서 건너뛰기: {Path(document_path).name}")
                     return {
                         "document_path": document_path,
@@ -145,12 +147,18 @@ def process_single_document_complete(document_path: str, max_pages: int = None,
             update_job_progress(job_id, "텍스트 추출 시작", 0)
             
         logger.info("📄 1단계: 텍스트 추출")
-        text_result = extract_text_from_document(document_path, max_pages)
+        text_result = extract_text_from_document(
+            document_path, max_pages, fingerprint=config.INCREMENTAL_REINDEX and db_initialized
+        )
         
         if job_id:
             update_job_progress(job_id, f"텍스트 추출 완료 - {text_result['total_pages']}페이지", 1,
                               {"extracted_pages": text_result['total_pages']})
         
+        # 증분 재처리 계획 (지문이 같은 페이지는 2~4단계 생략)
+        reindex_plan = plan_incremental_reindex(document_path, text_result, skip_image_processing, db_initialized)
+        changed_pages = reindex_plan["changed_pages"] if reindex_plan["incremental"] else None
+        
         if skip_image_processing:
             # 이미지 처리 건너뛰기
             logger.info("⏭️ 2-3단계: 이미지 처리 건너뛰기")
@@ -166,7 +174,7 @@ def process_single_document_complete(document_path: str, max_pages: int = None,
                 update_job_progress(job_id, "페이지별 이미지 캡처 시작", 1)
                 
             logger.info("🖼️ 2단계: 페이지별 이미지 캡처")
-            image_result = capture_page_images(document_path, max_pages=max_pages)
+            image_result = capture_page_images(document_path, max_pages=max_pages, page_numbers=changed_pages)
             
             if job_id:
                 update_job_progress(job_id, f"이미지 캡처 완료 - {len(image_result['image_paths'])}개", 2,
@@ -177,7 +185,7 @@ def process_single_document_complete(document_path: str, max_pages: int = None,
                 update_job_progress(job_id, "GPT 이미지 설명 생성 시작", 2)
                 
             logger.info("🤖 3단계: GPT 이미지 설명 생성")
-            description_result = generate_image_descriptions(image_result["image_paths"])
+            description_result = generate_image_descriptions(image_result["image_paths"], text_result)
             
             if job_id:
                 update_job_progress(job_id, f"GPT 설명 생성 완료 - {description_result['total_images']}개", 3,
@@ -191,7 +199,8 @@ def process_single_document_complete(document_path: str, max_pages: int = None,
         vector_result = create_vector_database(
             text_result, 
             description_result, 
-            document_path
+            document_path,
+            reindex_plan
         )
         
         if job_id:
@@ -216,14 +225,19 @@ def process_single_document_complete(document_path: str, max_pages: int = None,
                                  "content", "text_content", "image_description", "image_path"]
                 )
                 
+                page_fingerprints = page_fingerprints_from(text_result)
                 for doc_data in results:
+                    fingerprint = page_fingerprints.get(doc_data.get("page_number", 0), {})
                     chunk_data = {
                         "content_type": doc_data.get("content_type", "combined"),
                         "content": doc_data.get("content", ""),
                         "text_content": doc_data.get("text_content", ""),
                         "image_description": doc_data.get("image_description", ""),
                         "image_path": doc_data.get("image_path", ""),
-                        "milvus_id": str(doc_data.get("id", ""))
+                        "milvus_id": str(doc_data.get("id", "")),
+                        "source_path": document_path,
+                        "text_hash": fingerprint.get("text_hash"),
+                        "image_hash": fingerprint.get("image_hash")
                     }
                     
                     save_document_chunk(
@@ -266,6 +280,7 @@ def process_single_document_complete(document_path: str, max_pages: int = None,
             "captured_images": len(image_result['image_paths']),
             "generated_descriptions": description_result['total_images'],
             "vector_documents": vector_result['total_documents'],
+            "reused_pages": len(reindex_plan["reused_pages"]),
             "saved_chunks": saved_chunks,
             "processing_time": datetime.now().isoformat()
         }
@@ -21,10 +21,31 @@ class Config:
     AZURE_OPENAI_API_VERSION = os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview")  # GPT Vision용
     AZURE_OPENAI_DEPLOYMENT_NAME = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME")  # GPT-4 Vision 배포 이름
     
+    # GPT Vision 페이지 설명 동시성/속도 제한 설정
+    VISION_MAX_CONCURRENCY = int(os.getenv("VISION_MAX_CONCURRENCY", "8"))  # 동시 요청 수
+    VISION_TOKENS_PER_MINUTE = int(os.getenv("VISION_TOKENS_PER_MINUTE", "0"))  # 분당 토큰 한도 (0이면 제한 없음)
+    VISION_ESTIMATED_IMAGE_TOKENS = int(os.getenv("VISION_ESTIMATED_IMAGE_TOKENS", "1500"))  # 요청 1회 입력 토큰 추정치
+    VISION_MAX_TOKENS = int(os.getenv("VISION_MAX_TOKENS", "1000"))  # 설명 최대 출력 토큰
+    VISION_MAX_RETRIES = int(os.getenv("VISION_MAX_RETRIES", "3"))  # 페이지별 재시도 횟수
+    VISION_RETRY_BACKOFF = float(os.getenv("VISION_RETRY_BACKOFF", "2.0"))  # 재시도 기본 대기 (초, 지수 증가)
+    VISION_EMBED_PREFETCH_BATCH = int(os.getenv("VISION_EMBED_PREFETCH_BATCH", "16"))  # 완료된 설명 임베딩 선계산 단위 (0이면 사용 안 함)
+    
     # Azure OpenAI - Embeddings (별도 API 버전)
     AZURE_OPENAI_EMBEDDING_API_VERSION = os.getenv("AZURE_OPENAI_EMBEDDING_API_VERSION", "2023-12-01-preview")  # 임베딩용
     AZURE_OPENAI_EMBEDDING_DEPLOYMENT = os.getenv("AZURE_OPENAI_EMBEDDING_DEPLOYMENT")  # 임베딩 모델 배포 이름
     
+    # 임베딩 요청 배치/동시성 설정
+    EMBEDDING_BATCH_MAX_INPUTS = int(os.getenv("EMBEDDING_BATCH_MAX_INPUTS", "256"))  # 요청 1회당 최대 입력 수
+    EMBEDDING_BATCH_MAX_TOKENS = int(os.getenv("EMBEDDING_BATCH_MAX_TOKENS", "100000"))  # 요청 1회당 토큰 예산
+    EMBEDDING_MAX_CONCURRENCY = int(os.getenv("EMBEDDING_MAX_CONCURRENCY", "4"))  # 동시 요청 수
+    EMBEDDING_MAX_RETRIES = int(os.getenv("EMBEDDING_MAX_RETRIES", "5"))  # 429/일시 오류 재시도 횟수
+    EMBEDDING_RETRY_BACKOFF = float(os.getenv("EMBEDDING_RETRY_BACKOFF", "1.0"))  # 재시도 기본 대기 (초, 지수 증가)
+    EMBEDDING_DIMENSION = int(os.getenv("EMBEDDING_DIMENSION", "3072"))  # text-embedding-3-large
+    
+    # 임베딩 캐시 (SQLite 파일, 빈 값이면 캐시 사용 안 함)
+    EMBEDDING_CACHE_PATH = os.getenv("EMBEDDING_CACHE_PATH", "./embedding_cache.db")
+    EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "200000"))  # 초과 시 LRU 삭제
+    
     # Milvus Lite (파일 기반)
     MILVUS_URI = os.getenv("MILVUS_URI", "./milvus_lite.db")  # 파일 기반 DB
     MILVUS_HOST = os.getenv("MILVUS_HOST", "localhost")  # 백업용 (Docker 사용시)
@@ -32,6 +53,9 @@ class Config:
     MILVUS_COLLECTION_NAME = os.getenv("MILVUS_COLLECTION_NAME", "document_vectors")
     USE_MILVUS_LITE = os.getenv("USE_MILVUS_LITE", "true").lower() == "true"
     
+    # 증분 재처리 (페이지 지문이 같은 페이지는 설명/임베딩/Milvus 행 재사용)
+    INCREMENTAL_REINDEX = os.getenv("INCREMENTAL_REINDEX", "true").lower() == "true"
+    
     # PostgreSQL 데이터베이스 설정
     DATABASE_HOST = os.getenv("DATABASE_HOST", "localhost")
     DATABASE_PORT = os.getenv("DATABASE_PORT", "5432")
@@ -51,6 +75,13 @@ class Config:
     # 파일 경로 설정
     OUTPUT_DIR = Path(os.getenv("OUTPUT_DIR", "./extracted_image"))
     
+    # 페이지 렌더링 (PyMuPDF, 긴 변 기준 적응형 DPI, 프로세스 병렬)
+    RENDER_TARGET_LONG_EDGE = int(os.getenv("RENDER_TARGET_LONG_EDGE", "2048"))  # Vision 모델 입력 최대 해상도 (픽셀)
+    RENDER_MIN_DPI = int(os.getenv("RENDER_MIN_DPI", "72"))
+    RENDER_MAX_DPI = int(os.getenv("RENDER_MAX_DPI", "300"))
+    RENDER_WORKERS = int(os.getenv("RENDER_WORKERS", "4"))  # 렌더링 프로세스 수 (1이면 현재 프로세스에서 처리)
+    RENDER_PARALLEL_MIN_PAGES = int(os.getenv("RENDER_PARALLEL_MIN_PAGES", "8"))  # 이 페이지 수 미만은 프로세스 풀 없이 처리
+    
     # 기본 문서 및 폴더 경로 설정 
     DEFAULT_DOCUMENT_PATH = os.getenv("DEFAULT_DOCUMENT_PATH", "./test.pdf")
     DEFAULT_FOLDER_PATH = os.getenv("DEFAULT_FOLDER_PATH", "./uploads")
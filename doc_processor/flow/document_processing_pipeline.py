@@ -8,25 +8,33 @@
 """
 
 import asyncio
-import base64
 import io
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import fitz  # PyMuPDF
 
-# Azure OpenAI (통합 openai 패키지 사용)
-import openai
-
 # 환경 설정
 from config import config
 
 # 데이터베이스 관리 (공통 모듈 사용)
 from database import db_manager, get_db_session
-from pdf2image import convert_from_path
+
+# 임베딩 (공유 클라이언트 + 배치 요청)
+from embedding_service import get_embedding_service
+
+# 페이지 지문 (증분 재처리)
+from page_fingerprint import page_fingerprints_from, page_image_hash, page_text_hash, plan_reindex
+
+# 페이지 렌더링 (PyMuPDF, 적응형 DPI, 프로세스 병렬)
+from page_renderer import render_pages
+
+# GPT Vision (공유 클라이언트 + 동시 요청 + 토큰 한도)
+from vision_service import get_vision_describer
 from PIL import Image
 from prefect import flow, get_run_logger, task
 from prefect.futures import PrefectFuture
@@ -100,7 +108,8 @@ def create_document_metadata(document_path: str, document_type: str = 'common')
                 "file_size": result["file_size"],
                 "file_type": result["file_type"],
                 "file_hash": result["file_hash"],
-                "status": result["status"]
+                "status": result["status"],
+                "is_duplicate": result.get("is_duplicate", False)
             }
             
     except Exception as e:
@@ -147,6 +156,9 @@ def save_document_chunk(doc_id: str, page_number: int, chunk_data: Dict[str, Any
                 image_description=chunk_data.get("image_description", ""),
                 image_path=chunk_data.get("image_path", ""),
                 milvus_id=chunk_data.get("milvus_id", ""),
+                source_path=chunk_data.get("source_path"),
+                text_hash=chunk_data.get("text_hash"),
+                image_hash=chunk_data.get("image_hash"),
                 embedding_model="text-embedding-3-large",
                 vector_dimension=3072,
                 metadata_json={
@@ -265,32 +277,94 @@ def complete_processing_job(job_id: str, success_count: int, total_count: int, e
 # Azure OpenAI 임베딩 함수 (별도 API 버전 사용)
 # ===============================
 def get_azure_openai_embedding(text: str) -> List[float]:
-    """Azure OpenAI를 사용하여 텍스트 임베딩을 생성합니다. (임베딩 전용 API 버전)"""
+    """Azure OpenAI를 사용하여 텍스트 임베딩을 생성합니다. (임베딩 전용 API 버전, 공유 클라이언트)"""
     try:
-        # Azure OpenAI 클라이언트 생성 (새로운 API 방식)
-        client = openai.AzureOpenAI(
-            azure_endpoint=config.AZURE_OPENAI_ENDPOINT,
-            api_key=config.AZURE_OPENAI_KEY,
-            api_version=config.AZURE_OPENAI_EMBEDDING_API_VERSION
-        )
-        
-        logger.info(f"🔗 임베딩 API 버전: {config.AZURE_OPENAI_EMBEDDING_API_VERSION}")
-        
-        response = client.embeddings.create(
-            model=config.AZURE_OPENAI_EMBEDDING_DEPLOYMENT,
-            input=text
-        )
-        return response.data[0].embedding
+        return get_embedding_service().embed_text(text)
     except Exception as e:
         logger.error(f"❌ 임베딩 생성 실패: {str(e)}")
         raise
 
+
+def get_azure_openai_embeddings(texts: List[str]) -> List[List[float]]:
+    """여러 텍스트를 배치 요청으로 임베딩합니다. (입력 순서대로 반환)"""
+    try:
+        return get_embedding_service().embed_texts(texts)
+    except Exception as e:
+        logger.error(f"❌ 임베딩 일괄 생성 실패: {str(e)}")
+        raise
+
+
+# Milvus text_content / image_description 필드 최대 길이
+PAGE_FIELD_MAX_LENGTH = 10000
+
+
+def build_combined_content(text_content: str, image_description: str) -> str:
+    """페이지 텍스트와 이미지 설명을 임베딩용 통합 콘텐츠로 결합합니다."""
+    combined_content = ""
+    if text_content:
+        combined_content += f"텍스트: {text_content}"
+    if image_description:
+        if combined_content:
+            combined_content += " "
+        combined_content += f"이미지: {image_description}"
+    return combined_content
+
+
+class _EmbeddingPrefetcher:
+    """
+    완료된 페이지 설명의 통합 콘텐츠 임베딩을 백그라운드에서 미리 계산해 캐시에 채움
+    - 4단계와 같은 방식(build_combined_content)으로 콘텐츠를 만들어 캐시 키가 일치하도록 함
+    - 캐시가 없거나 텍스트 추출 결과가 없으면 아무 것도 하지 않음
+    - 선계산 실패는 4단계에서 다시 요청하므로 경고만 남김
+    """
+
+    def __init__(self, extracted_text: Optional[Dict[str, Any]]):
+        self.batch_size = config.VISION_EMBED_PREFETCH_BATCH
+        self.enabled = bool(extracted_text) and self.batch_size > 0 and get_embedding_service().cache is not None
+        self.page_texts: Dict[int, str] = {}
+        self.pending: List[str] = []
+        self.futures = []
+        self.executor = None
+        if not self.enabled:
+            return
+
+        for page_data in extracted_text.get("extracted_text", {}).values():
+            if page_data["text"].strip():
+                self.page_texts[page_data["page_number"]] = page_data["text"][:PAGE_FIELD_MAX_LENGTH]
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    def add(self, page_number: int, description: str):
+        if not self.enabled or not description.strip():
+            return
+        self.pending.append(
+            build_combined_content(self.page_texts.get(page_number, ""), description[:PAGE_FIELD_MAX_LENGTH])
+        )
+        if len(self.pending) >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        if self.pending:
+            self.futures.append(self.executor.submit(get_embedding_service().embed_texts, self.pending))
+            self.pending = []
+
+    def close(self):
+        """남은 콘텐츠를 요청하고 선계산이 끝날 때까지 대기"""
+        if not self.enabled:
+            return
+        self._flush()
+        for future in self.futures:
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning(f"⚠️ 임베딩 선계산 실패 (Vector DB 구성 단계에서 재요청): {str(e)}")
+        self.executor.shutdown()
+
 # ===============================
 # 1단계: 텍스트 추출 (Azure AI Search)
 # ===============================
 @task(name="extract_text_from_document")
-def extract_text_from_document(document_path: str, max_pages: int = None) -> Dict[str, Any]:
-    """문서에서 텍스트를 추출합니다."""
+def extract_text_from_document(document_path: str, max_pages: int = None, fingerprint: bool = None) -> Dict[str, Any]:
+    """문서에서 텍스트를 추출합니다. (fingerprint가 참이면 증분 재처리용 페이지 지문도 계산, 기본: INCREMENTAL_REINDEX)"""
     logger = get_run_logger()
     logger.info(f"📄 텍스트 추출 시작: {document_path}")
     
@@ -306,6 +380,9 @@ def extract_text_from_document(document_path: str, max_pages: int = None) -> Dic
         else:
             pages_to_process = total_pages
         
+        if fingerprint is None:
+            fingerprint = config.INCREMENTAL_REINDEX
+        
         extracted_text = {}
         
         for page_num in range(pages_to_process):
@@ -314,7 +391,10 @@ def extract_text_from_document(document_path: str, max_pages: int = None) -> Dic
             extracted_text[f"page_{page_num + 1}"] = {
                 "text": text,
                 "page_number": page_num + 1,
-                "word_count": len(text.split())
+                "word_count": len(text.split()),
+                # 페이지 지문 (증분 재처리 시 이전 결과와 비교, 비활성화 시 계산하지 않음)
+                "text_hash": page_text_hash(text) if fingerprint else None,
+                "image_hash": page_image_hash(doc, page) if fingerprint else None
             }
         
         doc.close()
@@ -331,12 +411,78 @@ def extract_text_from_document(document_path: str, max_pages: int = None) -> Dic
         logger.error(f"❌ 텍스트 추출 실패: {str(e)}")
         raise
 
+# ===============================
+# 1-1단계: 증분 재처리 계획 (페이지 지문 비교)
+# ===============================
+@task(name="plan_incremental_reindex")
+def plan_incremental_reindex(
+    document_path: str,
+    extracted_text: Dict[str, Any],
+    skip_image_processing: bool = False,
+    use_database: bool = True
+) -> Dict[str, Any]:
+    """
+    이전 처리 결과(DocumentChunk 페이지 지문, Milvus 행)와 비교해 재처리할 페이지를 정합니다.
+    - 텍스트/이미지 지문이 같고 Milvus 행이 남아 있는 페이지는 설명/임베딩/Milvus 행 재사용
+    - 이전 결과가 없거나 조회에 실패하면 전체 재처리
+    """
+    logger = get_run_logger()
+    page_fingerprints = page_fingerprints_from(extracted_text)
+    full_plan = {
+        "incremental": False,
+        "reused_pages": [],
+        "changed_pages": sorted(page_fingerprints),
+        "removed_pages": []
+    }
+    
+    if not config.INCREMENTAL_REINDEX or not use_database:
+        return full_plan
+    
+    try:
+        with next(get_db_session()) as session:
+            previous_chunks = DocumentChunkService(session).get_latest_page_chunks(document_path)
+        if not previous_chunks:
+            logger.info("🆕 이전 처리 결과 없음: 전체 페이지 처리")
+            return full_plan
+        
+        connections.connect("default", uri=config.MILVUS_URI)
+        if not utility.has_collection(config.MILVUS_COLLECTION_NAME):
+            return full_plan
+        collection = Collection(config.MILVUS_COLLECTION_NAME)
+        collection.load()
+        rows = collection.query(
+            expr=f'document_path == "{document_path}"',
+            output_fields=["page_number"]
+        )
+        
+        plan = plan_reindex(
+            page_fingerprints,
+            previous_chunks,
+            (row["page_number"] for row in rows),
+            require_image_description=not skip_image_processing
+        )
+        plan["incremental"] = True
+        logger.info(
+            f"♻️ 증분 재처리: 재사용 {len(plan['reused_pages'])}페이지, "
+            f"재처리 {len(plan['changed_pages'])}페이지, 삭제 {len(plan['removed_pages'])}페이지"
+        )
+        return plan
+        
+    except Exception as e:
+        logger.warning(f"⚠️ 증분 재처리 계획 실패, 전체 페이지 처리: {str(e)}")
+        return full_plan
+
 # ===============================
 # 2단계: 페이지별 이미지 캡처 및 저장
 # ===============================
 @task(name="capture_page_images")
-def capture_page_images(document_path: str, output_dir: str = None, max_pages: int = None) -> Dict[str, Any]:
-    """PDF의 각 페이지를 이미지로 캡처하여 저장합니다."""
+def capture_page_images(
+    document_path: str,
+    output_dir: str = None,
+    max_pages: int = None,
+    page_numbers: List[int] = None
+) -> Dict[str, Any]:
+    """PDF의 각 페이지를 이미지로 캡처하여 저장합니다. (page_numbers가 주어지면 해당 페이지만)"""
     logger = get_run_logger()
     logger.info(f"️ 페이지별 이미지 캡처 시작: {document_path}")
     
@@ -347,24 +493,29 @@ def capture_page_images(document_path: str, output_dir: str = None, max_pages: i
     output_path.mkdir(parents=True, exist_ok=True)
     
     try:
-        # PDF를 이미지로 변환 (페이지 수 제한)
-        if max_pages:
-            logger.info(f"🖼️ 페이지 수 제한: 처음 {max_pages}페이지만 이미지 변환")
-            images = convert_from_path(document_path, dpi=300, first_page=1, last_page=max_pages)
-        else:
-            images = convert_from_path(document_path, dpi=300)
+        # 렌더링할 페이지 결정 (페이지 수 제한)
+        # 문서는 1번만 열고 단일 프로세스 렌더링에서 그대로 재사용
+        with fitz.open(document_path) as doc:
+            total_pages = len(doc)
+            if page_numbers is not None:
+                logger.info(f"🖼️ 변경된 페이지만 이미지 변환: {len(page_numbers)}개")
+                pages = sorted(page_numbers)
+            elif max_pages:
+                logger.info(f"🖼️ 페이지 수 제한: 처음 {max_pages}페이지만 이미지 변환")
+                pages = list(range(1, min(max_pages, total_pages) + 1))
+            else:
+                pages = list(range(1, total_pages + 1))
         
-        image_paths = []
-        document_name = Path(document_path).stem
+            # 페이지별로 바로 PNG 저장 (적응형 DPI, 페이지가 많으면 프로세스 병렬)
+            rendered = {}
+            document_name = Path(document_path).stem
+            for page_number, image_path, dpi in render_pages(
+                document_path, pages, output_path, document_name, doc=doc
+            ):
+                rendered[page_number] = image_path
+                logger.info(f"💾 페이지 {page_number} 이미지 저장 ({dpi}DPI): {image_path}")
         
-        for i, image in enumerate(images):
-            # 페이지별 이미지 저장
-            image_filename = f"{document_name}_page_{i+1}.png"
-            image_path = output_path / image_filename
-            image.save(image_path, "PNG", quality=95)
-            image_paths.append(str(image_path))
-            
-            logger.info(f"💾 페이지 {i+1} 이미지 저장: {image_path}")
+        image_paths = [rendered[page_number] for page_number in pages]
         
         logger.info(f"✅ 이미지 캡처 완료: {len(image_paths)}개 페이지")
         return {
@@ -382,68 +533,52 @@ def capture_page_images(document_path: str, output_dir: str = None, max_pages: i
 # 3단계: GPT를 이용한 이미지 설명 생성 (별도 API 버전 사용)
 # ===============================
 @task(name="generate_image_descriptions")
-def generate_image_descriptions(image_paths: List[str]) -> Dict[str, Any]:
-    """이미지들을 GPT Vision API를 통해 설명을 생성합니다. (GPT Vision 전용 API 버전)"""
+def generate_image_descriptions(image_paths: List[str], extracted_text: Dict[str, Any] = None) -> Dict[str, Any]:
+    """
+    이미지들을 GPT Vision API를 통해 설명을 생성합니다. (GPT Vision 전용 API 버전)
+    - 페이지별 요청을 VISION_MAX_CONCURRENCY개까지 동시에 보내고 분당 토큰 한도를 지킴
+    - 429/일시 오류는 페이지별로 재시도
+    - extracted_text가 주어지고 임베딩 캐시가 있으면, 완료된 페이지의 통합 콘텐츠 임베딩을
+      백그라운드에서 미리 계산해 4단계(Vector DB 구성)가 캐시 적중으로 바로 진행되게 함
+    """
     logger = get_run_logger()
     logger.info(f"🤖 GPT 이미지 설명 생성 시작: {len(image_paths)}개 이미지")
     
     try:
-        # Azure OpenAI 클라이언트 생성 (새로운 API 방식)
-        client = openai.AzureOpenAI(
-            azure_endpoint=config.AZURE_OPENAI_ENDPOINT,
-            api_key=config.AZURE_OPENAI_KEY,
-            api_version=config.AZURE_OPENAI_API_VERSION
+        describer = get_vision_describer()
+        logger.info(
+            f"🔗 GPT Vision API 버전: {config.AZURE_OPENAI_API_VERSION} "
+            f"(동시 {describer.max_concurrency}개, 분당 토큰 한도 {config.VISION_TOKENS_PER_MINUTE or '없음'})"
         )
         
-        logger.info(f"🔗 GPT Vision API 버전: {config.AZURE_OPENAI_API_VERSION}")
-        
+        prefetcher = _EmbeddingPrefetcher(extracted_text)
         descriptions = {}
         
-        for image_path in image_paths:
-            try:
-                # 이미지를 base64로 인코딩
-                with open(image_path, "rb") as image_file:
-                    base64_image = base64.b64encode(image_file.read()).decode('utf-8')
-                
-                # GPT Vision API 호출 (새로운 API 방식)
-                response = client.chat.completions.create(
-                    model=config.AZURE_OPENAI_DEPLOYMENT_NAME,
-                    messages=[
-                        {
-                            "role": "user",
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": "이 이미지의 내용을 자세히 설명해주세요. 텍스트, 차트, 그래프, 표 등 모든 요소를 포함하여 설명해주세요."
-                                },
-                                {
-                                    "type": "image_url",
-                                    "image_url": {
-                                        "url": f"data:image/png;base64,{base64_image}"
-                                    }
-                                }
-                            ]
-                        }
-                    ],
-                    max_tokens=1000
-                )
+        try:
+            for image_path, description, error in describer.describe_images(image_paths):
+                if error is not None:
+                    logger.error(f"❌ 이미지 설명 생성 실패 ({image_path}): {str(error)}")
+                    descriptions[image_path] = {
+                        "description": f"설명 생성 실패: {str(error)}",
+                        "page_number": 0,
+                        "generation_timestamp": datetime.now().isoformat()
+                    }
+                    continue
                 
-                description = response.choices[0].message.content
+                page_number = int(Path(image_path).stem.split('_')[-1].replace('page_', ''))
                 descriptions[image_path] = {
                     "description": description,
-                    "page_number": int(Path(image_path).stem.split('_')[-1].replace('page_', '')),
+                    "page_number": page_number,
                     "generation_timestamp": datetime.now().isoformat()
                 }
+                prefetcher.add(page_number, description)
                 
-                logger.info(f"📝 페이지 {descriptions[image_path]['page_number']} 설명 생성 완료")
-                
-            except Exception as e:
-                logger.error(f"❌ 이미지 설명 생성 실패 ({image_path}): {str(e)}")
-                descriptions[image_path] = {
-                    "description": f"설명 생성 실패: {str(e)}",
-                    "page_number": 0,
-                    "generation_timestamp": datetime.now().isoformat()
-                }
+                logger.info(f"📝 페이지 {page_number} 설명 생성 완료 ({len(descriptions)}/{len(image_paths)})")
+        finally:
+            prefetcher.close()
+        
+        # 결과는 입력 이미지 순서로 정렬 (완료 순서와 무관)
+        descriptions = {path: descriptions[path] for path in image_paths if path in descriptions}
         
         logger.info(f"✅ 이미지 설명 생성 완료: {len(descriptions)}개")
         return {
@@ -463,9 +598,14 @@ def generate_image_descriptions(image_paths: List[str]) -> Dict[str, Any]:
 def create_vector_database(
     extracted_text: Dict[str, Any], 
     image_descriptions: Dict[str, Any],
-    document_path: str
+    document_path: str,
+    reindex_plan: Dict[str, Any] = None
 ) -> Dict[str, Any]:
-    """추출된 텍스트와 이미지 설명을 합쳐서 Vector DB를 구성합니다."""
+    """
+    추출된 텍스트와 이미지 설명을 합쳐서 Vector DB를 구성합니다.
+    - 문서의 기존 행을 지우고 새 행을 삽입 (다른 문서의 행은 유지)
+    - 증분 재처리 계획이 있으면 재처리/삭제 페이지의 행만 교체하고 나머지 행은 재사용
+    """
     logger = get_run_logger()
     logger.info(f"🗄️ Vector DB 구성 시작 (Azure OpenAI 임베딩 사용)")
     
@@ -473,11 +613,17 @@ def create_vector_database(
         # Milvus Lite 연결
         connections.connect("default", uri=config.MILVUS_URI)
         
-        # 기존 컬렉션이 있다면 삭제 (차원 불일치 해결)
+        # 기존 컬렉션의 임베딩 차원이 다르면 삭제 (차원 불일치 해결)
         collection_name = config.MILVUS_COLLECTION_NAME
         if utility.has_collection(collection_name):
-            logger.info(f"🗑️ 기존 컬렉션 삭제: {collection_name}")
-            utility.drop_collection(collection_name)
+            existing_dims = [
+                int(field.params.get("dim", 0))
+                for field in Collection(collection_name).schema.fields
+                if field.name == "embedding"
+            ]
+            if existing_dims != [3072]:
+                logger.info(f"🗑️ 임베딩 차원이 다른 기존 컬렉션 삭제: {collection_name}")
+                utility.drop_collection(collection_name)
         
         # 컬렉션 스키마 정의 (페이지별 통합 벡터)
         fields = [
@@ -494,20 +640,37 @@ def create_vector_database(
         
         schema = CollectionSchema(fields, "Document processing pipeline vector collection")
         
-        # 컬렉션 생성
-        collection = Collection(collection_name, schema)
-        
-        # Milvus Lite 최적화 FLAT 벡터 인덱스 생성
-        index_params = {
-            "metric_type": "COSINE",  # Azure OpenAI 임베딩은 코사인 유사도 사용
-            "index_type": "FLAT",     # Milvus Lite에서 최고 성능
-            "params": {}
-        }
-        collection.create_index("embedding", index_params)
-        logger.info(f"📚 새 컬렉션 생성: {collection_name} (3072차원)")
+        if utility.has_collection(collection_name):
+            collection = Collection(collection_name)
+        else:
+            # 컬렉션 생성
+            collection = Collection(collection_name, schema)
+            
+            # Milvus Lite 최적화 FLAT 벡터 인덱스 생성
+            index_params = {
+                "metric_type": "COSINE",  # Azure OpenAI 임베딩은 코사인 유사도 사용
+                "index_type": "FLAT",     # Milvus Lite에서 최고 성능
+                "params": {}
+            }
+            collection.create_index("embedding", index_params)
+            logger.info(f"📚 새 컬렉션 생성: {collection_name} (3072차원)")
+        
+        # 교체할 페이지 (증분 재처리가 아니면 문서 전체)
+        incremental = bool(reindex_plan and reindex_plan.get("incremental"))
+        reused_pages = reindex_plan["reused_pages"] if incremental else []
+        target_pages = set(reindex_plan["changed_pages"]) if incremental else None
+        if incremental:
+            replace_pages = sorted(target_pages | set(reindex_plan["removed_pages"]))
+            delete_expr = (
+                f'document_path == "{document_path}" and page_number in {replace_pages}'
+                if replace_pages else None
+            )
+        else:
+            delete_expr = f'document_path == "{document_path}"'
         
         # 데이터 준비 - 페이지별 통합 벡터 방식
         documents_to_insert = []
+        contents_to_embed = []
         embeddings_to_insert = []
         
         # 페이지별로 텍스트와 이미지 설명을 통합
@@ -516,6 +679,8 @@ def create_vector_database(
         # 텍스트 데이터 수집
         for page_key, page_data in extracted_text["extracted_text"].items():
             page_num = page_data["page_number"]
+            if target_pages is not None and page_num not in target_pages:
+                continue
             if page_num not in page_data_map:
                 page_data_map[page_num] = {
                     "text_content": "",
@@ -523,11 +688,13 @@ def create_vector_database(
                     "image_path": ""
                 }
             if page_data["text"].strip():
-                page_data_map[page_num]["text_content"] = page_data["text"][:10000]
+                page_data_map[page_num]["text_content"] = page_data["text"][:PAGE_FIELD_MAX_LENGTH]
         
         # 이미지 설명 데이터 수집
         for image_path, desc_data in image_descriptions["image_descriptions"].items():
             page_num = desc_data["page_number"]
+            if target_pages is not None and page_num not in target_pages:
+                continue
             if page_num not in page_data_map:
                 page_data_map[page_num] = {
                     "text_content": "",
@@ -535,23 +702,16 @@ def create_vector_database(
                     "image_path": ""
                 }
             if desc_data["description"].strip():
-                page_data_map[page_num]["image_description"] = desc_data["description"][:10000]
+                page_data_map[page_num]["image_description"] = desc_data["description"][:PAGE_FIELD_MAX_LENGTH]
                 page_data_map[page_num]["image_path"] = image_path
         
-        # 페이지별 통합 콘텐츠 생성 및 벡터화
+        # 페이지별 통합 콘텐츠 생성 (임베딩은 모아서 배치 요청)
         for page_num, page_data in page_data_map.items():
             # 텍스트와 이미지 설명을 결합
-            combined_content = ""
-            if page_data["text_content"]:
-                combined_content += f"텍스트: {page_data['text_content']}"
-            if page_data["image_description"]:
-                if combined_content:
-                    combined_content += " "
-                combined_content += f"이미지: {page_data['image_description']}"
+            combined_content = build_combined_content(page_data["text_content"], page_data["image_description"])
             
             if combined_content.strip():
-                embedding = get_azure_openai_embedding(combined_content)
-                
+                contents_to_embed.append(combined_content)
                 documents_to_insert.append({
                     "document_path": document_path,
                     "page_number": page_num,
@@ -561,14 +721,20 @@ def create_vector_database(
                     "image_description": page_data["image_description"][:10000],
                     "image_path": page_data["image_path"]
                 })
-                embeddings_to_insert.append(embedding)
+        
+        # 페이지 콘텐츠 일괄 벡터화 (입력 수/토큰 예산 단위 배치, 입력 순서 유지)
+        if documents_to_insert:
+            embeddings_to_insert = get_azure_openai_embeddings(contents_to_embed)
+        
+        # 컬렉션 로드
+        collection.load()
+        
+        # 문서의 기존 행 삭제 (재사용 페이지 제외)
+        if delete_expr:
+            collection.delete(delete_expr)
         
         # 데이터 삽입
         if documents_to_insert:
-            # 컬렉션 로드
-            collection.load()
-            
-            # 데이터 삽입
             insert_data = [
                 [doc["document_path"] for doc in documents_to_insert],
                 [doc["page_number"] for doc in documents_to_insert],
@@ -583,13 +749,20 @@ def create_vector_database(
             collection.insert(insert_data)
             collection.flush()
             
-            logger.info(f"✅ Vector DB 구성 완료: {len(documents_to_insert)}개 항목 삽입")
+            logger.info(
+                f"✅ Vector DB 구성 완료: {len(documents_to_insert)}개 항목 삽입"
+                + (f", {len(reused_pages)}개 페이지 재사용" if reused_pages else "")
+            )
+        elif reused_pages:
+            logger.info(f"♻️ 변경된 페이지 없음: {len(reused_pages)}개 페이지 재사용")
         else:
             logger.warning("⚠️ 삽입할 데이터가 없습니다.")
         
         return {
             "collection_name": config.MILVUS_COLLECTION_NAME,
-            "total_documents": len(documents_to_insert),
+            "total_documents": len(documents_to_insert) + len(reused_pages),
+            "inserted_documents": len(documents_to_insert),
+            "reused_documents": len(reused_pages),
             "combined_documents": len([d for d in documents_to_insert if d["content_type"] == "combined"]),
             "embedding_model": "Azure OpenAI text-embedding-3-large",
             "embedding_api_version": config.AZURE_OPENAI_EMBEDDING_API_VERSION,
@@ -967,12 +1140,18 @@ def document_processing_pipeline(document_path: str, skip_image_processing: bool
             update_job_progress(job_id, "텍스트 추출 시작", 0)
         
         logger.info("📄 1단계: 텍스트 추출 시작")
-        text_result = extract_text_from_document(document_path, max_pages)
+        text_result = extract_text_from_document(
+            document_path, max_pages, fingerprint=config.INCREMENTAL_REINDEX and db_initialized
+        )
         
         if job_id:
             update_job_progress(job_id, f"텍스트 추출 완료 - {text_result['total_pages']}페이지", 1, 
                               {"extracted_pages": text_result['total_pages']})
         
+        # 증분 재처리 계획 (지문이 같은 페이지는 2~4단계 생략)
+        reindex_plan = plan_incremental_reindex(document_path, text_result, skip_image_processing, db_initialized)
+        changed_pages = reindex_plan["changed_pages"] if reindex_plan["incremental"] else None
+        
         if skip_image_processing:
             # 이미지 처리 건너뛰기
             logger.info("⏭️ 2-3단계: 이미지 처리 건너뛰기")
@@ -988,7 +1167,7 @@ def document_processing_pipeline(document_path: str, skip_image_processing: bool
                 update_job_progress(job_id, "페이지별 이미지 캡처 시작", 1)
                 
             logger.info("🖼️ 2단계: 페이지별 이미지 캡처 시작")
-            image_result = capture_page_images(document_path, max_pages=max_pages)
+            image_result = capture_page_images(document_path, max_pages=max_pages, page_numbers=changed_pages)
             
             if job_id:
                 update_job_progress(job_id, f"이미지 캡처 완료 - {len(image_result['image_paths'])}개", 2,
@@ -999,7 +1178,7 @@ def document_processing_pipeline(document_path: str, skip_image_processing: bool
                 update_job_progress(job_id, "GPT 이미지 설명 생성 시작", 2)
                 
             logger.info("🤖 3단계: GPT 이미지 설명 생성 시작")
-            description_result = generate_image_descriptions(image_result["image_paths"])
+            description_result = generate_image_descriptions(image_result["image_paths"], text_result)
             
             if job_id:
                 update_job_progress(job_id, f"GPT 설명 생성 완료 - {description_result['total_images']}개", 3,
@@ -1013,7 +1192,8 @@ def document_processing_pipeline(document_path: str, skip_image_processing: bool
         vector_result = create_vector_database(
             text_result, 
             description_result, 
-            document_path
+            document_path,
+            reindex_plan
         )
         
         if job_id:
@@ -1038,14 +1218,19 @@ def document_processing_pipeline(document_path: str, skip_image_processing: bool
                                  "content", "text_content", "image_description", "image_path"]
                 )
                 
+                page_fingerprints = page_fingerprints_from(text_result)
                 for doc_data in results:
+                    fingerprint = page_fingerprints.get(doc_data.get("page_number", 0), {})
                     chunk_data = {
                         "content_type": doc_data.get("content_type", "combined"),
                         "content": doc_data.get("content", ""),
                         "text_content": doc_data.get("text_content", ""),
                         "image_description": doc_data.get("image_description", ""),
                         "image_path": doc_data.get("image_path", ""),
-                        "milvus_id": str(doc_data.get("id", ""))
+                        "milvus_id": str(doc_data.get("id", "")),
+                        "source_path": document_path,
+                        "text_hash": fingerprint.get("text_hash"),
+                        "image_hash": fingerprint.get("image_hash")
                     }
                     
                     chunk_id = save_document_chunk(
@@ -1086,6 +1271,7 @@ def document_processing_pipeline(document_path: str, skip_image_processing: bool
             "text_extraction": text_result,
             "image_capture": image_result,
             "image_descriptions": description_result,
+            "incremental_reindex": reindex_plan,
             "vector_database": vector_result,
             "postgresql_storage": {
                 "enabled": db_initialized,
@@ -1103,6 +1289,7 @@ def document_processing_pipeline(document_path: str, skip_image_processing: bool
         logger.info(f"   - 캡처된 이미지 수: {len(image_result['image_paths'])}")
         logger.info(f"   - 생성된 설명 수: {description_result['total_images']}")
         logger.info(f"   - Vector DB 항목 수: {vector_result['total_documents']}")
+        logger.info(f"   - 재사용 페이지 수: {len(reindex_plan['reused_pages'])}")
         logger.info(f"   - PostgreSQL 저장 청크 수: {saved_chunks}")
         logger.info(f"   - 사용된 임베딩 모델: {vector_result['embedding_model']}")
         logger.info(f"   - 임베딩 API 버전: {vector_result['embedding_api_version']}")
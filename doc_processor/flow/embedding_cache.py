@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+내용 주소 기반 임베딩 캐시 (로컬 SQLite 파일)
+- 키: (sha256(정규화 텍스트), 임베딩 배포 이름, 차원)
+- 값: float32 벡터 (Milvus FLOAT_VECTOR와 같은 정밀도)
+- 최대 항목 수를 넘으면 마지막 사용 시각이 오래된 항목부터 삭제 (LRU)
+- WAL 모드를 사용하므로 여러 워커 프로세스가 같은 파일을 공유할 수 있음
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# SQLite IN 절 변수 개수 제한을 넘지 않도록 조회 단위 분할
+_LOOKUP_CHUNK_SIZE = 500
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (유니코드 NFC, 줄바꿈 통일, 앞뒤 공백 제거)"""
+    text = unicodedata.normalize("NFC", text)
+    return text.replace("\r\n", "\n").replace("\r", "\n").strip()
+
+
+def text_hash(text: str) -> str:
+    """정규화 텍스트의 sha256"""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """임베딩 캐시"""
+
+    def __init__(self, path: str, model: str, dimension: int, max_entries: int = 200000):
+        self.path = str(path)
+        self.model = model or ""
+        self.dimension = dimension
+        self.max_entries = max_entries
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                text_hash TEXT NOT NULL,
+                model TEXT NOT NULL,
+                dimension INTEGER NOT NULL,
+                embedding BLOB NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (text_hash, model, dimension)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_used ON embedding_cache (last_used)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _encode(embedding: List[float]) -> bytes:
+        return array("f", embedding).tobytes()
+
+    @staticmethod
+    def _decode(blob: bytes) -> List[float]:
+        values = array("f")
+        values.frombytes(blob)
+        return values.tolist()
+
+    def get_many(self, hashes: Iterable[str]) -> Dict[str, List[float]]:
+        """해시 목록 일괄 조회 (적중 항목은 마지막 사용 시각 갱신)"""
+        hashes = list(dict.fromkeys(hashes))
+        found: Dict[str, List[float]] = {}
+        if not hashes:
+            return found
+
+        with self._lock:
+            for start in range(0, len(hashes), _LOOKUP_CHUNK_SIZE):
+                chunk = hashes[start:start + _LOOKUP_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT text_hash, embedding FROM embedding_cache "
+                    f"WHERE model = ? AND dimension = ? AND text_hash IN ({placeholders})",
+                    [self.model, self.dimension, *chunk],
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = self._decode(blob)
+
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE embedding_cache SET last_used = ? "
+                    "WHERE text_hash = ? AND model = ? AND dimension = ?",
+                    [(now, key, self.model, self.dimension) for key in found],
+                )
+                self._conn.commit()
+        return found
+
+    def put_many(self, embeddings: Dict[str, List[float]]):
+        """해시 → 임베딩 일괄 저장 (차원이 다른 벡터는 저장하지 않음) 후 LRU 정리"""
+        now = time.time()
+        rows = [
+            (key, self.model, self.dimension, self._encode(embedding), now)
+            for key, embedding in embeddings.items()
+            if len(embedding) == self.dimension
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache "
+                "(text_hash, model, dimension, embedding, last_used) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """최대 항목 수 초과분을 마지막 사용 시각이 오래된 순으로 삭제"""
+        if not self.max_entries or self.max_entries <= 0:
+            return
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM embedding_cache WHERE rowid IN "
+                "(SELECT rowid FROM embedding_cache ORDER BY last_used LIMIT ?)",
+                (overflow,),
+            )
+            logger.info(f"🧹 임베딩 캐시 정리: {overflow}개 삭제 (최대 {self.max_entries}개)")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def open_embedding_cache(
+    path: Optional[str], model: str, dimension: int, max_entries: int
+) -> Optional[EmbeddingCache]:
+    """캐시 열기 (경로가 비어 있거나 열 수 없으면 캐시 없이 동작)"""
+    if not path:
+        return None
+    try:
+        return EmbeddingCache(path, model, dimension, max_entries)
+    except Exception as e:
+        logger.warning(f"⚠️ 임베딩 캐시를 열 수 없어 캐시 없이 진행합니다 ({path}): {str(e)}")
+        return None
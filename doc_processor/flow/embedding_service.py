@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Azure OpenAI 임베딩 서비스
+- 프로세스당 1개의 AzureOpenAI 클라이언트(HTTP 연결 풀)를 재사용
+- 여러 텍스트를 입력 수/토큰 예산 기준으로 묶어 embeddings.create 1회로 요청
+- 배치 요청은 제한된 동시성으로 실행하고, 429/일시 오류는 지수 백오프로 재시도
+- 결과는 항상 입력 순서대로 반환
+- (정규화 텍스트 sha256, 배포 이름, 차원) 키의 캐시에 있는 텍스트는 API를 호출하지 않음
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import openai
+
+from config import config
+from embedding_cache import EmbeddingCache, open_embedding_cache, text_hash
+from openai_retry import RETRYABLE_ERRORS, LazyAzureOpenAI, retry_delay
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingService:
+    """배치 임베딩 클라이언트"""
+
+    def __init__(
+        self,
+        max_batch_inputs: int = None,
+        max_batch_tokens: int = None,
+        max_concurrency: int = None,
+        max_retries: int = None,
+        retry_backoff: float = None,
+    ):
+        self.max_batch_inputs = max(1, max_batch_inputs or config.EMBEDDING_BATCH_MAX_INPUTS)
+        self.max_batch_tokens = max(1, max_batch_tokens or config.EMBEDDING_BATCH_MAX_TOKENS)
+        self.max_concurrency = max(1, max_concurrency or config.EMBEDDING_MAX_CONCURRENCY)
+        self.max_retries = config.EMBEDDING_MAX_RETRIES if max_retries is None else max_retries
+        self.retry_backoff = config.EMBEDDING_RETRY_BACKOFF if retry_backoff is None else retry_backoff
+
+        self._client = LazyAzureOpenAI(config.AZURE_OPENAI_EMBEDDING_API_VERSION, "임베딩")
+        self._cache_lock = threading.Lock()
+        self._cache = None
+        self._cache_loaded = False
+        self._encoding = None
+        self._encoding_loaded = False
+
+    @property
+    def client(self) -> openai.AzureOpenAI:
+        """AzureOpenAI 클라이언트 (최초 사용 시 1회 생성, 스레드 간 공유)"""
+        return self._client.get()
+
+    @property
+    def cache(self) -> Optional[EmbeddingCache]:
+        """임베딩 캐시 (최초 사용 시 1회 열기, 설정이 없으면 None)"""
+        if not self._cache_loaded:
+            with self._cache_lock:
+                if not self._cache_loaded:
+                    self._cache = open_embedding_cache(
+                        config.EMBEDDING_CACHE_PATH,
+                        config.AZURE_OPENAI_EMBEDDING_DEPLOYMENT,
+                        config.EMBEDDING_DIMENSION,
+                        config.EMBEDDING_CACHE_MAX_ENTRIES,
+                    )
+                    self._cache_loaded = True
+        return self._cache
+
+    def count_tokens(self, text: str) -> int:
+        """토큰 수 (tiktoken이 있으면 정확히, 없으면 UTF-8 바이트 기준으로 넉넉하게 추정)"""
+        if not self._encoding_loaded:
+            try:
+                import tiktoken
+
+                self._encoding = tiktoken.get_encoding("cl100k_base")
+            except Exception:
+                self._encoding = None
+            self._encoding_loaded = True
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+        return len(text.encode("utf-8")) // 2 + 1
+
+    def _make_batches(self, texts: List[str]) -> List[List[int]]:
+        """입력 인덱스를 입력 수/토큰 예산 기준 배치로 분할 (입력 순서 유지)"""
+        batches = []
+        current = []
+        current_tokens = 0
+        for index, text in enumerate(texts):
+            tokens = self.count_tokens(text)
+            if current and (
+                len(current) >= self.max_batch_inputs
+                or current_tokens + tokens > self.max_batch_tokens
+            ):
+                batches.append(current)
+                current = []
+                current_tokens = 0
+            current.append(index)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    def _embed_batch(self, inputs: List[str]) -> List[List[float]]:
+        """embeddings.create 1회 요청 (재시도 포함, 결과는 입력 순서)"""
+        attempt = 0
+        while True:
+            try:
+                response = self.client.embeddings.create(
+                    model=config.AZURE_OPENAI_EMBEDDING_DEPLOYMENT,
+                    input=inputs,
+                )
+                data = sorted(response.data, key=lambda item: item.index)
+                return [item.embedding for item in data]
+            except RETRYABLE_ERRORS as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = retry_delay(e, attempt, self.retry_backoff)
+                attempt += 1
+                logger.warning(
+                    f"⏳ 임베딩 요청 재시도 {attempt}/{self.max_retries} "
+                    f"({type(e).__name__}, {delay:.1f}초 후, 입력 {len(inputs)}개)"
+                )
+                time.sleep(delay)
+
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        여러 텍스트 임베딩 (캐시 조회 → 미적중 고유 텍스트만 배치 + 제한된 동시 요청)
+
+        Returns:
+            List[List[float]]: texts와 같은 순서의 임베딩 목록
+        """
+        if not texts:
+            return []
+
+        hashes = [text_hash(text) for text in texts]
+        cache = self.cache
+        cached: Dict[str, List[float]] = {}
+        if cache:
+            try:
+                cached = cache.get_many(hashes)
+            except Exception as e:
+                logger.warning(f"⚠️ 임베딩 캐시 조회 실패 (API로 진행): {str(e)}")
+
+        # 캐시에 없는 텍스트는 같은 내용끼리 1번만 요청
+        missing: Dict[str, int] = {}
+        for index, key in enumerate(hashes):
+            if key not in cached and key not in missing:
+                missing[key] = index
+
+        fresh = {}
+        if missing:
+            embeddings = self._embed_uncached([texts[index] for index in missing.values()])
+            fresh = dict(zip(missing.keys(), embeddings))
+            if cache:
+                try:
+                    cache.put_many(fresh)
+                except Exception as e:
+                    logger.warning(f"⚠️ 임베딩 캐시 저장 실패: {str(e)}")
+
+        if cached:
+            logger.info(f"💾 임베딩 캐시 적중: {len(texts) - len(missing)}/{len(texts)}개")
+        return [cached[key] if key in cached else fresh[key] for key in hashes]
+
+    def _embed_uncached(self, texts: List[str]) -> List[List[float]]:
+        """API 배치 요청 (입력 순서대로 반환)"""
+        batches = self._make_batches(texts)
+        logger.info(
+            f"🧮 임베딩 요청: 입력 {len(texts)}개 → API 호출 {len(batches)}회 "
+            f"(동시 {min(self.max_concurrency, len(batches))}개)"
+        )
+
+        results: List[Optional[List[float]]] = [None] * len(texts)
+
+        def run(batch: List[int]):
+            embeddings = self._embed_batch([texts[index] for index in batch])
+            for index, embedding in zip(batch, embeddings):
+                results[index] = embedding
+
+        if len(batches) == 1:
+            run(batches[0])
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(batches))) as executor:
+                # 하나라도 실패하면 예외 전파
+                for future in [executor.submit(run, batch) for batch in batches]:
+                    future.result()
+
+        return results
+
+    def embed_text(self, text: str) -> List[float]:
+        """텍스트 1개 임베딩"""
+        return self.embed_texts([text])[0]
+
+
+# 전역 임베딩 서비스 인스턴스
+_embedding_service = None
+_embedding_service_lock = threading.Lock()
+
+
+def get_embedding_service() -> EmbeddingService:
+    """임베딩 서비스 싱글톤 (프로세스당 1개, 클라이언트 연결 재사용)"""
+    global _embedding_service
+    if _embedding_service is None:
+        with _embedding_service_lock:
+            if _embedding_service is None:
+                _embedding_service = EmbeddingService()
+    return _embedding_service
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Azure OpenAI 공통 클라이언트/재시도 정책 (임베딩, Vision 서비스 공용)
+- 프로세스당 1개의 AzureOpenAI 클라이언트를 최초 사용 시 생성하여 스레드 간 공유
+- SDK 자체 재시도는 끄고(max_retries=0) 서비스에서 직접 재시도 (429 Retry-After 반영)
+- 재시도 대상 오류와 대기 시간 계산을 한 곳에서 관리
+"""
+
+import logging
+import random
+import threading
+
+import openai
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 오류 (429, 연결/타임아웃, 5xx)
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.InternalServerError,
+)
+
+
+def retry_delay(error: Exception, attempt: int, backoff: float) -> float:
+    """재시도 대기 시간 (429 Retry-After 헤더 우선, 없으면 지수 백오프 + 지터)"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    for header in ("retry-after-ms", "retry-after"):
+        value = headers.get(header)
+        if value:
+            try:
+                seconds = float(value)
+                return seconds / 1000 if header == "retry-after-ms" else seconds
+            except ValueError:
+                pass
+    return backoff * (2 ** attempt) + random.uniform(0, backoff)
+
+
+class LazyAzureOpenAI:
+    """AzureOpenAI 클라이언트 (최초 사용 시 1회 생성, 스레드 간 공유)"""
+
+    def __init__(self, api_version: str, label: str):
+        self.api_version = api_version
+        self.label = label
+        self._client = None
+        self._lock = threading.Lock()
+
+    def get(self) -> openai.AzureOpenAI:
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    logger.info(f"🔗 {self.label} API 버전: {self.api_version}")
+                    # 재시도는 각 서비스에서 직접 처리 (429 Retry-After 반영)
+                    self._client = openai.AzureOpenAI(
+                        azure_endpoint=config.AZURE_OPENAI_ENDPOINT,
+                        api_key=config.AZURE_OPENAI_KEY,
+                        api_version=self.api_version,
+                        max_retries=0,
+                    )
+        return self._client
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+페이지 지문 (증분 재처리)
+- 텍스트 지문: 정규화한 페이지 텍스트의 sha256 (임베딩 캐시 키와 같은 정규화)
+- 이미지 지문: 페이지를 렌더링하지 않고 렌더링 입력(페이지 크기/회전, 콘텐츠 스트림,
+  참조 이미지/폼 XObject 스트림)의 sha256 → 렌더링 결과가 바뀌는 수정이면 지문도 바뀜
+- 이전 처리 결과(DocumentChunk)와 지문을 비교해 재사용/재처리 페이지를 나눔
+"""
+
+import hashlib
+from typing import Any, Dict, Iterable, List, Optional
+
+from embedding_cache import text_hash
+
+
+def page_text_hash(text: str) -> str:
+    """페이지 텍스트 지문"""
+    return text_hash(text or "")
+
+
+def page_image_hash(doc, page) -> str:
+    """
+    페이지 이미지 지문 (PyMuPDF 문서/페이지)
+
+    콘텐츠 스트림과 페이지가 참조하는 이미지/폼 XObject의 원본 스트림을 해시하므로
+    래스터화 없이 계산할 수 있음
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{tuple(page.rect)}|{page.rotation}".encode("utf-8"))
+    digest.update(page.read_contents() or b"")
+
+    xrefs = set()
+    for image in page.get_images(full=True):
+        xrefs.add(image[0])
+    for xobject in page.get_xobjects():
+        xrefs.add(xobject[0])
+    for xref in sorted(xrefs):
+        if xref <= 0:
+            continue
+        try:
+            digest.update(doc.xref_stream_raw(xref) or b"")
+        except Exception:
+            # 스트림이 아닌 객체는 정의 문자열로 대신함
+            digest.update(doc.xref_object(xref, compressed=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def plan_reindex(
+    page_fingerprints: Dict[int, Dict[str, str]],
+    previous_chunks: Dict[int, Dict[str, Any]],
+    indexed_pages: Iterable[int],
+    require_image_description: bool,
+) -> Dict[str, List[int]]:
+    """
+    재사용/재처리 페이지 분류
+
+    Args:
+        page_fingerprints: 이번 처리 페이지 번호 → {"text_hash", "image_hash"}
+        previous_chunks: 이전 처리의 페이지 번호 → 청크 정보 (get_latest_page_chunks)
+        indexed_pages: Milvus에 현재 행이 남아 있는 페이지 번호
+        require_image_description: 이미지 처리 여부 (이전 청크의 설명 유무가 같아야 재사용)
+
+    Returns:
+        Dict: reused_pages, changed_pages, removed_pages (오름차순)
+    """
+    indexed_pages = set(indexed_pages)
+    reused = []
+    changed = []
+    for page_number, fingerprint in sorted(page_fingerprints.items()):
+        chunk = previous_chunks.get(page_number)
+        if (
+            chunk
+            and page_number in indexed_pages
+            and chunk.get("text_hash") == fingerprint["text_hash"]
+            and chunk.get("image_hash") == fingerprint["image_hash"]
+            and bool(chunk.get("image_description")) == require_image_description
+        ):
+            reused.append(page_number)
+        else:
+            changed.append(page_number)
+
+    removed = sorted(indexed_pages - set(page_fingerprints))
+    return {"reused_pages": reused, "changed_pages": changed, "removed_pages": removed}
+
+
+def page_fingerprints_from(extracted_text: Optional[Dict[str, Any]]) -> Dict[int, Dict[str, str]]:
+    """텍스트 추출 결과에서 페이지 번호 → 지문"""
+    if not extracted_text:
+        return {}
+    return {
+        page_data["page_number"]: {
+            "text_hash": page_data.get("text_hash"),
+            "image_hash": page_data.get("image_hash"),
+        }
+        for page_data in extracted_text.get("extracted_text", {}).values()
+    }
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+PDF 페이지 렌더링 (PyMuPDF)
+- 페이지를 PIL 이미지로 모으지 않고 pixmap → PNG 파일로 바로 저장 (워커당 1페이지 메모리)
+- DPI는 Vision 모델이 실제로 쓰는 해상도에 맞춰 페이지 크기별로 결정
+  (긴 변이 RENDER_TARGET_LONG_EDGE 픽셀이 되도록, RENDER_MIN_DPI ~ RENDER_MAX_DPI 범위)
+- 페이지가 많으면 프로세스 풀에서 병렬 렌더링 (워커마다 문서를 1번만 열어 재사용)
+"""
+
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+import fitz  # PyMuPDF
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+# 워커 프로세스에서 연 문서 (initializer에서 1번만 열기)
+_worker_doc = None
+
+
+def adaptive_dpi(page, target_long_edge: int, min_dpi: int, max_dpi: int) -> int:
+    """긴 변이 target_long_edge 픽셀이 되는 DPI (min_dpi ~ max_dpi로 제한)"""
+    long_edge_pt = max(page.rect.width, page.rect.height) or 1
+    dpi = int(72 * target_long_edge / long_edge_pt)
+    return max(min_dpi, min(max_dpi, dpi))
+
+
+def render_page(doc, page_number: int, image_path: str, target_long_edge: int, min_dpi: int, max_dpi: int) -> int:
+    """페이지 1개를 PNG로 저장하고 사용한 DPI 반환 (page_number는 1부터)"""
+    page = doc.load_page(page_number - 1)
+    dpi = adaptive_dpi(page, target_long_edge, min_dpi, max_dpi)
+    pix = page.get_pixmap(dpi=dpi, alpha=False)
+    pix.save(image_path)
+    pix = None
+    return dpi
+
+
+def _init_worker(document_path: str):
+    global _worker_doc
+    _worker_doc = fitz.open(document_path)
+
+
+def _render_in_worker(page_number: int, image_path: str, target_long_edge: int, min_dpi: int, max_dpi: int):
+    dpi = render_page(_worker_doc, page_number, image_path, target_long_edge, min_dpi, max_dpi)
+    return page_number, image_path, dpi
+
+
+def render_pages(
+    document_path: str,
+    page_numbers: List[int],
+    output_dir: Path,
+    document_name: str,
+    doc=None,
+) -> Iterator[Tuple[int, str, int]]:
+    """
+    페이지들을 PNG로 렌더링 (완료된 순서대로 반환)
+
+    Args:
+        document_path: PDF 경로
+        page_numbers: 렌더링할 페이지 번호 (1부터)
+        output_dir: 저장 폴더
+        document_name: 파일명 접두어 ({document_name}_page_{n}.png)
+        doc: 이미 열린 fitz 문서 (단일 프로세스 렌더링 시 재사용)
+
+    Yields:
+        (page_number, image_path, dpi)
+    """
+    target_long_edge = config.RENDER_TARGET_LONG_EDGE
+    min_dpi = config.RENDER_MIN_DPI
+    max_dpi = config.RENDER_MAX_DPI
+    jobs = [
+        (page_number, str(Path(output_dir) / f"{document_name}_page_{page_number}.png"))
+        for page_number in page_numbers
+    ]
+    workers = min(config.RENDER_WORKERS, len(jobs))
+
+    if workers <= 1 or len(jobs) < config.RENDER_PARALLEL_MIN_PAGES:
+        own_doc = doc is None
+        if own_doc:
+            doc = fitz.open(document_path)
+        try:
+            for page_number, image_path in jobs:
+                yield page_number, image_path, render_page(
+                    doc, page_number, image_path, target_long_edge, min_dpi, max_dpi
+                )
+        finally:
+            if own_doc:
+                doc.close()
+        return
+
+    # fork는 스레드(Prefect 태스크 러너)가 있는 프로세스에서 안전하지 않으므로 spawn 사용
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(document_path,),
+    ) as executor:
+        futures = [
+            executor.submit(_render_in_worker, page_number, image_path, target_long_edge, min_dpi, max_dpi)
+            for page_number, image_path in jobs
+        ]
+        for future in as_completed(futures):
+            yield future.result()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+GPT Vision 페이지 설명 서비스
+- 프로세스당 1개의 AzureOpenAI 클라이언트(HTTP 연결 풀)를 재사용
+- 페이지 이미지를 스레드 풀에서 동시 요청 (VISION_MAX_CONCURRENCY)
+- 분당 토큰 한도(VISION_TOKENS_PER_MINUTE)를 토큰 버킷으로 지킴 (응답 usage로 실제 사용량 보정)
+- 429/일시 오류는 페이지별로 지수 백오프 재시도
+- 완료된 페이지부터 순서와 무관하게 바로 반환 (다음 단계에서 즉시 사용 가능)
+"""
+
+import base64
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Optional, Tuple
+
+import openai
+
+from config import config
+from openai_retry import RETRYABLE_ERRORS, LazyAzureOpenAI, retry_delay
+
+logger = logging.getLogger(__name__)
+
+VISION_PROMPT = "이 이미지의 내용을 자세히 설명해주세요. 텍스트, 차트, 그래프, 표 등 모든 요소를 포함하여 설명해주세요."
+
+
+class TokenRateLimiter:
+    """분당 토큰 한도 토큰 버킷 (tokens_per_minute가 0 이하이면 제한 없음)"""
+
+    def __init__(self, tokens_per_minute: int):
+        self.capacity = float(tokens_per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.capacity > 0
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, tokens: int):
+        """토큰 확보까지 대기 (요청 1회가 한도보다 크면 한도만큼만 확보)"""
+        if not self.enabled:
+            return
+        tokens = min(float(tokens), self.capacity)
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def adjust(self, delta: int):
+        """추정치와 실제 사용량 차이 반영 (양수면 추가 차감)"""
+        if not self.enabled or not delta:
+            return
+        with self._lock:
+            self._refill()
+            self.tokens -= delta
+
+
+class VisionDescriber:
+    """페이지 이미지 설명 생성기"""
+
+    def __init__(
+        self,
+        max_concurrency: int = None,
+        tokens_per_minute: int = None,
+        max_retries: int = None,
+        retry_backoff: float = None,
+    ):
+        self.max_concurrency = max(1, max_concurrency or config.VISION_MAX_CONCURRENCY)
+        self.max_retries = config.VISION_MAX_RETRIES if max_retries is None else max_retries
+        self.retry_backoff = config.VISION_RETRY_BACKOFF if retry_backoff is None else retry_backoff
+        self.limiter = TokenRateLimiter(
+            config.VISION_TOKENS_PER_MINUTE if tokens_per_minute is None else tokens_per_minute
+        )
+
+        self._client = LazyAzureOpenAI(config.AZURE_OPENAI_API_VERSION, "GPT Vision")
+
+    @property
+    def client(self) -> openai.AzureOpenAI:
+        """AzureOpenAI 클라이언트 (최초 사용 시 1회 생성, 스레드 간 공유)"""
+        return self._client.get()
+
+    def describe_image(self, image_path: str) -> str:
+        """이미지 1개 설명 생성 (토큰 한도 대기 + 재시도 포함)"""
+        with open(image_path, "rb") as image_file:
+            base64_image = base64.b64encode(image_file.read()).decode("utf-8")
+
+        messages = [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": VISION_PROMPT},
+                    {
+                        "type": "image_url",
+                        "image_url": {"url": f"data:image/png;base64,{base64_image}"},
+                    },
+                ],
+            }
+        ]
+        estimated_tokens = config.VISION_ESTIMATED_IMAGE_TOKENS + config.VISION_MAX_TOKENS
+
+        attempt = 0
+        while True:
+            self.limiter.acquire(estimated_tokens)
+            try:
+                response = self.client.chat.completions.create(
+                    model=config.AZURE_OPENAI_DEPLOYMENT_NAME,
+                    messages=messages,
+                    max_tokens=config.VISION_MAX_TOKENS,
+                )
+                usage = getattr(response, "usage", None)
+                if usage is not None and getattr(usage, "total_tokens", None):
+                    self.limiter.adjust(usage.total_tokens - estimated_tokens)
+                return response.choices[0].message.content
+            except RETRYABLE_ERRORS as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = retry_delay(e, attempt, self.retry_backoff)
+                attempt += 1
+                logger.warning(
+                    f"⏳ 이미지 설명 재시도 {attempt}/{self.max_retries} "
+                    f"({type(e).__name__}, {delay:.1f}초 후): {image_path}"
+                )
+                time.sleep(delay)
+
+    def describe_images(
+        self, image_paths: List[str]
+    ) -> Iterator[Tuple[str, Optional[str], Optional[Exception]]]:
+        """
+        여러 이미지 동시 설명 생성 (완료된 순서대로 반환)
+
+        Yields:
+            (image_path, description, error): 실패한 페이지는 description None, error 설정
+        """
+        if not image_paths:
+            return
+
+        workers = min(self.max_concurrency, len(image_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.describe_image, image_path): image_path
+                for image_path in image_paths
+            }
+            for future in as_completed(futures):
+                image_path = futures[future]
+                try:
+                    yield image_path, future.result(), None
+                except Exception as e:
+                    yield image_path, None, e
+
+
+# 전역 Vision 서비스 인스턴스
+_vision_describer = None
+_vision_describer_lock = threading.Lock()
+
+
+def get_vision_describer() -> VisionDescriber:
+    """Vision 서비스 싱글톤 (프로세스당 1개, 클라이언트 연결/토큰 한도 공유)"""
+    global _vision_describer
+    if _vision_describer is None:
+        with _vision_describer_lock:
+            if _vision_describer is None:
+                _vision_describer = VisionDescriber()
+    return _vision_describer
@@ -10,15 +10,13 @@ from typing import List, Dict, Any
 import logging
 import time
 
-# 프로젝트 루트를 Python 경로에 추가
+# 프로젝트 루트 및 flow 경로를 Python 경로에 추가
 sys.path.append(str(Path(__file__).parent))
+sys.path.append(str(Path(__file__).parent / "flow"))
 
 # Milvus
 from pymilvus import Collection, connections, utility
 
-# Azure OpenAI (임베딩용)
-import openai
-
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -27,27 +25,12 @@ logger = logging.getLogger(__name__)
 MILVUS_URI = os.getenv("MILVUS_URI", "./milvus_lite.db")  # 파일 기반 DB
 MILVUS_COLLECTION_NAME = os.getenv("MILVUS_COLLECTION_NAME", "document_vectors")
 
-# Azure OpenAI 설정
-AZURE_OPENAI_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT")
-AZURE_OPENAI_KEY = os.getenv("AZURE_OPENAI_KEY")
-AZURE_OPENAI_EMBEDDING_API_VERSION = os.getenv("AZURE_OPENAI_EMBEDDING_API_VERSION", "2023-12-01-preview")
-AZURE_OPENAI_EMBEDDING_DEPLOYMENT = os.getenv("AZURE_OPENAI_EMBEDDING_DEPLOYMENT")
-
 def get_azure_openai_embedding(text: str) -> List[float]:
-    """Azure OpenAI를 사용하여 텍스트 임베딩을 생성합니다."""
+    """Azure OpenAI를 사용하여 텍스트 임베딩을 생성합니다. (공유 클라이언트 + 임베딩 캐시)"""
     try:
-        # Azure OpenAI 클라이언트 생성
-        client = openai.AzureOpenAI(
-            azure_endpoint=AZURE_OPENAI_ENDPOINT,
-            api_key=AZURE_OPENAI_KEY,
-            api_version=AZURE_OPENAI_EMBEDDING_API_VERSION
-        )
-        
-        response = client.embeddings.create(
-            model=AZURE_OPENAI_EMBEDDING_DEPLOYMENT,
-            input=text
-        )
-        return response.data[0].embedding
+        from embedding_service import get_embedding_service
+
+        return get_embedding_service().embed_text(text)
     except Exception as e:
         logger.error(f"❌ 임베딩 생성 실패: {str(e)}")
         raise
@@ -426,6 +426,9 @@ class DocumentChunkCRUD:
         char_count: int = None,
         word_count: int = None,
         language: str = None,
+        source_path: str = None,
+        text_hash: str = None,
+        image_hash: str = None,
         metadata_json: dict = None
     ) -> DocumentChunk:
         """문서 청크 생성"""
@@ -444,6 +447,9 @@ class DocumentChunkCRUD:
                 char_count=char_count,
                 word_count=word_count,
                 language=language,
+                source_path=source_path,
+                text_hash=text_hash,
+                image_hash=image_hash,
                 metadata_json=metadata_json
             )
             self.db.add(chunk)
@@ -474,6 +480,19 @@ class DocumentChunkCRUD:
             logger.error(f"문서 청크 목록 조회 실패: {str(e)}")
             raise
     
+    def get_latest_page_chunks(self, source_path: str) -> Dict[int, DocumentChunk]:
+        """원본 문서 경로의 페이지별 최신 청크 조회 (증분 재처리용, DISTINCT ON으로 페이지당 1행만 조회)"""
+        try:
+            chunks = self.db.query(DocumentChunk)\
+                .filter(DocumentChunk.source_path == source_path)\
+                .distinct(DocumentChunk.page_number)\
+                .order_by(DocumentChunk.page_number, DocumentChunk.created_at.desc())\
+                .all()
+            return {chunk.page_number: chunk for chunk in chunks}
+        except Exception as e:
+            logger.error(f"페이지별 최신 청크 조회 실패: {str(e)}")
+            raise
+    
     def update_chunk(self, chunk_id: str, **kwargs) -> bool:
         """청크 정보 업데이트"""
         try:
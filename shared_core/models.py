@@ -143,6 +143,11 @@ class DocumentChunk(Base):
     word_count = Column(Integer)             # 단어 수
     language = Column(String(10))            # 언어
     
+    # 페이지 지문 (증분 재처리: 지문이 같은 페이지는 설명/임베딩/Milvus 행 재사용)
+    source_path = Column(String(500), index=True)  # 처리한 원본 문서 경로 (Milvus document_path)
+    text_hash = Column(String(64))           # 페이지 텍스트 sha256
+    image_hash = Column(String(64))          # 페이지 렌더링 입력(콘텐츠 스트림, 이미지) sha256
+    
     # 추가 정보
     metadata_json = Column(JSON)             # 기타 메타데이터
     
@@ -424,6 +424,16 @@ class DocumentChunkService:
             logger.error(f"문서 청크 목록 조회 실패: {str(e)}")
             raise
     
+    def get_latest_page_chunks(self, source_path: str) -> Dict[int, Dict]:
+        """원본 문서 경로의 페이지별 최신 청크 조회 (증분 재처리용)"""
+        try:
+            chunks = self.chunk_crud.get_latest_page_chunks(source_path)
+            return {page_number: self._chunk_to_dict(chunk) for page_number, chunk in chunks.items()}
+            
+        except Exception as e:
+            logger.error(f"페이지별 최신 청크 조회 실패: {str(e)}")
+            raise
+    
     def update_chunk(self, chunk_id: str, **kwargs) -> bool:
         """청크 정보 업데이트"""
         try:
@@ -459,6 +469,9 @@ class DocumentChunkService:
             "char_count": chunk.char_count,
             "word_count": chunk.word_count,
             "language": chunk.language,
+            "source_path": chunk.source_path,
+            "text_hash": chunk.text_hash,
+            "image_hash": chunk.image_hash,
             "metadata_json": chunk.metadata_json,
             "created_at": chunk.created_at.isoformat(),
             "updated_at": chunk.updated_at.isoformat()